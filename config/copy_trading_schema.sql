@@ -20,6 +20,14 @@ CREATE TABLE trader_stats (
 CREATE INDEX idx_trader_stats_address_time ON trader_stats(address, last_trade_at);
 CREATE INDEX idx_trader_stats_window ON trader_stats(window);
 
+-- Indexer block watermark reached by the incremental trader_stats refresh
+CREATE TABLE trader_stats_sync (
+    name VARCHAR(64) PRIMARY KEY,
+    last_block BIGINT NOT NULL,
+    window_start TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
 CREATE TABLE copytrader_profiles (
     id SERIAL PRIMARY KEY,
     user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
@@ -113,9 +121,11 @@ CREATE TABLE trade_events (
 );
 
 CREATE INDEX idx_trade_events_address ON trade_events(address);
+CREATE INDEX idx_trade_events_address_timestamp ON trade_events(address, timestamp);
 CREATE INDEX idx_trade_events_timestamp ON trade_events(timestamp);
 CREATE INDEX idx_trade_events_type ON trade_events(event_type);
 CREATE INDEX idx_trade_events_pair ON trade_events(pair);
+CREATE INDEX idx_trade_events_block ON trade_events(block_number);
 
 -- Performance monitoring
 CREATE TABLE performance_metrics (
@@ -130,6 +140,23 @@ CREATE TABLE performance_metrics (
 CREATE INDEX idx_performance_metrics_name ON performance_metrics(metric_name);
 CREATE INDEX idx_performance_metrics_timestamp ON performance_metrics(timestamp);
 
+-- Metric rollups written by PerformanceMonitor, one row per series and bucket
+CREATE TABLE performance_metric_rollups (
+    metric_name VARCHAR(100) NOT NULL,
+    metric_type VARCHAR(20) CHECK (metric_type IN ('counter', 'gauge', 'histogram')),
+    labels JSONB NOT NULL DEFAULT '{}',
+    resolution_s INTEGER NOT NULL,
+    bucket_start TIMESTAMP NOT NULL,
+    sample_count BIGINT NOT NULL,
+    value_sum DOUBLE PRECISION,
+    value_min DOUBLE PRECISION,
+    value_max DOUBLE PRECISION,
+    value_last DOUBLE PRECISION,
+    PRIMARY KEY (metric_name, labels, resolution_s, bucket_start)
+);
+
+CREATE INDEX idx_performance_metric_rollups_bucket ON performance_metric_rollups(resolution_s, bucket_start);
+
 -- Health checks
 CREATE TABLE health_checks (
     id SERIAL PRIMARY KEY,
@@ -191,4 +218,5 @@ COMMENT ON TABLE copy_positions IS 'Individual copy trades executed by the syste
 COMMENT ON TABLE trader_analytics IS 'AI-generated trader analysis and classification';
 COMMENT ON TABLE trade_events IS 'Raw blockchain events from Avantis Trading contract';
 COMMENT ON TABLE performance_metrics IS 'System performance and operational metrics';
+COMMENT ON TABLE performance_metric_rollups IS 'Pre-aggregated metric buckets at several resolutions';
 COMMENT ON TABLE health_checks IS 'Service health status monitoring';
\ No newline at end of file
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Benchmark event normalization in AvantisEventIndexer.
+
+Normalizes a synthetic block range against a node stand-in that sleeps for
+one round trip per ``eth_getBlock`` call, once with a timestamp lookup per
+event (the previous behaviour) and once through the shared block timestamp
+cache, and counts RPC calls for each.
+
+Usage:
+
+    python scripts/bench_block_timestamps.py --blocks 200 --events-per-block 30
+"""
+
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.analytics.data_extractor import AvantisEventIndexer
+
+
+class LatencyEth:
+    def __init__(self, rtt_s: float):
+        self.rtt_s = rtt_s
+        self.calls = 0
+
+    def get_block(self, block_number):
+        self.calls += 1
+        time.sleep(self.rtt_s)
+        return {"timestamp": 1_700_000_000 + block_number * 2}
+
+
+def build_events(blocks: int, per_block: int) -> list[tuple]:
+    return [
+        (
+            SimpleNamespace(
+                args=SimpleNamespace(
+                    trader="0xabc",
+                    pairIndex=i % 10,
+                    long=bool(i % 2),
+                    positionSizeDai=10**18,
+                    openPrice=5 * 10**14,
+                    leverage=10,
+                ),
+                blockNumber=b,
+                transactionHash=i.to_bytes(32, "big"),
+            ),
+            "OPENED",
+        )
+        for b in range(blocks)
+        for i in range(per_block)
+    ]
+
+
+def new_indexer(eth) -> AvantisEventIndexer:
+    with patch.object(AvantisEventIndexer, "_setup_web3"):
+        indexer = AvantisEventIndexer(None, None, None)
+    indexer.web3 = SimpleNamespace(eth=eth)
+    return indexer
+
+
+async def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Block timestamp cache benchmark")
+    parser.add_argument("--blocks", type=int, default=200)
+    parser.add_argument("--events-per-block", type=int, default=30)
+    parser.add_argument(
+        "--rtt-ms", type=float, default=20, help="Node round trip per eth_getBlock"
+    )
+    args = parser.parse_args()
+
+    raw_events = build_events(args.blocks, args.events_per_block)
+    results = {}
+
+    eth = LatencyEth(args.rtt_ms / 1000)
+    indexer = new_indexer(eth)
+    start = time.perf_counter()
+    per_event = [
+        indexer._normalize_trade_event(
+            event,
+            event_type,
+            indexer._fetch_block_timestamps([event.blockNumber])[event.blockNumber],
+        )
+        for event, event_type in raw_events
+    ]
+    results["per-event"] = (time.perf_counter() - start, eth.calls)
+
+    eth = LatencyEth(args.rtt_ms / 1000)
+    indexer = new_indexer(eth)
+    start = time.perf_counter()
+    cached = await indexer._normalize_trade_events(raw_events)
+    results["cached"] = (time.perf_counter() - start, eth.calls)
+
+    mismatches = sum(a != b for a, b in zip(per_event, cached))
+
+    print(
+        f"\nEVENT NORMALIZATION ({len(raw_events):,} events in {args.blocks} blocks,"
+        f" {args.rtt_ms:g} ms RTT)"
+    )
+    print("=" * 50)
+    for label, (elapsed, calls) in results.items():
+        print(f"  {label:<10} {elapsed:7.2f}s  {calls:>6,} eth_getBlock calls")
+    print(f"  speedup:   {results['per-event'][0] / results['cached'][0]:.1f}x")
+    print(f"  mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
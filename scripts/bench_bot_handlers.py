@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Benchmark Telegram handler latency with per-call vs process-wide services.
+
+Registers the /markets and /positions handlers on a real Application and
+drives fake Updates through their callbacks, once with the previous service
+factory (new engine, Web3 client, feed map, aggregator and market catalog on
+every call) and once with BotServices (only the DB session per update).
+Prices come from a warmed price bus and no wallet is bound, so neither run
+touches the network.
+
+Usage:
+
+    python scripts/bench_bot_handlers.py --updates 500
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+_db_path = os.path.join(tempfile.mkdtemp(), "bench_bot.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from telegram.ext import ApplicationBuilder
+from web3 import Web3
+
+from src.adapters.price.aggregator import PriceAggregator
+from src.adapters.price.chainlink_adapter import ChainlinkAdapter
+from src.blockchain.avantis.service import AvantisService
+from src.bot.application import BotServices
+from src.bot.handlers.market_handlers import register_markets
+from src.bot.handlers.positions_handlers import register_positions
+from src.config.feeds_loader import load_chainlink_feeds
+from src.config.settings import settings
+from src.database.models import Base
+from src.services.markets.market_catalog import default_market_catalog
+from src.services.price_bus import BusPriceFeed, price_bus
+
+
+def legacy_factory():
+    """The previous factory: every dependency rebuilt on every call."""
+    cl_map = load_chainlink_feeds()
+
+    def svc_factory():
+        w3 = Web3(Web3.HTTPProvider(settings.BASE_RPC_URL))
+        db_url = settings.DATABASE_URL.replace("sqlite+aiosqlite:", "sqlite:")
+        eng = create_engine(db_url, pool_pre_ping=True)
+        Session = sessionmaker(bind=eng, expire_on_commit=False)
+        db = Session()
+        price_agg = PriceAggregator(
+            [BusPriceFeed(price_bus, source="chainlink"), ChainlinkAdapter(w3, cl_map)]
+        )
+        svc = AvantisService(w3, db, price_agg)
+        return w3, db, svc
+
+    return svc_factory
+
+
+def command_callbacks(svc_factory) -> dict:
+    app = ApplicationBuilder().token("0:bench").build()
+    register_markets(app, svc_factory)
+    register_positions(app, svc_factory)
+    return {
+        command: handler.callback
+        for handler in app.handlers[0]
+        for command in handler.commands
+    }
+
+
+def fake_update(tg_id: int):
+    async def reply_markdown(text, **kwargs):
+        return None
+
+    update = SimpleNamespace(
+        message=SimpleNamespace(reply_markdown=reply_markdown),
+        effective_user=SimpleNamespace(id=tg_id),
+    )
+    context = SimpleNamespace(user=SimpleNamespace(tg_id=tg_id), args=[])
+    return update, context
+
+
+async def drive(callbacks: dict, updates: int) -> list[float]:
+    commands = sorted(callbacks)
+    latencies = []
+    for i in range(updates):
+        update, context = fake_update(1000 + i)
+        start = time.perf_counter()
+        await callbacks[commands[i % len(commands)]](update, context)
+        latencies.append(time.perf_counter() - start)
+    return sorted(latencies)
+
+
+async def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bot handler latency benchmark")
+    parser.add_argument("--updates", type=int, default=500)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(create_engine(os.environ["DATABASE_URL"]))
+    for symbol in default_market_catalog():
+        price_bus.publish("chainlink", symbol, 100.0)
+
+    services = BotServices()
+    runs = {"per-call": legacy_factory(), "shared": services}
+
+    print(f"\nHANDLER LATENCY ({args.updates} updates over /markets, /positions)")
+    print("=" * 60)
+    results = {}
+    for label, factory in runs.items():
+        latencies = await drive(command_callbacks(factory), args.updates)
+        results[label] = sum(latencies)
+        p50 = statistics.median(latencies) * 1000
+        p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+        print(
+            f"  {label:<9} {results[label]:7.2f}s  p50 {p50:7.2f} ms  p99 {p99:7.2f} ms"
+        )
+    print(f"  speedup:  {results['per-call'] / results['shared']:.1f}x")
+    services.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
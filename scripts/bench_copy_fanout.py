@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Benchmark leader monitoring fan-out in the copy executor.
+
+Drives ``CopyExecutor._poll_leaders_once`` against an in-process database and
+Redis stand-in and reports the number of database queries and the tick latency
+for a large follower population spread over a handful of leaders.
+
+Usage (ENCRYPTION_KEY must be set because the executor imports the wallet
+manager):
+
+    python scripts/bench_copy_fanout.py --followers 10000 --leaders 50
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.copy_trading.copy_executor import CopyExecutor
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CountingConnection:
+    """Connection stand-in that serves follow rows and leader trades."""
+
+    def __init__(self, follow_rows: list[dict], trades_per_leader: int):
+        self.follow_rows = follow_rows
+        self.trades_per_leader = trades_per_leader
+        self.queries = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def fetch(self, query: str, *args):
+        self.queries += 1
+        if "FROM leader_follows" in query:
+            return self.follow_rows
+        if "trade_events" in query:
+            return [
+                {
+                    "address": leader,
+                    "pair": "0",
+                    "is_long": True,
+                    "size": 1.0,
+                    "price": 50000.0,
+                    "leverage": 10,
+                    "timestamp": datetime.utcnow(),
+                    "block_number": 1,
+                    "tx_hash": f"0x{leader[-8:]}{i:04x}",
+                    "event_type": "OPENED",
+                }
+                for leader in args[0]
+                for i in range(self.trades_per_leader)
+            ]
+        return []
+
+
+class CountingPool:
+    def __init__(self, conn: CountingConnection):
+        self.conn = conn
+
+    async def acquire(self):
+        return self.conn
+
+
+class MemoryRedis:
+    """Minimal async Redis stand-in covering the calls made by the executor."""
+
+    def __init__(self):
+        self.data: dict[str, object] = {}
+        self.calls = 0
+
+    async def get(self, key):
+        self.calls += 1
+        return self.data.get(key)
+
+    async def set(self, key, value):
+        self.calls += 1
+        self.data[key] = value
+
+    async def hmget(self, key, fields):
+        self.calls += 1
+        bucket = self.data.get(key) or {}
+        return [bucket.get(f) for f in fields]
+
+    async def hset(self, key, mapping):
+        self.calls += 1
+        self.data.setdefault(key, {}).update(mapping)
+
+    async def setex(self, key, ttl, value):
+        self.calls += 1
+        self.data[key] = value
+
+    async def incr(self, key):
+        self.calls += 1
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+
+class TimingIntel:
+    def __init__(self):
+        self.calls = 0
+        self.signal = MagicMock(signal="green")
+
+    async def get_copy_timing_signal(self, symbol):
+        self.calls += 1
+        return self.signal
+
+
+async def run_benchmark(
+    followers: int, leaders: int, trades_per_leader: int, ticks: int
+) -> dict:
+    follow_rows = [
+        {
+            "leader_address": f"0x{i % leaders:040x}",
+            "copytrader_id": i,
+            "user_id": i,
+            "is_enabled": True,
+            "sizing_mode": "FIXED_NOTIONAL",
+            "sizing_value": 100.0,
+            "max_slippage_bps": 100,
+            "max_leverage": 50.0,
+            "notional_cap": None,
+            "pair_filters": {},
+        }
+        for i in range(followers)
+    ]
+    conn = CountingConnection(follow_rows, trades_per_leader)
+    redis_client = MemoryRedis()
+    intel = TimingIntel()
+    executor = CopyExecutor(
+        db_pool=CountingPool(conn),
+        redis_client=redis_client,
+        avantis_client=MagicMock(),
+        market_intelligence=intel,
+        config=MagicMock(),
+    )
+
+    latencies = []
+    queries_per_tick = []
+    queued_total = 0
+    for _ in range(ticks):
+        # Reset per-pair rate limits so every tick exercises the full fan-out
+        redis_client.data.clear()
+        queries_before = conn.queries
+        start = time.perf_counter()
+        queued_total += await executor._poll_leaders_once()
+        latencies.append(time.perf_counter() - start)
+        queries_per_tick.append(conn.queries - queries_before)
+        while not executor.execution_queue.empty():
+            executor.execution_queue.get_nowait()
+
+    return {
+        "followers": followers,
+        "leaders": leaders,
+        "ticks": ticks,
+        "queued": queued_total,
+        "queries_first_tick": queries_per_tick[0],
+        "queries_steady_tick": statistics.mean(queries_per_tick[1:] or [0]),
+        "legacy_queries_per_tick": 1 + 2 * followers,
+        "redis_calls": redis_client.calls,
+        "timing_signal_calls": intel.calls,
+        "p50_tick_ms": statistics.median(latencies) * 1000,
+        "max_tick_ms": max(latencies) * 1000,
+    }
+
+
+async def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Copy executor fan-out benchmark")
+    parser.add_argument("--followers", type=int, default=10_000)
+    parser.add_argument("--leaders", type=int, default=50)
+    parser.add_argument("--trades-per-leader", type=int, default=1)
+    parser.add_argument("--ticks", type=int, default=5)
+    args = parser.parse_args()
+
+    result = await run_benchmark(
+        args.followers, args.leaders, args.trades_per_leader, args.ticks
+    )
+
+    logger.info("📈 COPY FAN-OUT BENCHMARK")
+    logger.info("=" * 50)
+    for key, value in result.items():
+        if isinstance(value, float):
+            logger.info(f"  {key}: {value:.2f}")
+        else:
+            logger.info(f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark transaction build latency with the shared gas quote cache.
+
+Builds a burst of EIP-1559 transactions through TxBuilder against a node
+stand-in that sleeps for one round trip per ``eth_getBlock`` call and mines a
+block every ``--block-ms``. Runs once reading the latest header for every
+build (the previous behaviour) and once through GasQuoteCache, and counts
+header fetches for each.
+
+Usage:
+
+    python scripts/bench_gas_quotes.py --txs 500 --rtt-ms 20
+"""
+
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.blockchain.tx.builder import TxBuilder
+from src.blockchain.tx.gas_policy import GasPolicy, GasQuoteCache
+
+TO = "0x" + "cc" * 20
+FROM = "0x" + "bb" * 20
+
+
+class LatencyEth:
+    chain_id = 8453
+
+    def __init__(self, rtt_s: float, block_s: float):
+        self.rtt_s = rtt_s
+        self.block_s = block_s
+        self.started = time.monotonic()
+        self.calls = 0
+
+    def get_block(self, block_id):
+        self.calls += 1
+        time.sleep(self.rtt_s)
+        number = int((time.monotonic() - self.started) / self.block_s)
+        return {"number": number, "baseFeePerGas": 1_000_000_000 + number}
+
+
+class LatencyWeb3:
+    def __init__(self, rtt_s: float, block_s: float):
+        self.eth = LatencyEth(rtt_s, block_s)
+
+
+def run(txs: int, workers: int, rtt_s: float, block_s: float, cached: bool):
+    w3 = LatencyWeb3(rtt_s, block_s)
+    shared = GasQuoteCache(w3, block_time_s=block_s)
+    builder = TxBuilder(w3, w3.eth.chain_id, GasPolicy())
+
+    def cache_for(web3_client):
+        # A fresh cache per quote reproduces one header fetch per build
+        return shared if cached else GasQuoteCache(web3_client, block_s)
+
+    def build(i: int) -> float:
+        start = time.perf_counter()
+        builder.build_tx_params(
+            to=TO, data=i.to_bytes(4, "big"), from_addr=FROM, gas_limit_hint=300_000
+        )
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with patch.object(GasQuoteCache, "for_web3", side_effect=cache_for):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            latencies = sorted(pool.map(build, range(txs)))
+    elapsed = time.perf_counter() - start
+    return elapsed, latencies, w3.eth.calls
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gas quote cache benchmark")
+    parser.add_argument("--txs", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument(
+        "--rtt-ms", type=float, default=20, help="Node round trip per eth_getBlock"
+    )
+    parser.add_argument("--block-ms", type=float, default=2000, help="Block time")
+    args = parser.parse_args()
+
+    print(
+        f"\nTX BUILD LATENCY ({args.txs} txs, {args.workers} workers,"
+        f" {args.rtt_ms:g} ms RTT, {args.block_ms:g} ms blocks)"
+    )
+    print("=" * 60)
+    results = {}
+    for label, cached in (("per-build", False), ("cached", True)):
+        elapsed, latencies, calls = run(
+            args.txs, args.workers, args.rtt_ms / 1000, args.block_ms / 1000, cached
+        )
+        results[label] = elapsed
+        p50 = statistics.median(latencies) * 1000
+        p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+        print(
+            f"  {label:<10} {elapsed:7.2f}s  p50 {p50:7.2f} ms  p99 {p99:7.2f} ms"
+            f"  {calls:>5,} eth_getBlock calls"
+        )
+    print(f"  speedup:   {results['per-build'] / results['cached']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
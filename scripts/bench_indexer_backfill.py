@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Benchmark the Avantis indexer backfill.
+
+Backfills a synthetic chain from a provider stand-in that sleeps for one
+round trip per eth_getLogs call and rejects ranges returning too many logs.
+Compares the serial ``run_once`` loop with the concurrent ``backfill`` and
+checks both leave the sync_state watermark at the target block.
+
+Usage:
+
+    python scripts/bench_indexer_backfill.py --blocks 50000 --rtt-ms 150
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from web3 import Web3
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.database.models import Base
+from src.repositories.sync_state_repo import get_block, set_block
+from src.services.indexers.avantis_indexer import (
+    SYNC_NAME,
+    TRADING_CONTRACT,
+    backfill,
+    run_once,
+)
+
+
+class LatencyEth:
+    """eth namespace with a fixed round trip and a per-response log limit"""
+
+    def __init__(self, blocks: int, logs_per_block: float, limit: int, rtt_s: float):
+        address = Web3.to_checksum_address(TRADING_CONTRACT)
+        every = max(1, round(1 / logs_per_block)) if logs_per_block else 0
+        self.logs_by_block = {
+            b: [{"address": address, "blockNumber": b, "logIndex": 0}]
+            for b in range(1, blocks + 1)
+            if every and b % every == 0
+        }
+        self.block_number = blocks
+        self.limit = limit
+        self.rtt_s = rtt_s
+        self.calls = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def get_logs(self, params: dict) -> list[dict]:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.rtt_s)
+        logs = [
+            lg
+            for b in range(params["fromBlock"], params["toBlock"] + 1)
+            for lg in self.logs_by_block.get(b, ())
+        ]
+        if len(logs) > self.limit:
+            with self._lock:
+                self.rejected += 1
+            raise ValueError(
+                {"code": -32005, "message": f"query returned more than {self.limit}"}
+            )
+        return logs
+
+
+def fresh_sessions(start: int):
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    eng = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(eng)
+    SessionLocal = sessionmaker(bind=eng, expire_on_commit=False)
+    with SessionLocal() as db:
+        set_block(db, SYNC_NAME, start)
+    return SessionLocal
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Indexer backfill benchmark")
+    parser.add_argument("--blocks", type=int, default=50_000)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--logs-per-block", type=float, default=0.5)
+    parser.add_argument(
+        "--limit", type=int, default=10_000, help="Provider log limit per response"
+    )
+    parser.add_argument(
+        "--rtt-ms", type=float, default=150, help="Provider round trip per call"
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for label in ("serial", "backfill"):
+        eth = LatencyEth(
+            args.blocks + 2, args.logs_per_block, args.limit, args.rtt_ms / 1000
+        )
+        w3 = SimpleNamespace(eth=eth)
+        # Non-zero watermark so both paths start at block 1
+        SessionLocal = fresh_sessions(1)
+
+        start = time.perf_counter()
+        try:
+            if label == "serial":
+                while run_once(w3, None, SessionLocal):
+                    pass
+            else:
+                backfill(w3, None, SessionLocal, workers=args.workers)
+        except ValueError as e:
+            # The serial loop has no fallback for oversized ranges
+            print(f"  {label} stopped: {e}")
+        elapsed = time.perf_counter() - start
+
+        with SessionLocal() as db:
+            results[label] = (
+                elapsed,
+                eth.calls,
+                eth.rejected,
+                get_block(db, SYNC_NAME),
+            )
+
+    print(f"\nINDEXER BACKFILL ({args.blocks:,} blocks, {args.rtt_ms:g} ms RTT)")
+    print("=" * 50)
+    for label, (elapsed, calls, rejected, watermark) in results.items():
+        print(
+            f"  {label:<9} {elapsed:7.2f}s  {calls:>5} calls"
+            f" ({rejected} rejected)  watermark {watermark:,}"
+        )
+    if results["serial"][3] == results["backfill"][3]:
+        speedup = results["serial"][0] / results["backfill"][0]
+        print(f"  speedup:  {speedup:.1f}x with {args.workers} workers")
+
+
+if __name__ == "__main__":
+    main()
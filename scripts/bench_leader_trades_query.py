@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Microbenchmark for the batched leader-trade query used by the copy executor.
+
+Loads a SQLite stand-in of ``trade_events`` (1M rows by default) and compares
+the legacy access pattern, one query per watched leader, with the single
+watermark-join query issued by ``CopyExecutor._get_new_leader_trades``. SQLite
+has no ``unnest``, so the watermark list is passed as a ``VALUES`` table with
+the same join shape.
+
+Usage:
+
+    python scripts/bench_leader_trades_query.py --rows 1000000 --leaders 50
+"""
+
+import random
+import sqlite3
+import statistics
+import time
+from datetime import datetime, timedelta
+
+SCHEMA = """
+CREATE TABLE trade_events (
+    id INTEGER PRIMARY KEY,
+    address VARCHAR(42) NOT NULL,
+    pair VARCHAR(20),
+    is_long BOOLEAN,
+    size NUMERIC(20,8),
+    price NUMERIC(20,8),
+    leverage INTEGER,
+    event_type VARCHAR(10),
+    block_number BIGINT,
+    tx_hash VARCHAR(66),
+    timestamp TIMESTAMP
+);
+CREATE INDEX idx_trade_events_address_timestamp ON trade_events(address, timestamp);
+"""
+
+COLUMNS = (
+    "pair, is_long, size, price, leverage, timestamp, block_number, tx_hash, event_type"
+)
+
+
+def build_database(rows: int, addresses: int, now: datetime) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(SCHEMA)
+    rng = random.Random(42)
+    start = now - timedelta(days=30)
+    span = int(timedelta(days=30).total_seconds())
+
+    def generate():
+        for i in range(rows):
+            ts = start + timedelta(seconds=rng.randrange(span))
+            yield (
+                f"0x{rng.randrange(addresses):040x}",
+                str(rng.randrange(20)),
+                rng.random() < 0.5,
+                rng.random() * 10,
+                20000 + rng.random() * 50000,
+                rng.randrange(1, 50),
+                "OPENED" if rng.random() < 0.5 else "CLOSED",
+                i,
+                f"0x{i:064x}",
+                ts.isoformat(sep=" "),
+            )
+
+    conn.executemany(
+        "INSERT INTO trade_events (address, pair, is_long, size, price, leverage,"
+        " event_type, block_number, tx_hash, timestamp)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        generate(),
+    )
+    conn.commit()
+    return conn
+
+
+def per_leader(conn: sqlite3.Connection, since_by_leader: dict[str, str]) -> int:
+    found = 0
+    for leader, since in since_by_leader.items():
+        found += len(
+            conn.execute(
+                f"SELECT {COLUMNS} FROM trade_events"
+                " WHERE address = ? AND timestamp > ? AND event_type = 'OPENED'"
+                " ORDER BY timestamp ASC",
+                (leader, since),
+            ).fetchall()
+        )
+    return found
+
+
+def batched(conn: sqlite3.Connection, since_by_leader: dict[str, str]) -> int:
+    values = ", ".join("(?, ?)" for _ in since_by_leader)
+    params = [p for pair in since_by_leader.items() for p in pair]
+    rows = conn.execute(
+        f"WITH w(address, since) AS (VALUES {values})"
+        " SELECT te.address, "
+        + ", ".join(f"te.{c.strip()}" for c in COLUMNS.split(","))
+        + " FROM w JOIN trade_events te"
+        "   ON te.address = w.address AND te.timestamp > w.since"
+        " WHERE te.event_type = 'OPENED'"
+        " ORDER BY te.timestamp ASC",
+        params,
+    ).fetchall()
+    return len(rows)
+
+
+def time_it(fn, *args, repeats: int) -> tuple[float, int]:
+    samples = []
+    result = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn(*args)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), result
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Leader trade query benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--addresses", type=int, default=5_000)
+    parser.add_argument("--leaders", type=int, default=50)
+    parser.add_argument("--lookback-s", type=int, default=60)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument(
+        "--rtt-ms",
+        type=float,
+        default=1.0,
+        help="Database round-trip time added per query in the projected totals",
+    )
+    args = parser.parse_args()
+
+    now = datetime.utcnow()
+    print(f"Loading {args.rows:,} trade_events rows...")
+    load_start = time.perf_counter()
+    conn = build_database(args.rows, args.addresses, now)
+    print(f"  loaded in {time.perf_counter() - load_start:.1f}s")
+
+    since = (now - timedelta(seconds=args.lookback_s)).isoformat(sep=" ")
+    since_by_leader = {f"0x{i:040x}": since for i in range(args.leaders)}
+
+    legacy_s, legacy_rows = time_it(
+        per_leader, conn, since_by_leader, repeats=args.repeats
+    )
+    batched_s, batched_rows = time_it(
+        batched, conn, since_by_leader, repeats=args.repeats
+    )
+    assert legacy_rows == batched_rows, (legacy_rows, batched_rows)
+
+    print(f"\nLEADER TRADE QUERY ({args.leaders} leaders, {legacy_rows} new trades)")
+    print("=" * 50)
+    for label, round_trips, elapsed in (
+        ("per-leader", args.leaders, legacy_s),
+        ("batched", 1, batched_s),
+    ):
+        projected = elapsed * 1000 + round_trips * args.rtt_ms
+        print(
+            f"  {label:<10} {round_trips:>4} round trips, {elapsed * 1000:.2f} ms"
+            f" in-process, {projected:.2f} ms at {args.rtt_ms:g} ms RTT"
+        )
+
+
+if __name__ == "__main__":
+    main()
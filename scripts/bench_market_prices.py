@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark RPC calls per market-list render.
+
+Serves Chainlink aggregators and Multicall3 from an in-process JSON-RPC chain
+that sleeps for one round trip per request, then renders
+``AvantisService.list_markets`` for a synthetic catalog. The per-symbol path
+(``decimals()`` and ``latestRoundData()`` for each market) is compared with
+the single multicall snapshot.
+
+Usage:
+
+    python scripts/bench_market_prices.py --pairs 30 --rtt-ms 40
+"""
+
+import os
+import sys
+import time
+from dataclasses import replace
+
+from eth_abi import decode, encode
+from web3 import Web3
+from web3.providers import BaseProvider
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.adapters.price.aggregator import PriceAggregator
+from src.adapters.price.chainlink_adapter import (
+    DECIMALS_CALLDATA,
+    LATEST_ROUND_DATA_CALLDATA,
+    MULTICALL3_ADDRESS,
+    ROUND_DATA_TYPES,
+    ChainlinkAdapter,
+)
+from src.blockchain.avantis.service import AvantisService
+from src.services.markets.market_catalog import default_market_catalog
+
+
+class DevChain(BaseProvider):
+    """Local chain stand-in answering eth_call for feeds and Multicall3"""
+
+    def __init__(self, feeds: dict[str, int], rtt_s: float):
+        super().__init__()
+        self.feeds = {Web3.to_checksum_address(a): p for a, p in feeds.items()}
+        self.rtt_s = rtt_s
+        self.requests = 0
+
+    def make_request(self, method, params):
+        self.requests += 1
+        time.sleep(self.rtt_s)
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(8453)}
+
+        to = Web3.to_checksum_address(params[0]["to"])
+        data = bytes.fromhex(params[0]["data"][2:])
+        if to == Web3.to_checksum_address(MULTICALL3_ADDRESS):
+            _, calls = decode(["bool", "(address,bytes)[]"], data[4:])
+            out = encode(
+                ["uint256", "bytes32", "(bool,bytes)[]"],
+                [1, b"\x00" * 32, [self.call(t, d) for t, d in calls]],
+            )
+        else:
+            out = self.call(to, data)[1]
+        return {"jsonrpc": "2.0", "id": 1, "result": "0x" + out.hex()}
+
+    def call(self, target: str, calldata: bytes) -> tuple[bool, bytes]:
+        price = self.feeds[Web3.to_checksum_address(target)]
+        if calldata == DECIMALS_CALLDATA:
+            return True, encode(["uint8"], [8])
+        return True, encode(ROUND_DATA_TYPES, [1, price, 0, 0, 1])
+
+
+def build_service(pairs: int, rtt_s: float) -> tuple[AvantisService, DevChain]:
+    template = next(iter(default_market_catalog().values()))
+    symbols = [f"PAIR{i}-USD" for i in range(pairs)]
+    symbol_to_feed = {sym: "0x" + f"{i + 1:040x}" for i, sym in enumerate(symbols)}
+    chain = DevChain(
+        {addr: (i + 1) * 10**8 for i, addr in enumerate(symbol_to_feed.values())},
+        rtt_s,
+    )
+    price_agg = PriceAggregator([ChainlinkAdapter(Web3(chain), symbol_to_feed)])
+    service = AvantisService(Web3(chain), None, price_agg)
+    service.markets = {
+        sym: replace(template, symbol=sym, market_id=i) for i, sym in enumerate(symbols)
+    }
+    return service, chain
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Market list price benchmark")
+    parser.add_argument("--pairs", type=int, default=30)
+    parser.add_argument("--renders", type=int, default=5)
+    parser.add_argument(
+        "--rtt-ms", type=float, default=40, help="RPC round trip per request"
+    )
+    args = parser.parse_args()
+
+    service, chain = build_service(args.pairs, args.rtt_ms / 1000)
+
+    start = time.perf_counter()
+    for _ in range(args.renders):
+        per_symbol = {sym: service.price_agg.get_price(sym) for sym in service.markets}
+    per_symbol_s = (time.perf_counter() - start) / args.renders
+    per_symbol_calls = chain.requests / args.renders
+
+    chain.requests = 0
+    start = time.perf_counter()
+    for _ in range(args.renders):
+        views = service.list_markets()
+    snapshot_s = (time.perf_counter() - start) / args.renders
+    snapshot_calls = chain.requests / args.renders
+
+    mismatches = sum(
+        views[sym].price != (quote.price if quote else None)
+        for sym, quote in per_symbol.items()
+    )
+
+    print(f"\nMARKET LIST RENDER ({args.pairs} pairs, {args.rtt_ms:g} ms RTT)")
+    print("=" * 50)
+    print(f"  per-symbol: {per_symbol_calls:5.1f} RPC calls, {per_symbol_s:.3f}s")
+    print(f"  snapshot:   {snapshot_calls:5.1f} RPC calls, {snapshot_s:.3f}s")
+    print(f"  speedup:    {per_symbol_s / snapshot_s:.1f}x")
+    print(f"  mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
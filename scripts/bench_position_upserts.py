@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Benchmark indexer fill ingestion: per-row position upserts vs one bulk batch.
+
+Ingests ``--fills`` fills spread over ``--users`` wallets the way the indexer
+used to (add each fill, then upsert_position with its own SELECT, UPDATE and
+commit per fill) and through insert_fills + upsert_positions in a single
+transaction. Counts SQL statements and commits for each and checks both end
+with the same positions.
+
+Usage:
+
+    python scripts/bench_position_upserts.py --fills 5000 --users 500
+    python scripts/bench_position_upserts.py --db-url postgresql://...
+
+``--db-url`` must point at a scratch database: the indexed_fills and
+user_positions tables there are dropped and recreated for each run.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.database.models import Base, IndexedFill, UserPosition
+from src.repositories.positions_repo import (
+    PositionDelta,
+    insert_fills,
+    upsert_position,
+    upsert_positions,
+)
+
+
+def make_fills(n: int, users: int, rng: random.Random) -> list[dict]:
+    return [
+        {
+            "user_address": f"0x{rng.randrange(users):040x}",
+            "symbol": rng.choice(["BTC-USD", "ETH-USD", "SOL-USD"]),
+            "is_long": rng.random() < 0.5,
+            "usd_1e6": rng.randint(-2_000_000, 3_000_000),
+            "collateral_usdc_1e6": rng.randint(-500_000, 800_000),
+            "tx_hash": f"0x{i:064x}",
+            "block_number": i,
+        }
+        for i in range(n)
+    ]
+
+
+def per_row(db, fills: list[dict]) -> None:
+    for row in fills:
+        db.add(IndexedFill(**row))
+    db.commit()
+    for row in fills:
+        upsert_position(
+            db,
+            row["user_address"],
+            row["symbol"],
+            row["is_long"],
+            row["usd_1e6"],
+            row["collateral_usdc_1e6"],
+        )
+
+
+def bulk(db, fills: list[dict]) -> None:
+    insert_fills(db, [IndexedFill(**row) for row in fills], commit=False)
+    upsert_positions(
+        db,
+        [
+            PositionDelta(
+                row["user_address"],
+                row["symbol"],
+                row["is_long"],
+                row["usd_1e6"],
+                row["collateral_usdc_1e6"],
+            )
+            for row in fills
+        ],
+        commit=False,
+    )
+    db.commit()
+
+
+def run(db_url: str, ingest, fills: list[dict]):
+    eng = create_engine(db_url)
+    tables = [IndexedFill.__table__, UserPosition.__table__]
+    Base.metadata.drop_all(eng, tables=tables)
+    Base.metadata.create_all(eng, tables=tables)
+    counts = {"statements": 0, "commits": 0}
+    event.listen(
+        eng,
+        "before_cursor_execute",
+        lambda *args: counts.__setitem__("statements", counts["statements"] + 1),
+    )
+    event.listen(
+        eng,
+        "commit",
+        lambda *args: counts.__setitem__("commits", counts["commits"] + 1),
+    )
+    Session = sessionmaker(bind=eng, expire_on_commit=False)
+
+    with Session() as db:
+        start = time.perf_counter()
+        ingest(db, fills)
+        elapsed = time.perf_counter() - start
+        positions = sorted(
+            (
+                p.user_address,
+                p.symbol,
+                p.is_long,
+                p.size_usd_1e6,
+                p.entry_collateral_1e6,
+            )
+            for p in db.query(UserPosition)
+        )
+    eng.dispose()
+    return elapsed, counts, positions
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fill ingestion benchmark")
+    parser.add_argument("--fills", type=int, default=5_000)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--db-url", default=None, help="Database (default: SQLite)")
+    args = parser.parse_args()
+
+    fills = make_fills(args.fills, args.users, random.Random(11))
+    tmp = tempfile.mkdtemp()
+
+    print(f"\nFILL INGESTION ({args.fills:,} fills, {args.users:,} wallets)")
+    print("=" * 60)
+    results = {}
+    for label, ingest in (("per-row", per_row), ("bulk", bulk)):
+        db_url = args.db_url or f"sqlite:///{tmp}/{label}.db"
+        elapsed, counts, positions = run(db_url, ingest, fills)
+        results[label] = (elapsed, positions)
+        print(
+            f"  {label:<8} {elapsed:7.2f}s  {args.fills / elapsed:9,.0f} fills/s"
+            f"  {counts['statements']:>6,} statements  {counts['commits']:>5,} commits"
+        )
+    print(f"  speedup:  {results['per-row'][0] / results['bulk'][0]:.1f}x")
+    print(f"  same positions: {results['per-row'][1] == results['bulk'][1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark upstream price requests with and without the shared price bus.
+
+Runs N consumers (position monitor ticks, TP/SL checks, quote handlers) that
+each read a handful of symbols on their own cadence for a fixed duration,
+against an upstream that sleeps for one round trip per request. Without the
+bus every consumer asks upstream directly; with it, reads go through the
+bus's TTL'd last-value cache and concurrent refreshes share one request.
+
+Usage:
+
+    python scripts/bench_price_bus.py --consumers 50 --duration 3 --rtt-ms 40
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.services.price_bus import PriceBus
+
+SYMBOLS = ["BTC", "ETH", "SOL", "EUR", "XAU", "AERO", "CBBTC", "CBETH"]
+
+
+class Upstream:
+    def __init__(self, rtt_s: float):
+        self.rtt_s = rtt_s
+        self.requests = 0
+
+    async def fetch(self, symbols: list[str]) -> dict[str, float]:
+        self.requests += 1
+        await asyncio.sleep(self.rtt_s)
+        return {s: 100.0 + i for i, s in enumerate(symbols)}
+
+
+async def consumer(read, symbols: list[str], interval_s: float, until: float):
+    latencies = []
+    while time.perf_counter() < until:
+        start = time.perf_counter()
+        await read(symbols)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(interval_s)
+    return latencies
+
+
+async def run(args, use_bus: bool) -> tuple[int, list[float]]:
+    upstream = Upstream(args.rtt_ms / 1000)
+    if use_bus:
+        bus = PriceBus(ttl_s=args.ttl_s)
+        bus.register_source("upstream", upstream.fetch, SYMBOLS)
+        read = bus.get_many
+    else:
+        read = upstream.fetch
+
+    rng = random.Random(7)
+    until = time.perf_counter() + args.duration
+    latencies = await asyncio.gather(
+        *(
+            consumer(
+                read,
+                rng.sample(SYMBOLS, 3),
+                rng.uniform(0.05, 0.5),
+                until,
+            )
+            for _ in range(args.consumers)
+        )
+    )
+    return upstream.requests, [x for per in latencies for x in per]
+
+
+async def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Shared price bus benchmark")
+    parser.add_argument("--consumers", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=3)
+    parser.add_argument("--ttl-s", type=float, default=1.0)
+    parser.add_argument(
+        "--rtt-ms", type=float, default=40, help="Upstream round trip per request"
+    )
+    args = parser.parse_args()
+
+    results = {
+        "direct": await run(args, use_bus=False),
+        "bus": await run(args, use_bus=True),
+    }
+
+    print(
+        f"\nPRICE READS ({args.consumers} consumers, {args.duration:g}s,"
+        f" {args.rtt_ms:g} ms RTT, {args.ttl_s:g}s TTL)"
+    )
+    print("=" * 50)
+    for label, (requests, latencies) in results.items():
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2] * 1000
+        p99 = latencies[int(len(latencies) * 0.99)] * 1000
+        print(
+            f"  {label:<7} {requests:>6,} upstream requests for {len(latencies):,}"
+            f" reads, p50 {p50:6.1f} ms, p99 {p99:6.1f} ms"
+        )
+    print(f"  reduction: {results['direct'][0] / max(results['bus'][0], 1):.0f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
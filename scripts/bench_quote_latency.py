@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Benchmark trade quote latency against a mocked SDK.
+
+Every mocked SDK call sleeps ``--rtt-ms`` to stand in for one RPC round trip.
+Compares the previous quote_open (six SDK calls awaited one after another)
+with the concurrent AvantisPriceProvider.quote_open, and shows what a
+slippage-only re-render of the bot's quote card costs. The slippage button is
+pressed ``--think-s`` after the card appears, past the block cache, so the
+quote stored with the draft is what saves the calls.
+
+Usage:
+
+    python scripts/bench_quote_latency.py --rtt-ms 80 --rounds 5
+"""
+
+import asyncio
+import os
+import sys
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from avantis_trader_sdk.types import TradeInput
+
+from src.services.markets.avantis_price_provider import AvantisPriceProvider
+from src.services.trading import execution_service
+from src.services.trading.execution_service import ExecutionService
+from src.services.trading.trade_drafts import TradeDraft
+
+
+class MockSDK:
+    """SDK stand-in: each call costs one round trip and is counted."""
+
+    def __init__(self, rtt_s: float):
+        self.rtt_s = rtt_s
+        self.calls = 0
+
+        def rpc(value):
+            async def call(*args, **kwargs):
+                self.calls += 1
+                await asyncio.sleep(self.rtt_s)
+                return value
+
+            return call
+
+        tier = rpc(1)
+        percent = rpc(5)
+
+        async def loss_protection_for_trade_input(*args, **kwargs):
+            # Like the SDK: tier, then the tier's multiplier
+            await tier()
+            return SimpleNamespace(percentage=await percent(), amount=4.875)
+
+        self.pairs_cache = SimpleNamespace(
+            get_pair_index=rpc(1), get_pair_info=rpc(SimpleNamespace(base="ETH"))
+        )
+        self.fee_parameters = SimpleNamespace(get_opening_fee=rpc(2.5))
+        self.trading_parameters = SimpleNamespace(
+            get_loss_protection_tier=tier,
+            get_loss_protection_percentage_by_tier=percent,
+            get_loss_protection_for_trade_input=loss_protection_for_trade_input,
+        )
+        self.asset_parameters = SimpleNamespace(
+            get_pair_spread=rpc(0.01),
+            get_price_impact_spread=rpc(0.1),
+            get_skew_impact_spread=rpc(0.05),
+        )
+        self.tokens = SimpleNamespace(get_usdc=rpc(SimpleNamespace(address="0x1")))
+        trader = SimpleNamespace(get_address=rpc("0x2"))
+        self.get_trader_client = rpc(trader)
+        self.get_allowance = rpc(Decimal("1000000"))
+
+
+async def sequential_quote(client, pair, is_long, collateral, leverage):
+    """The previous quote_open: every call awaited in turn."""
+    pair_index = await client.pairs_cache.get_pair_index(pair)
+    position_size = collateral * leverage
+    trade_input = TradeInput(
+        trader="0x0000000000000000000000000000000000000000",
+        open_price=None,
+        pair_index=pair_index,
+        collateral_in_trade=collateral,
+        is_long=is_long,
+        leverage=leverage,
+        index=0,
+        tp=0,
+        sl=0,
+        timestamp=0,
+    )
+    fee = await client.fee_parameters.get_opening_fee(trade_input)
+    await client.trading_parameters.get_loss_protection_for_trade_input(
+        trade_input, opening_fee_usdc=fee
+    )
+    await client.asset_parameters.get_pair_spread(pair)
+    await client.asset_parameters.get_price_impact_spread(
+        position_size=position_size, is_long=is_long, pair=pair
+    )
+    await client.asset_parameters.get_skew_impact_spread(
+        position_size=position_size, is_long=is_long, pair=pair
+    )
+
+
+async def timed(sdk: MockSDK, coro) -> tuple[float, int]:
+    calls = sdk.calls
+    start = time.perf_counter()
+    await coro
+    return time.perf_counter() - start, sdk.calls - calls
+
+
+async def run(
+    rtt_s: float, rounds: int, think_s: float
+) -> dict[str, list[tuple[float, int]]]:
+    results: dict[str, list[tuple[float, int]]] = {}
+
+    def record(label, sample):
+        results.setdefault(label, []).append(sample)
+
+    for i in range(rounds):
+        sdk = MockSDK(rtt_s)
+        collateral = 100.0 + i
+        record(
+            "sequential quote",
+            await timed(sdk, sequential_quote(sdk, "ETH/USD", True, collateral, 10)),
+        )
+
+        provider = AvantisPriceProvider()
+        provider._client = sdk
+        record(
+            "provider: cold pair",
+            await timed(sdk, provider.quote_open("ETH/USD", True, collateral, 10)),
+        )
+        record(
+            "provider: new size",
+            await timed(sdk, provider.quote_open("ETH/USD", False, collateral, 5)),
+        )
+
+        for name in (
+            "pairs_cache",
+            "fee_parameters",
+            "trading_parameters",
+            "asset_parameters",
+            "tokens",
+            "get_trader_client",
+            "get_allowance",
+        ):
+            setattr(execution_service, name, getattr(sdk, name))
+        execution_service.SDK_AVAILABLE = True
+        service = ExecutionService(
+            SimpleNamespace(default_slippage_pct=1, trading_contract="0x3")
+        )
+        draft = TradeDraft(
+            user_id=1, pair="ETH/USD", side="LONG", leverage=10, collateral_usdc=100
+        )
+        record("bot quote: cold", await timed(sdk, service.quote_from_draft(draft)))
+        await asyncio.sleep(think_s)
+        record(
+            "bot quote: slippage",
+            await timed(
+                sdk, service.quote_from_draft(draft, Decimal("2"), reuse_quote=True)
+            ),
+        )
+    return results
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Quote latency benchmark")
+    parser.add_argument("--rtt-ms", type=float, default=80.0)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--think-s", type=float, default=3.0, help="delay before the slippage press"
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.rtt_ms / 1000, args.rounds, args.think_s))
+
+    print(f"\nQUOTE LATENCY (mocked SDK, {args.rtt_ms:g} ms per call)")
+    print("=" * 60)
+    mean = {}
+    for label, samples in results.items():
+        mean[label] = sum(s for s, _ in samples) / len(samples)
+        calls = sum(c for _, c in samples) / len(samples)
+        print(
+            f"  {label:<22} {mean[label] * 1000:8.1f} ms"
+            f"  {mean[label] * 1000 / args.rtt_ms:5.1f} RTT  {calls:4.1f} calls"
+        )
+    speedup = mean["sequential quote"] / mean["provider: new size"]
+    print(f"  speedup (new quote): {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
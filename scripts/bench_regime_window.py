@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark the rolling regime window used by MarketIntelligence.
+
+Simulates a full 24h window at a 1s cadence for many symbols, then measures
+the cost of one tick (push a price for every symbol and classify its regime).
+The legacy full-recompute path is measured on one symbol holding the same
+24h history and projected to the full symbol count; regime colors from both
+paths are checked for equality on every measured tick.
+
+Usage:
+
+    python scripts/bench_regime_window.py --symbols 100 --ticks 60
+"""
+
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.ai.market_intelligence import RegimeWindow
+
+VOLATILITY_THRESHOLDS = (0.3, 0.6)
+
+
+def regime_color(volatility: float) -> str:
+    if volatility < VOLATILITY_THRESHOLDS[0]:
+        return "green"
+    if volatility < VOLATILITY_THRESHOLDS[1]:
+        return "yellow"
+    return "red"
+
+
+class LegacyRegime:
+    """The pre-window algorithm: rebuild the 24h list and recompute each tick."""
+
+    def __init__(self):
+        self.prices: list[dict] = []
+        self.regime = "green"
+
+    def tick(self, price: float, now: datetime) -> str:
+        self.prices.append({"price": price, "timestamp": now})
+        cutoff = now - timedelta(hours=24)
+        self.prices = [p for p in self.prices if p["timestamp"] > cutoff]
+
+        prices = [p["price"] for p in self.prices]
+        if len(prices) < 20:
+            return self.regime
+        recent = prices[-12:]
+        returns = [np.log(recent[i] / recent[i - 1]) for i in range(1, len(recent))]
+        self.regime = regime_color(np.std(returns) * np.sqrt(720))
+        return self.regime
+
+
+class IncrementalRegime:
+    def __init__(self):
+        self.window = RegimeWindow()
+        self.regime = "green"
+
+    def tick(self, price: float, now: datetime) -> str:
+        self.window.push(price, now, now)
+        volatility = self.window.volatility()
+        if volatility is not None:
+            self.regime = regime_color(volatility)
+        return self.regime
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Regime window benchmark")
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--window-hours", type=float, default=24.0)
+    parser.add_argument("--ticks", type=int, default=60)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    history = int(args.window_hours * 3600)
+    start = datetime(2025, 1, 1)
+    walk = 100.0 * np.cumprod(1 + rng.normal(0, 0.002, history + args.ticks))
+
+    print(f"Prefilling {args.symbols} symbols with {history:,} points each...")
+    tracemalloc.start()
+    engines = [IncrementalRegime() for _ in range(args.symbols)]
+    for i in range(history):
+        now = start + timedelta(seconds=i)
+        for engine in engines:
+            engine.window.push(float(walk[i]), now, now)
+    incremental_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    legacy = LegacyRegime()
+    reference = IncrementalRegime()
+    for i in range(history):
+        now = start + timedelta(seconds=i)
+        legacy.prices.append({"price": float(walk[i]), "timestamp": now})
+        reference.window.push(float(walk[i]), now, now)
+
+    incremental_ticks = []
+    legacy_ticks = []
+    mismatches = 0
+    for t in range(args.ticks):
+        i = history + t
+        now = start + timedelta(seconds=i)
+        price = float(walk[i])
+
+        tick_start = time.perf_counter()
+        for engine in engines:
+            engine.tick(price, now)
+        incremental_ticks.append(time.perf_counter() - tick_start)
+
+        tick_start = time.perf_counter()
+        legacy_color = legacy.tick(price, now)
+        legacy_ticks.append((time.perf_counter() - tick_start) * args.symbols)
+
+        if legacy_color != reference.tick(price, now):
+            mismatches += 1
+
+    print(f"\nREGIME TICK COST ({args.symbols} symbols, 1s cadence)")
+    print("=" * 50)
+    print(f"  incremental: {statistics.median(incremental_ticks) * 1000:.2f} ms/tick")
+    print(
+        f"  legacy:      {statistics.median(legacy_ticks) * 1000:.2f} ms/tick"
+        " (projected from one symbol)"
+    )
+    print(f"  window memory: {incremental_bytes / args.symbols / 1024:.1f} KiB/symbol")
+    print(f"  legacy points/symbol: {len(legacy.prices):,}")
+    print(f"  regime mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Benchmark TP/SL evaluation cost per price update.
+
+Rests ``--orders`` long orders with TP/SL levels spread around the price and
+replays a random walk of ``--updates`` prices. Compares checking every order
+on each update (the previous executor tick) with crossing the TriggerBook,
+which only touches the levels each move passes.
+
+Usage:
+
+    python scripts/bench_tpsl_triggers.py --orders 50000 --updates 2000
+"""
+
+import os
+import random
+import sys
+import time
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.services.executors.trigger_book import RestingOrder, TriggerBook
+
+
+def make_orders(n: int, price: float, rng: random.Random) -> list[RestingOrder]:
+    return [
+        RestingOrder(
+            id=i,
+            tg_user_id=i % 5000,
+            symbol="BTC-USD",
+            is_long=True,
+            take_profit_price=price * (1 + rng.uniform(0.001, 0.2)),
+            stop_loss_price=price * (1 - rng.uniform(0.001, 0.2)),
+        )
+        for i in range(n)
+    ]
+
+
+def scan(orders: list[RestingOrder], prices: list[float]) -> tuple[float, int]:
+    active = {o.id: o for o in orders}
+    fired = 0
+    start = time.perf_counter()
+    for price in prices:
+        for order in list(active.values()):
+            if price >= order.take_profit_price or price <= order.stop_loss_price:
+                del active[order.id]
+                fired += 1
+    return time.perf_counter() - start, fired
+
+
+def book(orders: list[RestingOrder], prices: list[float]) -> tuple[float, int]:
+    trigger_book = TriggerBook()
+    for order in orders:
+        trigger_book.add(order)
+    fired = 0
+    start = time.perf_counter()
+    for price in prices:
+        fired += len(trigger_book.cross("BTC", price))
+    return time.perf_counter() - start, fired
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="TP/SL trigger benchmark")
+    parser.add_argument("--orders", type=int, default=50_000)
+    parser.add_argument("--updates", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    price = 65_000.0
+    orders = make_orders(args.orders, price, rng)
+    prices = []
+    for _ in range(args.updates):
+        price *= 1 + rng.gauss(0, 0.0005)
+        prices.append(price)
+
+    print(f"\nTP/SL EVALUATION ({args.orders:,} orders, {args.updates:,} prices)")
+    print("=" * 60)
+    results = {}
+    for label, run in (("scan", scan), ("book", book)):
+        elapsed, fired = run(orders, prices)
+        results[label] = elapsed
+        per_update = elapsed / args.updates * 1e6
+        print(
+            f"  {label:<5} {elapsed:8.3f}s  {per_update:9.1f} us/update"
+            f"  {fired:>6,} fired"
+        )
+    print(f"  speedup: {results['scan'] / results['book']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
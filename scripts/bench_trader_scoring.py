@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark batch trader scoring in TraderAnalyzer.
+
+Builds a synthetic leaderboard and scores it with ``analyze_traders`` (one
+columnar feature pass and one call per model) and with ``analyze_trader`` per
+address. The per-trader path is timed on a sample and projected to the full
+population unless ``--legacy-sample 0`` is given; every sampled result is
+checked against the batch output.
+
+Usage:
+
+    python scripts/bench_trader_scoring.py --traders 5000 --trades 200
+"""
+
+import asyncio
+import math
+import os
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.ai.trader_analyzer import TraderAnalyzer
+from src.analytics.position_tracker import TraderStats
+
+
+def build_traders(count: int, trades_per_trader: int, seed: int = 7) -> list[tuple]:
+    rng = np.random.default_rng(seed)
+    now = datetime.utcnow()
+    traders = []
+    for i in range(count):
+        address = f"0x{i:040x}"
+        n_trades = int(rng.integers(trades_per_trader // 2, trades_per_trader * 3 // 2))
+        minutes = rng.integers(0, 30 * 24 * 60, n_trades)
+        opened = rng.random(n_trades) < 0.55
+        trades = [
+            {
+                "pair": f"PAIR{rng.integers(0, 12)}",
+                "is_long": bool(rng.random() < 0.6),
+                "size": float(rng.uniform(0.1, 5)),
+                "price": float(rng.uniform(10, 60_000)),
+                "leverage": int(rng.integers(1, 50)),
+                "timestamp": now - timedelta(minutes=int(minutes[j])),
+                "event_type": "OPENED" if opened[j] else "CLOSED",
+                "pnl": 0.0 if opened[j] else float(rng.normal(10, 100)),
+            }
+            for j in range(n_trades)
+        ]
+        stats = TraderStats(
+            address=address,
+            last_30d_volume_usd=float(rng.uniform(1_000, 5_000_000)),
+            median_trade_size_usd=float(rng.uniform(100, 50_000)),
+            trade_count_30d=n_trades,
+            realized_pnl_clean_usd=float(rng.normal(0, 50_000)),
+            last_trade_at=now,
+            maker_ratio=float(rng.random()),
+            unique_symbols=int(rng.integers(1, 12)),
+            win_rate=float(rng.random()),
+        )
+        traders.append((address, stats, trades))
+    return traders
+
+
+def matches(batch, single) -> bool:
+    for field, value in asdict(single).items():
+        other = getattr(batch, field)
+        if isinstance(value, float):
+            if not math.isclose(other, value, rel_tol=1e-9, abs_tol=1e-12) and not (
+                math.isnan(value) and math.isnan(other)
+            ):
+                return False
+        elif other != value:
+            return False
+    return True
+
+
+async def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Trader batch scoring benchmark")
+    parser.add_argument("--traders", type=int, default=5_000)
+    parser.add_argument("--trades", type=int, default=200)
+    parser.add_argument(
+        "--legacy-sample",
+        type=int,
+        default=200,
+        help="Traders scored per-trader and projected (0 = score all of them)",
+    )
+    args = parser.parse_args()
+
+    print(f"Building {args.traders:,} traders (~{args.trades} trades each)...")
+    traders = build_traders(args.traders, args.trades)
+    total_trades = sum(len(t[2]) for t in traders)
+
+    # Model training writes ./models; keep it out of the working tree
+    os.chdir(tempfile.mkdtemp())
+    analyzer = TraderAnalyzer(config=None)
+    await analyzer._train_models()
+
+    start = time.perf_counter()
+    batch = await analyzer.analyze_traders(traders)
+    batch_s = time.perf_counter() - start
+
+    sample = traders if args.legacy_sample <= 0 else traders[: args.legacy_sample]
+    start = time.perf_counter()
+    single = [await analyzer.analyze_trader(*trader) for trader in sample]
+    legacy_s = (time.perf_counter() - start) * len(traders) / len(sample)
+    mismatches = sum(not matches(b, s) for b, s in zip(batch, single))
+
+    print(f"\nTRADER SCORING ({args.traders:,} traders, {total_trades:,} trades)")
+    print("=" * 50)
+    print(f"  batch:       {batch_s:.2f}s")
+    projected = (
+        "" if len(sample) == len(traders) else f" (projected from {len(sample)})"
+    )
+    print(f"  per-trader:  {legacy_s:.2f}s{projected}")
+    print(f"  speedup:     {legacy_s / batch_s:.1f}x")
+    print(f"  mismatches:  {mismatches} of {len(sample)} compared")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
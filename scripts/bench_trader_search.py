@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark partial-address trader search at leaderboard scale.
+
+Loads ``--traders`` random addresses with a 30d volume into an in-memory
+SQLite table standing in for ``trader_stats``. The previous search ran
+``address ILIKE '%query%' ORDER BY last_30d_volume_usd DESC LIMIT n``, which
+has to scan every row; SQLite's case-insensitive LIKE does the same scan
+here. That is compared with AddressIndex prefix and infix lookups, and every
+index result is checked against the scan.
+
+Usage:
+
+    python scripts/bench_trader_search.py --traders 1000000 --queries 50
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import time
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.copy_trading.address_index import AddressIndex
+
+
+def make_traders(count: int, seed: int) -> list[tuple[str, float]]:
+    rng = random.Random(seed)
+    return [
+        (f"0x{rng.getrandbits(160):040x}", rng.lognormvariate(10, 2))
+        for _ in range(count)
+    ]
+
+
+def make_queries(addresses: list[str], count: int, seed: int) -> dict[str, list[str]]:
+    rng = random.Random(seed)
+    queries: dict[str, list[str]] = {"prefix": [], "infix": []}
+    for _ in range(count):
+        address = rng.choice(addresses)
+        queries["prefix"].append(address[: rng.randint(6, 10)])
+        start = rng.randint(2, 34)
+        queries["infix"].append(address[start : start + rng.randint(4, 8)])
+    return queries
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Trader address search benchmark")
+    parser.add_argument("--traders", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    traders = make_traders(args.traders, args.seed)
+
+    db = sqlite3.connect(":memory:")
+    db.execute("CREATE TABLE trader_stats (address TEXT, last_30d_volume_usd REAL)")
+    db.execute("CREATE INDEX idx_volume ON trader_stats (last_30d_volume_usd)")
+    db.executemany("INSERT INTO trader_stats VALUES (?, ?)", traders)
+
+    start = time.perf_counter()
+    ranked = [
+        row[0]
+        for row in db.execute(
+            "SELECT address FROM trader_stats ORDER BY last_30d_volume_usd DESC"
+        )
+    ]
+    index = AddressIndex(ranked)
+    build_s = time.perf_counter() - start
+
+    queries = make_queries(ranked, args.queries, args.seed + 1)
+
+    def scan(query):
+        # The previous query: both kinds of search used ILIKE '%query%'
+        return [
+            row[0]
+            for row in db.execute(
+                "SELECT address FROM trader_stats WHERE address LIKE ? "
+                "ORDER BY last_30d_volume_usd DESC LIMIT ?",
+                (f"%{query}%", args.limit),
+            )
+        ]
+
+    mismatches = 0
+    results = {}
+    for kind, batch in queries.items():
+        for label, search in (("full scan", scan), ("index", index.search)):
+            start = time.perf_counter()
+            found = [search(q) for q in batch]
+            results[(kind, label)] = (time.perf_counter() - start) / len(batch)
+            if label == "full scan":
+                expected = found
+            else:
+                mismatches += sum(a != b for a, b in zip(found, expected))
+
+    print(f"\nTRADER ADDRESS SEARCH ({args.traders:,} traders, limit {args.limit})")
+    print("=" * 60)
+    print(f"  index build (ranked load + index) {build_s:8.2f} s")
+    for kind in queries:
+        scan_ms = results[(kind, "full scan")] * 1000
+        index_ms = results[(kind, "index")] * 1000
+        print(f"  {kind:<7} full scan  {scan_ms:10.2f} ms/query")
+        print(f"  {kind:<7} index      {index_ms:10.3f} ms/query")
+        print(f"  {kind:<7} speedup    {scan_ms / index_ms:10.0f}x")
+    print(f"  mismatches vs full scan: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""Benchmark the TraderStats refresh in PositionTracker.
+
+Runs ``PositionTracker._update_trader_stats`` against in-process database and
+Redis stand-ins holding a synthetic 30-day window (20k traders and 2M trade
+events by default). The first refresh is the full single-pass rebuild; a
+second tick after a few hundred traders trade in a new block measures the
+incremental path. The legacy per-trader path (one query, FIFO pass, Redis
+write and upsert per address) is timed on a sample of traders, projected to
+the full population and checked against the rebuilt results.
+
+Usage:
+
+    python scripts/bench_trader_stats_refresh.py --traders 20000 --events 2000000
+"""
+
+import asyncio
+import math
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.analytics.position_tracker import PositionTracker
+
+PAIRS = [f"PAIR{i}" for i in range(30)]
+
+
+def build_window(traders: int, events: int, seed: int = 7) -> list[dict]:
+    """Trade rows ordered by address then timestamp, as the window query returns"""
+    rng = np.random.default_rng(seed)
+    start = datetime.utcnow() - timedelta(days=30)
+    owner = np.sort(rng.integers(0, traders, events))
+    seconds = rng.integers(0, 30 * 24 * 3600, events)
+    order = np.lexsort((seconds, owner))
+    owner, seconds = owner[order], seconds[order]
+    pair = rng.integers(0, len(PAIRS), events)
+    is_long = rng.random(events) < 0.5
+    size = rng.uniform(0.1, 5, events).round(2)
+    price = rng.uniform(10, 60_000, events).round(2)
+    opened = rng.random(events) < 0.5
+    fee = rng.uniform(0, 2, events).round(4)
+
+    addresses = [f"0x{i:040x}" for i in range(traders)]
+    return [
+        {
+            "address": addresses[o],
+            "pair": PAIRS[p],
+            "is_long": bool(lg),
+            "size": float(sz),
+            "price": float(px),
+            "leverage": 10,
+            "event_type": "OPENED" if op else "CLOSED",
+            "timestamp": start + timedelta(seconds=int(s)),
+            "fee": float(f),
+            "block_number": 1 + int(s) // 2,
+        }
+        for o, s, p, lg, sz, px, op, f in zip(
+            owner.tolist(),
+            seconds.tolist(),
+            pair.tolist(),
+            is_long.tolist(),
+            size.tolist(),
+            price.tolist(),
+            opened.tolist(),
+            fee.tolist(),
+        )
+    ]
+
+
+class MemoryConnection:
+    """Database stand-in serving the tracker's trade_events queries from memory"""
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.by_address: dict[str, list[dict]] = {}
+        for row in rows:
+            self.by_address.setdefault(row["address"], []).append(row)
+        self.blocks = np.array([row["block_number"] for row in rows])
+        self.sync = None
+        self.round_trips = 0
+
+    def add_rows(self, new_rows: list[dict]):
+        for row in new_rows:
+            self.by_address.setdefault(row["address"], []).append(row)
+        self.rows.extend(new_rows)
+        self.blocks = np.append(self.blocks, [row["block_number"] for row in new_rows])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def transaction(self):
+        return self
+
+    async def fetchval(self, query: str, *args):
+        self.round_trips += 1
+        return int(self.blocks.max())
+
+    async def fetchrow(self, query: str, *args):
+        self.round_trips += 1
+        return self.sync
+
+    async def fetch(self, query: str, *args):
+        self.round_trips += 1
+        if "WHERE address = $1" in query:
+            return self.by_address.get(args[0], [])
+        if "WITH changed" in query:
+            # Nothing ages out between the benchmark's ticks, so only the
+            # block range selects traders
+            last_block, head = args[0], args[1]
+            hits = np.flatnonzero((self.blocks > last_block) & (self.blocks <= head))
+            changed = sorted({self.rows[i]["address"] for i in hits})
+            return [row for a in changed for row in self.by_address[a]]
+        return self.rows
+
+    async def execute(self, query: str, *args):
+        self.round_trips += 1
+        if "INSERT INTO trader_stats_sync" in query:
+            self.sync = {"last_block": args[1], "window_start": args[2]}
+
+
+class MemoryPool:
+    def __init__(self, conn: MemoryConnection):
+        self.conn = conn
+
+    async def acquire(self):
+        return self.conn
+
+
+class MemoryPipeline:
+    def __init__(self, redis_client):
+        self.redis = redis_client
+
+    def hset(self, key, mapping):
+        self.redis.data[key] = mapping
+
+    def expire(self, key, ttl):
+        pass
+
+    def delete(self, *keys):
+        for key in keys:
+            self.redis.data.pop(key, None)
+
+    async def execute(self):
+        self.redis.round_trips += 1
+
+
+class MemoryRedis:
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.data.get(key)
+
+    def pipeline(self):
+        return MemoryPipeline(self)
+
+    async def hset(self, key, mapping):
+        self.round_trips += 1
+        self.data[key] = mapping
+
+    async def expire(self, key, ttl):
+        self.round_trips += 1
+
+
+async def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="TraderStats refresh benchmark")
+    parser.add_argument("--traders", type=int, default=20_000)
+    parser.add_argument("--events", type=int, default=2_000_000)
+    parser.add_argument("--legacy-sample", type=int, default=500)
+    parser.add_argument(
+        "--changed-traders",
+        type=int,
+        default=300,
+        help="Traders with a new event in the incremental tick",
+    )
+    parser.add_argument(
+        "--rtt-ms",
+        type=float,
+        default=0.5,
+        help="Database/Redis round-trip time added per call in the projected totals",
+    )
+    args = parser.parse_args()
+
+    print(f"Building {args.events:,} events for {args.traders:,} traders...")
+    rows = build_window(args.traders, args.events)
+    conn = MemoryConnection(rows)
+    redis_client = MemoryRedis()
+    tracker = PositionTracker(MemoryPool(conn), redis_client, None)
+
+    start = time.perf_counter()
+    await tracker._update_trader_stats()
+    refresh_s = time.perf_counter() - start
+    batch_round_trips = conn.round_trips + redis_client.round_trips
+
+    start = time.perf_counter()
+    batch = {s.address: s for s in tracker._calculate_all_trader_stats(rows)}
+    compute_s = time.perf_counter() - start
+
+    # Legacy path: per-address query, stats pass and write-back
+    sample = list(conn.by_address)[: args.legacy_sample]
+    mismatches = 0
+    since = conn.sync["window_start"]
+    start = time.perf_counter()
+    for address in sample:
+        stats = await tracker._calculate_trader_stats(address, since)
+        sync = conn.sync
+        await tracker._persist_stats_delta(
+            [stats], [], sync["last_block"], sync["window_start"]
+        )
+        expected = batch[address]
+        if not (
+            math.isclose(
+                stats.realized_pnl_clean_usd,
+                expected.realized_pnl_clean_usd,
+                rel_tol=1e-9,
+                abs_tol=1e-6,
+            )
+            and math.isclose(
+                stats.last_30d_volume_usd, expected.last_30d_volume_usd, rel_tol=1e-12
+            )
+            and stats.median_trade_size_usd == expected.median_trade_size_usd
+            and stats.trade_count_30d == expected.trade_count_30d
+        ):
+            mismatches += 1
+    scale = len(batch) / len(sample)
+    legacy_s = (time.perf_counter() - start) * scale
+    # DISTINCT query, then trades query, HSET, EXPIRE and upsert per trader
+    legacy_round_trips = 1 + 4 * len(batch)
+
+    # Incremental tick: a few hundred traders trade in the next block
+    head = int(conn.blocks.max()) + 1
+    now = datetime.utcnow()
+    conn.add_rows(
+        [
+            {**conn.by_address[address][-1], "timestamp": now, "block_number": head}
+            for address in list(conn.by_address)[: args.changed_traders]
+        ]
+    )
+    redis_client.data[PositionTracker.INDEXER_WATERMARK_KEY] = str(head)
+    round_trips_before = conn.round_trips + redis_client.round_trips
+    start = time.perf_counter()
+    await tracker._update_trader_stats()
+    incremental_s = time.perf_counter() - start
+    incremental_round_trips = (
+        conn.round_trips + redis_client.round_trips - round_trips_before
+    )
+
+    print(f"\nTRADER STATS REFRESH ({len(batch):,} traders, {args.events:,} events)")
+    print("=" * 50)
+    print(f"  compute (single pass): {compute_s:.2f}s")
+    print(f"  incremental tick: {args.changed_traders} changed traders")
+    for label, elapsed, round_trips in (
+        ("rebuild", refresh_s, batch_round_trips),
+        ("incremental", incremental_s, incremental_round_trips),
+        ("per-trader", legacy_s, legacy_round_trips),
+    ):
+        projected = elapsed + round_trips * args.rtt_ms / 1000
+        print(
+            f"  {label:<11} {round_trips:>7,} round trips, {elapsed:.2f}s in-process,"
+            f" {projected:.2f}s at {args.rtt_ms:g} ms RTT"
+        )
+    print(f"  per-trader figures projected from {len(sample)} traders")
+    print(f"  mismatches: {mismatches} of {len(sample)} compared")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,15 +1,29 @@
 #!/usr/bin/env python3
-"""Load testing script for nonce reservation under high concurrency."""
+"""Load testing script for nonce reservation under high concurrency.
+
+Measures throughput and reservation latency (p50/p99) with many concurrent
+reservers for one address against a local Redis, and checks that every
+reserved nonce is unique and the sequence has no gaps after releases.
+``redis_lock`` replays the previous lock + GET + SET reservation for
+comparison.
+
+Usage:
+
+    python scripts/load_test_nonce.py --store-type all --requests 5000 --concurrency 500
+"""
 
 import asyncio
 import os
 import statistics
 import sys
 import time
+from contextlib import asynccontextmanager
 from typing import Any
 
+import redis.asyncio as redis
+
 # Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 from src.blockchain.tx.nonce_manager import NonceManager
 from src.blockchain.tx.nonce_store import (
@@ -21,43 +35,83 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+ADDRESS = "0x00000000000000000000000000000000000A11CE"
+
+
+class _ChainStub:
+    """Pending nonce source so no RPC node is needed."""
+
+    class eth:  # noqa: N801 - mirrors web3.eth
+        @staticmethod
+        def get_transaction_count(address, state):
+            return 0
+
+
+class _LockingRedisNonceStore:
+    """Previous reservation flow: lock, GET, SET, unlock (four round trips)."""
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+
+    @asynccontextmanager
+    async def reserve(self, address: str):
+        key = f"nonce-bench-lock:{address.lower()}"
+        async with self.redis.lock(f"{key}:lock", timeout=5, blocking_timeout=5):
+            cached = await self.redis.get(key)
+            nonce = int(cached) if cached is not None else 0
+            await self.redis.set(key, nonce + 1, ex=300)
+        yield nonce
+
 
 class NonceLoadTester:
     """Load tester for nonce reservation system."""
 
-    def __init__(self, redis_url: str = "redis://localhost:6379"):
+    def __init__(
+        self, redis_url: str = "redis://localhost:6379", release_rate: float = 0.0
+    ):
         self.redis_url = redis_url
+        self.release_rate = release_rate
         self.results: list[dict[str, Any]] = []
 
-    async def test_in_memory_store(
-        self, num_requests: int = 1000, concurrency: int = 50
-    ):
-        """Test in-memory nonce store under load."""
-        logger.info(
-            f"Testing in-memory store: {num_requests} requests, {concurrency} concurrent"
+    async def _fresh_redis(self):
+        client = redis.from_url(self.redis_url)
+        await client.delete(
+            f"nonce:{ADDRESS.lower()}",
+            f"nonce:{ADDRESS.lower()}:released",
+            f"nonce-bench-lock:{ADDRESS.lower()}",
         )
+        return client
 
-        store = InMemoryNonceStore()
-        manager = NonceManager(store)
-
-        start_time = time.time()
+    async def _run_load(
+        self, store_type: str, store, num_requests: int, concurrency: int
+    ) -> dict[str, Any]:
+        """Reserve num_requests nonces with concurrency reservers at a time."""
+        logger.info(
+            f"Testing {store_type} store: {num_requests} requests, {concurrency} concurrent"
+        )
+        latencies: list[float] = []
+        released = 0
 
         async def reserve_nonce(request_id: int):
+            nonlocal released
+            fail_first = (
+                self.release_rate > 0
+                and hasattr(store, "release")
+                and request_id % round(1 / self.release_rate) == 0
+            )
             try:
-                async with manager.reserve() as nonce:
-                    return {
-                        "request_id": request_id,
-                        "nonce": nonce,
-                        "success": True,
-                        "error": None,
-                    }
+                while True:
+                    start = time.perf_counter()
+                    async with store.reserve(ADDRESS) as nonce:
+                        latencies.append(time.perf_counter() - start)
+                    if not fail_first:
+                        return {"nonce": nonce, "success": True, "error": None}
+                    # The send "fails": hand the nonce back and retry
+                    fail_first = False
+                    released += 1
+                    await store.release(ADDRESS, nonce)
             except Exception as e:
-                return {
-                    "request_id": request_id,
-                    "nonce": None,
-                    "success": False,
-                    "error": str(e),
-                }
+                return {"nonce": None, "success": False, "error": str(e)}
 
         # Create semaphore to limit concurrency
         semaphore = asyncio.Semaphore(concurrency)
@@ -66,229 +120,101 @@ class NonceLoadTester:
             async with semaphore:
                 return await reserve_nonce(request_id)
 
-        # Run concurrent requests
-        tasks = [limited_reserve(i) for i in range(num_requests)]
-        results = await asyncio.gather(*tasks)
-
-        end_time = time.time()
-        duration = end_time - start_time
+        start_time = time.perf_counter()
+        results = await asyncio.gather(
+            *(limited_reserve(i) for i in range(num_requests))
+        )
+        duration = time.perf_counter() - start_time
 
         # Analyze results
         successful = [r for r in results if r["success"]]
         failed = [r for r in results if not r["success"]]
-
-        nonces = [r["nonce"] for r in successful]
+        nonces = sorted(r["nonce"] for r in successful if r["nonce"] is not None)
         nonce_collisions = len(nonces) - len(set(nonces))
+        gaps = (nonces[-1] - nonces[0] + 1 - len(set(nonces))) if nonces else 0
 
-        logger.info("In-memory results:")
-        logger.info(f"  Total requests: {num_requests}")
-        logger.info(f"  Successful: {len(successful)}")
-        logger.info(f"  Failed: {len(failed)}")
-        logger.info(f"  Nonce collisions: {nonce_collisions}")
-        logger.info(f"  Duration: {duration:.2f}s")
-        logger.info(f"  Requests/sec: {num_requests / duration:.2f}")
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2] * 1000 if latencies else 0.0
+        p99 = latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0
 
+        logger.info(f"{store_type} results:")
+        logger.info(f"  Successful: {len(successful)}  Failed: {len(failed)}")
+        logger.info(f"  Nonce collisions: {nonce_collisions}  Gaps: {gaps}")
+        logger.info(f"  Latency p50: {p50:.2f} ms  p99: {p99:.2f} ms")
+        logger.info(f"  Requests/sec: {num_requests / duration:.2f}")
         if failed:
             logger.warning(f"  Errors: {[f['error'] for f in failed[:5]]}")
 
         return {
-            "store_type": "in_memory",
+            "store_type": store_type,
             "total_requests": num_requests,
+            "concurrency": concurrency,
             "successful": len(successful),
             "failed": len(failed),
+            "released": released,
             "nonce_collisions": nonce_collisions,
+            "gaps": gaps,
             "duration": duration,
+            "p50_ms": p50,
+            "p99_ms": p99,
             "requests_per_sec": num_requests / duration,
             "success_rate": len(successful) / num_requests,
         }
 
-    async def test_redis_store(self, num_requests: int = 1000, concurrency: int = 50):
-        """Test Redis nonce store under load."""
-        logger.info(
-            f"Testing Redis store: {num_requests} requests, {concurrency} concurrent"
+    async def test_in_memory_store(
+        self, num_requests: int = 1000, concurrency: int = 50
+    ):
+        """Test in-memory nonce store under load."""
+        return await self._run_load(
+            "in_memory", InMemoryNonceStore(), num_requests, concurrency
         )
 
+    async def test_redis_store(self, num_requests: int = 1000, concurrency: int = 50):
+        """Test Redis nonce store under load."""
         try:
-            store = RedisNonceStore(self.redis_url)
-            manager = NonceManager(store)
-
-            start_time = time.time()
-
-            async def reserve_nonce(request_id: int):
-                try:
-                    async with manager.reserve() as nonce:
-                        return {
-                            "request_id": request_id,
-                            "nonce": nonce,
-                            "success": True,
-                            "error": None,
-                        }
-                except Exception as e:
-                    return {
-                        "request_id": request_id,
-                        "nonce": None,
-                        "success": False,
-                        "error": str(e),
-                    }
-
-            # Create semaphore to limit concurrency
-            semaphore = asyncio.Semaphore(concurrency)
-
-            async def limited_reserve(request_id: int):
-                async with semaphore:
-                    return await reserve_nonce(request_id)
-
-            # Run concurrent requests
-            tasks = [limited_reserve(i) for i in range(num_requests)]
-            results = await asyncio.gather(*tasks)
-
-            end_time = time.time()
-            duration = end_time - start_time
-
-            # Analyze results
-            successful = [r for r in results if r["success"]]
-            failed = [r for r in results if not r["success"]]
-
-            nonces = [r["nonce"] for r in successful]
-            nonce_collisions = len(nonces) - len(set(nonces))
-
-            logger.info("Redis results:")
-            logger.info(f"  Total requests: {num_requests}")
-            logger.info(f"  Successful: {len(successful)}")
-            logger.info(f"  Failed: {len(failed)}")
-            logger.info(f"  Nonce collisions: {nonce_collisions}")
-            logger.info(f"  Duration: {duration:.2f}s")
-            logger.info(f"  Requests/sec: {num_requests / duration:.2f}")
-
-            if failed:
-                logger.warning(f"  Errors: {[f['error'] for f in failed[:5]]}")
-
-            return {
-                "store_type": "redis",
-                "total_requests": num_requests,
-                "successful": len(successful),
-                "failed": len(failed),
-                "nonce_collisions": nonce_collisions,
-                "duration": duration,
-                "requests_per_sec": num_requests / duration,
-                "success_rate": len(successful) / num_requests,
-            }
-
+            client = await self._fresh_redis()
+            store = RedisNonceStore(client, _ChainStub())
+            return await self._run_load("redis", store, num_requests, concurrency)
         except Exception as e:
             logger.error(f"Redis store test failed: {e}")
             return {"store_type": "redis", "error": str(e), "success_rate": 0}
 
+    async def test_redis_lock_store(
+        self, num_requests: int = 1000, concurrency: int = 50
+    ):
+        """Test the previous lock-based Redis reservation under load."""
+        try:
+            client = await self._fresh_redis()
+            store = _LockingRedisNonceStore(client)
+            return await self._run_load("redis_lock", store, num_requests, concurrency)
+        except Exception as e:
+            logger.error(f"Redis lock store test failed: {e}")
+            return {"store_type": "redis_lock", "error": str(e), "success_rate": 0}
+
     async def test_hybrid_store(self, num_requests: int = 1000, concurrency: int = 50):
         """Test hybrid nonce store under load."""
-        logger.info(
-            f"Testing hybrid store: {num_requests} requests, {concurrency} concurrent"
-        )
-
         try:
-            store = HybridNonceStore(self.redis_url)
-            manager = NonceManager(store)
-
-            start_time = time.time()
-
-            async def reserve_nonce(request_id: int):
-                try:
-                    async with manager.reserve() as nonce:
-                        return {
-                            "request_id": request_id,
-                            "nonce": nonce,
-                            "success": True,
-                            "error": None,
-                        }
-                except Exception as e:
-                    return {
-                        "request_id": request_id,
-                        "nonce": None,
-                        "success": False,
-                        "error": str(e),
-                    }
-
-            # Create semaphore to limit concurrency
-            semaphore = asyncio.Semaphore(concurrency)
-
-            async def limited_reserve(request_id: int):
-                async with semaphore:
-                    return await reserve_nonce(request_id)
-
-            # Run concurrent requests
-            tasks = [limited_reserve(i) for i in range(num_requests)]
-            results = await asyncio.gather(*tasks)
-
-            end_time = time.time()
-            duration = end_time - start_time
-
-            # Analyze results
-            successful = [r for r in results if r["success"]]
-            failed = [r for r in results if not r["success"]]
-
-            nonces = [r["nonce"] for r in successful]
-            nonce_collisions = len(nonces) - len(set(nonces))
-
-            logger.info("Hybrid results:")
-            logger.info(f"  Total requests: {num_requests}")
-            logger.info(f"  Successful: {len(successful)}")
-            logger.info(f"  Failed: {len(failed)}")
-            logger.info(f"  Nonce collisions: {nonce_collisions}")
-            logger.info(f"  Duration: {duration:.2f}s")
-            logger.info(f"  Requests/sec: {num_requests / duration:.2f}")
-
-            if failed:
-                logger.warning(f"  Errors: {[f['error'] for f in failed[:5]]}")
-
-            return {
-                "store_type": "hybrid",
-                "total_requests": num_requests,
-                "successful": len(successful),
-                "failed": len(failed),
-                "nonce_collisions": nonce_collisions,
-                "duration": duration,
-                "requests_per_sec": num_requests / duration,
-                "success_rate": len(successful) / num_requests,
-            }
-
+            client = await self._fresh_redis()
+            manager = NonceManager(client, _ChainStub())
+            assert isinstance(manager.store, HybridNonceStore)
+            return await self._run_load(
+                "hybrid", manager.store, num_requests, concurrency
+            )
         except Exception as e:
             logger.error(f"Hybrid store test failed: {e}")
             return {"store_type": "hybrid", "error": str(e), "success_rate": 0}
 
-    async def run_comprehensive_test(self):
+    async def run_comprehensive_test(self, num_requests: int, concurrency: int):
         """Run comprehensive load test across all store types."""
         logger.info("🚀 Starting comprehensive nonce load testing")
 
-        test_configs = [
-            {"requests": 100, "concurrency": 10},
-            {"requests": 500, "concurrency": 25},
-            {"requests": 1000, "concurrency": 50},
+        all_results = [
+            await self.test_in_memory_store(num_requests, concurrency),
+            await self.test_redis_lock_store(num_requests, concurrency),
+            await self.test_redis_store(num_requests, concurrency),
+            await self.test_hybrid_store(num_requests, concurrency),
         ]
 
-        all_results = []
-
-        for config in test_configs:
-            logger.info(
-                f"\n📊 Testing configuration: {config['requests']} requests, {config['concurrency']} concurrent"
-            )
-
-            # Test in-memory store
-            in_memory_result = await self.test_in_memory_store(
-                config["requests"], config["concurrency"]
-            )
-            all_results.append(in_memory_result)
-
-            # Test Redis store
-            redis_result = await self.test_redis_store(
-                config["requests"], config["concurrency"]
-            )
-            all_results.append(redis_result)
-
-            # Test hybrid store
-            hybrid_result = await self.test_hybrid_store(
-                config["requests"], config["concurrency"]
-            )
-            all_results.append(hybrid_result)
-
         # Generate summary report
         self.generate_summary_report(all_results)
 
@@ -296,50 +222,31 @@ class NonceLoadTester:
 
     def generate_summary_report(self, results: list[dict[str, Any]]):
         """Generate summary report of load test results."""
-        logger.info("\n📈 LOAD TEST SUMMARY REPORT")
-        logger.info("=" * 50)
+        ok = [r for r in results if "error" not in r]
+        if ok:
+            print(
+                f"\nNONCE RESERVATION ({ok[0]['total_requests']} requests,"
+                f" {ok[0]['concurrency']} concurrent)"
+            )
+        else:
+            print("\nNONCE RESERVATION")
+        print("=" * 50)
 
-        # Group results by store type
-        by_store = {}
         for result in results:
-            store_type = result["store_type"]
-            if store_type not in by_store:
-                by_store[store_type] = []
-            by_store[store_type].append(result)
-
-        for store_type, store_results in by_store.items():
-            logger.info(f"\n🏪 {store_type.upper()} STORE:")
-
-            success_rates = [
-                r.get("success_rate", 0) for r in store_results if "success_rate" in r
-            ]
-            rps_values = [
-                r.get("requests_per_sec", 0)
-                for r in store_results
-                if "requests_per_sec" in r
-            ]
-            collision_counts = [
-                r.get("nonce_collisions", 0)
-                for r in store_results
-                if "nonce_collisions" in r
-            ]
-
-            if success_rates:
-                logger.info(
-                    f"  Success Rate: {statistics.mean(success_rates):.2%} (avg)"
-                )
-                logger.info(f"  Requests/sec: {statistics.mean(rps_values):.2f} (avg)")
-                logger.info(f"  Nonce Collisions: {sum(collision_counts)} (total)")
-
-                # Check for issues
-                if statistics.mean(success_rates) < 0.99:
-                    logger.warning("  ⚠️  Low success rate detected!")
-                if sum(collision_counts) > 0:
-                    logger.warning("  ⚠️  Nonce collisions detected!")
-                if statistics.mean(rps_values) < 100:
-                    logger.warning("  ⚠️  Low throughput detected!")
-
-        logger.info("\n✅ Load testing completed!")
+            if "error" in result:
+                print(f"  {result['store_type']:<11} failed: {result['error']}")
+                continue
+            print(
+                f"  {result['store_type']:<11} {result['requests_per_sec']:9,.0f} req/s"
+                f"  p50 {result['p50_ms']:7.2f} ms  p99 {result['p99_ms']:7.2f} ms"
+                f"  collisions {result['nonce_collisions']}  gaps {result['gaps']}"
+            )
+
+        # Check for issues
+        if ok and statistics.mean(r["success_rate"] for r in ok) < 0.99:
+            logger.warning("  ⚠️  Low success rate detected!")
+        if any(r["nonce_collisions"] or r["gaps"] for r in ok):
+            logger.warning("  ⚠️  Nonce collisions or gaps detected!")
 
 
 async def main():
@@ -350,27 +257,39 @@ async def main():
     parser.add_argument(
         "--redis-url", default="redis://localhost:6379", help="Redis URL"
     )
-    parser.add_argument("--requests", type=int, default=1000, help="Number of requests")
-    parser.add_argument("--concurrency", type=int, default=50, help="Concurrency level")
+    parser.add_argument("--requests", type=int, default=5000, help="Number of requests")
+    parser.add_argument(
+        "--concurrency", type=int, default=500, help="Concurrent reservers"
+    )
+    parser.add_argument(
+        "--release-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of reservations released as failed sends",
+    )
     parser.add_argument(
         "--store-type",
-        choices=["in_memory", "redis", "hybrid", "all"],
+        choices=["in_memory", "redis", "redis_lock", "hybrid", "all"],
         default="all",
         help="Store type to test",
     )
 
     args = parser.parse_args()
 
-    tester = NonceLoadTester(args.redis_url)
+    tester = NonceLoadTester(args.redis_url, args.release_rate)
 
     if args.store_type == "all":
-        await tester.run_comprehensive_test()
-    elif args.store_type == "in_memory":
-        await tester.test_in_memory_store(args.requests, args.concurrency)
-    elif args.store_type == "redis":
-        await tester.test_redis_store(args.requests, args.concurrency)
-    elif args.store_type == "hybrid":
-        await tester.test_hybrid_store(args.requests, args.concurrency)
+        await tester.run_comprehensive_test(args.requests, args.concurrency)
+        return
+
+    tests = {
+        "in_memory": tester.test_in_memory_store,
+        "redis": tester.test_redis_store,
+        "redis_lock": tester.test_redis_lock_store,
+        "hybrid": tester.test_hybrid_store,
+    }
+    result = await tests[args.store_type](args.requests, args.concurrency)
+    tester.generate_summary_report([result])
 
 
 if __name__ == "__main__":
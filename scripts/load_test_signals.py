@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""Load generator for the signal pipeline: webhook -> Redis queue -> worker.
+
+Posts signals to the ``/signals`` webhook at a fixed rate (in-process through
+the ASGI app, or ``--url`` for a deployed webhook) while a SignalWorker
+consumes the same Redis queue. Trade sends are replaced by a stub that sleeps
+for ``--send-ms``, so no chain is needed; rules, DB writes and the queue run
+for real. Reports webhook latency, achieved rates, the worker's
+dequeue-to-send latency from the ``exec_latency`` histogram and event loop
+stalls while the worker drains (a stall past SIGNALS_WORKER_LEASE_S lets
+other workers take over in-flight signals).
+
+Usage:
+
+    python scripts/load_test_signals.py --rate 1000 --duration 10 --users 200
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from unittest.mock import patch
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+if "DATABASE_URL" not in os.environ:
+    _db_path = os.path.join(tempfile.mkdtemp(), "load_test_signals.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{_db_path}"
+
+import httpx
+import redis
+import redis.asyncio as aioredis
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.api import webhook
+from src.config.settings import settings
+from src.database.models import Base, Execution
+from src.monitoring.metrics import exec_latency
+from src.workers.signal_worker import SignalWorker
+
+SYMBOLS = ["BTC-USD", "ETH-USD", "SOL-USD"]
+
+
+class StubService:
+    """AvantisService stand-in: one simulated send per trade."""
+
+    send_s = 0.05
+
+    def __init__(self, w3, db, price_agg, markets=None):
+        pass
+
+    async def open_market_async(self, *args, intent_key=None, **kwargs):
+        await asyncio.sleep(self.send_s)
+        return "0x" + hashlib.sha256(intent_key.encode()).hexdigest()
+
+    close_market_async = open_market_async
+
+
+async def watch_loop_lag(stalls: list[float], interval_s: float = 0.01) -> None:
+    """Record how late each short sleep wakes up, until cancelled."""
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval_s)
+        stalls.append(time.perf_counter() - start - interval_s)
+
+
+def histogram_quantiles(histogram, quantiles) -> dict[float, float]:
+    """Approximate quantiles (bucket upper bounds) from a prometheus Histogram."""
+    buckets, count = [], 0.0
+    for metric in histogram.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_bucket"):
+                buckets.append((float(sample.labels["le"]), sample.value))
+            elif sample.name.endswith("_count"):
+                count = sample.value
+    out = {}
+    for q in quantiles:
+        target = q * count
+        out[q] = next((le for le, c in sorted(buckets) if c >= target), float("nan"))
+    return out
+
+
+def signal_body(run_id: str, i: int, users: int) -> bytes:
+    return json.dumps(
+        {
+            "source": "loadtest",
+            "signal_id": f"{run_id}-{i}",
+            "tg_user_id": 1 + i % users,
+            "symbol": SYMBOLS[i % len(SYMBOLS)],
+            "side": "LONG" if i % 2 else "SHORT",
+            "collateral_usdc": 10.0,
+            "leverage_x": 2,
+            "reduce_usdc": 0.0,
+        }
+    ).encode()
+
+
+async def generate(client, args, run_id: str) -> tuple[list[float], int, float]:
+    """Post signals at args.rate for args.duration; returns latencies, errors."""
+    total = int(args.rate * args.duration)
+    latencies: list[float] = []
+    errors = 0
+    in_flight = asyncio.Semaphore(args.max_in_flight)
+
+    async def post(i: int):
+        nonlocal errors
+        body = signal_body(run_id, i, args.users)
+        headers = {"Content-Type": "application/json"}
+        if settings.WEBHOOK_HMAC_SECRET:
+            headers["X-Signature"] = hmac.new(
+                settings.WEBHOOK_HMAC_SECRET.encode(), body, hashlib.sha256
+            ).hexdigest()
+        async with in_flight:
+            start = time.perf_counter()
+            try:
+                resp = await client.post("/signals", content=body, headers=headers)
+                if resp.status_code != 200:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    tasks = []
+    for i in range(total):
+        # Open-loop pacing: fire on schedule regardless of response time
+        delay = start + i / args.rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(post(i)))
+    await asyncio.gather(*tasks)
+    return sorted(latencies), errors, time.perf_counter() - start
+
+
+async def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Signal pipeline load generator")
+    parser.add_argument("--rate", type=float, default=1000, help="Signals per second")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds")
+    parser.add_argument("--users", type=int, default=200, help="Distinct wallets")
+    parser.add_argument("--send-ms", type=float, default=50, help="Stub send time")
+    parser.add_argument("--concurrency", type=int, default=None)
+    parser.add_argument("--max-in-flight", type=int, default=512)
+    parser.add_argument("--drain-timeout", type=float, default=120, help="Seconds")
+    parser.add_argument("--url", default=None, help="Deployed webhook base URL")
+    parser.add_argument("--redis-url", default=settings.REDIS_URL)
+    args = parser.parse_args()
+
+    run_id = uuid.uuid4().hex[:8]
+    settings.SIGNALS_QUEUE = f"signals:loadtest:{run_id}"
+    settings.REDIS_URL = args.redis_url
+    StubService.send_s = args.send_ms / 1000
+
+    # The webhook logs a warning per request when HMAC is not configured
+    webhook.logger.setLevel("ERROR")
+
+    db_url = settings.DATABASE_URL.replace("sqlite+aiosqlite:", "sqlite:")
+    engine = create_engine(db_url, pool_pre_ping=True)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, expire_on_commit=False)
+
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=30)
+    else:
+        webhook._queue = redis.from_url(args.redis_url)
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=webhook.app),
+            base_url="http://webhook",
+            timeout=30,
+        )
+
+    queue = aioredis.from_url(args.redis_url)
+    worker = SignalWorker(
+        queue,
+        None,
+        Session,
+        None,
+        worker_id=f"loadtest-{run_id}",
+        max_concurrency=args.concurrency,
+        block_timeout_s=0.5,
+    )
+    total = int(args.rate * args.duration)
+
+    with patch("src.workers.signal_worker.AvantisService", StubService):
+        worker_task = asyncio.create_task(worker.run())
+        latencies, errors, elapsed = await generate(client, args, run_id)
+
+        # In-process, the webhook shares the loop; only time the worker's stalls
+        stalls: list[float] = []
+        lag_task = asyncio.create_task(watch_loop_lag(stalls))
+
+        # Wait for the worker to drain what was accepted
+        drain_start = time.perf_counter()
+        while await queue.llen(settings.SIGNALS_QUEUE) or await queue.llen(
+            worker.processing_key
+        ):
+            if time.perf_counter() - drain_start > args.drain_timeout:
+                print(f"Worker did not drain within {args.drain_timeout:g}s")
+                break
+            await asyncio.sleep(0.1)
+        worker_elapsed = elapsed + time.perf_counter() - drain_start
+        worker.stop()
+        await worker_task
+        lag_task.cancel()
+        stalls = sorted(stalls) or [0.0]
+
+    db = Session()
+    sent = (
+        db.query(Execution)
+        .filter(Execution.intent_key.like(f"sig:loadtest:{run_id}-%"))
+        .filter(Execution.status == "SENT")
+        .count()
+    )
+    db.close()
+    await client.aclose()
+    await queue.delete(settings.SIGNALS_QUEUE, worker.processing_key)
+
+    quantiles = histogram_quantiles(exec_latency, (0.5, 0.9, 0.99))
+    print(
+        f"\nSIGNAL PIPELINE ({total:,} signals at {args.rate:g}/s target,"
+        f" {args.users} wallets, {args.send_ms:g} ms sends)"
+    )
+    print("=" * 64)
+    print(f"  webhook rate:    {total / elapsed:8.1f}/s  ({errors} errors)")
+    print(
+        f"  webhook latency: p50 {statistics.median(latencies) * 1000:7.2f} ms"
+        f"  p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:7.2f} ms"
+    )
+    print(f"  worker rate:     {sent / worker_elapsed:8.1f}/s  ({sent:,} SENT)")
+    print(
+        "  dequeue->send (exec_latency buckets): "
+        + "  ".join(f"p{int(q * 100)} <= {v:g}s" for q, v in quantiles.items())
+    )
+    print(
+        f"  loop stall:      p99 {stalls[int(len(stalls) * 0.99) - 1] * 1000:7.2f} ms"
+        f"  max {stalls[-1] * 1000:7.2f} ms"
+        f"  (lease {settings.SIGNALS_WORKER_LEASE_S:g} s)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
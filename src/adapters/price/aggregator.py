@@ -1,6 +1,7 @@
 """Price aggregator with fallback strategy (Phase 3)."""
 
 import logging
+from collections.abc import Iterable
 from typing import Optional
 
 from .base import PriceFeed, PriceQuote
@@ -44,3 +45,51 @@ class PriceAggregator:
 
         logger.warning(f"No price available for {symbol} from any feed")
         return None
+
+    def get_prices(self, symbols: Iterable[str]) -> dict[str, PriceQuote]:
+        """Get prices for several symbols with the same per-symbol fallback.
+
+        Feeds that expose ``get_prices`` (e.g. ChainlinkAdapter) are asked for
+        all outstanding symbols at once; other feeds are queried per symbol.
+        Each later feed only sees the symbols still missing.
+
+        Args:
+            symbols: Market symbols
+
+        Returns:
+            Map of symbol to PriceQuote for symbols with a price
+        """
+        remaining = list(dict.fromkeys(symbols))
+        quotes: dict[str, PriceQuote] = {}
+
+        for feed in self.feeds:
+            if not remaining:
+                break
+
+            batch = getattr(feed, "get_prices", None)
+            if batch is not None:
+                try:
+                    quotes.update(
+                        (sym, quote)
+                        for sym, quote in batch(remaining).items()
+                        if quote is not None and sym in remaining
+                    )
+                except Exception as e:
+                    logger.warning(f"Feed {feed.__class__.__name__} failed: {e}")
+            else:
+                for sym in remaining:
+                    try:
+                        quote = feed.get_price(sym)
+                    except Exception as e:
+                        logger.warning(
+                            f"Feed {feed.__class__.__name__} failed for {sym}: {e}"
+                        )
+                        continue
+                    if quote is not None:
+                        quotes[sym] = quote
+
+            remaining = [sym for sym in remaining if sym not in quotes]
+
+        if remaining:
+            logger.warning(f"No price available for {remaining} from any feed")
+        return quotes
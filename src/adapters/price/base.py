@@ -13,6 +13,7 @@ class PriceQuote:
     decimals: int  # Scaling decimals (e.g., 8)
     source: str  # "pyth"|"chainlink"
     timestamp: int = 0  # Unix timestamp
+    block_number: int = 0  # Block the quote was read at (on-chain feeds)
 
 
 class PriceFeed(Protocol):
@@ -2,8 +2,11 @@
 
 import logging
 import time
+from collections.abc import Iterable
 from typing import Optional
 
+from eth_abi import decode
+from eth_utils import keccak
 from web3 import Web3
 
 from .base import PriceFeed, PriceQuote
@@ -34,20 +37,71 @@ CHAINLINK_AGG_ABI = [
     },
 ]
 
+# Multicall3 is deployed at the same address on Base and most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {"internalType": "bool", "name": "requireSuccess", "type": "bool"},
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call[]",
+                "name": "calls",
+                "type": "tuple[]",
+            },
+        ],
+        "name": "tryBlockAndAggregate",
+        "outputs": [
+            {"internalType": "uint256", "name": "blockNumber", "type": "uint256"},
+            {"internalType": "bytes32", "name": "blockHash", "type": "bytes32"},
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            },
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+# Calldata for the aggregator's argument-free view functions
+DECIMALS_CALLDATA = keccak(text="decimals()")[:4]
+LATEST_ROUND_DATA_CALLDATA = keccak(text="latestRoundData()")[:4]
+ROUND_DATA_TYPES = ["uint80", "int256", "uint256", "uint256", "uint80"]
+
 
 class ChainlinkAdapter(PriceFeed):
     """Chainlink price feed adapter."""
 
-    def __init__(self, w3: Web3, symbol_to_feed: dict[str, str]):
+    def __init__(
+        self,
+        w3: Web3,
+        symbol_to_feed: dict[str, str],
+        multicall_address: str = MULTICALL3_ADDRESS,
+    ):
         """Initialize Chainlink adapter.
 
         Args:
             w3: Web3 instance
             symbol_to_feed: Map of symbol to Chainlink feed address
                 e.g., {"BTC-USD": "0x64c911996D3c6aC71f9b455B1E8E7266BcbD848F"}
+            multicall_address: Multicall3 contract used by get_prices
         """
         self.w3 = w3
         self.feeds = {k: Web3.to_checksum_address(v) for k, v in symbol_to_feed.items()}
+        self.multicall_address = Web3.to_checksum_address(multicall_address)
+        self._multicall = None
+        # Feed decimals are immutable, so they are only read once
+        self._decimals: dict[str, int] = {}
 
     def get_price(self, symbol: str) -> Optional[PriceQuote]:
         """Get price from Chainlink feed.
@@ -93,3 +147,96 @@ class ChainlinkAdapter(PriceFeed):
         except Exception as e:
             logger.error(f"Failed to get Chainlink price for {symbol}: {e}")
             return None
+
+    def get_prices(
+        self, symbols: Optional[Iterable[str]] = None
+    ) -> dict[str, PriceQuote]:
+        """Get prices for several symbols in one eth_call.
+
+        Reads every requested feed through Multicall3's tryBlockAndAggregate,
+        so all answers come from the same block and a failing feed does not
+        affect the others. Decimals are read on a feed's first snapshot only.
+        If the multicall itself fails, or an answer cannot be decoded, those
+        symbols are read one by one through get_price instead.
+
+        Args:
+            symbols: Market symbols (default: every configured feed)
+
+        Returns:
+            Map of symbol to PriceQuote for feeds with a valid answer
+        """
+        wanted = [
+            sym
+            for sym in dict.fromkeys(self.feeds if symbols is None else symbols)
+            if sym in self.feeds
+        ]
+        if not wanted:
+            return {}
+
+        calls = []
+        for sym in wanted:
+            if sym not in self._decimals:
+                calls.append((self.feeds[sym], DECIMALS_CALLDATA))
+            calls.append((self.feeds[sym], LATEST_ROUND_DATA_CALLDATA))
+
+        try:
+            if self._multicall is None:
+                self._multicall = self.w3.eth.contract(
+                    address=self.multicall_address, abi=MULTICALL3_ABI
+                )
+            block_number, _, results = self._multicall.functions.tryBlockAndAggregate(
+                False, calls
+            ).call()
+        except Exception as e:
+            logger.error(f"Chainlink multicall failed for {len(wanted)} feeds: {e}")
+            return self._get_prices_one_by_one(wanted)
+
+        quotes: dict[str, PriceQuote] = {}
+        undecoded: list[str] = []
+        results = iter(results)
+        for sym in wanted:
+            try:
+                if sym not in self._decimals:
+                    success, data = next(results)
+                    if success:
+                        self._decimals[sym] = int(decode(["uint8"], data)[0])
+                success, data = next(results)
+                if not success or sym not in self._decimals:
+                    logger.warning(f"Chainlink call reverted for {sym}")
+                    continue
+
+                _, answer, _, updated_at, _ = decode(ROUND_DATA_TYPES, data)
+            except Exception as e:
+                logger.error(f"Failed to decode Chainlink answer for {sym}: {e}")
+                undecoded.append(sym)
+                continue
+
+            if int(answer) <= 0:
+                logger.warning(f"Invalid Chainlink price for {sym}: {answer}")
+                continue
+
+            quotes[sym] = PriceQuote(
+                symbol=sym,
+                price=int(answer),
+                decimals=self._decimals[sym],
+                source="chainlink",
+                timestamp=int(updated_at),
+                block_number=int(block_number),
+            )
+
+        logger.debug(
+            f"Chainlink snapshot at block {block_number}: "
+            f"{len(quotes)}/{len(wanted)} feeds"
+        )
+        if undecoded:
+            quotes.update(self._get_prices_one_by_one(undecoded))
+        return quotes
+
+    def _get_prices_one_by_one(self, symbols: list[str]) -> dict[str, PriceQuote]:
+        """Per-symbol get_price fallback for symbols the multicall did not answer."""
+        quotes = {}
+        for sym in symbols:
+            quote = self.get_price(sym)
+            if quote is not None:
+                quotes[sym] = quote
+        return quotes
@@ -7,6 +7,7 @@ import asyncio
 import json
 import logging
 import os
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Optional
@@ -37,18 +38,71 @@ class RegimeSignal:
     timestamp: datetime
 
 
+class RegimeWindow:
+    """Rolling 24h price window holding only what regime detection reads.
+
+    Regime metrics only look at the last 12 prices (volatility), the price 288
+    points back (trend) and whether at least 20/288 points are in the window,
+    so the window keeps the last 288 points and the last 11 log returns. Each
+    push is amortised O(1) and memory is bounded per symbol. Timestamps are
+    assumed to be non-decreasing, which holds for prices stamped at fetch time.
+    """
+
+    MIN_POINTS = 20
+    VOLATILITY_POINTS = 12  # 1 hour at 5-second intervals
+    TREND_POINTS = 288  # 4 hours at 5-second intervals
+    RETENTION = timedelta(hours=24)
+
+    def __init__(self):
+        self._points: deque[tuple[datetime, float]] = deque(maxlen=self.TREND_POINTS)
+        self._returns: deque[float] = deque(maxlen=self.VOLATILITY_POINTS - 1)
+
+    def __len__(self) -> int:
+        """Points in the 24h window, saturating at TREND_POINTS"""
+        return len(self._points)
+
+    def push(self, price: float, timestamp: datetime, now: datetime):
+        """Add a price point and expire points older than the retention window"""
+        if self._points:
+            self._returns.append(np.log(price / self._points[-1][1]))
+        self._points.append((timestamp, price))
+
+        cutoff = now - self.RETENTION
+        while self._points and self._points[0][0] <= cutoff:
+            self._points.popleft()
+
+    def volatility(self) -> Optional[float]:
+        """Annualised volatility of the last hour, None until MIN_POINTS"""
+        if len(self._points) < self.MIN_POINTS:
+            return None
+        return np.std(list(self._returns)) * np.sqrt(720)
+
+    def trend_return(self) -> Optional[float]:
+        """Return over the last 4 hours, None until TREND_POINTS"""
+        if len(self._points) < self.TREND_POINTS:
+            return None
+        first = self._points[0][1]
+        return (self._points[-1][1] - first) / first
+
+
 class MarketIntelligence:
     """Market intelligence and regime detection system"""
 
-    def __init__(self, config):
+    def __init__(self, config, monitor=None):
         self.config = config
         self.price_feeds = {}
         self.regime_data = {}
         self.is_running = False
 
+        # PerformanceMonitor that counts regime changes for the AI health check
+        self.monitor = monitor
+
         # Pyth price feed IDs
         self.pyth_feeds = json.loads(config.PYTH_PRICE_FEED_IDS_JSON)
 
+        # Persistent Hermes session shared by every feed, created lazily
+        self._session: Optional[aiohttp.ClientSession] = None
+
         # Market regime thresholds
         self.volatility_thresholds = {
             "green": 0.3,  # Low volatility - good for copying
@@ -73,11 +127,8 @@ class MarketIntelligence:
         logger.info("Starting market intelligence monitoring...")
 
         try:
-            # Start monitoring all configured price feeds
-            tasks = []
-            for symbol, pyth_id in self.pyth_feeds.items():
-                task = asyncio.create_task(self._monitor_price_feed(symbol, pyth_id))
-                tasks.append(task)
+            # Start monitoring all configured price feeds with one shared poller
+            tasks = [asyncio.create_task(self._monitor_price_feeds())]
 
             # Start overall regime analysis task
             analysis_task = asyncio.create_task(self._analyze_overall_regime())
@@ -94,110 +145,129 @@ class MarketIntelligence:
     async def stop_monitoring(self):
         """Stop market intelligence monitoring"""
         self.is_running = False
+        await self.close()
         logger.info("Stopped market intelligence monitoring")
 
-    async def _monitor_price_feed(self, symbol: str, pyth_id: str):
-        """Monitor individual price feed for regime changes"""
-        logger.info(f"Starting price monitoring for {symbol}")
+    async def close(self):
+        """Close the shared Hermes HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _monitor_price_feeds(self):
+        """Refresh every configured feed with one batched request per tick"""
+        logger.info(f"Starting price monitoring for {len(self.pyth_feeds)} feeds")
 
         while self.is_running:
             try:
-                # Fetch price data from Pyth
-                price_data = await self._fetch_pyth_price(pyth_id)
+                prices = await self._fetch_pyth_prices(list(self.pyth_feeds.values()))
 
-                if price_data:
-                    await self._update_regime_analysis(symbol, price_data)
+                for symbol, pyth_id in self.pyth_feeds.items():
+                    price_data = prices.get(pyth_id)
+                    if price_data:
+                        await self._update_regime_analysis(symbol, price_data)
 
                 # Wait before next update
                 await asyncio.sleep(5)  # Update every 5 seconds
 
             except Exception as e:
-                logger.error(f"Error monitoring {symbol}: {e}")
+                logger.error(f"Error monitoring price feeds: {e}")
                 await asyncio.sleep(30)  # Wait longer on error
 
     async def _fetch_pyth_price(self, pyth_id: str) -> Optional[PriceData]:
-        """Fetch price data from Pyth Network"""
+        """Fetch price data for a single Pyth feed"""
+        prices = await self._fetch_pyth_prices([pyth_id])
+        return prices.get(pyth_id)
+
+    async def _fetch_pyth_prices(self, pyth_ids: list[str]) -> dict[str, PriceData]:
+        """Fetch price data for many Pyth feeds in a single Hermes request
+
+        Returns:
+            Feed ID (as configured) -> price data; feeds missing from the
+            response are omitted
+        """
+        # Optional production REST path (kept off by default to avoid test flakiness)
+        # Provide PYTH_REST_URL in env to enable, e.g. https://hermes.pyth.network
+        rest_url = os.getenv("PYTH_REST_URL")
+        if not rest_url:
+            return {pyth_id: self._simulate_pyth_price(pyth_id) for pyth_id in pyth_ids}
+
         try:
-            # Optional production REST path (kept off by default to avoid test flakiness)
-            # Provide PYTH_REST_URL in env to enable, e.g. https://hermes.pyth.network
-            rest_url = os.getenv("PYTH_REST_URL")
-            if rest_url:
+            if self._session is None or self._session.closed:
                 timeout = aiohttp.ClientTimeout(total=5, connect=3)
-                url = f"{rest_url.rstrip('/')}/{pyth_id}"
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.get(url) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-                            # Try common shapes; fall back to simulation on parse errors
-                            price = None
-                            conf = 0.9
-                            if isinstance(data, dict):
-                                price = (
-                                    data.get("price")
-                                    or data.get("priceUsd")
-                                    or data.get("emaPrice")
-                                )
-                                conf = float(data.get("confidence", conf))
-                            elif isinstance(data, list) and data:
-                                item = data[0]
-                                if isinstance(item, dict):
-                                    price = (
-                                        item.get("price")
-                                        or item.get("priceUsd")
-                                        or item.get("emaPrice")
-                                    )
-                                    conf = float(item.get("confidence", conf))
-                            if price is not None:
-                                return PriceData(
-                                    symbol=pyth_id,
-                                    price=float(price),
-                                    timestamp=datetime.utcnow(),
-                                    confidence=float(conf),
-                                    source="pyth-rest",
-                                )
-
-            # Default: simulate price data (stable for tests)
-            base_price = (
-                50000 if "BTC" in pyth_id else 3000 if "ETH" in pyth_id else 100
-            )
-            price_change = np.random.normal(0, 0.001)  # ~0.1% volatility
-            current_price = base_price * (1 + price_change)
-
-            return PriceData(
-                symbol=pyth_id,
-                price=current_price,
-                timestamp=datetime.utcnow(),
-                confidence=0.95,
-                source="pyth-sim",
-            )
+                self._session = aiohttp.ClientSession(timeout=timeout)
+
+            url = f"{rest_url.rstrip('/')}/v2/updates/price/latest"
+            params = [("ids[]", pyth_id) for pyth_id in pyth_ids]
+            params.append(("parsed", "true"))
+            async with self._session.get(url, params=params) as resp:
+                if resp.status != 200:
+                    logger.error(f"Hermes returned HTTP {resp.status}")
+                    return {}
+                data = await resp.json()
+
+            # Hermes reports ids without the 0x prefix
+            by_id = {
+                pyth_id.lower().removeprefix("0x"): pyth_id for pyth_id in pyth_ids
+            }
+            now = datetime.utcnow()
+            prices = {}
+            for item in data.get("parsed", []):
+                pyth_id = by_id.get(str(item.get("id", "")).lower().removeprefix("0x"))
+                price_info = item.get("price") or {}
+                if pyth_id is None or "price" not in price_info:
+                    continue
+
+                scale = 10 ** int(price_info.get("expo", 0))
+                price = int(price_info["price"]) * scale
+                conf = int(price_info.get("conf", 0)) * scale
+                if price <= 0:
+                    continue
+
+                prices[pyth_id] = PriceData(
+                    symbol=pyth_id,
+                    price=float(price),
+                    timestamp=now,
+                    confidence=max(0.0, 1.0 - conf / price),
+                    source="pyth-rest",
+                )
+            return prices
 
         except Exception as e:
-            logger.error(f"Error fetching Pyth price for {pyth_id}: {e}")
-            return None
+            logger.error(f"Error fetching Pyth prices for {len(pyth_ids)} feeds: {e}")
+            return {}
+
+    def _simulate_pyth_price(self, pyth_id: str) -> PriceData:
+        """Simulate price data (stable for tests)"""
+        base_price = 50000 if "BTC" in pyth_id else 3000 if "ETH" in pyth_id else 100
+        price_change = np.random.normal(0, 0.001)  # ~0.1% volatility
+        current_price = base_price * (1 + price_change)
+
+        return PriceData(
+            symbol=pyth_id,
+            price=current_price,
+            timestamp=datetime.utcnow(),
+            confidence=0.95,
+            source="pyth-sim",
+        )
 
     async def _update_regime_analysis(self, symbol: str, price_data: PriceData):
         """Update regime analysis for a symbol"""
         try:
             if symbol not in self.regime_data:
                 self.regime_data[symbol] = {
-                    "prices": [],
+                    "window": RegimeWindow(),
                     "volatility": 0,
                     "trend": "neutral",
                     "regime": "green",
                     "last_updated": datetime.utcnow(),
                 }
 
-            # Add new price point
-            self.regime_data[symbol]["prices"].append(
-                {"price": price_data.price, "timestamp": price_data.timestamp}
+            # Add new price point; points older than 24 hours expire
+            self.regime_data[symbol]["window"].push(
+                price_data.price, price_data.timestamp, datetime.utcnow()
             )
 
-            # Keep only last 24 hours of data
-            cutoff = datetime.utcnow() - timedelta(hours=24)
-            self.regime_data[symbol]["prices"] = [
-                p for p in self.regime_data[symbol]["prices"] if p["timestamp"] > cutoff
-            ]
-
             # Calculate regime metrics
             await self._calculate_regime_metrics(symbol)
 
@@ -207,37 +277,34 @@ class MarketIntelligence:
     async def _calculate_regime_metrics(self, symbol: str):
         """Calculate volatility and trend for regime classification"""
         try:
-            prices = [p["price"] for p in self.regime_data[symbol]["prices"]]
+            window = self.regime_data[symbol]["window"]
 
-            if len(prices) < 20:
+            volatility = window.volatility()
+            if volatility is None:
                 return  # Need minimum data
 
-            # Calculate 1-hour volatility (assuming 5-second intervals)
-            recent_prices = prices[-12:] if len(prices) >= 12 else prices
-            if len(recent_prices) > 1:
-                returns = [
-                    np.log(recent_prices[i] / recent_prices[i - 1])
-                    for i in range(1, len(recent_prices))
-                ]
-                volatility = np.std(returns) * np.sqrt(720)  # Annualized
-            else:
-                volatility = 0.1  # Default moderate volatility
-
             # Calculate trend (4-hour momentum)
-            if len(prices) >= 288:  # 4 hours of data (5s intervals)
-                trend_return = (prices[-1] - prices[-288]) / prices[-288]
-                if trend_return > self.trend_thresholds["bullish"]:
-                    trend = "bullish"
-                elif trend_return < self.trend_thresholds["bearish"]:
-                    trend = "bearish"
-                else:
-                    trend = "neutral"
+            trend_return = window.trend_return()
+            if trend_return is None:
+                trend = "neutral"
+            elif trend_return > self.trend_thresholds["bullish"]:
+                trend = "bullish"
+            elif trend_return < self.trend_thresholds["bearish"]:
+                trend = "bearish"
             else:
                 trend = "neutral"
 
             # Determine regime color
             regime = self._determine_regime_color(volatility, trend)
 
+            if regime != self.regime_data[symbol]["regime"] and self.monitor:
+                self.monitor.record_metric(
+                    "market_regime_changes",
+                    1,
+                    "counter",
+                    {"service": "market_intelligence", "symbol": symbol},
+                )
+
             # Update regime data
             self.regime_data[symbol].update(
                 {
@@ -286,7 +353,7 @@ class MarketIntelligence:
             regime_info = self.regime_data[symbol]
 
             # Calculate confidence based on data quality
-            data_points = len(regime_info["prices"])
+            data_points = len(regime_info["window"])
             confidence = min(0.9, 0.3 + (data_points / 100) * 0.6)
 
             return RegimeSignal(
@@ -122,6 +122,84 @@ class TraderAnalyzer:
             logger.error(f"Error analyzing trader {address}: {e}")
             return self._create_default_analysis(address)
 
+    async def analyze_traders(
+        self, traders: list[tuple[str, TraderStats, list[dict]]]
+    ) -> list[TraderAnalysis]:
+        """Analyze many traders at once, e.g. a whole leaderboard
+
+        Takes (address, stats, trades) tuples and returns analyses in the same
+        order, matching analyze_trader for each entry. All trades are flattened
+        into one columnar frame, features are computed with grouped numpy
+        operations and each model runs once over the full feature matrix.
+        """
+        if not traders:
+            return []
+
+        try:
+            frame = self._build_trade_frame(traders)
+            valid = frame["valid"]
+
+            if not valid.any():
+                return [
+                    self._create_default_analysis(address) for address, _, _ in traders
+                ]
+
+            if not self.is_trained:
+                await self._train_models()
+
+            features = self._extract_features_batch(frame)
+            performance, anomaly, archetypes = self._score_batch(features[valid])
+            risk_metrics = self._calculate_risk_metrics_batch(frame)
+            recent_volatility = self._calculate_recent_volatility_batch(
+                frame, datetime.utcnow()
+            )
+
+            score_rows = np.cumsum(valid) - 1
+            results = []
+            for i, (address, _, _) in enumerate(traders):
+                if not valid[i]:
+                    results.append(self._create_default_analysis(address))
+                    continue
+
+                row = score_rows[i]
+                risk = {name: float(values[i]) for name, values in risk_metrics.items()}
+                performance_score = max(0.0, min(1.0, performance[row]))
+                anomaly_score = max(0.0, min(1.0, (anomaly[row] + 1) / 2))
+                archetype = int(archetypes[row])
+
+                if self.is_trained:
+                    win_prob = performance_score
+                    expected_dd = min(0.3, recent_volatility[i] * 1.5)
+                else:
+                    win_prob, expected_dd = 0.5, 0.05
+
+                results.append(
+                    TraderAnalysis(
+                        address=address,
+                        archetype=self.archetypes.get(archetype, "Unknown"),
+                        performance_score=performance_score,
+                        anomaly_score=anomaly_score,
+                        risk_level=self._determine_risk_level(risk),
+                        sharpe_like=risk["sharpe_like"],
+                        max_drawdown=risk["max_drawdown"],
+                        consistency=risk["consistency"],
+                        win_prob_7d=win_prob,
+                        expected_dd_7d=expected_dd,
+                        optimal_copy_ratio=self._calculate_optimal_copy_ratio(risk),
+                        strengths=self._identify_strengths(features[i], archetype),
+                        warnings=self._identify_warnings(anomaly_score, risk),
+                    )
+                )
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Error in batch analysis, falling back to per-trader: {e}")
+            return [
+                await self.analyze_trader(address, stats, trades)
+                for address, stats, trades in traders
+            ]
+
     def _extract_features(
         self, stats: TraderStats, trades: list[dict]
     ) -> Optional[np.ndarray]:
@@ -492,6 +570,375 @@ class TraderAnalyzer:
             logger.error(f"Error calculating volatility: {e}")
             return 0.1
 
+    # Batch scoring helpers. Each mirrors the per-trader method of the same
+    # name, operating on the flat frame built by _build_trade_frame where every
+    # trade row carries the index of the trader it belongs to.
+
+    def _build_trade_frame(
+        self, traders: list[tuple[str, TraderStats, list[dict]]]
+    ) -> dict[str, np.ndarray]:
+        """Flatten all traders' trades into column arrays keyed by trader index"""
+        n = len(traders)
+        valid = np.zeros(n, dtype=bool)
+        stats_rows = np.zeros((n, 7))
+        columns = {
+            "owner": [],
+            "timestamp": [],
+            "pair": [],
+            "is_long": [],
+            "event_type": [],
+            "leverage": [],
+            "notional": [],
+            "pnl": [],
+        }
+
+        for i, (_, stats, trades) in enumerate(traders):
+            if not trades:
+                valid[i] = True
+                continue
+
+            # Same required keys as _extract_features; a trader that would fail
+            # there gets the default analysis here as well
+            try:
+                stats_row = (
+                    stats.last_30d_volume_usd,
+                    stats.trade_count_30d,
+                    stats.median_trade_size_usd,
+                    stats.win_rate,
+                    stats.maker_ratio or 0.5,
+                    stats.unique_symbols,
+                    stats.realized_pnl_clean_usd,
+                )
+                trader_columns = {
+                    "owner": [i] * len(trades),
+                    "timestamp": [t["timestamp"] for t in trades],
+                    "pair": [t["pair"] for t in trades],
+                    "is_long": [bool(t["is_long"]) for t in trades],
+                    "event_type": [t["event_type"] for t in trades],
+                    "leverage": [t.get("leverage", 1) for t in trades],
+                    "notional": (
+                        [t["size"] * t["price"] for t in trades]
+                        if len(trades) >= 2
+                        else [np.nan]
+                    ),
+                    "pnl": [t.get("pnl", 0) for t in trades],
+                }
+                stats_rows[i] = stats_row
+            except Exception as e:
+                logger.error(f"Error extracting features: {e}")
+                continue
+
+            valid[i] = True
+            for name, values in trader_columns.items():
+                columns[name].extend(values)
+
+        timestamps = pd.DatetimeIndex(pd.to_datetime(columns["timestamp"]))
+        event_types = np.asarray(columns["event_type"], dtype=object)
+
+        return {
+            "n": n,
+            "valid": valid,
+            "stats": stats_rows,
+            "owner": np.asarray(columns["owner"], dtype=np.int64),
+            "timestamp_ns": timestamps.asi8,
+            "hour": np.asarray(timestamps.hour, dtype=np.int64),
+            "day_ns": timestamps.normalize().asi8,
+            "timezone_aware": timestamps.tz is not None,
+            "pair": pd.factorize(np.asarray(columns["pair"], dtype=object))[0],
+            "is_long": np.asarray(columns["is_long"], dtype=bool),
+            "is_open": event_types == "OPENED",
+            "is_close": event_types == "CLOSED",
+            "leverage": np.asarray(columns["leverage"], dtype=float),
+            "notional": np.asarray(columns["notional"], dtype=float),
+            "pnl": np.asarray(columns["pnl"], dtype=float),
+        }
+
+    @staticmethod
+    def _grouped_mean_std(
+        owner: np.ndarray, values: np.ndarray, n: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Per-trader count, mean and population std (zero for empty groups)"""
+        counts = np.bincount(owner, minlength=n)
+        safe_counts = np.maximum(counts, 1)
+        means = np.bincount(owner, weights=values, minlength=n) / safe_counts
+        squared = np.bincount(owner, weights=(values - means[owner]) ** 2, minlength=n)
+        return counts, means, np.sqrt(squared / safe_counts)
+
+    def _extract_features_batch(self, frame: dict[str, np.ndarray]) -> np.ndarray:
+        """Feature matrix with one _extract_features row per trader"""
+        n = frame["n"]
+        owner = frame["owner"]
+        features = np.zeros((n, 20))
+
+        trade_counts = np.bincount(owner, minlength=n)
+        active = trade_counts > 0
+        safe_counts = np.maximum(trade_counts, 1)
+        stats = frame["stats"]
+
+        # Basic stats features (log-normalized)
+        features[:, 0] = np.log1p(np.maximum(stats[:, 0], 1))
+        features[:, 1] = np.log1p(np.maximum(stats[:, 1], 1))
+        features[:, 2] = np.log1p(np.maximum(stats[:, 2], 1))
+        features[:, 3] = stats[:, 3]
+        features[:, 4] = stats[:, 4]
+
+        # Hold times
+        hold_owner, hold_times = self._calculate_hold_times_batch(frame)
+        hold_counts, hold_mean, hold_std = self._grouped_mean_std(
+            hold_owner, hold_times, n
+        )
+        features[:, 5] = np.where(hold_counts > 0, hold_mean, 0)
+        features[:, 6] = np.where(hold_counts > 1, hold_std, 0)
+
+        # Leverage analysis
+        _, leverage_mean, leverage_std = self._grouped_mean_std(
+            owner, frame["leverage"], n
+        )
+        features[:, 7] = leverage_mean
+        features[:, 8] = 1 - leverage_std / np.maximum(leverage_mean, 1)
+
+        # Symbol diversity
+        features[:, 9] = self._calculate_symbol_entropy_batch(frame, safe_counts)
+
+        # Direction bias
+        features[:, 10] = (
+            np.bincount(owner, weights=frame["is_long"], minlength=n) / safe_counts
+        )
+
+        # Size scaling pattern
+        _, size_mean, size_std = self._grouped_mean_std(owner, frame["notional"], n)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cv = np.where(size_mean > 0, size_std / size_mean, 1.0)
+        features[:, 11] = np.where(trade_counts >= 2, 1.0 / (1.0 + cv), 0.0)
+
+        # Time pattern features (first 6 hours of the day)
+        hourly_counts = np.bincount(owner * 24 + frame["hour"], minlength=n * 24)
+        features[:, 12:18] = hourly_counts.reshape(n, 24)[:, :6] / safe_counts[:, None]
+
+        features[:, 18] = stats[:, 5] / safe_counts
+        features[:, 19] = stats[:, 6] / np.maximum(stats[:, 0], 1)  # ROI
+
+        # Traders without trades keep the default all-zero vector
+        features[~active] = 0.0
+        return features
+
+    def _calculate_hold_times_batch(
+        self, frame: dict[str, np.ndarray]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """FIFO-match opens to closes per (trader, pair, direction) in one pass
+
+        Returns (trader index, hold time in hours) for every matched close.
+        """
+        rows = np.flatnonzero(frame["is_open"] | frame["is_close"])
+        owner = frame["owner"][rows]
+        pair = frame["pair"][rows]
+        is_long = frame["is_long"][rows]
+        timestamp = frame["timestamp_ns"][rows]
+
+        # Stable sort keeps input order for equal timestamps, as sorted() does
+        order = np.lexsort((timestamp, is_long, pair, owner))
+        rows, owner, pair, is_long, timestamp = (
+            rows[order],
+            owner[order],
+            pair[order],
+            is_long[order],
+            timestamp[order],
+        )
+        if len(rows) == 0:
+            return owner, np.zeros(0)
+
+        is_open = frame["is_open"][rows]
+        group_start = np.ones(len(rows), dtype=bool)
+        group_start[1:] = (
+            (owner[1:] != owner[:-1])
+            | (pair[1:] != pair[:-1])
+            | (is_long[1:] != is_long[:-1])
+        )
+        group = np.cumsum(group_start) - 1
+
+        # Open-position queue depth is a walk of +1 per open and -1 per close
+        # that is reflected at zero (a close against an empty queue is ignored)
+        walk = pd.Series(np.where(is_open, 1, -1)).groupby(group).cumsum()
+        floor = np.minimum(walk.groupby(group).cummin().to_numpy(), 0)
+        depth = walk.to_numpy() - floor
+        depth_before = np.concatenate(([0], depth[:-1]))
+        depth_before[group_start] = 0
+        matched_close = ~is_open & (depth_before > 0)
+
+        # The k-th matched close in a group pairs with the k-th open
+        open_rows = np.flatnonzero(is_open)
+        opens_per_group = np.bincount(group, weights=is_open)
+        first_open = (np.cumsum(opens_per_group) - opens_per_group).astype(np.int64)
+        close_rank = pd.Series(matched_close).groupby(group).cumsum().to_numpy() - 1
+
+        closes = np.flatnonzero(matched_close)
+        opens = open_rows[first_open[group[closes]] + close_rank[closes]]
+        hold_seconds = (timestamp[closes] - timestamp[opens]) / 1e9
+        return owner[closes], hold_seconds / 3600  # hours
+
+    @staticmethod
+    def _calculate_symbol_entropy_batch(
+        frame: dict[str, np.ndarray], trade_counts: np.ndarray
+    ) -> np.ndarray:
+        """Per-trader Shannon entropy of traded pairs"""
+        n = frame["n"]
+        n_pairs = int(frame["pair"].max()) + 1 if len(frame["pair"]) else 1
+        keys, counts = np.unique(
+            frame["owner"] * n_pairs + frame["pair"], return_counts=True
+        )
+        owner = keys // n_pairs
+        probabilities = counts / trade_counts[owner]
+        terms = probabilities * np.log2(probabilities + 1e-10)
+        return -np.bincount(owner, weights=terms, minlength=n)
+
+    def _calculate_risk_metrics_batch(
+        self, frame: dict[str, np.ndarray]
+    ) -> dict[str, np.ndarray]:
+        """Per-trader sharpe_like, max_drawdown and consistency arrays"""
+        n = frame["n"]
+        metrics = {
+            "sharpe_like": np.zeros(n),
+            "max_drawdown": np.zeros(n),
+            "consistency": np.zeros(n),
+        }
+
+        closed = frame["is_close"]
+        if not closed.any():
+            return metrics
+
+        pnl = frame["pnl"][closed]
+        daily = (
+            pd.DataFrame(
+                {
+                    "owner": frame["owner"][closed],
+                    "day": frame["day_ns"][closed],
+                    "pnl": pnl,
+                    "win": pnl > 0,
+                }
+            )
+            .groupby(["owner", "day"], sort=True)
+            .agg(pnl=("pnl", "sum"), wins=("win", "sum"), total=("win", "size"))
+        )
+        day_owner = daily.index.get_level_values("owner").to_numpy()
+        daily_pnl = daily["pnl"].to_numpy()
+
+        first_day = np.ones(len(day_owner), dtype=bool)
+        first_day[1:] = day_owner[1:] != day_owner[:-1]
+
+        # Daily returns: change in daily PnL against the previous trading day
+        prev_pnl = np.concatenate(([0.0], daily_pnl[:-1]))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.where(
+                prev_pnl != 0, (daily_pnl - prev_pnl) / np.abs(prev_pnl), 0.0
+            )
+        returns, return_owner = returns[~first_day], day_owner[~first_day]
+
+        if len(returns):
+            by_owner = pd.Series(returns).groupby(return_owner)
+            ewm = by_owner.ewm(span=10)
+            ewma_return = ewm.mean().to_numpy()
+            ewma_vol = ewm.std().to_numpy()
+            last = np.flatnonzero(
+                np.append(return_owner[1:] != return_owner[:-1], True)
+            )
+            owners = return_owner[last]
+
+            # Python's max(nan, 0.001) keeps the NaN; mirror that here
+            vol = ewma_vol[last]
+            vol = np.where(0.001 > vol, 0.001, vol)
+            metrics["sharpe_like"][owners] = ewma_return[last] / vol
+
+            cumulative = by_owner.cumsum()
+            drawdowns = cumulative - cumulative.groupby(return_owner).cummax()
+            metrics["max_drawdown"][owners] = np.abs(
+                drawdowns.groupby(return_owner).min().to_numpy()
+            )
+
+            # Consistency needs daily returns too, so it shares this branch
+            metrics["consistency"][owners] = self._calculate_consistency_batch(
+                day_owner, daily["wins"].to_numpy(), daily["total"].to_numpy(), n
+            )[owners]
+
+        return metrics
+
+    @staticmethod
+    def _calculate_consistency_batch(
+        day_owner: np.ndarray,
+        wins: np.ndarray,
+        totals: np.ndarray,
+        n: int,
+        window: int = 7,
+    ) -> np.ndarray:
+        """1 - std of rolling win rates, per trader (see _calculate_rolling_win_rates)"""
+        day_counts = np.bincount(day_owner, minlength=n)
+        day_start = np.cumsum(day_counts) - day_counts
+        position = np.arange(len(day_owner)) - day_start[day_owner]
+
+        # Window i covers days [i - window, i), i.e. ends at position i - 1 for
+        # i in [window, days); so window ends run from window - 1 to days - 2
+        ends = np.flatnonzero(
+            (position >= window - 1) & (position <= day_counts[day_owner] - 2)
+        )
+        win_sums = np.concatenate(([0], np.cumsum(wins)))
+        total_sums = np.concatenate(([0], np.cumsum(totals)))
+        win_rates = (win_sums[ends + 1] - win_sums[ends + 1 - window]) / (
+            total_sums[ends + 1] - total_sums[ends + 1 - window]
+        )
+
+        rate_counts, _, rate_std = TraderAnalyzer._grouped_mean_std(
+            day_owner[ends], win_rates, n
+        )
+        return np.where(rate_counts > 1, 1 - rate_std, 0.0)
+
+    def _calculate_recent_volatility_batch(
+        self, frame: dict[str, np.ndarray], now: datetime
+    ) -> np.ndarray:
+        """Per-trader _calculate_recent_volatility"""
+        n = frame["n"]
+        volatility = np.full(n, 0.1)
+        owner = frame["owner"]
+
+        # Aware timestamps cannot be compared with utcnow(); the per-trader
+        # path falls back to the default in that case too
+        if frame["timezone_aware"] or len(owner) == 0:
+            return volatility
+
+        cutoff = pd.Timestamp(now - timedelta(days=30)).value
+        recent = frame["timestamp_ns"] > cutoff
+        recent_counts = np.bincount(owner, weights=recent, minlength=n)
+
+        recent_closed = recent & frame["is_close"]
+        pnl = frame["pnl"][recent_closed]
+        pnl_owner = owner[recent_closed]
+        pnl_counts, _, pnl_std = self._grouped_mean_std(pnl_owner, pnl, n)
+        mean_abs = np.bincount(pnl_owner, weights=np.abs(pnl), minlength=n) / (
+            np.maximum(pnl_counts, 1)
+        )
+
+        eligible = (
+            (np.bincount(owner, minlength=n) >= 10)
+            & (recent_counts >= 5)
+            & (pnl_counts >= 3)
+        )
+        volatility[eligible] = pnl_std[eligible] / (mean_abs[eligible] + 1e-10)
+        return volatility
+
+    def _score_batch(
+        self, features: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Raw performance, anomaly and cluster outputs for a feature matrix"""
+        n = len(features)
+        if not self.is_trained or n == 0:
+            # Neutral values as returned by the single-row predictors
+            return np.full(n, 0.5), np.zeros(n), np.zeros(n, dtype=int)
+
+        features_scaled = self.scaler.transform(features)
+        return (
+            self.performance_model.predict(features_scaled),
+            self.anomaly_detector.decision_function(features_scaled),
+            self.clustering_model.predict(features_scaled),
+        )
+
     def _determine_risk_level(self, risk_metrics: dict[str, float]) -> str:
         """Determine overall risk level"""
         sharpe = risk_metrics["sharpe_like"]
@@ -7,6 +7,8 @@ import asyncio
 import json
 import logging
 import os
+from collections import OrderedDict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
@@ -39,6 +41,9 @@ class TradeEvent:
 class AvantisEventIndexer:
     """Indexes Avantis Trading contract events from Base chain"""
 
+    # Most recently used block timestamps kept in memory
+    BLOCK_TIMESTAMP_CACHE_SIZE = 4096
+
     def __init__(self, config, db_pool: asyncpg.Pool, redis_client: redis.Redis):
         self.config = config
         self.db_pool = db_pool
@@ -47,6 +52,10 @@ class AvantisEventIndexer:
         self.trading_contract = None
         self.is_running = False
 
+        # Block timestamps shared by backfill and real-time monitoring
+        self._block_timestamps: OrderedDict[int, datetime] = OrderedDict()
+        self._block_timestamp_lock = asyncio.Lock()
+
         # Initialize Web3 connection
         self._setup_web3()
 
@@ -185,18 +194,15 @@ class AvantisEventIndexer:
     async def _process_block_range(self, from_block: int, to_block: int):
         """Process events in a block range with retry logic"""
         try:
-            events = []
-
             # Get TradeOpened events
             trade_opened_filter = (
                 self.trading_contract.events.TradeOpened.create_filter(
                     fromBlock=from_block, toBlock=to_block
                 )
             )
-
-            for event in trade_opened_filter.get_all_entries():
-                trade_event = self._normalize_trade_event(event, "OPENED")
-                events.append(trade_event)
+            raw_events = [
+                (event, "OPENED") for event in trade_opened_filter.get_all_entries()
+            ]
 
             # Get TradeClosed events
             trade_closed_filter = (
@@ -204,10 +210,11 @@ class AvantisEventIndexer:
                     fromBlock=from_block, toBlock=to_block
                 )
             )
+            raw_events += [
+                (event, "CLOSED") for event in trade_closed_filter.get_all_entries()
+            ]
 
-            for event in trade_closed_filter.get_all_entries():
-                trade_event = self._normalize_trade_event(event, "CLOSED")
-                events.append(trade_event)
+            events = await self._normalize_trade_events(raw_events)
 
             # Persist events to database
             if events:
@@ -220,7 +227,23 @@ class AvantisEventIndexer:
             logger.error(f"Error processing blocks {from_block}-{to_block}: {e}")
             raise
 
-    def _normalize_trade_event(self, event, event_type: str) -> TradeEvent:
+    async def _normalize_trade_events(
+        self, raw_events: list[tuple]
+    ) -> list[TradeEvent]:
+        """Normalize (event, event_type) pairs, looking up each block's timestamp once"""
+        timestamps = await self._get_block_timestamps(
+            event.blockNumber for event, _ in raw_events
+        )
+        return [
+            self._normalize_trade_event(
+                event, event_type, timestamps[event.blockNumber]
+            )
+            for event, event_type in raw_events
+        ]
+
+    def _normalize_trade_event(
+        self, event, event_type: str, timestamp: Optional[datetime] = None
+    ) -> TradeEvent:
         """Normalize raw blockchain event to our data structure"""
         try:
             # Convert price from Avantis format (multiplied by 1e10)
@@ -245,7 +268,8 @@ class AvantisEventIndexer:
             )
 
             # Get block timestamp
-            timestamp = self._get_block_timestamp(event.blockNumber)
+            if timestamp is None:
+                timestamp = self._get_block_timestamp(event.blockNumber)
 
             return TradeEvent(
                 address=event.args.trader.lower(),
@@ -267,12 +291,63 @@ class AvantisEventIndexer:
 
     def _get_block_timestamp(self, block_number: int) -> datetime:
         """Get timestamp for a block number"""
-        try:
-            block = self.web3.eth.get_block(block_number)
-            return datetime.fromtimestamp(block["timestamp"])
-        except Exception as e:
-            logger.error(f"Error getting block timestamp for block {block_number}: {e}")
-            return datetime.utcnow()
+        cached = self._block_timestamps.get(block_number)
+        if cached is not None:
+            self._block_timestamps.move_to_end(block_number)
+            return cached
+
+        fetched = self._fetch_block_timestamps([block_number])
+        self._remember_block_timestamps(fetched)
+        return fetched.get(block_number) or datetime.utcnow()
+
+    async def _get_block_timestamps(
+        self, block_numbers: Iterable[int]
+    ) -> dict[int, datetime]:
+        """Get timestamps for many blocks, fetching each uncached block once.
+
+        Lookups run in a worker thread so they do not block the event loop, and
+        the lock makes concurrent callers wait for an in-flight fetch instead of
+        repeating it.
+        """
+        wanted = set(block_numbers)
+        fetched: dict[int, datetime] = {}
+
+        async with self._block_timestamp_lock:
+            missing = sorted(n for n in wanted if n not in self._block_timestamps)
+            if missing:
+                fetched = await asyncio.to_thread(self._fetch_block_timestamps, missing)
+                self._remember_block_timestamps(fetched)
+
+        timestamps = {}
+        for block_number in wanted:
+            if block_number in self._block_timestamps:
+                self._block_timestamps.move_to_end(block_number)
+                timestamps[block_number] = self._block_timestamps[block_number]
+            else:
+                # Fetch failed, or evicted by a batch larger than the cache
+                timestamps[block_number] = fetched.get(block_number, datetime.utcnow())
+        return timestamps
+
+    def _fetch_block_timestamps(self, block_numbers: list[int]) -> dict[int, datetime]:
+        """Fetch block timestamps from the node, skipping blocks that fail"""
+        timestamps = {}
+        for block_number in block_numbers:
+            try:
+                block = self.web3.eth.get_block(block_number)
+                timestamps[block_number] = datetime.fromtimestamp(block["timestamp"])
+            except Exception as e:
+                logger.error(
+                    f"Error getting block timestamp for block {block_number}: {e}"
+                )
+        return timestamps
+
+    def _remember_block_timestamps(self, timestamps: dict[int, datetime]):
+        """Add timestamps to the cache, evicting the least recently used blocks"""
+        for block_number, timestamp in timestamps.items():
+            self._block_timestamps[block_number] = timestamp
+            self._block_timestamps.move_to_end(block_number)
+        while len(self._block_timestamps) > self.BLOCK_TIMESTAMP_CACHE_SIZE:
+            self._block_timestamps.popitem(last=False)
 
     async def _persist_events(self, events: list[TradeEvent]):
         """Persist events to database with conflict resolution"""
@@ -333,23 +408,24 @@ class AvantisEventIndexer:
 
         while self.is_running:
             try:
-                # Check for new TradeOpened events
-                opened_events = trade_opened_filter.get_new_entries()
-                for event in opened_events:
-                    trade_event = self._normalize_trade_event(event, "OPENED")
-                    await self._persist_events([trade_event])
-
-                    # Update last indexed block
-                    await self.redis.set("last_indexed_block", event.blockNumber)
+                # Check for new TradeOpened and TradeClosed events
+                raw_events = [
+                    (event, "OPENED") for event in trade_opened_filter.get_new_entries()
+                ]
+                raw_events += [
+                    (event, "CLOSED") for event in trade_closed_filter.get_new_entries()
+                ]
 
-                # Check for new TradeClosed events
-                closed_events = trade_closed_filter.get_new_entries()
-                for event in closed_events:
-                    trade_event = self._normalize_trade_event(event, "CLOSED")
-                    await self._persist_events([trade_event])
+                if raw_events:
+                    await self._persist_events(
+                        await self._normalize_trade_events(raw_events)
+                    )
 
                     # Update last indexed block
-                    await self.redis.set("last_indexed_block", event.blockNumber)
+                    await self.redis.set(
+                        "last_indexed_block",
+                        max(event.blockNumber for event, _ in raw_events),
+                    )
 
                 # Wait before next check
                 await asyncio.sleep(self.config.EVENT_MONITORING_INTERVAL)
@@ -5,12 +5,15 @@ Handles real-time position tracking and FIFO PnL calculation
 
 import asyncio
 import logging
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from statistics import median
-from typing import Optional
+from typing import Callable, Optional
 
 import asyncpg
+import numpy as np
+import pandas as pd
 import redis.asyncio as redis
 
 logger = logging.getLogger(__name__)
@@ -40,11 +43,29 @@ class Position:
 class PositionTracker:
     """Tracks trader positions and calculates FIFO PnL"""
 
+    # Refresh watermark row in trader_stats_sync
+    STATS_SYNC_NAME = "trader_stats_30d"
+    # Block watermark published by the event indexer (AvantisEventIndexer)
+    INDEXER_WATERMARK_KEY = "last_indexed_block"
+
     def __init__(self, db_pool: asyncpg.Pool, redis_client: redis.Redis, config):
         self.db_pool = db_pool
         self.redis = redis_client
         self.config = config
         self.is_running = False
+        self._refresh_listeners: list[Callable[[int], None]] = []
+
+    def on_stats_refreshed(self, listener: Callable[[int], None]) -> Callable[[], None]:
+        """Register a callback run after each committed stats refresh
+
+        The callback gets the block the stats are now current to and must not
+        block; schedule any slow work (e.g. LeaderboardService.schedule_refresh).
+
+        Returns:
+            Function that unregisters the callback
+        """
+        self._refresh_listeners.append(listener)
+        return lambda: self._refresh_listeners.remove(listener)
 
     async def start_tracking(self):
         """Start background tracking of trader positions"""
@@ -70,51 +91,259 @@ class PositionTracker:
         self.is_running = False
         logger.info("Stopped position tracking")
 
-    async def _update_trader_stats(self):
-        """Update 30-day stats for all traders"""
+    async def _update_trader_stats(self, now: Optional[datetime] = None):
+        """Bring 30-day stats up to date with the event indexer
+
+        Only traders with trade_events in blocks past the stored watermark, or
+        with events that aged out of the window since the last refresh, are
+        recomputed. The watermark is committed together with the stats, so a
+        restart resumes from it; only the very first run rebuilds everything.
+        """
         try:
-            thirty_days_ago = datetime.utcnow() - timedelta(days=30)
+            window_start = (now or datetime.utcnow()) - timedelta(days=30)
+            head = await self._get_indexer_watermark()
+            sync = await self._load_stats_sync()
+
+            if sync is None:
+                # First run: one pass over every trade in the window
+                trades = await self._get_window_trades(window_start)
+                removed = None
+            else:
+                trades = await self._get_changed_window_trades(
+                    sync["last_block"], head, sync["window_start"], window_start
+                )
+                # Traders left without trades in the window come back as a
+                # single row of NULLs from the outer join
+                removed = [t["address"] for t in trades if t["timestamp"] is None]
+                trades = [t for t in trades if t["timestamp"] is not None]
 
-            # Get all unique traders with activity in last 30 days
-            active_traders = await self._get_active_traders(thirty_days_ago)
+            all_stats = self._calculate_all_trader_stats(trades)
 
-            logger.info(f"Updating stats for {len(active_traders)} active traders")
+            logger.info(
+                f"Updating stats for {len(all_stats)} traders"
+                f" ({'full rebuild' if removed is None else 'incremental'},"
+                f" block {head})"
+            )
 
-            for trader_address in active_traders:
-                try:
-                    stats = await self._calculate_trader_stats(
-                        trader_address, thirty_days_ago
-                    )
-                    if stats:
-                        await self._cache_and_persist_stats(trader_address, stats)
-                except Exception as e:
-                    logger.error(f"Error calculating stats for {trader_address}: {e}")
-                    continue
+            await self._persist_stats_delta(all_stats, removed, head, window_start)
 
         except Exception as e:
             logger.error(f"Error in _update_trader_stats: {e}")
+            return
 
-    async def _get_active_traders(self, since: datetime) -> list[str]:
-        """Get list of traders with activity since given time"""
-        try:
-            acq = await self.db_pool.acquire()
-            async with acq as conn:
-                rows = await conn.fetch(
-                    """
+        for listener in self._refresh_listeners:
+            try:
+                listener(head)
+            except Exception as e:
+                logger.error(f"Stats refresh listener failed: {e}")
+
+    async def _get_indexer_watermark(self) -> int:
+        """Last block whose trade_events the event indexer has persisted"""
+        block = await self.redis.get(self.INDEXER_WATERMARK_KEY)
+        if block is not None:
+            return int(block)
+
+        # Indexer has not published a watermark yet; use what is stored
+        acq = await self.db_pool.acquire()
+        async with acq as conn:
+            return await conn.fetchval(
+                "SELECT COALESCE(MAX(block_number), 0) FROM trade_events"
+            )
+
+    async def _load_stats_sync(self) -> Optional[dict]:
+        """Watermark of the last committed stats refresh, if any"""
+        acq = await self.db_pool.acquire()
+        async with acq as conn:
+            row = await conn.fetchrow(
+                """
+                SELECT last_block, window_start
+                FROM trader_stats_sync
+                WHERE name = $1
+            """,
+                self.STATS_SYNC_NAME,
+            )
+            return dict(row) if row else None
+
+    async def _get_window_trades(self, since: datetime) -> list:
+        """Get all trades since given time, ordered by trader then time"""
+        acq = await self.db_pool.acquire()
+        async with acq as conn:
+            return await conn.fetch(
+                """
+                SELECT address, pair, is_long, size::float8 AS size,
+                       price::float8 AS price, event_type, timestamp,
+                       COALESCE(fee, 0)::float8 AS fee
+                FROM trade_events
+                WHERE timestamp >= $1
+                ORDER BY address, timestamp ASC, id ASC
+            """,
+                since,
+            )
+
+    async def _get_changed_window_trades(
+        self,
+        last_block: int,
+        head: int,
+        previous_start: datetime,
+        window_start: datetime,
+    ) -> list:
+        """Get window trades of traders whose window changed since last refresh
+
+        A trader changed if it has events in blocks (last_block, head] or
+        events in [previous_start, window_start) that just left the window.
+        Rows are shaped and ordered like _get_window_trades.
+        """
+        acq = await self.db_pool.acquire()
+        async with acq as conn:
+            return await conn.fetch(
+                """
+                WITH changed AS (
                     SELECT DISTINCT address
                     FROM trade_events
-                    WHERE timestamp >= $1
-                    ORDER BY address
-                """,
-                    since,
+                    WHERE (block_number > $1 AND block_number <= $2)
+                       OR (timestamp >= $3 AND timestamp < $4)
                 )
+                SELECT c.address, te.pair, te.is_long, te.size::float8 AS size,
+                       te.price::float8 AS price, te.event_type, te.timestamp,
+                       COALESCE(te.fee, 0)::float8 AS fee
+                FROM changed c
+                LEFT JOIN trade_events te
+                  ON te.address = c.address AND te.timestamp >= $4
+                ORDER BY c.address, te.timestamp ASC, te.id ASC
+            """,
+                last_block,
+                head,
+                previous_start,
+                window_start,
+            )
 
-                return [row["address"] for row in rows]
+    def _calculate_all_trader_stats(self, trades: list) -> list[TraderStats]:
+        """Columnar equivalent of _calculate_trader_stats for many traders
 
-        except Exception as e:
-            logger.error(f"Error getting active traders: {e}")
+        Expects rows ordered by address, then timestamp, as returned by
+        _get_window_trades. Aggregates are computed with numpy over the whole
+        window; only the FIFO lot matching walks the rows one by one.
+        """
+        if not trades:
             return []
 
+        addresses = np.asarray([t["address"] for t in trades], dtype=object)
+        starts = np.flatnonzero(np.r_[True, addresses[1:] != addresses[:-1]])
+        counts = np.diff(np.append(starts, len(addresses)))
+        owner = np.repeat(np.arange(len(starts)), counts)
+
+        pairs = [t["pair"] for t in trades]
+        is_long = [t["is_long"] for t in trades]
+        sizes = [t["size"] for t in trades]
+        prices = [t["price"] for t in trades]
+        event_types = [t["event_type"] for t in trades]
+        fees = [t.get("fee", 0) for t in trades]
+
+        # Volume and trade metrics
+        notional = np.asarray(sizes, dtype=float) * np.asarray(prices, dtype=float)
+        volume = np.add.reduceat(notional, starts)
+        by_size = notional[np.lexsort((notional, owner))]
+        median_size = (
+            by_size[starts + (counts - 1) // 2] + by_size[starts + counts // 2]
+        ) / 2
+
+        # Win rate calculation
+        closed_rows = [i for i, event in enumerate(event_types) if event == "CLOSED"]
+        wins = np.asarray([trades[i].get("pnl", 0) > 0 for i in closed_rows], bool)
+        closed_owner = owner[closed_rows]
+        closed_counts = np.bincount(closed_owner, minlength=len(starts))
+        win_counts = np.bincount(closed_owner[wins], minlength=len(starts))
+
+        # Unique symbols
+        pair_codes, symbols = pd.factorize(
+            np.asarray(pairs, dtype=object), use_na_sentinel=False
+        )
+        owner_pairs = np.unique(owner * len(symbols) + pair_codes)
+        unique_symbols = np.bincount(owner_pairs // len(symbols), minlength=len(starts))
+
+        realized_pnl = self._fifo_pnl_by_trader(
+            (starts + counts).tolist(), pairs, is_long, event_types, sizes, prices, fees
+        )
+
+        return [
+            TraderStats(
+                address=addresses[start],
+                last_30d_volume_usd=float(volume[g]),
+                median_trade_size_usd=float(median_size[g]),
+                trade_count_30d=int(counts[g]),
+                realized_pnl_clean_usd=realized_pnl[g],
+                last_trade_at=trades[start + counts[g] - 1]["timestamp"],
+                maker_ratio=None,  # See _calculate_maker_ratio
+                unique_symbols=int(unique_symbols[g]),
+                win_rate=(win_counts[g] / closed_counts[g] if closed_counts[g] else 0),
+            )
+            for g, start in enumerate(starts)
+        ]
+
+    @staticmethod
+    def _fifo_pnl_by_trader(
+        ends: list[int],
+        pairs: list,
+        is_long: list[bool],
+        event_types: list[str],
+        sizes: list[float],
+        prices: list[float],
+        fees: list[float],
+    ) -> list[float]:
+        """Realized FIFO PnL per trader; same matching as _calculate_fifo_pnl
+
+        Rows are grouped by trader and each group ends at the matching entry of
+        ``ends``, so open lots only need to be kept for one trader at a time.
+        """
+        realized = []
+        start = 0
+
+        for end in ends:
+            lots: dict[tuple, deque] = {}
+            pnl_total = 0.0
+
+            for i in range(start, end):
+                key = (pairs[i], bool(is_long[i]))
+                event_type = event_types[i]
+
+                if event_type == "OPENED":
+                    queue = lots.get(key)
+                    if queue is None:
+                        queue = lots[key] = deque()
+                    queue.append([sizes[i], prices[i]])
+
+                elif event_type == "CLOSED":
+                    queue = lots.get(key)
+                    remaining = sizes[i]
+                    price = prices[i]
+
+                    while remaining > 0 and queue:
+                        lot = queue[0]
+                        entry = lot[1]
+
+                        if remaining >= lot[0]:
+                            # Close entire lot
+                            matched = lot[0]
+                            queue.popleft()
+                        else:
+                            # Partial close, shrink the remaining lot
+                            matched = remaining
+                            lot[0] -= remaining
+
+                        if entry == 0:
+                            pnl = 0.0
+                        elif key[1]:
+                            pnl = matched * (price - entry) / entry
+                        else:
+                            pnl = matched * (entry - price) / entry
+                        pnl_total += pnl - fees[i]
+                        remaining -= matched
+
+            realized.append(pnl_total)
+            start = end
+
+        return realized
+
     async def _calculate_trader_stats(
         self, address: str, since: datetime
     ) -> Optional[TraderStats]:
@@ -273,59 +502,121 @@ class PositionTracker:
         # For now, return None to indicate unknown
         return None
 
-    async def _cache_and_persist_stats(self, address: str, stats: TraderStats):
-        """Cache and persist trader stats"""
-        try:
-            # Cache in Redis for fast access
-            cache_key = f"trader_stats:{address}:30d"
-            await self.redis.hset(
-                cache_key,
-                mapping={
-                    "volume": stats.last_30d_volume_usd,
-                    "median_size": stats.median_trade_size_usd,
-                    "trade_count": stats.trade_count_30d,
-                    "realized_pnl": stats.realized_pnl_clean_usd,
-                    "win_rate": stats.win_rate,
-                    "unique_symbols": stats.unique_symbols,
-                    "updated_at": datetime.utcnow().isoformat(),
-                },
-            )
-            await self.redis.expire(cache_key, 3600)  # Cache for 1 hour
+    async def _persist_stats_delta(
+        self,
+        all_stats: list[TraderStats],
+        removed: Optional[list[str]],
+        last_block: int,
+        window_start: datetime,
+    ):
+        """Persist changed stats and advance the refresh watermark atomically
+
+        ``removed`` lists traders with no trades left in the window; None marks
+        a full rebuild, which drops every stored trader missing from all_stats.
+        Raises on database errors so the watermark only moves with the stats.
+        """
+        updated_at = datetime.utcnow()
+
+        acq = await self.db_pool.acquire()
+        async with acq as conn:
+            async with conn.transaction():
+                if all_stats:
+                    await conn.execute(
+                        """
+                        INSERT INTO trader_stats (
+                            address, window, last_30d_volume_usd,
+                            median_trade_size_usd, trade_count_30d,
+                            realized_pnl_clean_usd, last_trade_at, maker_ratio,
+                            unique_symbols, updated_at
+                        )
+                        SELECT s.address, '30d', s.volume, s.median_size,
+                               s.trade_count, s.realized_pnl, s.last_trade_at,
+                               s.maker_ratio, s.unique_symbols, $9
+                        FROM unnest(
+                            $1::varchar[], $2::numeric[], $3::numeric[], $4::int[],
+                            $5::numeric[], $6::timestamp[], $7::numeric[], $8::int[]
+                        ) AS s(
+                            address, volume, median_size, trade_count,
+                            realized_pnl, last_trade_at, maker_ratio, unique_symbols
+                        )
+                        ON CONFLICT (address, window) DO UPDATE SET
+                            last_30d_volume_usd = EXCLUDED.last_30d_volume_usd,
+                            median_trade_size_usd = EXCLUDED.median_trade_size_usd,
+                            trade_count_30d = EXCLUDED.trade_count_30d,
+                            realized_pnl_clean_usd = EXCLUDED.realized_pnl_clean_usd,
+                            last_trade_at = EXCLUDED.last_trade_at,
+                            maker_ratio = EXCLUDED.maker_ratio,
+                            unique_symbols = EXCLUDED.unique_symbols,
+                            updated_at = EXCLUDED.updated_at
+                    """,
+                        [s.address for s in all_stats],
+                        [s.last_30d_volume_usd for s in all_stats],
+                        [s.median_trade_size_usd for s in all_stats],
+                        [s.trade_count_30d for s in all_stats],
+                        [s.realized_pnl_clean_usd for s in all_stats],
+                        [s.last_trade_at for s in all_stats],
+                        [s.maker_ratio for s in all_stats],
+                        [s.unique_symbols for s in all_stats],
+                        updated_at,
+                    )
+
+                if removed is None:
+                    await conn.execute(
+                        """
+                        DELETE FROM trader_stats
+                        WHERE window = '30d' AND NOT (address = ANY($1::varchar[]))
+                    """,
+                        [s.address for s in all_stats],
+                    )
+                elif removed:
+                    await conn.execute(
+                        """
+                        DELETE FROM trader_stats
+                        WHERE window = '30d' AND address = ANY($1::varchar[])
+                    """,
+                        removed,
+                    )
 
-            # Persist to database
-            acq = await self.db_pool.acquire()
-            async with acq as conn:
                 await conn.execute(
                     """
-                    INSERT INTO trader_stats (
-                        address, window, last_30d_volume_usd, median_trade_size_usd,
-                        trade_count_30d, realized_pnl_clean_usd, last_trade_at,
-                        maker_ratio, unique_symbols, updated_at
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                    ON CONFLICT (address, window) DO UPDATE SET
-                        last_30d_volume_usd = EXCLUDED.last_30d_volume_usd,
-                        median_trade_size_usd = EXCLUDED.median_trade_size_usd,
-                        trade_count_30d = EXCLUDED.trade_count_30d,
-                        realized_pnl_clean_usd = EXCLUDED.realized_pnl_clean_usd,
-                        last_trade_at = EXCLUDED.last_trade_at,
-                        maker_ratio = EXCLUDED.maker_ratio,
-                        unique_symbols = EXCLUDED.unique_symbols,
+                    INSERT INTO trader_stats_sync (
+                        name, last_block, window_start, updated_at
+                    ) VALUES ($1, $2, $3, $4)
+                    ON CONFLICT (name) DO UPDATE SET
+                        last_block = EXCLUDED.last_block,
+                        window_start = EXCLUDED.window_start,
                         updated_at = EXCLUDED.updated_at
                 """,
-                    address,
-                    "30d",
-                    stats.last_30d_volume_usd,
-                    stats.median_trade_size_usd,
-                    stats.trade_count_30d,
-                    stats.realized_pnl_clean_usd,
-                    stats.last_trade_at,
-                    stats.maker_ratio,
-                    stats.unique_symbols,
-                    datetime.utcnow(),
+                    self.STATS_SYNC_NAME,
+                    last_block,
+                    window_start,
+                    updated_at,
+                )
+
+        try:
+            # Cache in Redis for fast access
+            pipe = self.redis.pipeline()
+            for stats in all_stats:
+                cache_key = f"trader_stats:{stats.address}:30d"
+                pipe.hset(
+                    cache_key,
+                    mapping={
+                        "volume": stats.last_30d_volume_usd,
+                        "median_size": stats.median_trade_size_usd,
+                        "trade_count": stats.trade_count_30d,
+                        "realized_pnl": stats.realized_pnl_clean_usd,
+                        "win_rate": stats.win_rate,
+                        "unique_symbols": stats.unique_symbols,
+                        "updated_at": updated_at.isoformat(),
+                    },
                 )
+                pipe.expire(cache_key, 3600)  # Cache for 1 hour
+            if removed:
+                pipe.delete(*[f"trader_stats:{address}:30d" for address in removed])
+            await pipe.execute()
 
         except Exception as e:
-            logger.error(f"Error caching/persisting stats for {address}: {e}")
+            logger.error(f"Error caching stats for {len(all_stats)} traders: {e}")
 
     async def get_trader_stats(
         self, address: str, window: str = "30d"
@@ -21,9 +21,10 @@ logger = logging.getLogger(__name__)
 
 app = FastAPI(title="Vanta-Bot Signals API")
 
-# Lazy DB factory
+# Lazy DB factory and queue client
 _eng = None
 _Session = None
+_queue = None
 
 
 def _get_session():
@@ -63,8 +64,11 @@ def _verify_hmac(req_body: bytes, signature: str | None) -> bool:
 
 
 def _get_queue():
-    """Get Redis queue client."""
-    return redis.from_url(settings.REDIS_URL)
+    """Get Redis queue client (one connection pool per process)."""
+    global _queue
+    if _queue is None:
+        _queue = redis.from_url(settings.REDIS_URL)
+    return _queue
 
 
 @app.post("/signals")
@@ -109,8 +113,11 @@ async def receive_signal(req: Request):
     finally:
         db.close()
 
-    # Push to queue (RPUSH)
-    _get_queue().rpush(settings.SIGNALS_QUEUE, json.dumps({"intent_key": intent_key}))
+    # Push to queue (RPUSH); the user id lets the worker order by wallet
+    _get_queue().rpush(
+        settings.SIGNALS_QUEUE,
+        json.dumps({"intent_key": intent_key, "tg_user_id": data.tg_user_id}),
+    )
 
     # Increment metrics
     signals_queued.labels(source=data.source).inc()
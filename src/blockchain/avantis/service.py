@@ -67,23 +67,45 @@ class MarketView:
 class AvantisService:
     """Unified Avantis integration service (Phase 3)."""
 
-    def __init__(self, w3: Web3, db: Session, price_agg: PriceAggregator):
+    def __init__(
+        self,
+        w3: Web3,
+        db: Session,
+        price_agg: PriceAggregator,
+        markets: Optional[dict[str, MarketInfo]] = None,
+    ):
         """Initialize Avantis service.
 
         Args:
             w3: Web3 instance
             db: Database session
             price_agg: Price aggregator
+            markets: Preloaded market catalog (loaded from config if None)
         """
         self.w3 = w3
         self.db = db
         self.price_agg = price_agg
+        # One orchestrator for every send, built on first use
+        self._orchestrator: Optional[TxOrchestrator] = None
 
         # Load market catalog
-        self.markets = default_market_catalog()
+        self.markets = markets if markets is not None else default_market_catalog()
 
         logger.info(f"Avantis service initialized with {len(self.markets)} markets")
 
+    def _get_orchestrator(self) -> TxOrchestrator:
+        if self._orchestrator is None:
+            self._orchestrator = TxOrchestrator(self.w3, self.db)
+        return self._orchestrator
+
+    async def _get_orchestrator_async(self) -> TxOrchestrator:
+        if self._orchestrator is None:
+            orch = await TxOrchestrator.create(self.w3, self.db)
+            # Concurrent first calls may both build one; keep the first
+            if self._orchestrator is None:
+                self._orchestrator = orch
+        return self._orchestrator
+
     def list_markets(self) -> dict[str, MarketView]:
         """List all available markets with current prices.
 
@@ -91,9 +113,11 @@ class AvantisService:
             Dict mapping symbol to MarketView
         """
         out: dict[str, MarketView] = {}
+        # One snapshot for every market instead of a price lookup per symbol
+        quotes = self.price_agg.get_prices(self.markets)
 
         for sym, market_info in self.markets.items():
-            quote = self.price_agg.get_price(sym)
+            quote = quotes.get(sym)
 
             out[sym] = MarketView(
                 symbol=sym,
@@ -124,6 +148,7 @@ class AvantisService:
         collateral_usdc: float,
         leverage_x: int,
         slippage_pct: float,
+        intent_key: Optional[str] = None,
     ) -> str:
         """Open market position.
 
@@ -134,6 +159,7 @@ class AvantisService:
             collateral_usdc: Collateral amount in USDC
             leverage_x: Leverage (1..500)
             slippage_pct: Slippage percentage (e.g., 1.0 for 1%)
+            intent_key: Caller's idempotency key (derived from the order if None)
 
         Returns:
             Transaction hash
@@ -141,6 +167,47 @@ class AvantisService:
         Raises:
             ValueError: If market unknown or below min size
         """
+        intent_key, to_addr, data = self._prepare_open(
+            user_id, symbol, side, collateral_usdc, leverage_x, slippage_pct, intent_key
+        )
+        orch = self._get_orchestrator()
+        return orch.execute(
+            intent_key=intent_key, to=to_addr, data=data, value=0, confirmations=2
+        )
+
+    async def open_market_async(
+        self,
+        user_id: int,
+        symbol: str,
+        side: str,
+        collateral_usdc: float,
+        leverage_x: int,
+        slippage_pct: float,
+        intent_key: Optional[str] = None,
+    ) -> str:
+        """Open market position without blocking the event loop.
+
+        Same arguments and validation as open_market.
+        """
+        intent_key, to_addr, data = self._prepare_open(
+            user_id, symbol, side, collateral_usdc, leverage_x, slippage_pct, intent_key
+        )
+        orch = await self._get_orchestrator_async()
+        return await orch.execute_async(
+            intent_key=intent_key, to=to_addr, data=data, value=0, confirmations=2
+        )
+
+    def _prepare_open(
+        self,
+        user_id: int,
+        symbol: str,
+        side: str,
+        collateral_usdc: float,
+        leverage_x: int,
+        slippage_pct: float,
+        intent_key: Optional[str] = None,
+    ) -> tuple[str, str, bytes]:
+        """Validate an open and return its intent key, target and calldata."""
         market = self.markets.get(symbol.upper())
         if not market:
             raise ValueError(f"Unknown market: {symbol}")
@@ -160,23 +227,21 @@ class AvantisService:
         to_addr, data = encode_open(self.w3, market.perpetual, order, market.market_id)
 
         # Execute via orchestrator with deterministic idempotency key
-        intent_key = make_intent_key(
-            user_id=user_id,
-            action="open",
-            symbol=symbol,
-            side=side,
-            qty_1e6=order.size_usd,
-        )
-        orch = TxOrchestrator(self.w3, self.db)
+        if intent_key is None:
+            intent_key = make_intent_key(
+                user_id=user_id,
+                action="open",
+                symbol=symbol,
+                side=side,
+                qty_1e6=order.size_usd,
+            )
 
         logger.info(
             f"Opening {symbol} {side} position: collateral={collateral_usdc} USDC, "
             f"leverage={leverage_x}x, size={order.size_usd / 1_000_000:.2f} USDC"
         )
 
-        return orch.execute(
-            intent_key=intent_key, to=to_addr, data=data, value=0, confirmations=2
-        )
+        return intent_key, to_addr, data
 
     def close_market(
         self,
@@ -184,6 +249,7 @@ class AvantisService:
         symbol: str,
         reduce_usdc: float,
         slippage_pct: float,
+        intent_key: Optional[str] = None,
     ) -> str:
         """Close market position (full or partial).
 
@@ -192,6 +258,7 @@ class AvantisService:
             symbol: Market symbol
             reduce_usdc: Amount to reduce in USDC
             slippage_pct: Slippage percentage
+            intent_key: Caller's idempotency key (derived from the order if None)
 
         Returns:
             Transaction hash
@@ -199,6 +266,43 @@ class AvantisService:
         Raises:
             ValueError: If market unknown
         """
+        intent_key, to_addr, data = self._prepare_close(
+            user_id, symbol, reduce_usdc, slippage_pct, intent_key
+        )
+        orch = self._get_orchestrator()
+        return orch.execute(
+            intent_key=intent_key, to=to_addr, data=data, value=0, confirmations=2
+        )
+
+    async def close_market_async(
+        self,
+        user_id: int,
+        symbol: str,
+        reduce_usdc: float,
+        slippage_pct: float,
+        intent_key: Optional[str] = None,
+    ) -> str:
+        """Close market position without blocking the event loop.
+
+        Same arguments and validation as close_market.
+        """
+        intent_key, to_addr, data = self._prepare_close(
+            user_id, symbol, reduce_usdc, slippage_pct, intent_key
+        )
+        orch = await self._get_orchestrator_async()
+        return await orch.execute_async(
+            intent_key=intent_key, to=to_addr, data=data, value=0, confirmations=2
+        )
+
+    def _prepare_close(
+        self,
+        user_id: int,
+        symbol: str,
+        reduce_usdc: float,
+        slippage_pct: float,
+        intent_key: Optional[str] = None,
+    ) -> tuple[str, str, bytes]:
+        """Validate a close and return its intent key, target and calldata."""
         market = self.markets.get(symbol.upper())
         if not market:
             raise ValueError(f"Unknown market: {symbol}")
@@ -213,25 +317,23 @@ class AvantisService:
         )
 
         # Execute via orchestrator with deterministic idempotency key
-        intent_key = make_intent_key(
-            user_id=user_id,
-            action="close",
-            symbol=symbol,
-            side=None,
-            qty_1e6=reduce_1e6,
-        )
-        orch = TxOrchestrator(self.w3, self.db)
+        if intent_key is None:
+            intent_key = make_intent_key(
+                user_id=user_id,
+                action="close",
+                symbol=symbol,
+                side=None,
+                qty_1e6=reduce_1e6,
+            )
 
         logger.info(
             f"Closing {symbol} position: reduce={reduce_usdc} USDC, "
             f"slippage={slippage_pct}%"
         )
 
-        return orch.execute(
-            intent_key=intent_key, to=to_addr, data=data, value=0, confirmations=2
-        )
+        return intent_key, to_addr, data
 
-    def list_user_positions(self, user_address: str) -> list[dict]:
+    async def list_user_positions(self, user_address: str) -> list[dict]:
         """List positions for a user (from indexed data).
 
         Args:
@@ -241,25 +343,20 @@ class AvantisService:
             List of position dicts with cached reads
         """
         from src.repositories.positions_repo import list_positions
-        from src.services.cache.positions_cache import PositionsCache
-
-        cache = PositionsCache()
-        cached = cache.get_positions(user_address)
-        if cached is not None:
-            return cached
-
-        rows = list_positions(self.db, user_address)
-        out = [
-            {
-                "symbol": r.symbol,
-                "is_long": r.is_long,
-                "size_usd_1e6": int(r.size_usd_1e6),
-                "collateral_1e6": int(r.entry_collateral_1e6),
-                "realized_pnl_1e6": int(r.realized_pnl_1e6),
-                "updated_at": r.updated_at.isoformat(),
-            }
-            for r in rows
-        ]
-
-        cache.set_positions(user_address, out)
-        return out
+        from src.services.cache.positions_cache import positions_cache
+
+        def load() -> list[dict]:
+            return [
+                {
+                    "symbol": r.symbol,
+                    "is_long": r.is_long,
+                    "size_usd_1e6": int(r.size_usd_1e6),
+                    "collateral_1e6": int(r.entry_collateral_1e6),
+                    "realized_pnl_1e6": int(r.realized_pnl_1e6),
+                    "updated_at": r.updated_at.isoformat(),
+                }
+                for r in list_positions(self.db, user_address)
+            ]
+
+        # Concurrent requests for one user share a single DB load
+        return await positions_cache.get_or_load(user_address, load)
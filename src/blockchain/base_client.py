@@ -128,8 +128,8 @@ class BaseClient:
 
             # Initialize Redis for nonce management
             try:
-                self.redis = redis.from_url(settings.REDIS_URL)
-                self.redis.ping()  # Test connection
+                redis.from_url(settings.REDIS_URL).ping()  # Test connection
+                self.redis = redis.asyncio.from_url(settings.REDIS_URL)
                 logger.info("Connected to Redis for nonce management")
             except Exception as e:
                 logger.warning(f"Redis connection failed: {e}")
@@ -192,26 +192,39 @@ class BaseClient:
 
                 # Reserve nonce
                 async with nonce_manager.reserve(self.signer.address) as nonce:
-                    # Get gas quote
-                    max_fee, max_priority = gas_policy.quote(self.w3)
-
-                    # Estimate gas
-                    gas = tx_builder.estimate_gas(tx_params)
-
-                    # Build transaction
-                    tx = tx_builder.build(
-                        from_addr=self.signer.address,
-                        to=tx_params.get("to"),
-                        data=tx_params.get("data", b""),
-                        value=tx_params.get("value", 0),
-                        gas=gas,
-                        nonce=nonce,
-                        max_fee=max_fee,
-                        max_priority=max_priority,
-                    )
+                    try:
+                        # Get gas quote
+                        max_fee, max_priority = gas_policy.quote(self.w3)
+
+                        # Estimate gas
+                        gas = tx_builder.estimate_gas(tx_params)
+
+                        # Build transaction
+                        tx = tx_builder.build(
+                            from_addr=self.signer.address,
+                            to=tx_params.get("to"),
+                            data=tx_params.get("data", b""),
+                            value=tx_params.get("value", 0),
+                            gas=gas,
+                            nonce=nonce,
+                            max_fee=max_fee,
+                            max_priority=max_priority,
+                        )
+                    except Exception:
+                        # Nothing was sent: hand the nonce to the next send
+                        await nonce_manager.release_nonce(self.signer.address, nonce)
+                        raise
 
                     # Sign and send using signer
-                    tx_hash = await self.signer.sign_and_send(tx)
+                    try:
+                        tx_hash = await self.signer.sign_and_send(tx)
+                    except Exception:
+                        # May have been broadcast before failing: only release
+                        # the nonce if the chain shows it unused
+                        await nonce_manager.settle_failed_send(
+                            self.signer.address, nonce
+                        )
+                        raise
 
                     # Record transaction for idempotency
                     await repo.record_if_new(request_id, tx_hash, payload_hash)
@@ -1,11 +1,95 @@
 """Gas policy for EIP-1559 transactions with caps and surge controls."""
 
 import logging
+import threading
+import time
+import weakref
 from dataclasses import dataclass
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class BlockFeeState:
+    """Fee inputs read from one block header."""
+
+    block_number: Optional[int]
+    base_fee: Optional[int]
+    gas_price: Optional[int] = None  # Only read on non-EIP-1559 chains
+
+
+class GasQuoteCache:
+    """Per-block fee state shared by every quote against one Web3 client.
+
+    The latest header is fetched at most once per block interval; concurrent
+    callers wait for the in-flight fetch instead of issuing their own, so a
+    burst of builds and RBF bumps costs one header read per block.
+    """
+
+    _shared: "weakref.WeakKeyDictionary[object, GasQuoteCache]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _shared_lock = threading.Lock()
+
+    def __init__(self, web3_client, block_time_s: float = 2.0):
+        """Initialize gas quote cache.
+
+        Args:
+            web3_client: Web3 client instance
+            block_time_s: Expected block interval; state older than this is
+                refreshed (2s on Base)
+        """
+        self.web3 = web3_client
+        self.block_time_s = block_time_s
+        self._state: Optional[BlockFeeState] = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_web3(cls, web3_client) -> "GasQuoteCache":
+        """Process-wide cache for a Web3 client."""
+        with cls._shared_lock:
+            cache = cls._shared.get(web3_client)
+            if cache is None:
+                cache = cls._shared[web3_client] = cls(web3_client)
+            return cache
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._state is not None
+            and time.monotonic() - self._fetched_at < self.block_time_s
+        )
+
+    def get(self) -> BlockFeeState:
+        """Fee state of the latest block, fetching the header if stale."""
+        if self._is_fresh():
+            return self._state
+
+        with self._lock:
+            # Another thread may have refreshed while we waited
+            if self._is_fresh():
+                return self._state
+
+            latest_block = self.web3.eth.get_block("latest")
+            base_fee = latest_block.get("baseFeePerGas")
+            gas_price = None
+            if base_fee is None:
+                gas_price = self.web3.eth.gas_price
+
+            self._state = BlockFeeState(
+                block_number=latest_block.get("number"),
+                base_fee=base_fee,
+                gas_price=gas_price,
+            )
+            self._fetched_at = time.monotonic()
+            return self._state
+
+    def invalidate(self) -> None:
+        """Drop cached state so the next quote reads a fresh header."""
+        self._state = None
+
+
 @dataclass
 class GasPolicy:
     """Gas policy for EIP-1559 transactions."""
@@ -25,13 +109,13 @@ class GasPolicy:
             Tuple of (max_fee_per_gas, max_priority_fee_per_gas) in wei
         """
         try:
-            # Get latest block to read baseFeePerGas
-            latest_block = web3_client.eth.get_block("latest")
-            base_fee = latest_block.get("baseFeePerGas")
+            # Read baseFeePerGas from the shared per-block state
+            state = GasQuoteCache.for_web3(web3_client).get()
+            base_fee = state.base_fee
 
             if base_fee is None:
                 # Fallback for non-EIP-1559 chains (shouldn't happen on Base)
-                gas_price = int(web3_client.eth.gas_price * 1.2)
+                gas_price = int(state.gas_price * 1.2)
                 priority = int(gas_price * 0.1)
                 logger.warning(
                     "No baseFeePerGas found; using legacy gas_price fallback"
@@ -41,12 +125,7 @@ class GasPolicy:
             # Set priority fee (tip to miner)
             priority_wei = int(self.max_priority_gwei * 1e9)
 
-            # Calculate max fee: base + priority, with safety multiplier
-            max_fee = int((base_fee + priority_wei) * self.surge_multiplier)
-
-            # Cap to prevent excessive fees
-            max_fee_cap_wei = int(self.max_fee_cap_gwei * 1e9)
-            max_fee = min(max_fee, max_fee_cap_wei)
+            max_fee = self._max_fee(base_fee)
 
             # Ensure minimum priority fee
             min_priority_wei = int(self.min_priority_gwei * 1e9)
@@ -67,17 +146,40 @@ class GasPolicy:
             )
             return fallback_max_fee, fallback_priority
 
-    def bump_fee(self, current_max_fee: int, bump_percent: float = 0.15) -> int:
+    def _max_fee(self, base_fee: int) -> int:
+        """Max fee for a base fee: base + priority with surge, capped."""
+        priority_wei = int(self.max_priority_gwei * 1e9)
+
+        # Calculate max fee: base + priority, with safety multiplier
+        max_fee = int((base_fee + priority_wei) * self.surge_multiplier)
+
+        # Cap to prevent excessive fees
+        max_fee_cap_wei = int(self.max_fee_cap_gwei * 1e9)
+        return min(max_fee, max_fee_cap_wei)
+
+    def bump_fee(
+        self, current_max_fee: int, bump_percent: float = 0.15, web3_client=None
+    ) -> int:
         """Bump the max fee for retry scenarios.
 
         Args:
             current_max_fee: Current max fee in wei
             bump_percent: Percentage to bump (default 15%)
+            web3_client: Optional Web3 client; when given, the bump is never
+                below a fresh quote for the current block
 
         Returns:
             New max fee in wei
         """
         bumped = int(current_max_fee * (1 + bump_percent))
+        if web3_client is not None:
+            # Base fee may have risen past the bump since the original send
+            try:
+                state = GasQuoteCache.for_web3(web3_client).get()
+                if state.base_fee is not None:
+                    bumped = max(bumped, self._max_fee(state.base_fee))
+            except Exception as e:
+                logger.warning(f"Bumping without fresh base fee: {e}")
         capped = min(bumped, int(self.max_fee_cap_gwei * 1e9))
 
         logger.debug(f"Bumped fee from {current_max_fee} to {capped}")
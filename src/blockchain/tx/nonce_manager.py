@@ -1,10 +1,11 @@
-"""Nonce management with Redis locks to prevent collisions."""
+"""Nonce management with atomic Redis reservations to prevent collisions."""
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import Optional
 
-from redis import Redis
+from redis.asyncio import Redis
 
 from .nonce_store import HybridNonceStore
 
@@ -18,7 +19,7 @@ class NonceManager:
         """Initialize with Redis client and Web3 client.
 
         Args:
-            redis_client: Redis client (can be None for fallback-only mode)
+            redis_client: Async Redis client (can be None for fallback-only mode)
             web3_client: Web3 client for on-chain nonce queries
         """
         self.web3 = web3_client
@@ -37,26 +38,63 @@ class NonceManager:
         Raises:
             RuntimeError: If all nonce stores fail
         """
-        try:
-            async with self.store.reserve(address) as nonce:
-                logger.debug(f"Reserved nonce {nonce} for {address}")
-                yield nonce
-        except Exception as e:
-            logger.error(f"Failed to reserve nonce for {address}: {e}")
-            raise RuntimeError(f"Nonce reservation failed for {address}: {e}")
+        async with AsyncExitStack() as stack:
+            try:
+                nonce = await stack.enter_async_context(self.store.reserve(address))
+            except Exception as e:
+                logger.error(f"Failed to reserve nonce for {address}: {e}")
+                raise RuntimeError(f"Nonce reservation failed for {address}: {e}")
+
+            # Errors from the caller's block propagate unchanged
+            logger.debug(f"Reserved nonce {nonce} for {address}")
+            yield nonce
 
-    def release_nonce(self, address: str, nonce: int):
+    async def release_nonce(self, address: str, nonce: int):
         """Release a nonce back to the pool (for failed transactions).
 
-        Note: This is a simplified implementation. In production, you'd want
-        to implement proper nonce release logic in the store.
+        Only release nonces whose transaction was never broadcast; the next
+        reservation for the address reuses the lowest released nonce.
         """
         try:
+            await self.store.release(address, nonce)
             logger.debug(f"Released nonce {nonce} for {address}")
-            # In a full implementation, you'd update the store here
         except Exception as e:
             logger.error(f"Failed to release nonce {nonce} for {address}: {e}")
 
+    async def settle_failed_send(self, address: str, nonce: int) -> bool:
+        """Decide what happens to a nonce whose send raised.
+
+        A send can fail after the transaction reached the node (timeout,
+        dropped connection), so the nonce is only released when the chain's
+        pending nonce shows it unused. If that cannot be read the nonce stays
+        reserved: a gap stalls later sends until a resync, but reusing a live
+        nonce would replace or collide with the broadcast transaction.
+
+        Returns:
+            True if the nonce was released
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            pending = await loop.run_in_executor(
+                None, self.web3.eth.get_transaction_count, address, "pending"
+            )
+        except Exception as e:
+            logger.error(
+                f"Could not check nonce {nonce} for {address} after a failed "
+                f"send, keeping it reserved: {e}"
+            )
+            return False
+
+        if pending > nonce:
+            logger.warning(
+                f"Send with nonce {nonce} for {address} failed but the nonce is "
+                f"in use (pending nonce {pending}); not releasing it"
+            )
+            return False
+
+        await self.release_nonce(address, nonce)
+        return True
+
     def get_current_nonce(self, address: str) -> int:
         """Get current nonce for address without reserving."""
         try:
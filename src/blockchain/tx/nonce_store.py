@@ -8,10 +8,77 @@ from typing import Protocol
 
 logger = logging.getLogger(__name__)
 
+# Reserve the next nonce for an address in one atomic round trip.
+# KEYS[1]: next nonce counter, KEYS[2]: sorted set of released nonces
+# ARGV[1]: on-chain pending nonce ("" when not known), ARGV[2]: counter TTL
+# Released nonces below the counter are handed out first, lowest first, so
+# failed sends do not leave gaps. Returns -1 when the counter is cold and no
+# on-chain nonce was passed; the caller reads it and calls again.
+RESERVE_NONCE_LUA = """
+local nxt = tonumber(redis.call('GET', KEYS[1]))
+local floor = tonumber(ARGV[1])
+if not nxt and not floor then
+    return -1
+end
+if floor then
+    redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', '(' .. floor)
+    if not nxt or floor > nxt then
+        nxt = floor
+    end
+end
+local nonce = nxt
+local released = redis.call('ZRANGE', KEYS[2], 0, 0)
+if released[1] and tonumber(released[1]) < nxt then
+    redis.call('ZREM', KEYS[2], released[1])
+    nonce = tonumber(released[1])
+else
+    nxt = nxt + 1
+end
+redis.call('SET', KEYS[1], nxt, 'EX', ARGV[2])
+return nonce
+"""
+
+# Return a reserved but never broadcast nonce to the pool.
+# KEYS/ARGV[2] as above, ARGV[1]: the nonce. Nonces at or above the counter
+# were never handed out by this store and are ignored.
+RELEASE_NONCE_LUA = """
+local nxt = tonumber(redis.call('GET', KEYS[1]))
+local nonce = tonumber(ARGV[1])
+if not nxt or nonce >= nxt then
+    return 0
+end
+redis.call('ZADD', KEYS[2], nonce, ARGV[1])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return 1
+"""
+
+# Move the counter up to the on-chain pending nonce after a "nonce too low".
+# KEYS/ARGV[2] as above, ARGV[1]: on-chain pending nonce. The counter is never
+# lowered, so nonces other processes reserved but have not broadcast yet are
+# not handed out twice. Returns the counter.
+SYNC_NONCE_LUA = """
+local nxt = tonumber(redis.call('GET', KEYS[1]))
+local floor = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', '(' .. floor)
+if not nxt or floor > nxt then
+    nxt = floor
+end
+redis.call('SET', KEYS[1], nxt, 'EX', ARGV[2])
+return nxt
+"""
+
 
 class NonceStore(Protocol):
     """Protocol for nonce storage."""
 
+    async def acquire(self, address: str) -> int:
+        """Reserve and return the next nonce for the given address."""
+        ...
+
+    async def release(self, address: str, nonce: int) -> None:
+        """Return a nonce whose transaction was never broadcast."""
+        ...
+
     @asynccontextmanager
     async def reserve(self, address: str):
         """Reserve a nonce for the given address."""
@@ -19,94 +86,118 @@ class NonceStore(Protocol):
 
 
 class InMemoryNonceStore:
-    """In-memory nonce store with asyncio locks as fallback."""
+    """In-memory nonce store as fallback (single process only)."""
 
     def __init__(self):
         self._nonces: dict[str, int] = {}
-        self._locks: dict[str, asyncio.Lock] = {}
+        self._released: dict[str, set[int]] = {}
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
 
+    async def acquire(self, address: str) -> int:
+        """Reserve a nonce using in-memory store."""
+        # No awaits below, so each reservation is atomic on the event loop
+        released = self._released.get(address)
+        if released:
+            nonce = min(released)
+            released.remove(nonce)
+        else:
+            nonce = self._nonces.get(address, 0) + 1
+            self._nonces[address] = nonce
+
+        logger.debug(f"Reserved in-memory nonce {nonce} for {address}")
+        return nonce
+
+    async def release(self, address: str, nonce: int) -> None:
+        """Return a nonce to the in-memory pool."""
+        if nonce <= self._nonces.get(address, 0):
+            self._released.setdefault(address, set()).add(nonce)
+
+    def advance(self, address: str, nonce: int) -> None:
+        """Move the pool forward so every reservation is above nonce."""
+        if nonce > self._nonces.get(address, 0):
+            self._nonces[address] = nonce
+        released = self._released.get(address)
+        if released:
+            self._released[address] = {n for n in released if n > nonce}
+
     @asynccontextmanager
     async def reserve(self, address: str):
         """Reserve a nonce using in-memory store."""
-        # Get or create lock for this address
-        if address not in self._locks:
-            self._locks[address] = asyncio.Lock()
-
-        lock = self._locks[address]
-
-        try:
-            # Acquire lock properly in async context
-            await lock.acquire()
-
-            # Get current nonce
-            current_nonce = self._nonces.get(address, 0)
-            next_nonce = current_nonce + 1
-
-            # Update stored nonce
-            self._nonces[address] = next_nonce
-
-            logger.debug(f"Reserved in-memory nonce {next_nonce} for {address}")
-            yield next_nonce
-
-        finally:
-            # Release lock
-            lock.release()
+        yield await self.acquire(address)
 
 
 class RedisNonceStore:
-    """Redis-based nonce store with distributed locking."""
+    """Redis-based nonce store with atomic Lua reservation.
+
+    Expects a redis.asyncio client. Each reservation is a single script call
+    and never blocks the event loop; the on-chain pending nonce is only read
+    when the address has no cached counter.
+    """
 
     def __init__(self, redis_client, web3_client):
         self.redis = redis_client
         self.web3 = web3_client
-        self.lock_timeout = 5  # seconds
-        self.blocking_timeout = 5  # seconds
         self.nonce_cache_ttl = 300  # 5 minutes
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        self._reserve_script = redis_client.register_script(RESERVE_NONCE_LUA)
+        self._release_script = redis_client.register_script(RELEASE_NONCE_LUA)
+        self._sync_script = redis_client.register_script(SYNC_NONCE_LUA)
 
-    @asynccontextmanager
-    async def reserve(self, address: str):
-        """Reserve a nonce using Redis distributed lock."""
+    @staticmethod
+    def _keys(address: str) -> list[str]:
         key = f"nonce:{address.lower()}"
-        lock_key = f"{key}:lock"
+        return [key, f"{key}:released"]
 
+    async def acquire(self, address: str) -> int:
+        """Reserve a nonce with one atomic Redis round trip."""
+        keys = self._keys(address)
         try:
-            # Acquire distributed lock
-            with self.redis.lock(
-                lock_key,
-                timeout=self.lock_timeout,
-                blocking_timeout=self.blocking_timeout,
-            ):
-                # Get current on-chain nonce in executor to avoid blocking
-                loop = asyncio.get_event_loop()
+            nonce = await self._reserve_script(
+                keys=keys, args=["", self.nonce_cache_ttl]
+            )
+            if int(nonce) < 0:
+                # Cold counter: seed it from the on-chain pending nonce
+                loop = asyncio.get_running_loop()
                 onchain_nonce = await loop.run_in_executor(
                     self._executor,
                     self.web3.eth.get_transaction_count,
                     address,
                     "pending",
                 )
-
-                # Get cached nonce from Redis
-                cached_nonce = self.redis.get(key)
-                if cached_nonce is not None:
-                    cached_nonce = int(cached_nonce)
-                else:
-                    cached_nonce = onchain_nonce
-
-                # Use the higher of on-chain or cached nonce
-                next_nonce = max(onchain_nonce, cached_nonce)
-
-                # Update cache with next nonce
-                self.redis.set(key, next_nonce + 1, ex=self.nonce_cache_ttl)
-
-                logger.debug(f"Reserved Redis nonce {next_nonce} for {address}")
-                yield next_nonce
-
+                nonce = await self._reserve_script(
+                    keys=keys, args=[onchain_nonce, self.nonce_cache_ttl]
+                )
         except Exception as e:
             logger.error(f"Failed to reserve Redis nonce for {address}: {e}")
             raise RuntimeError(f"Redis nonce reservation failed for {address}: {e}")
 
+        logger.debug(f"Reserved Redis nonce {nonce} for {address}")
+        return int(nonce)
+
+    async def release(self, address: str, nonce: int) -> None:
+        """Return a nonce so the next reservation refills the gap."""
+        released = await self._release_script(
+            keys=self._keys(address), args=[nonce, self.nonce_cache_ttl]
+        )
+        if int(released):
+            logger.debug(f"Released Redis nonce {nonce} for {address}")
+
+    async def resync(self, address: str) -> None:
+        """Skip nonces the chain has already used, e.g. by another sender."""
+        loop = asyncio.get_running_loop()
+        onchain_nonce = await loop.run_in_executor(
+            self._executor, self.web3.eth.get_transaction_count, address, "pending"
+        )
+        nxt = await self._sync_script(
+            keys=self._keys(address), args=[onchain_nonce, self.nonce_cache_ttl]
+        )
+        logger.info(f"Resynced Redis nonce for {address} to {nxt}")
+
+    @asynccontextmanager
+    async def reserve(self, address: str):
+        """Reserve a nonce using an atomic Redis script."""
+        yield await self.acquire(address)
+
 
 class HybridNonceStore:
     """Hybrid nonce store with Redis primary and in-memory fallback."""
@@ -121,32 +212,13 @@ class HybridNonceStore:
         self._redis_healthy = True
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
 
-    def _check_redis_health(self) -> bool:
-        """Check if Redis is healthy."""
-        if not self.redis:
-            return False
-
-        try:
-            self.redis.ping()
-            return True
-        except Exception:
-            return False
-
-    @asynccontextmanager
-    async def reserve(self, address: str):
+    async def acquire(self, address: str) -> int:
         """Reserve nonce with fallback strategy."""
-        # Check Redis health
-        if self._redis_healthy and not self._check_redis_health():
-            logger.warning("Redis unhealthy, switching to in-memory nonce store")
-            self._redis_healthy = False
-
         if self._redis_healthy and self.redis_store:
             try:
-                # Try Redis first
-                async with self.redis_store.reserve(address) as nonce:
-                    yield nonce
-                return
+                return await self.redis_store.acquire(address)
             except Exception as e:
+                # Stay on the fallback: mixing stores would reissue nonces
                 logger.warning(
                     f"Redis nonce store failed: {e}, falling back to in-memory"
                 )
@@ -154,21 +226,97 @@ class HybridNonceStore:
 
         # Fallback to in-memory store
         try:
-            async with self.memory_store.reserve(address) as nonce:
-                # Sync with on-chain nonce to avoid conflicts
-                loop = asyncio.get_event_loop()
-                onchain_nonce = await loop.run_in_executor(
-                    self._executor,
-                    self.web3.eth.get_transaction_count,
-                    address,
-                    "pending",
-                )
-                if nonce <= onchain_nonce:
-                    # Use on-chain nonce if it's higher
-                    nonce = onchain_nonce + 1
-                    logger.info(f"Synced in-memory nonce with on-chain: {nonce}")
-
-                yield nonce
+            # Sync with on-chain nonce to avoid conflicts
+            loop = asyncio.get_running_loop()
+            onchain_nonce = await loop.run_in_executor(
+                self._executor,
+                self.web3.eth.get_transaction_count,
+                address,
+                "pending",
+            )
+            self.memory_store.advance(address, onchain_nonce)
+            return await self.memory_store.acquire(address)
         except Exception as e:
             logger.error(f"Both Redis and in-memory nonce stores failed: {e}")
             raise RuntimeError(f"All nonce stores failed for {address}: {e}")
+
+    async def release(self, address: str, nonce: int) -> None:
+        """Release a nonce to whichever store is serving reservations."""
+        if self._redis_healthy and self.redis_store:
+            try:
+                await self.redis_store.release(address, nonce)
+                return
+            except Exception as e:
+                logger.warning(f"Redis nonce release failed: {e}")
+                return
+        await self.memory_store.release(address, nonce)
+
+    @asynccontextmanager
+    async def reserve(self, address: str):
+        """Reserve nonce with fallback strategy."""
+        yield await self.acquire(address)
+
+
+class LocalNonceStore:
+    """Process-local nonce store seeded from the chain's pending nonce.
+
+    Hands out consecutive nonces per address without an RPC call per
+    reservation. Use RedisNonceStore when several processes share a signer.
+    """
+
+    def __init__(self, web3_client):
+        self.web3 = web3_client
+        self._next: dict[str, int] = {}
+        self._released: dict[str, set[int]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def acquire(self, address: str) -> int:
+        """Reserve the next nonce, reading the pending nonce on first use."""
+        if address not in self._next:
+            lock = self._locks.setdefault(address, asyncio.Lock())
+            async with lock:
+                if address not in self._next:
+                    loop = asyncio.get_running_loop()
+                    self._next[address] = await loop.run_in_executor(
+                        None, self.web3.eth.get_transaction_count, address, "pending"
+                    )
+
+        released = self._released.get(address)
+        if released:
+            nonce = min(released)
+            released.remove(nonce)
+        else:
+            nonce = self._next[address]
+            self._next[address] = nonce + 1
+
+        logger.debug(f"Reserved local nonce {nonce} for {address}")
+        return nonce
+
+    async def release(self, address: str, nonce: int) -> None:
+        """Return a nonce whose transaction was never broadcast."""
+        if nonce < self._next.get(address, 0):
+            self._released.setdefault(address, set()).add(nonce)
+
+    def reset(self, address: str) -> None:
+        """Forget local state so the next reservation re-reads the chain."""
+        self._next.pop(address, None)
+        self._released.pop(address, None)
+
+    async def resync(self, address: str) -> None:
+        """Skip nonces the chain has already used, e.g. by another sender.
+
+        Unlike reset(), never moves below nonces already handed out here.
+        """
+        loop = asyncio.get_running_loop()
+        onchain_nonce = await loop.run_in_executor(
+            None, self.web3.eth.get_transaction_count, address, "pending"
+        )
+        self._next[address] = max(self._next.get(address, 0), onchain_nonce)
+        released = self._released.get(address)
+        if released:
+            self._released[address] = {n for n in released if n >= onchain_nonce}
+
+    @asynccontextmanager
+    async def reserve(self, address: str):
+        """Reserve a nonce from the local pool."""
+        yield await self.acquire(address)
@@ -1,28 +1,164 @@
 """Transaction orchestrator with idempotency and persistence (Phase 2)."""
 
+import asyncio
 import json
 import logging
 import time
+import weakref
 from datetime import datetime
 from typing import Optional
 from uuid import uuid4
 
+import redis.asyncio as redis_async
 from sqlalchemy.orm import Session
 from web3 import Web3
 from web3.exceptions import TransactionNotFound
 
-from src.blockchain.signers.factory import get_signer
+from src.blockchain.signers import factory as signer_factory
+from src.config.settings import settings
 from src.database.models import TxIntent, TxReceipt, TxSend
 
 from .builder import TxBuilder
 from .gas_policy import GasPolicy
+from .nonce_store import LocalNonceStore, NonceStore, RedisNonceStore
 
 logger = logging.getLogger(__name__)
 
 
+# Send errors meaning the nonce is already used on chain
+_NONCE_ERRORS = ("nonce too low", "already known", "replacement transaction")
+# Of those, the ones where another transaction took the nonce, so the send
+# can be retried with a fresh one. "already known" means this very
+# transaction is already in the mempool and must not be sent again.
+_NONCE_TAKEN_ERRORS = ("nonce too low", "replacement transaction")
+
+
+def _hex(tx_hash) -> str:
+    tx_hash = tx_hash if isinstance(tx_hash, str) else tx_hash.hex()
+    tx_hash = tx_hash.lower()
+    return tx_hash if tx_hash.startswith("0x") else f"0x{tx_hash}"
+
+
+class ReceiptTracker:
+    """Resolves receipts for many in-flight transactions as blocks arrive.
+
+    One polling task per Web3 instance follows the chain head, scans each new
+    block's transaction hashes and only fetches receipts for transactions it
+    is tracking, so the RPC cost grows with blocks rather than with the
+    number of pending transactions.
+    """
+
+    _shared: "weakref.WeakKeyDictionary[Web3, ReceiptTracker]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(self, web3: Web3, poll_interval: float = 1.0, max_scan: int = 20):
+        """Initialize receipt tracker.
+
+        Args:
+            web3: Web3 instance
+            poll_interval: Seconds between chain head polls
+            max_scan: Most blocks to scan per poll; beyond that pending
+                receipts are looked up directly
+        """
+        self.web3 = web3
+        self.poll_interval = poll_interval
+        self.max_scan = max_scan
+        self._pending: dict[str, asyncio.Future] = {}
+        self._unchecked: set[str] = set()
+        self._last_block: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def for_web3(cls, web3: Web3) -> "ReceiptTracker":
+        """Process-wide tracker for a Web3 instance."""
+        tracker = cls._shared.get(web3)
+        if tracker is None:
+            tracker = cls._shared[web3] = cls(web3)
+        return tracker
+
+    async def wait(self, tx_hashes: list[str], timeout: float):
+        """Wait until any of the hashes (replacements of one nonce) is mined.
+
+        Returns:
+            Receipt of the mined transaction
+
+        Raises:
+            TimeoutError: If none is mined within timeout
+        """
+        futures = []
+        for tx_hash in map(_hex, tx_hashes):
+            if tx_hash not in self._pending:
+                self._pending[tx_hash] = asyncio.get_running_loop().create_future()
+                self._unchecked.add(tx_hash)
+            futures.append(self._pending[tx_hash])
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        done, _ = await asyncio.wait(
+            futures, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+        if not done:
+            raise TimeoutError(
+                f"Transaction {tx_hashes[-1]} not mined within {timeout}s"
+            )
+        return next(iter(done)).result()
+
+    def forget(self, tx_hashes: list[str]) -> None:
+        """Stop tracking hashes once their intent is settled."""
+        for tx_hash in map(_hex, tx_hashes):
+            future = self._pending.pop(tx_hash, None)
+            if future is not None and not future.done():
+                future.cancel()
+            self._unchecked.discard(tx_hash)
+
+    async def _run(self) -> None:
+        while self._pending:
+            try:
+                await self._poll()
+            except Exception as e:
+                logger.warning(f"Receipt tracker poll failed: {e}")
+            await asyncio.sleep(self.poll_interval)
+        self._last_block = None
+
+    async def _poll(self) -> None:
+        head = await asyncio.to_thread(lambda: self.web3.eth.block_number)
+
+        # Hashes registered since the last poll may already be mined
+        lookups = set(self._unchecked)
+        self._unchecked.clear()
+
+        if self._last_block is None or head - self._last_block > self.max_scan:
+            lookups |= set(self._pending)
+        else:
+            for number in range(self._last_block + 1, head + 1):
+                block = await asyncio.to_thread(self.web3.eth.get_block, number)
+                mined = {_hex(h) for h in block["transactions"]}
+                lookups |= mined & self._pending.keys()
+        self._last_block = head
+
+        for tx_hash in lookups:
+            future = self._pending.get(tx_hash)
+            if future is None or future.done():
+                continue
+            try:
+                receipt = await asyncio.to_thread(
+                    self.web3.eth.get_transaction_receipt, tx_hash
+                )
+            except TransactionNotFound:
+                continue
+            if receipt is not None and not future.done():
+                future.set_result(receipt)
+
+
 class TxOrchestrator:
     """Orchestrates transaction lifecycle with idempotency and persistence."""
 
+    # Receipt wait before each RBF replacement, and after the last one
+    rbf_wait_s = 5
+    final_wait_s = 30
+
     def __init__(
         self,
         web3: Web3,
@@ -30,6 +166,7 @@ class TxOrchestrator:
         gas_policy: Optional[GasPolicy] = None,
         rbf_attempts: int = 2,
         rbf_bump_multiplier: float = 1.15,
+        nonce_store: Optional[NonceStore] = None,
     ):
         """Initialize transaction orchestrator.
 
@@ -39,14 +176,29 @@ class TxOrchestrator:
             gas_policy: Gas policy (default if None)
             rbf_attempts: Number of RBF retry attempts
             rbf_bump_multiplier: Fee bump multiplier for RBF
+            nonce_store: Nonce store for execute_async (default: a
+                RedisNonceStore shared by every process when REDIS_URL is
+                set, else one process-local store per Web3 instance)
         """
         self.web3 = web3
         self.db = db
-        self.signer = get_signer(web3)
+        self.signer = signer_factory.get_signer(web3)
         self.builder = TxBuilder(web3, web3.eth.chain_id, gas_policy)
         self.gas_policy = gas_policy or GasPolicy()
         self.rbf_attempts = rbf_attempts
         self.rbf_bump_multiplier = rbf_bump_multiplier
+        self.nonce_store = nonce_store or _default_nonce_store(web3)
+        self.receipts = ReceiptTracker.for_web3(web3)
+
+    @classmethod
+    async def create(cls, web3: Web3, db: Session, **kwargs) -> "TxOrchestrator":
+        """Build an orchestrator without blocking the event loop.
+
+        The constructor reads the chain id and may load the signer's key
+        (a KMS call), so it runs in a worker thread. Build once and reuse
+        the orchestrator for every execute_async.
+        """
+        return await asyncio.to_thread(cls, web3, db, **kwargs)
 
     def _get_or_create_intent(self, intent_key: str, metadata: dict) -> TxIntent:
         """Get or create transaction intent.
@@ -107,19 +259,9 @@ class TxOrchestrator:
         # Check for existing completed intent
         intent = self._get_or_create_intent(intent_key, metadata or {"to": to})
 
-        if intent.status in ("SENT", "MINED"):
-            # Return existing tx hash
-            existing_send = (
-                self.db.query(TxSend)
-                .filter_by(intent_id=intent.id)
-                .order_by(TxSend.id.desc())
-                .first()
-            )
-            if existing_send:
-                logger.info(
-                    f"Intent already {intent.status}, returning existing tx: {existing_send.tx_hash}"
-                )
-                return existing_send.tx_hash
+        existing_hash = self._existing_tx_hash(intent)
+        if existing_hash:
+            return existing_hash
 
         # Build transaction
         from_addr = self.signer.address
@@ -146,30 +288,18 @@ class TxOrchestrator:
         tx_hash = self.web3.eth.send_raw_transaction(raw_tx).hex()
 
         # Persist send record
-        send = TxSend(
-            intent_id=intent.id,
-            chain_id=self.web3.eth.chain_id,
-            nonce=nonce,
-            max_fee_per_gas=int(tx_params["maxFeePerGas"]),
-            max_priority_fee_per_gas=int(tx_params["maxPriorityFeePerGas"]),
-            gas_limit=int(tx_params["gas"]),
-            raw_tx=b"",  # Optionally store; omitted for size
-            tx_hash=tx_hash,
-            sent_at=datetime.utcnow(),
-        )
-        self.db.add(send)
-        intent.status = "SENT"
-        self.db.add(intent)
-        self.db.commit()
-
-        logger.info(f"Sent transaction: {tx_hash}")
+        send = self._record_send(intent, tx_params, nonce, tx_hash)
 
         # Wait for confirmation with RBF retries
         last_hash = tx_hash
         for attempt in range(self.rbf_attempts):
             try:
                 # Try to get receipt (shorter timeout for initial attempts)
-                timeout = 5 if attempt < self.rbf_attempts - 1 else 30
+                timeout = (
+                    self.rbf_wait_s
+                    if attempt < self.rbf_attempts - 1
+                    else self.final_wait_s
+                )
                 receipt = self._wait_for_receipt(last_hash, timeout=timeout)
                 if receipt:
                     # Success - persist receipt
@@ -195,6 +325,169 @@ class TxOrchestrator:
 
         return last_hash
 
+    async def execute_async(
+        self,
+        intent_key: str,
+        to: str,
+        data: bytes,
+        value: int = 0,
+        gas_limit_hint: Optional[int] = None,
+        confirmations: int = 2,
+        metadata: Optional[dict] = None,
+    ) -> str:
+        """Execute transaction without blocking the event loop.
+
+        Same idempotency, persistence and RBF behaviour as execute(), but
+        RPC calls run in worker threads, nonces come from the nonce store and
+        receipts are resolved by the shared ReceiptTracker, so hundreds of
+        transactions can be in flight per process. Receipts are awaited for
+        every hash sent for the intent, so a replaced transaction that still
+        gets mined is recognised.
+
+        Returns:
+            Hash of the mined transaction
+
+        Raises:
+            RuntimeError: If transaction fails
+        """
+        intent = self._get_or_create_intent(intent_key, metadata or {"to": to})
+
+        existing_hash = self._existing_tx_hash(intent)
+        if existing_hash:
+            return existing_hash
+
+        from_addr = self.signer.address
+        tx_params = await asyncio.to_thread(
+            self.builder.build_tx_params,
+            to=to,
+            data=data,
+            from_addr=from_addr,
+            value=value,
+            gas_limit_hint=gas_limit_hint,
+        )
+
+        intent.status = "BUILT"
+        self.db.add(intent)
+        self.db.commit()
+
+        nonce, tx_hash = await self._send_with_reserved_nonce(from_addr, tx_params)
+        send = self._record_send(intent, tx_params, nonce, tx_hash)
+
+        sent = [tx_hash]
+        try:
+            for attempt in range(self.rbf_attempts):
+                timeout = (
+                    self.rbf_wait_s
+                    if attempt < self.rbf_attempts - 1
+                    else self.final_wait_s
+                )
+                try:
+                    receipt = await self.receipts.wait(sent, timeout=timeout)
+                except TimeoutError:
+                    if attempt < self.rbf_attempts - 1:
+                        logger.warning(
+                            f"Transaction stuck, attempting RBF (attempt {attempt + 1})"
+                        )
+                        await asyncio.to_thread(self._bump_fees, tx_params, nonce)
+                        try:
+                            new_hash = await self._sign_and_send_async(tx_params)
+                        except Exception as e:
+                            # Usually the original was mined meanwhile
+                            logger.warning(f"RBF send failed, still waiting: {e}")
+                            continue
+                        self._record_replacement(
+                            tx_params, nonce, send, intent, new_hash
+                        )
+                        sent.append(new_hash)
+                        continue
+                    intent.status = "FAILED"
+                    self.db.add(intent)
+                    self.db.commit()
+                    raise RuntimeError(
+                        f"Transaction timed out after {self.rbf_attempts} attempts: {sent[-1]}"
+                    )
+
+                self._persist_receipt(receipt, intent)
+                return _hex(receipt.transactionHash)
+        finally:
+            self.receipts.forget(sent)
+
+        return sent[-1]
+
+    async def _sign_and_send_async(self, tx_params: dict) -> str:
+        raw_tx = self.signer.sign_tx(tx_params)
+        tx_hash = await asyncio.to_thread(self.web3.eth.send_raw_transaction, raw_tx)
+        return tx_hash.hex()
+
+    def _existing_tx_hash(self, intent: TxIntent) -> Optional[str]:
+        """Hash of the latest send when the intent was already sent or mined."""
+        if intent.status not in ("SENT", "MINED"):
+            return None
+
+        # Return existing tx hash
+        existing_send = (
+            self.db.query(TxSend)
+            .filter_by(intent_id=intent.id)
+            .order_by(TxSend.id.desc())
+            .first()
+        )
+        if existing_send:
+            logger.info(
+                f"Intent already {intent.status}, returning existing tx: {existing_send.tx_hash}"
+            )
+            return existing_send.tx_hash
+        return None
+
+    async def _send_with_reserved_nonce(
+        self, from_addr: str, tx_params: dict
+    ) -> tuple[int, str]:
+        """Reserve a nonce and send, retrying once if the nonce was taken.
+
+        Returns:
+            (nonce, tx_hash) of the broadcast transaction
+        """
+        for attempt in range(2):
+            nonce = await self.nonce_store.acquire(from_addr)
+            tx_params["nonce"] = nonce
+            try:
+                return nonce, await self._sign_and_send_async(tx_params)
+            except Exception as e:
+                message = str(e).lower()
+                if not any(err in message for err in _NONCE_ERRORS):
+                    # Never broadcast: the next transaction takes the nonce
+                    await self.nonce_store.release(from_addr, nonce)
+                    raise
+                # The store is behind the chain: resync instead of reusing
+                resync = getattr(self.nonce_store, "resync", None)
+                if resync is not None:
+                    await resync(from_addr)
+                if attempt or not any(err in message for err in _NONCE_TAKEN_ERRORS):
+                    raise
+                logger.warning(f"Nonce {nonce} already used for {from_addr}: {e}")
+
+    def _record_send(
+        self, intent: TxIntent, tx_params: dict, nonce: int, tx_hash: str
+    ) -> TxSend:
+        """Persist the initial send and mark the intent SENT."""
+        send = TxSend(
+            intent_id=intent.id,
+            chain_id=self.builder.chain_id,
+            nonce=nonce,
+            max_fee_per_gas=int(tx_params["maxFeePerGas"]),
+            max_priority_fee_per_gas=int(tx_params["maxPriorityFeePerGas"]),
+            gas_limit=int(tx_params["gas"]),
+            raw_tx=b"",  # Optionally store; omitted for size
+            tx_hash=tx_hash,
+            sent_at=datetime.utcnow(),
+        )
+        self.db.add(send)
+        intent.status = "SENT"
+        self.db.add(intent)
+        self.db.commit()
+
+        logger.info(f"Sent transaction: {tx_hash}")
+        return send
+
     def _wait_for_receipt(self, tx_hash: str, timeout: int = 60):
         """Wait for transaction receipt.
 
@@ -233,22 +526,40 @@ class TxOrchestrator:
         Returns:
             New transaction hash
         """
-        # Bump fees
-        new_max_fee = int(tx_params["maxFeePerGas"] * self.rbf_bump_multiplier)
-        new_priority = int(tx_params["maxPriorityFeePerGas"] * self.rbf_bump_multiplier)
+        self._bump_fees(tx_params, nonce)
 
-        # Cap fees
-        max_fee_cap = int(self.gas_policy.max_fee_cap_gwei * 1e9)
-        new_max_fee = min(new_max_fee, max_fee_cap)
+        # Sign and send
+        raw_tx = self.signer.sign_tx(tx_params)
+        new_hash = self.web3.eth.send_raw_transaction(raw_tx).hex()
+
+        self._record_replacement(tx_params, nonce, original_send, intent, new_hash)
+        return new_hash
+
+    def _bump_fees(self, tx_params: dict, nonce: int) -> None:
+        """Raise fees in place for a replacement of the same nonce."""
+        # Bump fees, never below a quote for the current block (capped)
+        new_max_fee = self.gas_policy.bump_fee(
+            tx_params["maxFeePerGas"], self.rbf_bump_multiplier - 1, self.web3
+        )
+        new_priority = int(tx_params["maxPriorityFeePerGas"] * self.rbf_bump_multiplier)
+        new_priority = min(new_priority, new_max_fee)
 
         # Build replacement tx
         tx_params["maxFeePerGas"] = new_max_fee
         tx_params["maxPriorityFeePerGas"] = new_priority
         tx_params["nonce"] = nonce
 
-        # Sign and send
-        raw_tx = self.signer.sign_tx(tx_params)
-        new_hash = self.web3.eth.send_raw_transaction(raw_tx).hex()
+    def _record_replacement(
+        self,
+        tx_params: dict,
+        nonce: int,
+        original_send: TxSend,
+        intent: TxIntent,
+        new_hash: str,
+    ) -> None:
+        """Persist a fee-bumped replacement of original_send."""
+        new_max_fee = int(tx_params["maxFeePerGas"])
+        new_priority = int(tx_params["maxPriorityFeePerGas"])
 
         # Update original send record
         original_send.replaced_by = new_hash
@@ -257,7 +568,7 @@ class TxOrchestrator:
         # Create new send record
         new_send = TxSend(
             intent_id=intent.id,
-            chain_id=self.web3.eth.chain_id,
+            chain_id=self.builder.chain_id,
             nonce=nonce,
             max_fee_per_gas=new_max_fee,
             max_priority_fee_per_gas=new_priority,
@@ -274,7 +585,6 @@ class TxOrchestrator:
         logger.info(
             f"Replaced tx {original_send.tx_hash} with {new_hash} (fees bumped)"
         )
-        return new_hash
 
     def _persist_receipt(self, receipt, intent: TxIntent):
         """Persist transaction receipt.
@@ -314,3 +624,24 @@ class TxOrchestrator:
         onchain_nonce = self.web3.eth.get_transaction_count(addr, "pending")
         logger.info(f"Reconciled nonce for {addr}: {onchain_nonce}")
         return onchain_nonce
+
+
+_default_nonce_stores: "weakref.WeakKeyDictionary[Web3, NonceStore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _default_nonce_store(web3: Web3) -> NonceStore:
+    """Process-wide nonce store per Web3 instance, shared by orchestrators.
+
+    Backed by Redis when REDIS_URL is set, so processes sharing a signer never
+    reserve the same nonce; process-local otherwise.
+    """
+    store = _default_nonce_stores.get(web3)
+    if store is None:
+        if settings.REDIS_URL:
+            store = RedisNonceStore(redis_async.from_url(settings.REDIS_URL), web3)
+        else:
+            store = LocalNonceStore(web3)
+        _default_nonce_stores[web3] = store
+    return store
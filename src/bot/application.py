@@ -21,44 +21,84 @@ from src.bot.middlewares.auth import user_context_middleware
 from src.bot.middlewares.errors import error_handler
 from src.config.feeds_loader import load_chainlink_feeds
 from src.config.settings import settings
+from src.services.markets.market_catalog import default_market_catalog
+from src.services.price_bus import BusPriceFeed, price_bus
 
 logger = logging.getLogger(__name__)
 
 
-def build_services():
-    """Build service factory for dependency injection."""
+class BotServices:
+    """Process-wide bot dependencies; handlers get a fresh DB session per call.
+
+    The engine, Web3 client, feed map, price aggregator and market catalog
+    are built once. Calling the instance returns ``(w3, db, svc)`` like the
+    previous per-call factory, and close() releases the connection pool.
+    """
 
-    def svc_factory():
-        """Create Web3, DB session, and AvantisService."""
-        w3 = Web3(Web3.HTTPProvider(settings.BASE_RPC_URL))
+    def __init__(self):
+        self.w3 = Web3(Web3.HTTPProvider(settings.BASE_RPC_URL))
 
         # Convert async URL to sync for repositories
         db_url = settings.DATABASE_URL.replace("sqlite+aiosqlite:", "sqlite:")
-        eng = create_engine(db_url, pool_pre_ping=True)
-        Session = sessionmaker(bind=eng, expire_on_commit=False)
-        db = Session()
+        self.engine = create_engine(db_url, pool_pre_ping=True)
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
 
-        # Load Chainlink feeds from config
+        # Chainlink prices are ingested once by the bus and shared by every handler
         cl_map = load_chainlink_feeds()
-        price_agg = PriceAggregator([ChainlinkAdapter(w3, cl_map)])
+        chainlink = ChainlinkAdapter(self.w3, cl_map)
+        price_bus.register_source("chainlink", chainlink.get_prices, cl_map)
+
+        # Bus last-value cache first, direct Chainlink reads when it is cold
+        self.price_agg = PriceAggregator(
+            [BusPriceFeed(price_bus, source="chainlink"), chainlink]
+        )
+        self.markets = default_market_catalog()
 
-        svc = AvantisService(w3, db, price_agg)
-        return w3, db, svc
+    def __call__(self):
+        """Create a DB session and an AvantisService bound to it."""
+        db = self.Session()
+        svc = AvantisService(self.w3, db, self.price_agg, self.markets)
+        return self.w3, db, svc
 
-    return svc_factory
+    def close(self) -> None:
+        """Dispose of pooled DB connections."""
+        self.engine.dispose()
+
+
+def build_services() -> BotServices:
+    """Build service factory for dependency injection."""
+    return BotServices()
+
+
+async def _start_price_bus(app):
+    price_bus.start()
+
+
+async def _shutdown(app):
+    await price_bus.stop()
+    services = app.bot_data.pop("services", None)
+    if services is not None:
+        services.close()
 
 
 def build_app():
     """Build Telegram application with all handlers."""
     logger.info("Building Telegram application...")
 
-    app = ApplicationBuilder().token(settings.TELEGRAM_BOT_TOKEN).build()
+    app = (
+        ApplicationBuilder()
+        .token(settings.TELEGRAM_BOT_TOKEN)
+        .post_init(_start_price_bus)
+        .post_shutdown(_shutdown)
+        .build()
+    )
 
     # Add error handler
     app.add_error_handler(error_handler)
 
-    # Build services
+    # Build services once per application; closed on shutdown
     svc = build_services()
+    app.bot_data["services"] = svc
 
     # Register all handlers
     register_base(app, svc)
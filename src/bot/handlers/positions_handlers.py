@@ -21,7 +21,7 @@ def register_positions(app: Application, svc_factory):
                 )
                 return
 
-            rows = svc.list_user_positions(addr)
+            rows = await svc.list_user_positions(addr)
             if not rows:
                 await update.message.reply_markdown(h1("Positions") + "\nNone.")
             else:
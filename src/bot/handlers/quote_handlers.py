@@ -100,6 +100,8 @@ async def cb_show_quote(update: Update, context: ContextTypes.DEFAULT_TYPE):
             reply_markup=kb([[("⬅️ Back to Pair", f"pair:{pair}")]]),
         )
         return
+    # Keep the fetched quote with the draft for slippage changes
+    draft_store.put(d)
 
     qd = res.data or {}
     txt = _quote_card_text(qd)
@@ -149,11 +151,14 @@ async def cb_set_slippage(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
 
-    # Requote with chosen slippage (store in context.user_data for Phase 4 usage)
+    # Re-render with chosen slippage (store in context.user_data for Phase 4 usage);
+    # the quote stored with the draft is reused, so this makes no RPC
     context.user_data["slippage_pct"] = Decimal(slip)
 
     svc = get_execution_service(settings)
-    res = await svc.quote_from_draft(draft=d, slippage_pct=Decimal(slip))
+    res = await svc.quote_from_draft(
+        draft=d, slippage_pct=Decimal(slip), reuse_quote=True
+    )
     if not res.ok:
         await q.edit_message_text(
             f"❌ {res.message}",
@@ -194,8 +199,8 @@ async def cb_approve(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     svc = get_execution_service(settings)
 
-    # Recompute quote to ensure we have up-to-date usdc_required
-    res = await svc.quote_from_draft(draft=d)
+    # usdc_required does not change with market data: reuse the draft's quote
+    res = await svc.quote_from_draft(draft=d, reuse_quote=True)
     if not res.ok or not res.data:
         await q.edit_message_text(
             f"❌ {res.message}", reply_markup=kb([[("⬅️ Back to Pair", f"pair:{pair}")]])
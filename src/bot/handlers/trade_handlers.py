@@ -155,7 +155,7 @@ def register_trades(app: Application, svc_factory):
                         context.user_data.pop(OPEN_FLOW, None)
                         return
 
-                    txh = svc.open_market(
+                    txh = await svc.open_market_async(
                         user_id=context.user.tg_id,
                         symbol=st["symbol"],
                         side=st["side"],
@@ -200,7 +200,7 @@ def register_trades(app: Application, svc_factory):
                         context.user_data.pop(CLOSE_FLOW, None)
                         return
 
-                    txh = svc.close_market(
+                    txh = await svc.close_market_async(
                         user_id=context.user.tg_id,
                         symbol=st["symbol"],
                         reduce_usdc=st["reduce"],
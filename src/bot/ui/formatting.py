@@ -45,3 +45,15 @@ def usdc1e6(amount: int) -> str:
         Formatted string (e.g., "10.50 USDC")
     """
     return f"{amount / 1_000_000:.2f} USDC"
+
+
+def fmt_usd(amount) -> str:
+    """Format USD amount.
+
+    Args:
+        amount: Amount in dollars (Decimal, float or int)
+
+    Returns:
+        Formatted string (e.g., "$1,250.00")
+    """
+    return f"${amount:,.2f}"
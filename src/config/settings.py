@@ -35,7 +35,11 @@ class Settings(BaseSettings):
     SIGNALS_ENABLED: bool = True
     SIGNALS_QUEUE: str = "signals:q:v1"
     SIGNALS_MAX_BATCH: int = 50
+    SIGNALS_EXECUTION_CONCURRENCY: int = 16
+    SIGNALS_WORKER_ID: str | None = None  # default: <hostname>:<pid>
+    SIGNALS_WORKER_LEASE_S: float = 30.0
     AUTOMATION_PAUSED: bool = False
+    TPSL_RESYNC_S: float = 30.0
 
     # Security & secrets
     ENCRYPTION_KEY: str | None = Field(None, env="ENCRYPTION_KEY")
@@ -68,6 +72,7 @@ class Settings(BaseSettings):
     DEFAULT_SLIPPAGE_PCT: float = Field(1.0, env="DEFAULT_SLIPPAGE_PCT")
     MAX_LEVERAGE: int = Field(500, env="MAX_LEVERAGE")
     MAX_COPY_LEVERAGE: int = Field(100, env="MAX_COPY_LEVERAGE")
+    COPY_EXECUTION_CONCURRENCY: int = Field(16, env="COPY_EXECUTION_CONCURRENCY")
     MIN_POSITION_SIZE: int = Field(1, env="MIN_POSITION_SIZE")
     MAX_POSITION_SIZE: int = Field(100_000, env="MAX_POSITION_SIZE")
 
@@ -101,6 +106,11 @@ class Settings(BaseSettings):
 
     # Indexer / backfill configuration
     INDEXER_BACKFILL_RANGE: int = Field(50_000, env="INDEXER_BACKFILL_RANGE")
+    INDEXER_BACKFILL_WORKERS: int = Field(8, env="INDEXER_BACKFILL_WORKERS")
+
+    # Shared price bus: last-value cache TTL and default upstream poll interval
+    PRICE_BUS_TTL_S: float = Field(5.0, env="PRICE_BUS_TTL_S")
+    PRICE_BUS_POLL_INTERVAL_S: float = Field(2.0, env="PRICE_BUS_POLL_INTERVAL_S")
 
     model_config = SettingsConfigDict(
         env_file=".env", case_sensitive=False, extra="ignore"
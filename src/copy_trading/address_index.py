@@ -0,0 +1,158 @@
+"""
+Trader Address Index for Vanta Bot
+In-memory prefix and substring search over trader addresses
+"""
+
+import logging
+from collections.abc import Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Characters are folded to 5-bit codes: hex digits keep their value and
+# anything else lands in 16..30; 31 marks padding past the end of an address
+_PAD = 31
+_CODES = np.array(
+    [
+        int(chr(b), 16) if chr(b) in "0123456789abcdef" else 16 + b % 15
+        for b in range(256)
+    ],
+    dtype=np.uint32,
+)
+_CODES[0] = _PAD
+
+# A gram is 4 consecutive characters packed into 20 bits
+_GRAM = 4
+_GRAM_KEYS = 1 << (5 * _GRAM)
+
+
+def _normalize(address: str) -> str:
+    address = address.lower()
+    return address[2:] if address.startswith("0x") else address
+
+
+class AddressIndex:
+    """Search trader addresses by prefix or by any substring
+
+    Addresses are given in ranking order (e.g. by 30d volume), and results
+    come back in that order. A prefix query is a binary search over the
+    sorted addresses. A substring query intersects the posting lists of its
+    4-character grams and confirms the few candidates left, so neither scans
+    every trader. At 1M traders the index takes ~250 MB and a few seconds to
+    build; it is immutable, so rebuild it off the event loop and swap it in.
+    """
+
+    MIN_QUERY = _GRAM
+
+    def __init__(self, addresses: Sequence[str]):
+        """Build the index
+
+        Args:
+            addresses: Trader addresses, best ranked first
+        """
+        # Row i is the i-th ranked trader; bytes arrays instead of lists of
+        # str keep 1M addresses in tens of MB
+        self._addresses = np.array([a.encode() for a in addresses], dtype=bytes)
+        hex_rows = np.array([_normalize(a).encode() for a in addresses], dtype=bytes)
+
+        self._by_hex = np.argsort(hex_rows, kind="stable").astype(np.int32)
+        self._sorted_hex = hex_rows[self._by_hex]
+        self._hex_pos = np.empty_like(self._by_hex)
+        self._hex_pos[self._by_hex] = np.arange(len(self._by_hex), dtype=np.int32)
+
+        self._offsets, self._postings = self._build_postings(hex_rows)
+
+    def __len__(self) -> int:
+        return len(self._addresses)
+
+    @staticmethod
+    def _build_postings(hex_rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        width = hex_rows.dtype.itemsize
+        if width < _GRAM or not len(hex_rows):
+            return np.zeros(_GRAM_KEYS + 1, dtype=np.int64), np.zeros(0, np.int32)
+
+        codes = _CODES[hex_rows.view(np.uint8).reshape(len(hex_rows), width)]
+        keys = np.zeros((len(hex_rows), width - _GRAM + 1), dtype=np.uint32)
+        valid = np.ones(keys.shape, dtype=bool)
+        for i in range(_GRAM):
+            part = codes[:, i : i + keys.shape[1]]
+            keys = (keys << 5) | part
+            valid &= part != _PAD
+
+        rows = np.broadcast_to(
+            np.arange(len(hex_rows), dtype=np.uint64)[:, None], keys.shape
+        )[valid]
+        keys = keys[valid]
+        # Sorting (key, row) pairs packed in one integer keeps each posting
+        # list in row (ranking) order, and is much faster than an argsort
+        packed = np.sort((keys.astype(np.uint64) << np.uint64(32)) | rows)
+        offsets = np.zeros(_GRAM_KEYS + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys, minlength=_GRAM_KEYS), out=offsets[1:])
+        return offsets, (packed & np.uint64(0xFFFFFFFF)).astype(np.int32)
+
+    def search(self, query: str, limit: int = 10) -> list[str]:
+        """Best-ranked addresses matching a query
+
+        A query starting with 0x matches address prefixes; anything else
+        matches anywhere in the address.
+
+        Args:
+            query: Partial address
+            limit: Maximum results
+
+        Returns:
+            Matching addresses in ranking order
+        """
+        if query.lower().startswith("0x"):
+            return self.search_prefix(query, limit)
+        return self.search_substring(query, limit)
+
+    def search_prefix(self, prefix: str, limit: int = 10) -> list[str]:
+        """Best-ranked addresses starting with a prefix"""
+        needle = _normalize(prefix).encode()
+        width = self._sorted_hex.dtype.itemsize
+        if len(needle) > width or not len(self):
+            return []
+
+        lo = np.searchsorted(self._sorted_hex, needle, side="left")
+        hi = np.searchsorted(
+            self._sorted_hex, needle + b"\xff" * (width - len(needle)), side="right"
+        )
+        return self._top(self._by_hex[lo:hi], limit)
+
+    def search_substring(self, fragment: str, limit: int = 10) -> list[str]:
+        """Best-ranked addresses containing a fragment"""
+        needle = _normalize(fragment).encode()
+        if len(needle) < _GRAM:
+            return []
+
+        codes = _CODES[np.frombuffer(needle, dtype=np.uint8)]
+        lists = []
+        for start in range(len(needle) - _GRAM + 1):
+            key = 0
+            for code in codes[start : start + _GRAM]:
+                key = (key << 5) | int(code)
+            lists.append(self._postings[self._offsets[key] : self._offsets[key + 1]])
+
+        # Start from the rarest gram; every list is sorted by row
+        lists.sort(key=len)
+        candidates = np.unique(lists[0])
+        for postings in lists[1:]:
+            if not len(candidates):
+                return []
+            candidates = candidates[np.isin(candidates, postings)]
+
+        # Grams may match at different offsets; confirm the whole fragment
+        found = []
+        for row in candidates:
+            if needle in self._sorted_hex[self._hex_pos[row]]:
+                found.append(self._addresses[row].decode())
+                if len(found) == limit:
+                    break
+        return found
+
+    def _top(self, rows: np.ndarray, limit: int) -> list[str]:
+        if len(rows) > limit:
+            rows = np.partition(rows, limit - 1)[:limit]
+        return [self._addresses[row].decode() for row in np.sort(rows)]
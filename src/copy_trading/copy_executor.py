@@ -5,8 +5,10 @@ Handles copy trading logic, monitoring leaders, and executing trades
 
 import asyncio
 import logging
+import time
 import uuid
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from functools import partial
@@ -16,6 +18,13 @@ import asyncpg
 import redis.asyncio as redis
 
 from src.blockchain.wallet_manager import wallet_manager
+from src.config.settings import settings
+from src.monitoring.metrics import (
+    copy_active_wallets,
+    copy_exec_latency,
+    copy_queue_depth,
+    copy_wallet_lag,
+)
 from src.services.price_service import price_service
 from src.utils.resilience import CircuitBreaker, guarded_call
 
@@ -40,6 +49,7 @@ class CopyTradeRequest:
     max_slippage_bps: int
     priority: int = 1
     request_id: str = None
+    created_at: float = field(default_factory=time.monotonic)
 
 
 @dataclass
@@ -58,6 +68,13 @@ class CopyConfiguration:
 class CopyExecutor:
     """Main copy trading execution engine"""
 
+    # How long the leader -> followers index is reused between reloads
+    FOLLOWER_INDEX_TTL_S = 30.0
+    # Redis counter bumped on every follow/config change, in any process
+    FOLLOWER_INDEX_VERSION_KEY = "copy:follower_index_version"
+    # Redis hash of leader address -> ISO timestamp of the last trade check
+    LEADER_WATERMARKS_KEY = "copy:leader_watermarks"
+
     def __init__(
         self,
         db_pool: asyncpg.Pool,
@@ -65,6 +82,7 @@ class CopyExecutor:
         avantis_client,
         market_intelligence,
         config,
+        max_concurrency: Optional[int] = None,
     ):
         self.db_pool = db_pool
         self.redis = redis_client
@@ -82,6 +100,21 @@ class CopyExecutor:
         self.active_copytraders = set()
         self.is_running = False
 
+        # Per-wallet execution lanes: requests for one follower run strictly in
+        # order, different followers run in parallel up to max_concurrency.
+        self.max_concurrency = max(
+            1, max_concurrency or settings.COPY_EXECUTION_CONCURRENCY
+        )
+        self._execution_slots = asyncio.Semaphore(self.max_concurrency)
+        self._wallet_lanes: dict[int, deque[CopyTradeRequest]] = {}
+        self._lane_tasks: dict[int, asyncio.Task] = {}
+        self._pending_requests = 0
+
+        # Leader -> follower configurations, see _get_leader_followers
+        self._follower_index: dict[str, list[CopyConfiguration]] = {}
+        self._follower_index_loaded_at: Optional[float] = None
+        self._follower_index_version: Optional[str] = None
+
         # Rate limiting
         self.execution_limits = {}
         self._avantis_breaker = CircuitBreaker(fail_threshold=3, reset_after=60.0)
@@ -119,8 +152,10 @@ class CopyExecutor:
         logger.info("Stopped copy trading execution")
 
     async def _execution_worker(self):
-        """Worker that processes copy trade requests"""
-        logger.info("Starting copy execution worker...")
+        """Dispatch copy trade requests onto per-wallet execution lanes"""
+        logger.info(
+            f"Starting copy execution worker (concurrency={self.max_concurrency})..."
+        )
 
         while self.is_running:
             try:
@@ -132,24 +167,72 @@ class CopyExecutor:
                 except asyncio.TimeoutError:
                     continue
 
-                # Execute the copy trade
-                await self._execute_copy_trade(copy_request)
+                self._dispatch_copy_request(copy_request)
 
             except Exception as e:
                 logger.error(f"Error in copy execution worker: {e}")
                 await asyncio.sleep(1)
 
+        # Let in-flight lanes finish their current trade before returning
+        if self._lane_tasks:
+            await asyncio.gather(*self._lane_tasks.values(), return_exceptions=True)
+
+    @staticmethod
+    def _lane_key(request: CopyTradeRequest) -> int:
+        """Ordering key for a request; one copytrader maps to one follower wallet"""
+        return request.copytrader_id
+
+    def _dispatch_copy_request(self, request: CopyTradeRequest):
+        """Append a request to its wallet lane, starting the lane if idle"""
+        key = self._lane_key(request)
+        self._wallet_lanes.setdefault(key, deque()).append(request)
+        self._pending_requests += 1
+        self._update_queue_metrics()
+
+        if key not in self._lane_tasks:
+            self._lane_tasks[key] = asyncio.create_task(self._drain_wallet_lane(key))
+
+    async def _drain_wallet_lane(self, key: int):
+        """Execute one wallet's requests in order, one concurrency slot at a time"""
+        lane = self._wallet_lanes[key]
+        try:
+            while lane and self.is_running:
+                async with self._execution_slots:
+                    request = lane.popleft()
+                    self._pending_requests -= 1
+                    self._update_queue_metrics()
+
+                    started = time.monotonic()
+                    copy_wallet_lag.observe(max(0.0, started - request.created_at))
+                    try:
+                        await self._execute_copy_trade(request)
+                    except Exception as e:
+                        logger.error(
+                            f"Unhandled error executing copy {request.request_id}: {e}"
+                        )
+                    finally:
+                        copy_exec_latency.observe(time.monotonic() - started)
+        finally:
+            self._lane_tasks.pop(key, None)
+            if not lane:
+                self._wallet_lanes.pop(key, None)
+            self._update_queue_metrics()
+
+    def _update_queue_metrics(self):
+        copy_queue_depth.set(self._pending_requests + self.execution_queue.qsize())
+        copy_active_wallets.set(len(self._wallet_lanes))
+
     async def _monitor_leaders(self):
-        """Monitor followed leaders for new trades"""
+        """Monitor followed leaders for new trades.
+
+        Each tick costs one trade query per distinct leader, independent of how
+        many copytraders follow that leader.
+        """
         logger.info("Starting leader monitoring...")
 
         while self.is_running:
             try:
-                # Get all active copy configurations
-                active_configs = await self._get_active_copy_configs()
-
-                for config in active_configs:
-                    await self._check_leader_activity(config)
+                await self._poll_leaders_once()
 
                 # Wait before next check
                 await asyncio.sleep(5)  # Check every 5 seconds
@@ -158,6 +241,102 @@ class CopyExecutor:
                 logger.error(f"Error in leader monitoring: {e}")
                 await asyncio.sleep(10)
 
+    async def _poll_leaders_once(self) -> int:
+        """Detect new trades for every followed leader and fan them out.
+
+        A tick costs one Redis read for all watermarks, one ``trade_events``
+        query for all leaders and one Redis write for the new watermarks.
+
+        Returns:
+            Number of copy requests queued during this tick
+        """
+        followers_by_leader = await self._get_leader_followers()
+        if not followers_by_leader:
+            return 0
+
+        leaders = list(followers_by_leader)
+        since_by_leader = await self._load_leader_watermarks(leaders)
+
+        # Capture the watermark before querying so trades landing mid-query
+        # are picked up on the next tick rather than skipped.
+        checked_at = datetime.utcnow()
+        trades_by_leader = await self._get_new_leader_trades(since_by_leader)
+        if trades_by_leader is None:
+            # Query failed; keep the old watermarks so nothing is skipped
+            return 0
+
+        queued = 0
+        for leader_address, new_trades in trades_by_leader.items():
+            followers = followers_by_leader.get(leader_address, [])
+            for trade in new_trades:
+                queued += await self._fan_out_trade(leader_address, trade, followers)
+
+        await self._store_leader_watermarks(leaders, checked_at)
+        return queued
+
+    async def _load_leader_watermarks(self, leaders: list[str]) -> dict[str, datetime]:
+        """Read the last-checked time of every leader in one round trip"""
+        # First check - look at last hour
+        default_since = datetime.utcnow() - timedelta(hours=1)
+        try:
+            values = await self.redis.hmget(self.LEADER_WATERMARKS_KEY, leaders)
+        except Exception as e:
+            logger.error(f"Error loading leader watermarks: {e}")
+            values = [None] * len(leaders)
+
+        since_by_leader = {}
+        for leader_address, value in zip(leaders, values):
+            if isinstance(value, bytes):
+                value = value.decode()
+            since_by_leader[leader_address] = (
+                datetime.fromisoformat(value) if value else default_since
+            )
+        return since_by_leader
+
+    async def _store_leader_watermarks(self, leaders: list[str], checked_at: datetime):
+        """Persist the last-checked time of every leader in one round trip"""
+        try:
+            stamp = checked_at.isoformat()
+            await self.redis.hset(
+                self.LEADER_WATERMARKS_KEY,
+                mapping=dict.fromkeys(leaders, stamp),
+            )
+        except Exception as e:
+            logger.error(f"Error storing leader watermarks: {e}")
+
+    async def _fan_out_trade(
+        self,
+        leader_address: str,
+        trade: dict,
+        followers: list[CopyConfiguration],
+    ) -> int:
+        """Deliver a single leader trade to all of its followers in one pass"""
+        try:
+            symbol = self._get_symbol_from_pair(trade["pair"])
+            timing_signal = await self.market_intel.get_copy_timing_signal(symbol)
+        except Exception as e:
+            logger.error(f"Error getting timing signal for leader trade: {e}")
+            return 0
+
+        queued = 0
+        for config in followers:
+            try:
+                if not await self._should_copy_trade(
+                    config, trade, timing_signal=timing_signal
+                ):
+                    continue
+                copy_request = await self._create_copy_request(
+                    config, trade, leader_address
+                )
+                await self.execution_queue.put(copy_request)
+                queued += 1
+            except Exception as e:
+                logger.error(
+                    f"Error fanning out trade to copytrader {config.copytrader_id}: {e}"
+                )
+
+        return queued
+
     async def _track_positions(self):
         """Track and update copy positions"""
         logger.info("Starting position tracking...")
@@ -199,114 +378,169 @@ class CopyExecutor:
                 """
                 )
 
-                configs = []
-                for row in rows:
-                    config = CopyConfiguration(
-                        copytrader_id=row["copytrader_id"],
-                        user_id=row["user_id"],
-                        sizing_mode=row["sizing_mode"],
-                        sizing_value=float(row["sizing_value"]),
-                        max_slippage_bps=row["max_slippage_bps"],
-                        max_leverage=float(row["max_leverage"]),
-                        notional_cap=float(row["notional_cap"])
-                        if row["notional_cap"]
-                        else None,
-                        pair_filters=row["pair_filters"] or {},
-                        is_enabled=row["is_enabled"],
-                    )
-                    configs.append(config)
-
-                return configs
+                return [self._row_to_config(row) for row in rows]
 
         except Exception as e:
             logger.error(f"Error getting active copy configs: {e}")
             return []
 
-    async def _check_leader_activity(self, config: CopyConfiguration):
-        """Check if leader has new trades to copy"""
-        try:
-            # Get leaders for this copytrader
-            leaders = await self._get_copytrader_leaders(config.copytrader_id)
+    async def _get_leader_followers(self) -> dict[str, list[CopyConfiguration]]:
+        """Get active follower configurations grouped by leader address.
 
-            for leader_address in leaders:
-                # Check for new trades since last check
-                last_check_key = f"last_check:{config.copytrader_id}:{leader_address}"
-                last_check = await self.redis.get(last_check_key)
+        The index is cached for ``FOLLOWER_INDEX_TTL_S`` seconds and reloaded
+        early when ``FOLLOWER_INDEX_VERSION_KEY`` changes, so follow and config
+        changes made by any process are picked up on the next tick.
+        """
+        now = time.monotonic()
+        version = await self._get_follower_index_version()
+        if (
+            self._follower_index_loaded_at is not None
+            and now - self._follower_index_loaded_at < self.FOLLOWER_INDEX_TTL_S
+            and version == self._follower_index_version
+        ):
+            return self._follower_index
 
-                if last_check:
-                    last_check_time = datetime.fromisoformat(last_check)
-                else:
-                    # First check - look at last hour
-                    last_check_time = datetime.utcnow() - timedelta(hours=1)
+        try:
+            acq = await self.db_pool.acquire()
+            async with acq as conn:
+                rows = await conn.fetch(
+                    """
+                    SELECT
+                        lf.leader_address,
+                        cp.id as copytrader_id,
+                        cp.user_id,
+                        cp.is_enabled,
+                        cc.sizing_mode,
+                        cc.sizing_value,
+                        cc.max_slippage_bps,
+                        cc.max_leverage,
+                        cc.notional_cap,
+                        cc.pair_filters
+                    FROM leader_follows lf
+                    JOIN copytrader_profiles cp ON cp.id = lf.copytrader_id
+                    JOIN copy_configurations cc ON cp.id = cc.copytrader_id
+                    WHERE cp.is_enabled = true
+                      AND lf.is_active = true
+                """
+                )
 
-                # Get new trades
-                new_trades = await self._get_new_leader_trades(
-                    leader_address, since=last_check_time
+            index: dict[str, list[CopyConfiguration]] = {}
+            for row in rows:
+                index.setdefault(row["leader_address"], []).append(
+                    self._row_to_config(row)
                 )
 
-                for trade in new_trades:
-                    # Check if we should copy this trade
-                    if await self._should_copy_trade(config, trade):
-                        copy_request = await self._create_copy_request(
-                            config, trade, leader_address
-                        )
-                        await self.execution_queue.put(copy_request)
+            self._follower_index = index
+            self._follower_index_loaded_at = now
+            self._follower_index_version = version
+            return index
 
-                # Update last check timestamp
-                await self.redis.set(last_check_key, datetime.utcnow().isoformat())
+        except Exception as e:
+            logger.error(f"Error getting leader followers: {e}")
+            # Keep serving the last known index rather than dropping all copies
+            return self._follower_index
 
+    async def _get_follower_index_version(self) -> Optional[str]:
+        """Current follower index version, or None if Redis is unavailable"""
+        try:
+            version = await self.redis.get(self.FOLLOWER_INDEX_VERSION_KEY)
         except Exception as e:
-            logger.error(f"Error checking leader activity: {e}")
+            logger.warning(f"Error reading follower index version: {e}")
+            return None
+        return version.decode() if isinstance(version, bytes) else version
 
-    async def _get_copytrader_leaders(self, copytrader_id: int) -> list[str]:
-        """Get leaders followed by a copytrader"""
+    async def _invalidate_follower_index(self):
+        """Force every executor to reload the follower index on its next tick"""
+        self._follower_index_loaded_at = None
         try:
-            acq = await self.db_pool.acquire()
-            async with acq as conn:
-                rows = await conn.fetch(
-                    """
-                    SELECT leader_address
-                    FROM leader_follows
-                    WHERE copytrader_id = $1 AND is_active = true
-                """,
-                    copytrader_id,
-                )
+            await self.redis.incr(self.FOLLOWER_INDEX_VERSION_KEY)
+        except Exception as e:
+            # Other processes fall back to the TTL
+            logger.warning(f"Error bumping follower index version: {e}")
 
-                return [row["leader_address"] for row in rows]
+    async def _is_follow_active(self, copytrader_id: int, leader_address: str) -> bool:
+        """Check the follow is still enabled right before executing a copy.
 
-        except Exception as e:
-            logger.error(f"Error getting copytrader leaders: {e}")
-            return []
+        Follow changes bump ``FOLLOWER_INDEX_VERSION_KEY``, so reading the
+        follower index costs one Redis GET and only hits the database when a
+        change was made since the request was queued.
+        """
+        index = await self._get_leader_followers()
+        return any(
+            config.copytrader_id == copytrader_id
+            for config in index.get(leader_address, [])
+        )
+
+    @staticmethod
+    def _row_to_config(row) -> CopyConfiguration:
+        """Build a CopyConfiguration from a copy configuration row"""
+        return CopyConfiguration(
+            copytrader_id=row["copytrader_id"],
+            user_id=row["user_id"],
+            sizing_mode=row["sizing_mode"],
+            sizing_value=float(row["sizing_value"]),
+            max_slippage_bps=row["max_slippage_bps"],
+            max_leverage=float(row["max_leverage"]),
+            notional_cap=float(row["notional_cap"]) if row["notional_cap"] else None,
+            pair_filters=row["pair_filters"] or {},
+            is_enabled=row["is_enabled"],
+        )
 
     async def _get_new_leader_trades(
-        self, leader_address: str, since: datetime
-    ) -> list[dict]:
-        """Get new trades from a leader since given time"""
+        self, since_by_leader: dict[str, datetime]
+    ) -> Optional[dict[str, list[dict]]]:
+        """Get new trades for all watched leaders in a single query
+
+        Args:
+            since_by_leader: Leader address -> only return trades after this time
+
+        Returns:
+            Leader address -> new OPENED trades in timestamp order, or None if
+            the query failed
+        """
+        if not since_by_leader:
+            return {}
+
         try:
             acq = await self.db_pool.acquire()
             async with acq as conn:
                 rows = await conn.fetch(
                     """
-                    SELECT pair, is_long, size, price, leverage, timestamp,
-                           block_number, tx_hash, event_type
-                    FROM trade_events
-                    WHERE address = $1
-                      AND timestamp > $2
-                      AND event_type = 'OPENED'
-                    ORDER BY timestamp ASC
+                    SELECT te.address, te.pair, te.is_long, te.size, te.price,
+                           te.leverage, te.timestamp, te.block_number,
+                           te.tx_hash, te.event_type
+                    FROM unnest($1::varchar[], $2::timestamp[]) AS w(address, since)
+                    JOIN trade_events te
+                      ON te.address = w.address
+                     AND te.timestamp > w.since
+                    WHERE te.event_type = 'OPENED'
+                    ORDER BY te.timestamp ASC
                 """,
-                    leader_address,
-                    since,
+                    list(since_by_leader.keys()),
+                    list(since_by_leader.values()),
                 )
 
-                return [dict(row) for row in rows]
+            trades_by_leader: dict[str, list[dict]] = {}
+            for row in rows:
+                trade = dict(row)
+                trades_by_leader.setdefault(trade.pop("address"), []).append(trade)
+            return trades_by_leader
 
         except Exception as e:
             logger.error(f"Error getting new leader trades: {e}")
-            return []
-
-    async def _should_copy_trade(self, config: CopyConfiguration, trade: dict) -> bool:
-        """Determine if trade should be copied based on filters and conditions"""
+            return None
+
+    async def _should_copy_trade(
+        self, config: CopyConfiguration, trade: dict, timing_signal=None
+    ) -> bool:
+        """Determine if trade should be copied based on filters and conditions
+
+        Args:
+            config: Follower configuration
+            trade: Leader trade
+            timing_signal: Pre-fetched market timing signal shared by all
+                followers of the same trade; fetched on demand when omitted
+        """
         try:
             # Check if copytrader is enabled
             if not config.is_enabled:
@@ -324,7 +558,8 @@ class CopyExecutor:
 
             # Check market regime
             symbol = self._get_symbol_from_pair(trade["pair"])
-            timing_signal = await self.market_intel.get_copy_timing_signal(symbol)
+            if timing_signal is None:
+                timing_signal = await self.market_intel.get_copy_timing_signal(symbol)
 
             if timing_signal.signal == "red":
                 logger.info(f"Skipping copy due to red regime for {symbol}")
@@ -494,6 +729,17 @@ class CopyExecutor:
         try:
             logger.info(f"Executing copy trade: {request.request_id}")
 
+            if not await self._is_follow_active(
+                request.copytrader_id, request.leader_address
+            ):
+                logger.info(
+                    f"Skipping copy trade {request.request_id}: follow no longer active"
+                )
+                await self._record_copy_position(
+                    request, CopyStatus.CANCELLED, reason="Follow no longer active"
+                )
+                return
+
             # Check slippage before execution
             current_price = await self._get_current_price(request.trade_data["pair"])
             price_impact = (
@@ -826,6 +1072,7 @@ class CopyExecutor:
 
             # Start monitoring this leader
             self.active_copytraders.add(copytrader_id)
+            await self._invalidate_follower_index()
 
             return {
                 "success": True,
@@ -856,6 +1103,8 @@ class CopyExecutor:
                     leader_address,
                 )
 
+            await self._invalidate_follower_index()
+
             return {
                 "success": True,
                 "message": f"Stopped following {leader_address[:10]}...",
@@ -3,8 +3,10 @@ Leaderboard Service for Vanta Bot
 Ranks traders based on performance and AI analysis
 """
 
+import asyncio
 import json
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Optional
@@ -14,6 +16,8 @@ import numpy as np
 import redis.asyncio as redis
 
 from ..ai.trader_analyzer import TraderAnalyzer
+from ..services.cache.single_flight import SingleFlight
+from .address_index import AddressIndex
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +36,32 @@ class TraderRanking:
     ai_analysis: Optional[dict]
 
 
+# Category -> sort key over ranked traders; "overall" keeps the ranking order
+LEADERBOARD_CATEGORIES = {
+    "overall": None,
+    "volume": lambda t: t.get("last_30d_volume_usd", 0),
+    "pnl": lambda t: t.get("realized_pnl_clean_usd", 0),
+    "consistency": lambda t: t.get("consistency_score", 0),
+    "copyability": lambda t: t.get("copyability_score", 50),
+}
+
+
 class LeaderboardService:
-    """Service for ranking and managing trader leaderboards"""
+    """Service for ranking and managing trader leaderboards
+
+    Leaderboards are materialized: each window is ranked once, with every
+    category's ordering, and published to Redis as a single snapshot. Reads
+    only slice a snapshot. Wire ``schedule_refresh`` to
+    ``PositionTracker.on_stats_refreshed`` to rebuild after each stats
+    refresh; a read that finds no snapshot builds it once for all callers.
+    """
+
+    # Windows materialized by refresh()
+    WINDOWS = ("30d",)
+    # Traders kept per snapshot; categories re-order this top set
+    SNAPSHOT_SIZE = 100
+    # How long a build may hold the cross-process lock
+    BUILD_LOCK_TTL_S = 30
 
     def __init__(
         self,
@@ -50,55 +78,161 @@ class LeaderboardService:
         # Cache settings
         self.cache_ttl = 300  # 5 minutes
 
-    async def get_top_traders(self, limit: int = 50, window: str = "30d") -> list[dict]:
-        """Get ranked list of top traders with AI scoring"""
-        try:
-            # Check cache first
-            cache_key = f"leaderboard:{window}:{limit}"
-            cached = await self.redis.get(cache_key)
-
-            if cached:
-                data = json.loads(cached)
-                # Tolerate either a single object or list being cached
-                if isinstance(data, dict):
-                    return [data]
-                return data
-
-            # Fetch from database with filters
-            traders = await self._fetch_filtered_traders(window)
+        # In-flight snapshot (per window) and address index builds, shared by
+        # concurrent callers
+        self._builds = SingleFlight()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_again = False
 
-            # Apply ranking algorithm
-            ranked_traders = await self._rank_traders(traders)
+        # Address search index, built on first search and kept fresh by refresh()
+        self._address_index: Optional[AddressIndex] = None
+        self._address_index_built_at = 0.0
 
-            # Add AI analysis
-            enriched_traders = await self._enrich_with_ai_analysis(ranked_traders)
-
-            # Take top N
-            top_traders = enriched_traders[:limit]
-
-            # Cache for 5 minutes
-            await self.redis.setex(
-                cache_key, self.cache_ttl, json.dumps(top_traders, default=str)
-            )
+    async def get_top_traders(
+        self, limit: int = 50, window: str = "30d", category: str = "overall"
+    ) -> list[dict]:
+        """Get ranked list of top traders with AI scoring"""
+        try:
+            snapshot = await self._get_snapshot(window)
+            if not snapshot:
+                return []
 
-            logger.info(f"Generated leaderboard with {len(top_traders)} traders")
-            return top_traders
+            traders = snapshot["traders"]
+            order = snapshot["rankings"].get(category)
+            if order is None:
+                return traders[:limit]
+            return [traders[i] for i in order[:limit]]
 
         except Exception as e:
             logger.error(f"Error getting top traders: {e}")
             return []
 
+    @staticmethod
+    def _snapshot_key(window: str) -> str:
+        return f"leaderboard:{window}"
+
+    @staticmethod
+    def _decode_snapshot(raw) -> dict:
+        data = json.loads(raw)
+        if isinstance(data, dict) and "traders" in data:
+            return data
+        # Tolerate either a single object or list being cached
+        return {"traders": [data] if isinstance(data, dict) else data, "rankings": {}}
+
+    async def _get_snapshot(self, window: str) -> Optional[dict]:
+        """Published snapshot for a window, building it once on a miss"""
+        cached = await self.redis.get(self._snapshot_key(window))
+        if cached:
+            return self._decode_snapshot(cached)
+
+        return await self._builds.do(
+            ("snapshot", window), lambda: self._build_once(window)
+        )
+
+    async def _build_once(self, window: str) -> Optional[dict]:
+        """Materialize a window unless another process is already doing it"""
+        lock_key = f"{self._snapshot_key(window)}:lock"
+        if await self.redis.set(lock_key, "1", nx=True, ex=self.BUILD_LOCK_TTL_S):
+            try:
+                return await self.materialize(window)
+            finally:
+                await self.redis.delete(lock_key)
+
+        # Someone else holds the lock: wait for their snapshot
+        for _ in range(self.BUILD_LOCK_TTL_S * 10):
+            await asyncio.sleep(0.1)
+            cached = await self.redis.get(self._snapshot_key(window))
+            if cached:
+                return self._decode_snapshot(cached)
+        return None
+
+    async def materialize(self, window: str = "30d") -> dict:
+        """Rank a window once and publish it with every category ordering"""
+        # Fetch from database with filters (AI analysis comes joined in)
+        traders = await self._fetch_filtered_traders(window)
+
+        # Apply ranking algorithm
+        ranked_traders = await self._rank_traders(traders)
+
+        # Add AI analysis
+        enriched_traders = await self._enrich_with_ai_analysis(ranked_traders)
+
+        snapshot = self._build_snapshot(enriched_traders[: self.SNAPSHOT_SIZE])
+        await self.redis.setex(
+            self._snapshot_key(window),
+            self.cache_ttl,
+            json.dumps(snapshot, default=str),
+        )
+
+        logger.info(
+            f"Materialized {window} leaderboard with {len(snapshot['traders'])} traders"
+        )
+        return snapshot
+
+    def _build_snapshot(self, ranked_traders: list[dict]) -> dict:
+        """Ranked traders plus, per category, their indices in display order"""
+        rankings = {}
+        for category, key in LEADERBOARD_CATEGORIES.items():
+            if key is None:
+                continue
+            rankings[category] = sorted(
+                range(len(ranked_traders)),
+                key=lambda i, key=key: key(ranked_traders[i]),
+                reverse=True,
+            )
+        return {
+            "traders": ranked_traders,
+            "rankings": rankings,
+            "generated_at": datetime.utcnow().isoformat(),
+        }
+
+    async def refresh(self) -> None:
+        """Materialize every window (after a stats refresh)"""
+        for window in self.WINDOWS:
+            try:
+                await self.materialize(window)
+            except Exception as e:
+                logger.error(f"Error materializing {window} leaderboard: {e}")
+
+        # Keep an address index that is in use fresh, at most once per cache_ttl
+        if (
+            self._address_index is not None
+            and time.monotonic() - self._address_index_built_at >= self.cache_ttl
+        ):
+            try:
+                await self.refresh_address_index()
+            except Exception as e:
+                logger.error(f"Error rebuilding trader address index: {e}")
+
+    def schedule_refresh(self, *_args) -> None:
+        """Refresh in the background; calls during a refresh coalesce into one more"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_again = True
+            return
+        self._refresh_task = asyncio.get_running_loop().create_task(
+            self._refresh_loop()
+        )
+
+    async def _refresh_loop(self) -> None:
+        self._refresh_again = True
+        while self._refresh_again:
+            self._refresh_again = False
+            await self.refresh()
+
     async def _fetch_filtered_traders(self, window: str) -> list[dict]:
         """Fetch traders that meet quality criteria"""
         try:
             query = f"""
-                SELECT ts.*, ta.archetype, ta.risk_level, ta.sharpe_like, ta.consistency
+                SELECT ts.*, ta.archetype, ta.risk_level, ta.sharpe_like,
+                       ta.max_drawdown, ta.consistency, ta.win_prob_7d,
+                       ta.expected_dd_7d, ta.optimal_copy_ratio,
+                       ta.address IS NOT NULL AS has_ai_analysis
                 FROM trader_stats ts
                 LEFT JOIN trader_analytics ta ON ts.address = ta.address AND ts.window = ta.window
                 WHERE ts.window = $1
                   AND ts.last_trade_at > NOW() - INTERVAL '{self.config.LEADER_ACTIVE_HOURS} hours'
-                  AND ts.trade_count_30d >= $3
-                  AND ts.last_30d_volume_usd >= $4
+                  AND ts.trade_count_30d >= $2
+                  AND ts.last_30d_volume_usd >= $3
                   AND (ts.maker_ratio IS NULL OR ts.maker_ratio <= 0.95)
                   AND ts.unique_symbols >= 3
                 ORDER BY ts.last_30d_volume_usd DESC
@@ -230,15 +364,10 @@ class LeaderboardService:
         return 0.0
 
     async def _enrich_with_ai_analysis(self, traders: list[dict]) -> list[dict]:
-        """Add AI analysis and copyability scores"""
+        """Add copyability scores from the AI analysis joined into each row"""
         try:
             for trader in traders:
-                # Get AI analysis if available
-                ai_analysis = await self._get_ai_analysis(trader["address"])
-
-                if ai_analysis:
-                    trader.update(ai_analysis)
-
+                if trader.pop("has_ai_analysis", False):
                     # Calculate copyability score (0-100)
                     copyability = self._calculate_copyability_score(trader)
                     trader["copyability_score"] = copyability
@@ -525,79 +654,61 @@ class LeaderboardService:
     ) -> list[dict]:
         """Get leaderboard filtered by category"""
         try:
-            all_traders = await self.get_top_traders(limit=100)
-
-            if category == "volume":
-                # Sort by volume
-                return sorted(
-                    all_traders,
-                    key=lambda x: x.get("last_30d_volume_usd", 0),
-                    reverse=True,
-                )[:limit]
-
-            elif category == "pnl":
-                # Sort by PnL
-                return sorted(
-                    all_traders,
-                    key=lambda x: x.get("realized_pnl_clean_usd", 0),
-                    reverse=True,
-                )[:limit]
-
-            elif category == "consistency":
-                # Sort by consistency score
-                return sorted(
-                    all_traders,
-                    key=lambda x: x.get("consistency_score", 0),
-                    reverse=True,
-                )[:limit]
-
-            elif category == "copyability":
-                # Sort by copyability score
-                return sorted(
-                    all_traders,
-                    key=lambda x: x.get("copyability_score", 50),
-                    reverse=True,
-                )[:limit]
-
-            else:
-                # Default: overall ranking
-                return all_traders[:limit]
+            # Unknown categories fall back to the overall ranking
+            if category not in LEADERBOARD_CATEGORIES:
+                category = "overall"
+            return await self.get_top_traders(limit=limit, category=category)
 
         except Exception as e:
             logger.error(f"Error getting leaderboard by category {category}: {e}")
             return []
 
     async def search_traders(self, query: str, limit: int = 10) -> list[dict]:
-        """Search traders by address or other criteria"""
+        """Search traders by partial address
+
+        A query starting with 0x matches address prefixes of any length; a
+        bare hex fragment matches anywhere in the address and needs at least
+        4 hex digits.
+        """
         try:
-            # For now, simple address matching
-            # In production, this could be more sophisticated
+            query = query.strip().lower()
+            prefix = query.startswith("0x")
+            digits = query[2:] if prefix else query
+            min_digits = 1 if prefix else AddressIndex.MIN_QUERY
+            if len(digits) < min_digits or not all(
+                c in "0123456789abcdef" for c in digits
+            ):
+                return []
 
-            if not query.startswith("0x") or len(query) < 6:
+            index = await self._get_address_index()
+            addresses = index.search(query, limit)
+            if not addresses:
                 return []
 
-            # Get trader stats for addresses that match
+            # One query for every result card, AI analysis joined in
             acq = await self.db_pool.acquire()
             async with acq as conn:
                 rows = await conn.fetch(
                     """
-                    SELECT * FROM trader_stats
-                    WHERE address ILIKE $1 AND window = '30d'
-                    ORDER BY last_30d_volume_usd DESC
-                    LIMIT $2
+                    SELECT ts.*, ta.archetype, ta.risk_level, ta.sharpe_like,
+                           ta.max_drawdown, ta.consistency, ta.win_prob_7d,
+                           ta.expected_dd_7d, ta.optimal_copy_ratio,
+                           ta.address IS NOT NULL AS has_ai_analysis
+                    FROM trader_stats ts
+                    LEFT JOIN trader_analytics ta ON ts.address = ta.address AND ts.window = ta.window
+                    WHERE ts.address = ANY($1::varchar[]) AND ts.window = '30d'
                 """,
-                    f"%{query}%",
-                    limit,
+                    addresses,
                 )
 
+            by_address = {row["address"]: dict(row) for row in rows}
             traders = []
-            for row in rows:
-                trader_data = dict(row)
-
-                # Add AI analysis
-                ai_analysis = await self._get_ai_analysis(row["address"])
-                if ai_analysis:
-                    trader_data.update(ai_analysis)
+            for address in addresses:
+                trader_data = by_address.get(address)
+                if trader_data is None:
+                    # Gone since the index was built
+                    continue
+                trader_data.pop("has_ai_analysis", None)
 
                 # Calculate copyability score
                 trader_data["copyability_score"] = self._calculate_copyability_score(
@@ -612,6 +723,43 @@ class LeaderboardService:
             logger.error(f"Error searching traders: {e}")
             return []
 
+    async def _get_address_index(self) -> AddressIndex:
+        if self._address_index is None:
+            return await self.refresh_address_index()
+        if time.monotonic() - self._address_index_built_at >= self.cache_ttl:
+            # Stale: answer from it now, rebuild behind
+            self._start_address_index_build()
+        return self._address_index
+
+    async def refresh_address_index(self) -> AddressIndex:
+        """Rebuild the address search index; concurrent callers share one build"""
+        return await asyncio.shield(self._start_address_index_build())
+
+    def _start_address_index_build(self) -> asyncio.Task:
+        return self._builds.start("address_index", self._build_address_index)
+
+    async def _build_address_index(self) -> AddressIndex:
+        acq = await self.db_pool.acquire()
+        async with acq as conn:
+            rows = await conn.fetch(
+                """
+                SELECT address FROM trader_stats
+                WHERE window = '30d'
+                ORDER BY last_30d_volume_usd DESC NULLS LAST
+            """
+            )
+
+        # Building takes seconds at 1M traders; keep it off the event loop
+        addresses = [row["address"] for row in rows]
+        index = await asyncio.get_running_loop().run_in_executor(
+            None, AddressIndex, addresses
+        )
+        self._address_index = index
+        self._address_index_built_at = time.monotonic()
+
+        logger.info(f"Built trader address index with {len(index)} addresses")
+        return index
+
     async def get_trader_analytics_summary(self) -> dict[str, Any]:
         """Get summary analytics for all traders"""
         try:
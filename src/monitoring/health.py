@@ -16,6 +16,7 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.config.settings import settings
+from src.monitoring.probes import ProbeSnapshot, run_probes
 from src.services.copy_trading.execution_mode import execution_manager
 from src.utils.logging import get_logger, log_system_health
 
@@ -81,17 +82,31 @@ async def _get_oracle_status() -> dict:
 class HealthChecker:
     """Health check service for monitoring system components"""
 
+    # Deadline per check, in seconds; a check past it counts as unhealthy
+    PROBE_TIMEOUTS = {
+        "redis": 2.0,
+        "database": 3.0,
+        "system": 2.5,
+        "avantis": 5.0,
+        "oracle": 5.0,
+    }
+
     def __init__(self):
         self.redis_client = None
         self.db_engine = None
         self._initialize_clients()
 
+        # Endpoints answer from this; start_health_monitoring keeps it fresh
+        self.snapshot = ProbeSnapshot(self.run_all_checks, interval_s=15.0)
+
     def _initialize_clients(self):
         """Initialize database and Redis clients for health checks"""
         try:
             # Initialize Redis client
             if settings.REDIS_URL:
-                self.redis_client = redis.from_url(settings.REDIS_URL)
+                self.redis_client = redis.from_url(
+                    settings.REDIS_URL, socket_timeout=2, socket_connect_timeout=2
+                )
 
             # Initialize database engine
             if settings.DATABASE_URL:
@@ -110,17 +125,8 @@ class HealthChecker:
 
         start_time = time.time()
         try:
-            # Test basic connectivity
-            self.redis_client.ping()
-
-            # Test set/get operation
-            test_key = f"health_check_{int(time.time())}"
-            self.redis_client.set(test_key, "test_value", ex=10)
-            value = self.redis_client.get(test_key)
-            self.redis_client.delete(test_key)
-
-            if value != b"test_value":
-                raise Exception("Redis set/get test failed")
+            # The client is synchronous; keep its round trips off the event loop
+            await asyncio.to_thread(self._redis_roundtrip)
 
             response_time = (time.time() - start_time) * 1000
 
@@ -138,6 +144,19 @@ class HealthChecker:
                 "response_time_ms": round(response_time, 2),
             }
 
+    def _redis_roundtrip(self) -> None:
+        # Test basic connectivity
+        self.redis_client.ping()
+
+        # Test set/get operation
+        test_key = f"health_check_{int(time.time())}"
+        self.redis_client.set(test_key, "test_value", ex=10)
+        value = self.redis_client.get(test_key)
+        self.redis_client.delete(test_key)
+
+        if value != b"test_value":
+            raise Exception("Redis set/get test failed")
+
     async def check_database(self) -> dict[str, Any]:
         """Check database connectivity and performance"""
         if not self.db_engine:
@@ -149,35 +168,17 @@ class HealthChecker:
 
         start_time = time.time()
         try:
-            with self.db_engine.connect() as conn:
-                # Test basic connectivity
-                result = conn.execute(text("SELECT 1"))
-                result.fetchone()
-
-                # Test table existence (if using SQLite, check if tables exist)
-                if "sqlite" in settings.DATABASE_URL:
-                    result = conn.execute(
-                        text("SELECT name FROM sqlite_master WHERE type='table'")
-                    )
-                    tables = result.fetchall()
-                    table_count = len(tables)
-                else:
-                    # For PostgreSQL, check if we can query information_schema
-                    result = conn.execute(
-                        text(
-                            "SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = 'public'"
-                        )
-                    )
-                    table_count = result.fetchone()[0]
+            # The engine is synchronous; keep the queries off the event loop
+            table_count = await asyncio.to_thread(self._query_database)
 
-                response_time = (time.time() - start_time) * 1000
+            response_time = (time.time() - start_time) * 1000
 
-                return {
-                    "status": "healthy",
-                    "message": f"Database is responding correctly ({table_count} tables)",
-                    "response_time_ms": round(response_time, 2),
-                    "table_count": table_count,
-                }
+            return {
+                "status": "healthy",
+                "message": f"Database is responding correctly ({table_count} tables)",
+                "response_time_ms": round(response_time, 2),
+                "table_count": table_count,
+            }
 
         except SQLAlchemyError as e:
             response_time = (time.time() - start_time) * 1000
@@ -187,11 +188,33 @@ class HealthChecker:
                 "response_time_ms": round(response_time, 2),
             }
 
+    def _query_database(self) -> int:
+        with self.db_engine.connect() as conn:
+            # Test basic connectivity
+            result = conn.execute(text("SELECT 1"))
+            result.fetchone()
+
+            # Test table existence (if using SQLite, check if tables exist)
+            if "sqlite" in settings.DATABASE_URL:
+                result = conn.execute(
+                    text("SELECT name FROM sqlite_master WHERE type='table'")
+                )
+                tables = result.fetchall()
+                return len(tables)
+
+            # For PostgreSQL, check if we can query information_schema
+            result = conn.execute(
+                text(
+                    "SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = 'public'"
+                )
+            )
+            return result.fetchone()[0]
+
     async def check_system_resources(self) -> dict[str, Any]:
         """Check system resource usage"""
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU usage, sampled over a second in a worker thread
+            cpu_percent = await asyncio.to_thread(psutil.cpu_percent, interval=1)
 
             # Memory usage
             memory = psutil.virtual_memory()
@@ -297,28 +320,34 @@ class HealthChecker:
             }
 
     async def run_all_checks(self) -> dict[str, Any]:
-        """Run all health checks"""
-        checks = {}
-
-        # Run checks in parallel
-        check_tasks = [
-            ("redis", self.check_redis()),
-            ("database", self.check_database()),
-            ("system", self.check_system_resources()),
-            ("avantis", self.check_avantis_connectivity()),
-        ]
+        """Run all health checks concurrently, each under its deadline"""
+        results = await run_probes(
+            {
+                "redis": self.check_redis,
+                "database": self.check_database,
+                "system": self.check_system_resources,
+                "avantis": self.check_avantis_connectivity,
+                "oracle": _get_oracle_status,
+            },
+            self.PROBE_TIMEOUTS,
+        )
+
+        # Oracle status is informational and does not count towards health
+        oracle_status = results.pop("oracle")
+        if isinstance(oracle_status, Exception):
+            oracle_status = {"status": "error", "error": str(oracle_status)}
 
-        for check_name, check_task in check_tasks:
-            try:
-                result = await check_task
-                checks[check_name] = result
-                log_system_health(check_name, result["status"], result)
-            except Exception as e:
+        checks = {}
+        for check_name, result in results.items():
+            if isinstance(result, Exception):
                 checks[check_name] = {
                     "status": "unhealthy",
-                    "message": f"Check failed with exception: {str(e)}",
+                    "message": f"Check failed with exception: {str(result)}",
                 }
-                log_system_health(check_name, "unhealthy", {"error": str(e)})
+                log_system_health(check_name, "unhealthy", {"error": str(result)})
+            else:
+                checks[check_name] = result
+                log_system_health(check_name, result["status"], result)
 
         # Determine overall health
         overall_status = "healthy"
@@ -334,15 +363,21 @@ class HealthChecker:
         elif degraded_checks:
             overall_status = "degraded"
 
-        return {
+        report = {
             "status": overall_status,
             "checks": checks,
             "unhealthy_checks": unhealthy_checks,
             "degraded_checks": degraded_checks,
+            "oracle_status": oracle_status,
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "uptime_seconds": time.time() - _health_state["startup_time"],
         }
 
+        # Update global state
+        _health_state["last_check"] = time.time()
+        _health_state["checks"] = report
+        return report
+
 
 # Global health checker instance
 health_checker = HealthChecker()
@@ -378,8 +413,9 @@ def create_health_app() -> FastAPI:
     async def readiness_check():
         """Readiness check endpoint"""
         try:
-            # Run basic checks to ensure service is ready
-            checks = await health_checker.run_all_checks()
+            # Latest background check results; no dependency is touched here
+            checks = await health_checker.snapshot.get()
+            checks["snapshot_age_seconds"] = round(health_checker.snapshot.age(), 3)
 
             if checks["status"] == "unhealthy":
                 raise HTTPException(status_code=503, detail=checks)
@@ -395,7 +431,8 @@ def create_health_app() -> FastAPI:
     async def detailed_health_check():
         """Detailed health check endpoint"""
         try:
-            checks = await health_checker.run_all_checks()
+            checks = await health_checker.snapshot.get()
+            checks["snapshot_age_seconds"] = round(health_checker.snapshot.age(), 3)
 
             # Include additional system information
             checks["system_info"] = {
@@ -406,13 +443,6 @@ def create_health_app() -> FastAPI:
                 "emergency_stop": settings.EMERGENCY_STOP,
             }
 
-            # Include oracle status for operational visibility
-            checks["oracle_status"] = await _get_oracle_status()
-
-            # Update global state
-            _health_state["last_check"] = time.time()
-            _health_state["checks"] = checks
-
             return JSONResponse(
                 status_code=200 if checks["status"] != "unhealthy" else 503,
                 content=checks,
@@ -421,6 +451,16 @@ def create_health_app() -> FastAPI:
             logger.error(f"Detailed health check failed: {e}")
             raise HTTPException(status_code=503, detail="Health check failed")
 
+    @app.get("/oracle/status")
+    async def oracle_status():
+        """Lightweight oracle status endpoint for dashboards."""
+        try:
+            checks = await health_checker.snapshot.get()
+            return JSONResponse(content=checks["oracle_status"])
+        except Exception as e:
+            logger.error(f"Oracle status endpoint failed: {e}")
+            raise HTTPException(status_code=500, detail="Oracle status failed")
+
     @app.get("/metrics")
     async def metrics():
         """Basic metrics endpoint"""
@@ -471,9 +511,7 @@ async def start_health_monitoring():
     async def health_monitor():
         while True:
             try:
-                checks = await health_checker.run_all_checks()
-                _health_state["last_check"] = time.time()
-                _health_state["checks"] = checks
+                checks = await health_checker.snapshot.refresh()
 
                 # Log any unhealthy checks
                 for check_name, result in checks["checks"].items():
@@ -482,22 +520,11 @@ async def start_health_monitoring():
                             f"Health check failed: {check_name} - {result['message']}"
                         )
 
-                # Wait 60 seconds before next check
-                await asyncio.sleep(60)
-
             except Exception as e:
                 logger.error(f"Health monitoring error: {e}")
-                await asyncio.sleep(60)
 
-    @app.get("/oracle/status")
-    async def oracle_status():
-        """Lightweight oracle status endpoint for dashboards."""
-        try:
-            oracle_status = await _get_oracle_status()
-            return JSONResponse(content=oracle_status)
-        except Exception as e:
-            logger.error(f"Oracle status endpoint failed: {e}")
-            raise HTTPException(status_code=500, detail="Oracle status failed")
+            # Keep the snapshot the endpoints serve fresh
+            await asyncio.sleep(health_checker.snapshot.interval_s)
 
     # Start the monitoring task
     asyncio.create_task(health_monitor())
@@ -1,5 +1,7 @@
 """Health and readiness server for monitoring."""
 
+import asyncio
+import contextlib
 import logging
 import time
 
@@ -8,11 +10,26 @@ from fastapi.responses import JSONResponse
 
 from src.config.settings import settings
 from src.middleware.circuit_breakers import circuit_breaker_manager
+from src.monitoring.probes import ProbeSnapshot, run_probes
 
 logger = logging.getLogger(__name__)
 
+# Deadline per check, in seconds; a check past it counts as failed
+PROBE_TIMEOUTS = {"database": 3.0, "redis": 2.0, "rpc": 5.0, "circuit_breakers": 1.0}
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Refresh the health snapshot in the background while serving."""
+    refresher = asyncio.create_task(_snapshot.run_forever())
+    try:
+        yield
+    finally:
+        refresher.cancel()
+
+
 # Create FastAPI app
-app = FastAPI(title="Vanta Bot Health", version="1.0.0")
+app = FastAPI(title="Vanta Bot Health", version="1.0.0", lifespan=lifespan)
 
 
 @app.get("/live")
@@ -25,7 +42,8 @@ async def liveness():
 async def readiness():
     """Readiness probe - checks if service is ready to handle requests."""
     try:
-        checks = await _perform_health_checks()
+        # Latest background check results; no dependency is touched here
+        checks = await _snapshot.get()
 
         # Check if all critical services are healthy
         all_healthy = all(checks.values())
@@ -53,13 +71,14 @@ async def readiness():
 async def health():
     """Comprehensive health check with detailed status."""
     try:
-        checks = await _perform_health_checks()
+        checks = await _snapshot.get()
         circuit_status = circuit_breaker_manager.get_status()
 
         return {
             "status": "healthy" if all(checks.values()) else "unhealthy",
             "timestamp": time.time(),
             "checks": checks,
+            "snapshot_age_seconds": round(_snapshot.age(), 3),
             "circuit_breakers": circuit_status,
             "version": "1.0.0",
         }
@@ -73,26 +92,33 @@ async def health():
 
 
 async def _perform_health_checks() -> dict[str, bool]:
-    """Perform all health checks.
+    """Perform all health checks concurrently.
 
     Returns:
-        Dict mapping check name to result
+        Dict mapping check name to result; a check that raises or misses its
+        deadline counts as failed
     """
-    checks = {}
+    results = await run_probes(
+        {
+            "database": _check_database,
+            "redis": _check_redis,
+            "rpc": _check_rpc,
+            "circuit_breakers": _check_circuit_breakers,
+        },
+        PROBE_TIMEOUTS,
+    )
 
-    # Database check
-    checks["database"] = await _check_database()
-
-    # Redis check
-    checks["redis"] = await _check_redis()
-
-    # RPC check
-    checks["rpc"] = await _check_rpc()
+    checks = {}
+    for name, result in results.items():
+        if isinstance(result, Exception):
+            logger.error(f"{name} check failed: {result}")
+            result = False
+        checks[name] = result
+    return checks
 
-    # Circuit breakers check
-    checks["circuit_breakers"] = await _check_circuit_breakers()
 
-    return checks
+# Endpoints answer from this; the app lifespan keeps it fresh
+_snapshot = ProbeSnapshot(_perform_health_checks, interval_s=15.0)
 
 
 async def _check_database() -> bool:
@@ -111,8 +137,11 @@ async def _check_redis() -> bool:
     try:
         import redis
 
-        r = redis.from_url(settings.REDIS_URL)
-        r.ping()
+        r = redis.from_url(
+            settings.REDIS_URL, socket_timeout=2, socket_connect_timeout=2
+        )
+        # Synchronous client; keep the round trip off the event loop
+        await asyncio.to_thread(r.ping)
         return True
     except Exception as e:
         logger.error(f"Redis check failed: {e}")
@@ -124,8 +153,8 @@ async def _check_rpc() -> bool:
     try:
         from src.blockchain.base_client import base_client
 
-        # Check if we can get the latest block
-        base_client.w3.eth.get_block("latest")
+        # Check if we can get the latest block (a blocking RPC call)
+        await asyncio.to_thread(base_client.w3.eth.get_block, "latest")
         return True
     except Exception as e:
         logger.error(f"RPC check failed: {e}")
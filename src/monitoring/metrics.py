@@ -25,11 +25,45 @@ tpsl_triggers = Counter(
 )  # type: TP|SL
 tpsl_errors = Counter("vanta_tpsl_errors_total", "TP/SL executor errors")
 
+# Copy trading metrics
+copy_queue_depth = Gauge(
+    "vanta_copy_queue_depth", "Copy trade requests waiting for execution"
+)
+copy_active_wallets = Gauge(
+    "vanta_copy_active_wallets", "Follower wallets with pending copy trades"
+)
+copy_wallet_lag = Histogram(
+    "vanta_copy_wallet_lag_seconds",
+    "Time a copy trade waited behind its follower wallet's queue",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+copy_exec_latency = Histogram(
+    "vanta_copy_exec_latency_seconds", "Copy trade execution latency"
+)
+
+# Price bus metrics
+price_bus_fetches = Counter(
+    "vanta_price_bus_fetches_total",
+    "Upstream price fetches by the price bus",
+    ["source"],
+)
+price_bus_reads = Counter(
+    "vanta_price_bus_reads_total", "Price bus reads", ["result"]
+)  # result: hit|miss
+
 # Bot metrics
 bot_tx_sent = Counter(
     "vanta_bot_tx_sent_total", "Bot-initiated transactions", ["action"]
 )  # open|close
 bot_errors = Counter("vanta_bot_errors_total", "Bot handler errors")
 
+# Health probe metrics
+health_probe_latency = Histogram(
+    "vanta_health_probe_latency_seconds",
+    "Health probe latency",
+    ["probe", "result"],  # result: ok|error|timeout
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
 # Generic health
 loop_heartbeat = Gauge("vanta_loop_heartbeat", "1 when loop healthy", ["component"])
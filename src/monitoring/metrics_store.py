@@ -0,0 +1,261 @@
+"""
+Metrics Store for Vanta Bot
+Bounded, columnar rollups of monitoring samples
+"""
+
+import json
+import time
+from datetime import datetime
+from typing import Any, Optional
+
+import numpy as np
+
+# (bucket seconds, buckets kept): 3h of minutes, a day of 5 minutes, a week of hours
+DEFAULT_RESOLUTIONS = ((60, 180), (300, 288), (3600, 168))
+
+
+class _Rollup:
+    """Ring of buckets at one resolution, one column array per statistic
+
+    Row r holds series r; a timestamp maps to slot (ts // resolution) % slots,
+    so old buckets are overwritten in place and memory never grows with time.
+    """
+
+    def __init__(self, resolution: int, slots: int, rows: int):
+        self.resolution = resolution
+        self.slots = slots
+        self.start = np.full((rows, slots), -1, dtype=np.int64)
+        self.count = np.zeros((rows, slots), dtype=np.int64)
+        self.sum = np.zeros((rows, slots), dtype=np.float64)
+        self.min = np.zeros((rows, slots), dtype=np.float64)
+        self.max = np.zeros((rows, slots), dtype=np.float64)
+        self.last = np.zeros((rows, slots), dtype=np.float64)
+
+    def grow(self, rows: int) -> None:
+        extra = rows - self.start.shape[0]
+        for name in ("start", "count", "sum", "min", "max", "last"):
+            column = getattr(self, name)
+            fill = -1 if name == "start" else 0
+            pad = np.full((extra, self.slots), fill, dtype=column.dtype)
+            setattr(self, name, np.concatenate([column, pad]))
+
+    def add(self, row: int, ts: int, value: float) -> Optional[int]:
+        """Fold a sample into its bucket; returns the slot, or None if too old"""
+        start = ts - ts % self.resolution
+        slot = (start // self.resolution) % self.slots
+        current = self.start[row, slot]
+        if current > start:
+            return None
+        if current != start:
+            self.start[row, slot] = start
+            self.count[row, slot] = 1
+            self.sum[row, slot] = value
+            self.min[row, slot] = value
+            self.max[row, slot] = value
+        else:
+            self.count[row, slot] += 1
+            self.sum[row, slot] += value
+            if value < self.min[row, slot]:
+                self.min[row, slot] = value
+            elif value > self.max[row, slot]:
+                self.max[row, slot] = value
+        self.last[row, slot] = value
+        return slot
+
+    def span(self) -> int:
+        return self.resolution * self.slots
+
+
+class MetricsStore:
+    """In-memory time series of monitoring metrics
+
+    Samples are not kept individually: each is folded into count, sum, min,
+    max and last for its bucket at every resolution. Memory is fixed by the
+    number of series and buckets, however many samples arrive. Buckets
+    touched since the last drain() are handed out as rows for one bulk write.
+    """
+
+    def __init__(
+        self,
+        resolutions: tuple[tuple[int, int], ...] = DEFAULT_RESOLUTIONS,
+        max_series: int = 512,
+    ):
+        """Initialize the store
+
+        Args:
+            resolutions: (bucket seconds, buckets kept) pairs, finest first
+            max_series: Distinct (name, labels) series tracked; more are dropped
+        """
+        self.max_series = max_series
+        self._series: dict[tuple[str, str], int] = {}
+        self._meta: list[tuple[str, str, dict[str, str]]] = []
+        self._rollups = [
+            _Rollup(resolution, slots, min(16, max_series))
+            for resolution, slots in resolutions
+        ]
+        self._dirty: set[tuple[int, int, int]] = set()
+
+    def __len__(self) -> int:
+        return len(self._meta)
+
+    def _row(
+        self, name: str, metric_type: str, labels: dict[str, str]
+    ) -> Optional[int]:
+        key = (name, json.dumps(labels, sort_keys=True))
+        row = self._series.get(key)
+        if row is not None:
+            return row
+        if len(self._meta) >= self.max_series:
+            return None
+
+        row = len(self._meta)
+        if row == self._rollups[0].start.shape[0]:
+            for rollup in self._rollups:
+                rollup.grow(min(row * 2, self.max_series))
+        self._series[key] = row
+        self._meta.append((name, metric_type, dict(labels)))
+        return row
+
+    def record(
+        self,
+        name: str,
+        value: float,
+        metric_type: str = "gauge",
+        labels: Optional[dict[str, str]] = None,
+        timestamp: Optional[float] = None,
+    ) -> bool:
+        """Add one sample
+
+        Counter samples are increments, so a window's total is their sum.
+
+        Returns:
+            False when the series limit is reached or the sample is too old
+        """
+        row = self._row(name, metric_type, labels or {})
+        if row is None:
+            return False
+
+        ts = int(time.time() if timestamp is None else timestamp)
+        stored = False
+        for level, rollup in enumerate(self._rollups):
+            slot = rollup.add(row, ts, float(value))
+            if slot is not None:
+                self._dirty.add((level, row, slot))
+                stored = True
+        return stored
+
+    def _rollup_for(self, window_s: int) -> tuple[int, _Rollup]:
+        """Finest resolution whose ring still covers the window"""
+        for level, rollup in enumerate(self._rollups):
+            if rollup.span() >= window_s:
+                return level, rollup
+        return len(self._rollups) - 1, self._rollups[-1]
+
+    def _window_mask(self, rollup: _Rollup, window_s: int, now: float) -> np.ndarray:
+        since = int(now) - window_s
+        # A bucket counts once any of it falls inside the window
+        return rollup.start[: len(self._meta)] > since - rollup.resolution
+
+    def total(
+        self,
+        name: str,
+        window_s: int,
+        labels: Optional[dict[str, str]] = None,
+        now: Optional[float] = None,
+    ) -> float:
+        """Sum of a metric's samples over the last window_s seconds
+
+        Args:
+            name: Metric name
+            window_s: Window length in seconds
+            labels: Only this series; all series of the name when None
+            now: End of the window (defaults to the current time)
+        """
+        _, rollup = self._rollup_for(window_s)
+        mask = self._window_mask(rollup, window_s, time.time() if now is None else now)
+        rows = [
+            row
+            for (series_name, series_labels), row in self._series.items()
+            if series_name == name
+            and (labels is None or series_labels == json.dumps(labels, sort_keys=True))
+        ]
+        if not rows:
+            return 0.0
+        return float(rollup.sum[rows][mask[rows]].sum())
+
+    def summary(self, window_s: int = 3600, now: Optional[float] = None) -> list[dict]:
+        """Per-metric statistics over the last window_s seconds, by name"""
+        _, rollup = self._rollup_for(window_s)
+        mask = self._window_mask(rollup, window_s, time.time() if now is None else now)
+        count = np.where(mask, rollup.count[: len(self._meta)], 0)
+
+        by_name: dict[str, dict[str, Any]] = {}
+        for row, (name, metric_type, _) in enumerate(self._meta):
+            samples = int(count[row].sum())
+            if not samples:
+                continue
+            live = mask[row] & (count[row] > 0)
+            stats = by_name.setdefault(
+                name,
+                {
+                    "metric_name": name,
+                    "metric_type": metric_type,
+                    "samples": 0,
+                    "total": 0.0,
+                    "min_value": float("inf"),
+                    "max_value": float("-inf"),
+                    "last_value": None,
+                    "_last_at": -1,
+                },
+            )
+            stats["samples"] += samples
+            stats["total"] += float(rollup.sum[row][live].sum())
+            stats["min_value"] = min(stats["min_value"], rollup.min[row][live].min())
+            stats["max_value"] = max(stats["max_value"], rollup.max[row][live].max())
+            latest = int(np.argmax(np.where(live, rollup.start[row], -1)))
+            if rollup.start[row, latest] > stats["_last_at"]:
+                stats["_last_at"] = int(rollup.start[row, latest])
+                stats["last_value"] = float(rollup.last[row, latest])
+
+        metrics = []
+        for name in sorted(by_name):
+            stats = by_name[name]
+            del stats["_last_at"]
+            stats["avg_value"] = stats["total"] / stats["samples"]
+            stats["min_value"] = float(stats["min_value"])
+            stats["max_value"] = float(stats["max_value"])
+            metrics.append(stats)
+        return metrics
+
+    def drain(self) -> tuple[list[tuple], set[tuple[int, int, int]]]:
+        """Buckets changed since the last drain, as rows for a bulk upsert
+
+        Returns:
+            (rows, keys): rows are (name, type, labels JSON, resolution_s,
+            bucket_start, count, sum, min, max, last); pass keys back to
+            mark_dirty() if writing them fails
+        """
+        keys, self._dirty = self._dirty, set()
+        rows = []
+        for level, row, slot in sorted(keys):
+            rollup = self._rollups[level]
+            name, metric_type, labels = self._meta[row]
+            rows.append(
+                (
+                    name,
+                    metric_type,
+                    json.dumps(labels, sort_keys=True),
+                    rollup.resolution,
+                    datetime.utcfromtimestamp(int(rollup.start[row, slot])),
+                    int(rollup.count[row, slot]),
+                    float(rollup.sum[row, slot]),
+                    float(rollup.min[row, slot]),
+                    float(rollup.max[row, slot]),
+                    float(rollup.last[row, slot]),
+                )
+            )
+        return rows, keys
+
+    def mark_dirty(self, keys: set[tuple[int, int, int]]) -> None:
+        """Queue buckets from a failed drain for the next one"""
+        self._dirty |= keys
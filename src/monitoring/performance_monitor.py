@@ -5,14 +5,19 @@ Handles metrics collection, health checks, and alerting
 
 import asyncio
 import logging
+import time
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
 
 import asyncpg
 import redis.asyncio as redis
 
+from .metrics_store import MetricsStore
+from .probes import run_probes
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,15 +47,36 @@ class HealthCheck:
 class PerformanceMonitor:
     """Performance monitoring and health check system"""
 
+    # Window of the "last hour" counts
+    RECENT_WINDOW_S = 3600
+    # Ids are taken at insert, so a row can commit after a higher id was
+    # counted; each pass re-reads ids this far back and skips counted ones
+    ID_OVERLAP_S = 120
+    # Deadline per service health check, in seconds
+    HEALTH_CHECK_TIMEOUTS = {
+        "database": 5.0,
+        "redis": 2.0,
+        "blockchain": 5.0,
+        "copy_trading": 5.0,
+        "ai_services": 5.0,
+    }
+
     def __init__(self, db_pool: asyncpg.Pool, redis_client: redis.Redis, config):
         self.db_pool = db_pool
         self.redis = redis_client
         self.config = config
 
-        # Metrics storage
-        self.metrics_buffer = []
+        # Metrics storage: bounded rollups instead of a list of samples
+        self.metrics_store = MetricsStore()
         self.health_checks = {}
 
+        # Per table: (pass time, highest id counted) of recent passes, and the
+        # ids counted above the oldest of those marks
+        self._id_marks: dict[str, deque[tuple[float, int]]] = {}
+        self._counted_ids: dict[str, set[int]] = {}
+        # Last activity per trader within the recent window
+        self._trader_last_seen: dict[str, float] = {}
+
         # Monitoring state
         self.is_running = False
 
@@ -130,20 +156,38 @@ class PerformanceMonitor:
                 """
                 )
 
-                # Copy positions in last hour
-                recent_positions = await conn.fetchval(
+                # Copy positions (and failures) recorded since the last pass
+                rows = await self._fetch_new_rows(
+                    conn,
+                    "copy_positions",
                     """
-                    SELECT COUNT(*) FROM copy_positions
-                    WHERE created_at > NOW() - INTERVAL '1 hour'
-                """
+                    SELECT date_trunc('minute', created_at) AS minute,
+                           COUNT(*) AS positions,
+                           COUNT(*) FILTER (WHERE status = 'FAILED') AS failed,
+                           array_agg(id) AS ids
+                    FROM copy_positions
+                    WHERE id > $1 AND id <> ALL($2::bigint[])
+                      AND created_at > NOW() - INTERVAL '1 hour'
+                    GROUP BY 1
+                """,
                 )
 
-                # Failed copy trades in last hour
-                failed_trades = await conn.fetchval(
-                    """
-                    SELECT COUNT(*) FROM copy_positions
-                    WHERE status = 'FAILED' AND created_at > NOW() - INTERVAL '1 hour'
-                """
+            labels = {"service": "copy_executor"}
+            for row in rows:
+                minute = self._epoch(row["minute"])
+                self.record_metric(
+                    "copy_trades_recent_positions",
+                    row["positions"],
+                    "counter",
+                    labels,
+                    timestamp=minute,
+                )
+                self.record_metric(
+                    "copy_trades_failed_trades",
+                    row["failed"],
+                    "counter",
+                    labels,
+                    timestamp=minute,
                 )
 
             # Store metrics
@@ -151,30 +195,64 @@ class PerformanceMonitor:
                 "copy_trades_active_copytraders",
                 active_copytraders,
                 "gauge",
-                {"service": "copy_executor"},
+                labels,
             )
             await self._store_metric(
                 "copy_trades_active_follows",
                 active_follows,
                 "gauge",
-                {"service": "copy_executor"},
-            )
-            await self._store_metric(
-                "copy_trades_recent_positions",
-                recent_positions,
-                "counter",
-                {"service": "copy_executor"},
-            )
-            await self._store_metric(
-                "copy_trades_failed_trades",
-                failed_trades,
-                "counter",
-                {"service": "copy_executor"},
+                labels,
             )
 
         except Exception as e:
             logger.error(f"Error collecting copy trading metrics: {e}")
 
+    async def _fetch_new_rows(self, conn, table: str, query: str) -> list:
+        """Run an aggregate over rows of the table not counted yet
+
+        The query takes an id floor as $1 and the ids already counted above it
+        as $2, and returns an ids array per group. Only the first pass looks
+        back over the recent window. Later passes start from the highest id
+        counted ID_OVERLAP_S ago, so a row that commits after a higher id was
+        counted is still counted once. Rows still uncommitted when the first
+        pass runs, or for longer than ID_OVERLAP_S, are missed.
+        """
+        now = time.monotonic()
+        marks = self._id_marks.get(table)
+        if marks is None:
+            floor = 0
+        else:
+            # Keep the newest mark that is at least ID_OVERLAP_S old
+            while len(marks) > 1 and marks[1][0] <= now - self.ID_OVERLAP_S:
+                marks.popleft()
+            floor = marks[0][1]
+
+        counted = {i for i in self._counted_ids.get(table, ()) if i > floor}
+        rows = await conn.fetch(query, floor, list(counted))
+        for row in rows:
+            counted.update(row["ids"])
+
+        if marks is None:
+            high = max(counted, default=None)
+            if high is None:
+                high = await conn.fetchval(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+            # The first pass's rows are all below its mark, so later passes
+            # start from there
+            self._id_marks[table] = deque([(now - self.ID_OVERLAP_S, high)])
+            counted = set()
+        else:
+            marks.append((now, max(counted, default=floor)))
+        self._counted_ids[table] = counted
+        return rows
+
+    @staticmethod
+    def _epoch(value: datetime) -> float:
+        # Timestamps are stored as naive UTC
+        return value.replace(tzinfo=timezone.utc).timestamp()
+
+    def _recent_total(self, name: str) -> int:
+        return int(self.metrics_store.total(name, self.RECENT_WINDOW_S))
+
     async def _collect_system_metrics(self):
         """Collect system metrics"""
         try:
@@ -208,27 +286,14 @@ class PerformanceMonitor:
                 """
                 )
 
-                # Market regime changes in last hour
-                regime_changes = await conn.fetchval(
-                    """
-                    SELECT COUNT(*) FROM performance_metrics
-                    WHERE metric_name = 'market_regime_changes'
-                    AND timestamp > NOW() - INTERVAL '1 hour'
-                """
-                )
-
+            # Market regime changes are counters recorded by MarketIntelligence
+            # when it is constructed with this monitor
             await self._store_metric(
                 "ai_analyses_performed",
                 ai_analyses,
-                "counter",
+                "gauge",
                 {"service": "trader_analyzer"},
             )
-            await self._store_metric(
-                "market_regime_changes",
-                regime_changes,
-                "counter",
-                {"service": "market_intelligence"},
-            )
 
         except Exception as e:
             logger.error(f"Error collecting AI metrics: {e}")
@@ -237,48 +302,65 @@ class PerformanceMonitor:
         """Collect event monitoring metrics"""
         try:
             async with self.db_pool.acquire() as conn:
-                # Events indexed in last hour
-                events_indexed = await conn.fetchval(
+                # Events indexed since the last pass, per trader and minute
+                rows = await self._fetch_new_rows(
+                    conn,
+                    "trade_events",
                     """
-                    SELECT COUNT(*) FROM trade_events
-                    WHERE created_at > NOW() - INTERVAL '1 hour'
-                """
+                    SELECT address, date_trunc('minute', created_at) AS minute,
+                           COUNT(*) AS events, array_agg(id) AS ids
+                    FROM trade_events
+                    WHERE id > $1 AND id <> ALL($2::bigint[])
+                      AND created_at > NOW() - INTERVAL '1 hour'
+                    GROUP BY 1, 2
+                """,
                 )
 
-                # Unique traders with activity in last hour
-                active_traders = await conn.fetchval(
-                    """
-                    SELECT COUNT(DISTINCT address) FROM trade_events
-                    WHERE created_at > NOW() - INTERVAL '1 hour'
-                """
+            labels = {"service": "event_indexer"}
+            events_by_minute: dict[float, int] = {}
+            for row in rows:
+                minute = self._epoch(row["minute"])
+                events_by_minute[minute] = (
+                    events_by_minute.get(minute, 0) + row["events"]
+                )
+                if minute > self._trader_last_seen.get(row["address"], 0):
+                    self._trader_last_seen[row["address"]] = minute
+            for minute, events in events_by_minute.items():
+                self.record_metric(
+                    "events_indexed", events, "counter", labels, timestamp=minute
                 )
 
+            # Unique traders with activity in the last hour
+            cutoff = self._epoch(datetime.utcnow()) - self.RECENT_WINDOW_S
+            self._trader_last_seen = {
+                address: seen
+                for address, seen in self._trader_last_seen.items()
+                if seen > cutoff
+            }
             await self._store_metric(
-                "events_indexed",
-                events_indexed,
-                "counter",
-                {"service": "event_indexer"},
-            )
-            await self._store_metric(
-                "active_traders", active_traders, "gauge", {"service": "event_indexer"}
+                "active_traders", len(self._trader_last_seen), "gauge", labels
             )
 
         except Exception as e:
             logger.error(f"Error collecting event monitoring metrics: {e}")
 
+    def record_metric(
+        self,
+        name: str,
+        value: float,
+        metric_type: str = "counter",
+        labels: Optional[dict[str, str]] = None,
+        timestamp: Optional[float] = None,
+    ):
+        """Record a sample; counter samples are increments"""
+        if not self.metrics_store.record(name, value, metric_type, labels, timestamp):
+            logger.debug(f"Dropped sample for metric {name}")
+
     async def _store_metric(
         self, name: str, value: float, metric_type: str, labels: dict[str, str]
     ):
-        """Store metric in buffer"""
-        metric = Metric(
-            name=name,
-            value=value,
-            metric_type=metric_type,
-            labels=labels,
-            timestamp=datetime.utcnow(),
-        )
-
-        self.metrics_buffer.append(metric)
+        """Store metric in the rollup store"""
+        self.record_metric(name, value, metric_type, labels)
 
     async def _persist_metrics(self):
         """Persist metrics to database"""
@@ -286,12 +368,8 @@ class PerformanceMonitor:
 
         while self.is_running:
             try:
-                if self.metrics_buffer:
-                    # Persist metrics to database
-                    await self._write_metrics_to_db()
-
-                    # Clear buffer
-                    self.metrics_buffer.clear()
+                # Persist the rollup buckets touched since the last pass
+                await self._write_metrics_to_db()
 
                 # Wait before next persistence
                 await asyncio.sleep(60)  # Persist every minute
@@ -301,32 +379,44 @@ class PerformanceMonitor:
                 await asyncio.sleep(30)
 
     async def _write_metrics_to_db(self):
-        """Write metrics to database"""
+        """Write changed rollup buckets to database in one statement"""
+        rows, keys = self.metrics_store.drain()
+        if not rows:
+            return
+
         try:
+            columns = list(zip(*rows))
             async with self.db_pool.acquire() as conn:
-                # Batch insert metrics
-                await conn.executemany(
+                await conn.execute(
                     """
-                    INSERT INTO performance_metrics (metric_name, metric_value, metric_type, labels, timestamp)
-                    VALUES ($1, $2, $3, $4, $5)
+                    INSERT INTO performance_metric_rollups (
+                        metric_name, metric_type, labels, resolution_s, bucket_start,
+                        sample_count, value_sum, value_min, value_max, value_last
+                    )
+                    SELECT name, type, labels::jsonb, resolution, bucket_start,
+                           samples, total, low, high, last
+                    FROM unnest(
+                        $1::varchar[], $2::varchar[], $3::text[], $4::int[],
+                        $5::timestamp[], $6::bigint[], $7::float8[], $8::float8[],
+                        $9::float8[], $10::float8[]
+                    ) AS r(name, type, labels, resolution, bucket_start,
+                           samples, total, low, high, last)
+                    ON CONFLICT (metric_name, labels, resolution_s, bucket_start)
+                    DO UPDATE SET
+                        sample_count = EXCLUDED.sample_count,
+                        value_sum = EXCLUDED.value_sum,
+                        value_min = EXCLUDED.value_min,
+                        value_max = EXCLUDED.value_max,
+                        value_last = EXCLUDED.value_last
                 """,
-                    [
-                        (
-                            metric.name,
-                            metric.value,
-                            metric.metric_type,
-                            metric.labels,
-                            metric.timestamp,
-                        )
-                        for metric in self.metrics_buffer
-                    ],
+                    *(list(column) for column in columns),
                 )
 
-                logger.debug(
-                    f"Persisted {len(self.metrics_buffer)} metrics to database"
-                )
+            logger.debug(f"Persisted {len(rows)} metric rollup buckets to database")
 
         except Exception as e:
+            # Buckets hold running totals, so the next pass rewrites them whole
+            self.metrics_store.mark_dirty(keys)
             logger.error(f"Error writing metrics to database: {e}")
 
     async def _run_health_checks(self):
@@ -335,25 +425,7 @@ class PerformanceMonitor:
 
         while self.is_running:
             try:
-                # Check database health
-                db_health = await self._check_database_health_detailed()
-                await self._update_health_check("database", db_health)
-
-                # Check Redis health
-                redis_health = await self._check_redis_health_detailed()
-                await self._update_health_check("redis", redis_health)
-
-                # Check blockchain connectivity
-                blockchain_health = await self._check_blockchain_health()
-                await self._update_health_check("blockchain", blockchain_health)
-
-                # Check copy trading service
-                copy_trading_health = await self._check_copy_trading_health()
-                await self._update_health_check("copy_trading", copy_trading_health)
-
-                # Check AI services
-                ai_health = await self._check_ai_services_health()
-                await self._update_health_check("ai_services", ai_health)
+                await self._check_all_services()
 
                 # Wait before next health check
                 await asyncio.sleep(60)  # Check every minute
@@ -362,6 +434,35 @@ class PerformanceMonitor:
                 logger.error(f"Error running health checks: {e}")
                 await asyncio.sleep(30)
 
+    async def _check_all_services(self) -> dict[str, HealthCheck]:
+        """Check every service concurrently, each under its deadline"""
+        results = await run_probes(
+            {
+                "database": self._check_database_health_detailed,
+                "redis": self._check_redis_health_detailed,
+                "blockchain": self._check_blockchain_health,
+                "copy_trading": self._check_copy_trading_health,
+                "ai_services": self._check_ai_services_health,
+            },
+            self.HEALTH_CHECK_TIMEOUTS,
+        )
+
+        checks = {}
+        for service_name, result in results.items():
+            if isinstance(result, Exception):
+                result = HealthCheck(
+                    service_name=service_name,
+                    status=HealthStatus.UNHEALTHY,
+                    details={"error": str(result)},
+                    checked_at=datetime.utcnow(),
+                )
+            checks[service_name] = result
+
+        await asyncio.gather(
+            *(self._update_health_check(name, check) for name, check in checks.items())
+        )
+        return checks
+
     async def _check_database_health(self) -> int:
         """Check database connectivity"""
         try:
@@ -498,32 +599,20 @@ class PerformanceMonitor:
     async def _check_copy_trading_health(self) -> HealthCheck:
         """Check copy trading service health"""
         try:
-            async with self.db_pool.acquire() as conn:
-                # Check recent copy trading activity
-                recent_trades = await conn.fetchval(
-                    """
-                    SELECT COUNT(*) FROM copy_positions
-                    WHERE created_at > NOW() - INTERVAL '1 hour'
-                """
-                )
+            # Recent copy trading activity, kept up to date by metrics collection
+            recent_trades = self._recent_total("copy_trades_recent_positions")
+            failed_trades = self._recent_total("copy_trades_failed_trades")
 
-                # Check failed trades ratio
-                failed_trades = await conn.fetchval(
-                    """
-                    SELECT COUNT(*) FROM copy_positions
-                    WHERE status = 'FAILED' AND created_at > NOW() - INTERVAL '1 hour'
-                """
-                )
+            # Calculate failure rate
+            failure_rate = (failed_trades / max(recent_trades, 1)) * 100
 
-                # Calculate failure rate
-                failure_rate = (failed_trades / max(recent_trades, 1)) * 100
-
-                status = HealthStatus.HEALTHY
-                if failure_rate > 10:
-                    status = HealthStatus.DEGRADED
-                if failure_rate > 25:
-                    status = HealthStatus.UNHEALTHY
+            status = HealthStatus.HEALTHY
+            if failure_rate > 10:
+                status = HealthStatus.DEGRADED
+            if failure_rate > 25:
+                status = HealthStatus.UNHEALTHY
 
+            async with self.db_pool.acquire() as conn:
                 return HealthCheck(
                     service_name="copy_trading",
                     status=status,
@@ -559,13 +648,7 @@ class PerformanceMonitor:
                 )
 
                 # Check market intelligence activity
-                market_updates = await conn.fetchval(
-                    """
-                    SELECT COUNT(*) FROM performance_metrics
-                    WHERE metric_name = 'market_regime_changes'
-                    AND timestamp > NOW() - INTERVAL '1 hour'
-                """
-                )
+                market_updates = self._recent_total("market_regime_changes")
 
                 status = HealthStatus.HEALTHY
                 if recent_analyses == 0 and market_updates == 0:
@@ -659,22 +742,11 @@ class PerformanceMonitor:
     async def get_metrics_summary(self) -> dict[str, Any]:
         """Get metrics summary"""
         try:
-            async with self.db_pool.acquire() as conn:
-                # Get recent metrics
-                recent_metrics = await conn.fetch(
-                    """
-                    SELECT metric_name, AVG(metric_value) as avg_value, MAX(metric_value) as max_value
-                    FROM performance_metrics
-                    WHERE timestamp > NOW() - INTERVAL '1 hour'
-                    GROUP BY metric_name
-                    ORDER BY metric_name
-                """
-                )
-
-                return {
-                    "metrics": [dict(row) for row in recent_metrics],
-                    "last_updated": datetime.utcnow().isoformat(),
-                }
+            # Recent metrics, straight from the in-memory rollups
+            return {
+                "metrics": self.metrics_store.summary(self.RECENT_WINDOW_S),
+                "last_updated": datetime.utcnow().isoformat(),
+            }
 
         except Exception as e:
             logger.error(f"Error getting metrics summary: {e}")
@@ -0,0 +1,132 @@
+"""Concurrent health probes and a cached snapshot of their results."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable
+from typing import Any, Callable, Optional, Union
+
+from src.monitoring.metrics import health_probe_latency
+from src.services.cache.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+Probe = Callable[[], Awaitable[Any]]
+
+
+class ProbeTimeout(Exception):
+    """A probe did not answer within its deadline."""
+
+    def __init__(self, name: str, timeout_s: float):
+        super().__init__(f"{name} check timed out after {timeout_s:g}s")
+        self.name = name
+        self.timeout_s = timeout_s
+
+
+async def run_probes(
+    probes: dict[str, Probe],
+    timeouts: Optional[dict[str, float]] = None,
+    default_timeout_s: float = 5.0,
+) -> dict[str, Union[Any, Exception]]:
+    """Run probes concurrently, each under its own deadline.
+
+    A slow or failing probe costs at most its deadline and does not hold up
+    the others. Every probe's latency is observed in the
+    ``vanta_health_probe_latency_seconds`` histogram.
+
+    Args:
+        probes: Probe name to coroutine function
+        timeouts: Per-probe deadlines in seconds
+        default_timeout_s: Deadline for probes missing from ``timeouts``
+
+    Returns:
+        Probe name to its result, or to the exception it raised
+        (ProbeTimeout when the deadline passed)
+    """
+    timeouts = timeouts or {}
+
+    async def run(name: str, probe: Probe) -> Union[Any, Exception]:
+        timeout_s = timeouts.get(name, default_timeout_s)
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(probe(), timeout_s)
+            outcome = "ok"
+        except asyncio.TimeoutError:
+            result = ProbeTimeout(name, timeout_s)
+            outcome = "timeout"
+        except Exception as e:
+            result = e
+            outcome = "error"
+        health_probe_latency.labels(probe=name, result=outcome).observe(
+            time.perf_counter() - start
+        )
+        return result
+
+    results = await asyncio.gather(*(run(name, p) for name, p in probes.items()))
+    return dict(zip(probes, results))
+
+
+class ProbeSnapshot:
+    """Latest result of a health refresh, for endpoints to answer from.
+
+    Probes and scrapes read the snapshot instead of touching dependencies. A
+    background loop refreshes it; concurrent refreshes share one run. Before
+    the first refresh completes, readers wait for it once.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[], Awaitable[dict[str, Any]]],
+        interval_s: float = 15.0,
+        max_age_s: float = 60.0,
+    ):
+        """Initialize the snapshot.
+
+        Args:
+            refresh: Coroutine function running every probe
+            interval_s: Seconds between background refreshes
+            max_age_s: Age after which a read also kicks off a refresh
+        """
+        self._refresh = refresh
+        self.interval_s = interval_s
+        self.max_age_s = max_age_s
+        self._value: Optional[dict[str, Any]] = None
+        self._taken_at = 0.0
+        self._runs = SingleFlight()
+
+    def age(self) -> Optional[float]:
+        """Seconds since the snapshot was taken, or None before the first."""
+        if self._value is None:
+            return None
+        return time.monotonic() - self._taken_at
+
+    async def get(self) -> dict[str, Any]:
+        """A copy of the latest snapshot."""
+        if self._value is None:
+            await self.refresh()
+        elif self.age() > self.max_age_s:
+            # Stale (background loop stalled?): answer now, refresh behind
+            self._start_refresh()
+        return dict(self._value)
+
+    async def refresh(self) -> dict[str, Any]:
+        """Run the probes now, joining a refresh already in flight."""
+        return await asyncio.shield(self._start_refresh())
+
+    def _start_refresh(self) -> asyncio.Task:
+        return self._runs.start("refresh", self._run)
+
+    async def _run(self) -> dict[str, Any]:
+        value = await self._refresh()
+        self._value = value
+        self._taken_at = time.monotonic()
+        return value
+
+    async def run_forever(self) -> None:
+        """Refresh every ``interval_s`` until cancelled."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Health snapshot refresh failed: {e}")
+            await asyncio.sleep(self.interval_s)
@@ -1,14 +1,35 @@
 """Positions repository for Phase 4 persistence."""
 
 from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from web3 import Web3
 
 from src.database.models import IndexedFill, UserPosition
 
+# Dialects with INSERT ... ON CONFLICT DO UPDATE for set-based upserts
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# Addresses per IN (...) lookup, well under SQLite's bound-parameter limit
+_LOOKUP_CHUNK = 500
+
+
+@dataclass(frozen=True)
+class PositionDelta:
+    """One change to a user position, as taken by upsert_position."""
+
+    user_addr: str
+    symbol: str
+    is_long: bool
+    size_delta_1e6: int
+    collateral_delta_1e6: int
+    realized_pnl_delta_1e6: int = 0
+
 
 def _normalize_address(addr: str) -> str:
     """Normalize address to lowercase (checksummed if valid).
@@ -98,6 +119,107 @@ def upsert_position(
     return pos
 
 
+def upsert_positions(
+    db: Session, deltas: Iterable[PositionDelta], commit: bool = True
+) -> set[str]:
+    """Apply many position changes with a fixed number of statements.
+
+    Ends in the same state as calling upsert_position for each delta in
+    order, but reads the affected positions with chunked IN lookups and writes
+    them back with one multi-row INSERT ... ON CONFLICT DO UPDATE.
+
+    Args:
+        db: Database session
+        deltas: Position changes, applied in order
+        commit: Commit when done (False leaves it to the caller's transaction)
+
+    Returns:
+        Normalized addresses whose positions changed
+    """
+    addresses: dict[str, str] = {}
+    ordered: list[tuple[tuple[str, str], PositionDelta]] = []
+    for delta in deltas:
+        addr = addresses.get(delta.user_addr)
+        if addr is None:
+            addr = addresses[delta.user_addr] = _normalize_address(delta.user_addr)
+        ordered.append(((addr, delta.symbol.upper()), delta))
+    if not ordered:
+        return set()
+
+    dialect = db.get_bind().dialect.name
+    if dialect not in _UPSERT_INSERTS:
+        raise NotImplementedError(f"Bulk position upserts not supported on {dialect}")
+
+    # Current state of every touched position, locked until the caller commits
+    keys = {key for key, _ in ordered}
+    users = sorted({addr for addr, _ in keys})
+    state: dict[tuple[str, str], dict] = {}
+    for i in range(0, len(users), _LOOKUP_CHUNK):
+        rows = db.execute(
+            select(
+                UserPosition.user_address,
+                UserPosition.symbol,
+                UserPosition.size_usd_1e6,
+                UserPosition.entry_collateral_1e6,
+                UserPosition.realized_pnl_1e6,
+            )
+            .where(UserPosition.user_address.in_(users[i : i + _LOOKUP_CHUNK]))
+            .with_for_update()
+        )
+        for addr, symbol, size, collateral, pnl in rows:
+            if (addr, symbol) in keys:
+                state[(addr, symbol)] = {
+                    "size_usd_1e6": size,
+                    "entry_collateral_1e6": collateral,
+                    "realized_pnl_1e6": pnl,
+                }
+
+    # Fold in order so clamping at zero matches the per-row path
+    now = datetime.utcnow()
+    for (addr, symbol), delta in ordered:
+        pos = state.setdefault(
+            (addr, symbol),
+            {"size_usd_1e6": 0, "entry_collateral_1e6": 0, "realized_pnl_1e6": 0},
+        )
+        pos["size_usd_1e6"] = max(0, pos["size_usd_1e6"] + delta.size_delta_1e6)
+        pos["entry_collateral_1e6"] = max(
+            0, pos["entry_collateral_1e6"] + delta.collateral_delta_1e6
+        )
+        pos["realized_pnl_1e6"] += delta.realized_pnl_delta_1e6
+        pos["is_long"] = delta.is_long
+
+    stmt = _UPSERT_INSERTS[dialect](UserPosition)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserPosition.user_address, UserPosition.symbol],
+        set_={
+            col: stmt.excluded[col]
+            for col in (
+                "is_long",
+                "size_usd_1e6",
+                "entry_collateral_1e6",
+                "realized_pnl_1e6",
+                "updated_at",
+            )
+        },
+    )
+    db.execute(
+        stmt,
+        [
+            {"user_address": addr, "symbol": symbol, "updated_at": now, **pos}
+            for (addr, symbol), pos in state.items()
+        ],
+    )
+
+    # Loaded positions no longer match their rows
+    for obj in list(db.identity_map.values()):
+        if isinstance(obj, UserPosition):
+            db.expire(obj)
+
+    if commit:
+        db.commit()
+    return {addr for addr, _ in keys}
+
+
 def list_positions(db: Session, user_addr: str) -> list[UserPosition]:
     """List all positions for a user.
 
@@ -118,16 +240,40 @@ def list_positions(db: Session, user_addr: str) -> list[UserPosition]:
     )
 
 
-def insert_fills(db: Session, rows: Iterable[IndexedFill]) -> None:
-    """Bulk insert fill records.
+def insert_fills(db: Session, rows: Iterable[IndexedFill], commit: bool = True) -> int:
+    """Bulk insert fill records with one multi-row INSERT.
+
+    The IndexedFill objects are read, not added to the session, so their ids
+    stay unset.
 
     Args:
         db: Database session
         rows: Iterable of IndexedFill objects
+        commit: Commit when done (False leaves it to the caller's transaction)
+
+    Returns:
+        Number of fills inserted
     """
-    for fill in rows:
-        db.add(fill)
-    db.commit()
+    now = datetime.utcnow()
+    values = [
+        {
+            "user_address": fill.user_address,
+            "symbol": fill.symbol,
+            "is_long": fill.is_long,
+            "usd_1e6": fill.usd_1e6,
+            "collateral_usdc_1e6": fill.collateral_usdc_1e6 or 0,
+            "tx_hash": fill.tx_hash,
+            "block_number": fill.block_number,
+            "ts": fill.ts or now,
+            "meta": fill.meta or "{}",
+        }
+        for fill in rows
+    ]
+    if values:
+        db.execute(insert(IndexedFill), values)
+    if commit:
+        db.commit()
+    return len(values)
 
 
 def get_fills_for_user(
@@ -1,9 +1,35 @@
 """TP/SL repository (Phase 7)."""
 
+import logging
+from collections.abc import Callable
+
 from sqlalchemy.orm import Session
 
 from src.database.models import TPSL
 
+logger = logging.getLogger(__name__)
+
+# Called with each row once add_tpsl/deactivate_tpsl has committed it
+_listeners: list[Callable[[TPSL], None]] = []
+
+
+def on_tpsl_change(listener: Callable[[TPSL], None]) -> Callable[[], None]:
+    """Register a callback for TP/SL orders added or deactivated in-process.
+
+    Returns:
+        Function that unregisters the callback
+    """
+    _listeners.append(listener)
+    return lambda: _listeners.remove(listener)
+
+
+def _notify(rec: TPSL) -> None:
+    for listener in _listeners:
+        try:
+            listener(rec)
+        except Exception as e:
+            logger.error(f"TP/SL listener failed for {rec.id}: {e}")
+
 
 def add_tpsl(
     db: Session,
@@ -24,6 +50,7 @@ def add_tpsl(
     db.add(rec)
     db.commit()
     db.refresh(rec)
+    _notify(rec)
     return rec
 
 
@@ -41,3 +68,4 @@ def deactivate_tpsl(db: Session, tpsl_id: int):
     if rec:
         rec.active = False
         db.commit()
+        _notify(rec)
@@ -17,7 +17,6 @@ from src.services.contracts.avantis_registry import (
     initialize_registry,
     resolve_avantis_vault,
 )
-from src.services.indexers.avantis_indexer import AvantisIndexer
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -40,6 +39,7 @@ class BackgroundServiceManager:
             self._start_price_feed_client(),
             self._start_contract_registry(),
             self._start_position_tracker(),
+            self._start_trader_leaderboards(),
             self._start_avantis_indexer(),
             self._start_health_monitoring(),
         ]
@@ -170,12 +170,49 @@ class BackgroundServiceManager:
         except Exception as e:
             logger.warning(f"⚠️ Failed to start position tracker: {e}")
 
+    async def _start_trader_leaderboards(self) -> None:
+        """Start 30d trader stats tracking and leaderboard rebuilds"""
+        try:
+            # Trader stats and leaderboards are asyncpg-only
+            db_url = settings.DATABASE_URL or ""
+            if not db_url.startswith(("postgresql://", "postgresql+asyncpg://")):
+                return
+            db_url = db_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+            import asyncpg
+            import redis.asyncio as redis
+
+            from src.ai.trader_analyzer import TraderAnalyzer
+            from src.analytics.position_tracker import (
+                PositionTracker as TraderStatsTracker,
+            )
+            from src.copy_trading.leaderboard_service import LeaderboardService
+
+            db_pool = await asyncpg.create_pool(db_url)
+            redis_client = redis.from_url(settings.REDIS_URL)
+
+            tracker = TraderStatsTracker(db_pool, redis_client, settings)
+            leaderboard = LeaderboardService(
+                db_pool, redis_client, TraderAnalyzer(settings), settings
+            )
+
+            # Republish leaderboard snapshots after every committed stats refresh
+            tracker.on_stats_refreshed(leaderboard.schedule_refresh)
+
+            task = asyncio.create_task(tracker.start_tracking())
+            self.services.append(task)
+            logger.info("✅ Trader stats tracking and leaderboards started")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to start trader leaderboards: {e}")
+
     async def _start_avantis_indexer(self) -> None:
         """Start Avantis indexer"""
         try:
             if not (settings.AVANTIS_TRADING_CONTRACT and settings.BASE_RPC_URL):
                 return
 
+            from src.services.indexers.avantis_indexer import AvantisIndexer
+
             # Set up database session factory for indexer
             # Ensure sync URL for background services (indexer uses sync SQLAlchemy)
             db_url = settings.DATABASE_URL
@@ -0,0 +1,89 @@
+"""Short-lived in-process cache for chain reads."""
+
+import time
+from collections.abc import Awaitable, Hashable
+from typing import Any, Callable, Optional
+
+from src.services.cache.single_flight import SingleFlight
+
+
+class BlockCache:
+    """Async cache whose entries live for about one block.
+
+    Values are loaded on a miss and kept for ``ttl_s`` seconds. Concurrent
+    misses for the same key share a single load instead of each issuing
+    their own RPC. Failed loads are not cached. Use it from one event loop.
+    """
+
+    def __init__(self, ttl_s: float = 2.0, max_entries: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            ttl_s: Seconds an entry stays fresh (2s is one block on Base)
+            max_entries: Entries kept before the oldest are dropped
+        """
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._loads = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Fresh value for a key, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value for ``ttl_s`` seconds."""
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl_s, value)
+        if len(self._entries) > self.max_entries:
+            self._evict()
+
+    async def get_or_load(
+        self, key: Hashable, load: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Cached value for a key, loading it once on a miss.
+
+        Args:
+            key: Cache key
+            load: Coroutine function returning the value
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+
+        async def load_and_set() -> Any:
+            value = await load()
+            self.set(key, value)
+            return value
+
+        return await self._loads.do(key, load_and_set)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one key, or every entry when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for key in [
+            k for k, (expires_at, _) in self._entries.items() if expires_at <= now
+        ]:
+            del self._entries[key]
+        # Still full: drop the oldest writes first
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
@@ -1,70 +1,120 @@
 """Lightweight positions cache using Redis (Phase 4)."""
 
+import asyncio
+import inspect
 import json
 import logging
-from typing import Optional
+import threading
+import time
+import weakref
+from collections.abc import Awaitable, Iterable
+from typing import Callable, Optional, Union
 
 import redis
+import redis.asyncio as redis_async
 
 from src.config.settings import settings
+from src.services.cache.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Seconds to skip Redis after a failed call instead of retrying every request
+_RETRY_AFTER_S = 30.0
 
-class PositionsCache:
-    """Redis cache for user positions."""
+PositionsLoader = Callable[[], Union[list[dict], Awaitable[list[dict]]]]
 
-    def __init__(self):
-        """Initialize Redis client."""
-        try:
-            self.r = redis.from_url(settings.REDIS_URL, decode_responses=True)
-            # Test connection
-            self.r.ping()
-        except Exception as e:
-            logger.warning(f"Redis not available, cache disabled: {e}")
-            self.r = None
 
-    def _key(self, user_addr: str) -> str:
-        """Generate cache key for user positions.
+def _key(user_addr: str) -> str:
+    """Generate cache key for user positions.
 
-        Args:
-            user_addr: User wallet address
+    Args:
+        user_addr: User wallet address
 
-        Returns:
-            Redis key
-        """
-        from web3 import Web3
+    Returns:
+        Redis key
+    """
+    from web3 import Web3
+
+    # Normalize address to lowercase (handle both real and test addresses)
+    try:
+        addr = Web3.to_checksum_address(user_addr).lower()
+    except (ValueError, TypeError):
+        addr = user_addr.lower()
+
+    chain_id = getattr(settings, "CHAIN_ID", 8453)  # Base mainnet
+    return f"pos:{chain_id}:{addr}"
 
-        # Normalize address to lowercase (handle both real and test addresses)
-        try:
-            addr = Web3.to_checksum_address(user_addr).lower()
-        except (ValueError, TypeError):
-            addr = user_addr.lower()
 
-        chain_id = getattr(settings, "CHAIN_ID", 8453)  # Base mainnet
-        return f"pos:{chain_id}:{addr}"
+class PositionsCache:
+    """Async Redis cache for user positions.
+
+    Every caller on an event loop shares one connection pool, created on first
+    use. Concurrent misses for the same user share a single load, and many
+    users are invalidated with one command. When Redis fails the cache turns
+    itself off for a while and callers fall through to their loader.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        client: Optional[redis_async.Redis] = None,
+        ttl: int = 30,
+    ):
+        """Initialize the cache.
 
-    def set_positions(
-        self, user_addr: str, positions: list[dict], ttl: int = 30
+        Args:
+            url: Redis URL (default: settings.REDIS_URL)
+            client: Async Redis client to use on every loop instead of url
+            ttl: Default time-to-live in seconds
+        """
+        self.url = url or settings.REDIS_URL
+        self.ttl = ttl
+        self._client = client
+        # Async connections belong to the loop that opened them
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._loads = SingleFlight()
+        self._down_until = 0.0
+
+    def _redis(self) -> Optional[redis_async.Redis]:
+        if time.monotonic() < self._down_until:
+            return None
+        if self._client is not None:
+            return self._client
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = redis_async.from_url(
+                self.url, decode_responses=True
+            )
+        return client
+
+    def _failed(self, action: str, error: Exception) -> None:
+        self._down_until = time.monotonic() + _RETRY_AFTER_S
+        logger.warning(
+            f"Failed to {action}: {error}; cache off for {_RETRY_AFTER_S:g}s"
+        )
+
+    async def set_positions(
+        self, user_addr: str, positions: list[dict], ttl: Optional[int] = None
     ) -> None:
         """Cache user positions.
 
         Args:
             user_addr: User wallet address
             positions: List of position dicts
-            ttl: Time-to-live in seconds (default 30s)
+            ttl: Time-to-live in seconds (default: the cache's ttl)
         """
-        if not self.r:
+        r = self._redis()
+        if r is None:
             return
 
         try:
-            key = self._key(user_addr)
-            self.r.setex(key, ttl, json.dumps(positions))
+            await r.setex(_key(user_addr), ttl or self.ttl, json.dumps(positions))
             logger.debug(f"Cached {len(positions)} positions for {user_addr[:8]}...")
         except Exception as e:
-            logger.warning(f"Failed to cache positions: {e}")
+            self._failed("cache positions", e)
 
-    def get_positions(self, user_addr: str) -> Optional[list[dict]]:
+    async def get_positions(self, user_addr: str) -> Optional[list[dict]]:
         """Get cached user positions.
 
         Args:
@@ -73,32 +123,110 @@ class PositionsCache:
         Returns:
             List of position dicts, or None if not cached
         """
-        if not self.r:
+        r = self._redis()
+        if r is None:
             return None
 
         try:
-            key = self._key(user_addr)
-            raw = self.r.get(key)
-            if raw:
-                logger.debug(f"Cache hit for {user_addr[:8]}...")
-                return json.loads(raw)
-            return None
+            raw = await r.get(_key(user_addr))
         except Exception as e:
-            logger.warning(f"Failed to get cached positions: {e}")
+            self._failed("get cached positions", e)
             return None
+        if raw:
+            logger.debug(f"Cache hit for {user_addr[:8]}...")
+            return json.loads(raw)
+        return None
+
+    async def get_or_load(self, user_addr: str, load: PositionsLoader) -> list[dict]:
+        """Cached positions, loading and caching them once on a miss.
+
+        Callers missing on the same user while a load runs wait for that load
+        instead of starting their own.
+
+        Args:
+            user_addr: User wallet address
+            load: Returns the user's positions (sync or async)
 
-    def invalidate(self, user_addr: str) -> None:
+        Returns:
+            List of position dicts
+        """
+        key = _key(user_addr)
+        if key not in self._loads:
+            cached = await self.get_positions(user_addr)
+            if cached is not None:
+                return cached
+
+        async def load_and_set() -> list[dict]:
+            positions = load()
+            if inspect.isawaitable(positions):
+                positions = await positions
+            await self.set_positions(user_addr, positions)
+            return positions
+
+        # Joins a load another caller started while we read the cache
+        return await self._loads.do(key, load_and_set)
+
+    async def invalidate(self, user_addr: str) -> None:
         """Invalidate cached positions for a user.
 
         Args:
             user_addr: User wallet address
         """
-        if not self.r:
-            return
+        await self.invalidate_many([user_addr])
+
+    async def invalidate_many(self, user_addrs: Iterable[str]) -> int:
+        """Invalidate cached positions for many users in one round trip.
+
+        Args:
+            user_addrs: User wallet addresses
+
+        Returns:
+            Number of cache entries removed
+        """
+        keys = list(dict.fromkeys(_key(addr) for addr in user_addrs))
+        r = self._redis()
+        if r is None or not keys:
+            return 0
 
         try:
-            key = self._key(user_addr)
-            self.r.delete(key)
-            logger.debug(f"Invalidated cache for {user_addr[:8]}...")
+            removed = await r.unlink(*keys)
+            logger.debug(f"Invalidated cached positions for {len(keys)} users")
+            return removed
         except Exception as e:
-            logger.warning(f"Failed to invalidate cache: {e}")
+            self._failed("invalidate cached positions", e)
+            return 0
+
+
+_sync_client: Optional[redis.Redis] = None
+_sync_client_lock = threading.Lock()
+
+
+def invalidate_positions(user_addrs: Iterable[str]) -> int:
+    """Invalidate cached positions for many users from sync code.
+
+    Uses one process-wide client and a single UNLINK for the whole batch.
+
+    Args:
+        user_addrs: User wallet addresses
+
+    Returns:
+        Number of cache entries removed
+    """
+    global _sync_client
+
+    keys = list(dict.fromkeys(_key(addr) for addr in user_addrs))
+    if not keys:
+        return 0
+
+    with _sync_client_lock:
+        if _sync_client is None:
+            _sync_client = redis.from_url(settings.REDIS_URL)
+    try:
+        return _sync_client.unlink(*keys)
+    except Exception as e:
+        logger.warning(f"Failed to invalidate cached positions: {e}")
+        return 0
+
+
+# Global instance
+positions_cache = PositionsCache()
@@ -0,0 +1,66 @@
+"""Share one in-flight load between concurrent callers."""
+
+import asyncio
+from collections.abc import Awaitable, Hashable, Iterable
+from typing import Any, Callable, Optional
+
+
+class SingleFlight:
+    """At most one running load per key; callers arriving meanwhile join it.
+
+    Each load runs as its own task, so a caller that is cancelled while
+    waiting does not cancel it for the others. A failed load is raised to
+    every caller waiting on it, and is marked retrieved so one that nobody
+    awaits (e.g. a background refresh) does not log an unretrieved error. Use
+    it from one event loop.
+    """
+
+    def __init__(self):
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: Hashable) -> Optional[asyncio.Task]:
+        """The load running for a key, or None."""
+        task = self._tasks.get(key)
+        if task is None or task.done():
+            return None
+        return task
+
+    def start(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Start a load for a key unless one is running.
+
+        Args:
+            key: Load key
+            load: Coroutine function producing the value
+
+        Returns:
+            The running load, new or joined
+        """
+        return self.get(key) or self.start_many([key], load)
+
+    def start_many(
+        self, keys: Iterable[Hashable], load: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task:
+        """Start one load that covers several keys.
+
+        Callers must only pass keys with no load running (see ``get``).
+        """
+        keys = list(keys)
+        task = asyncio.ensure_future(load())
+        for key in keys:
+            self._tasks[key] = task
+        task.add_done_callback(lambda done: self._finished(keys, done))
+        return task
+
+    async def do(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        """Result of the load for a key, starting one if none is running."""
+        return await asyncio.shield(self.start(key, load))
+
+    def _finished(self, keys: list[Hashable], task: asyncio.Task) -> None:
+        for key in keys:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        if not task.cancelled():
+            task.exception()
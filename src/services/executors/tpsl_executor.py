@@ -1,7 +1,8 @@
 """TP/SL executor daemon (Phase 7)."""
 
+import asyncio
 import logging
-import time
+from typing import Optional
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -13,84 +14,248 @@ from src.blockchain.avantis.service import AvantisService
 from src.config.feeds_loader import load_chainlink_feeds
 from src.config.settings import settings
 from src.monitoring.metrics import loop_heartbeat, tpsl_errors, tpsl_triggers
-from src.repositories.tpsl_repo import deactivate_tpsl, list_tpsl
+from src.repositories.tpsl_repo import deactivate_tpsl, list_tpsl, on_tpsl_change
+from src.services.executors.trigger_book import Fill, RestingOrder, TriggerBook
+from src.services.markets.market_catalog import default_market_catalog
+from src.services.price_bus import BusPriceFeed, PriceBus, PriceUpdate, price_bus
 
 logger = logging.getLogger(__name__)
 
 
 def run_loop():
     """Main TP/SL executor loop."""
-    logger.info("Starting TP/SL executor...")
+    asyncio.run(_run_loop())
 
-    w3 = Web3(Web3.HTTPProvider(settings.BASE_RPC_URL))
-    db_url = settings.DATABASE_URL.replace("sqlite+aiosqlite:", "sqlite:")
-    eng = create_engine(db_url, pool_pre_ping=True)
-    Session = sessionmaker(bind=eng, expire_on_commit=False)
 
-    # Load Chainlink feeds from config
-    cl_map = load_chainlink_feeds()
-    price_agg = PriceAggregator([ChainlinkAdapter(w3, cl_map)])
+class TPSLExecutor:
+    """Closes positions as prices cross their resting TP/SL triggers.
+
+    Active orders are held in a TriggerBook, updated as tpsl_repo adds or
+    deactivates them in this process and resynced from the database every
+    resync_s for orders written elsewhere. Each price the bus publishes for
+    a symbol with triggers is crossed against the book as it arrives. An
+    order whose close failed is re-armed after a delay that doubles with
+    each consecutive failure.
+    """
+
+    # Delay before re-arming an order after its first failed close; the
+    # polling loop this replaced retried every 10 s
+    RETRY_BASE_S = 10.0
+    # Longest delay between retries of a failing close
+    RETRY_MAX_S = 300.0
+
+    def __init__(
+        self,
+        w3,
+        Session,
+        price_agg,
+        markets=None,
+        bus: PriceBus = price_bus,
+        source: str = "chainlink",
+        resync_s: Optional[float] = None,
+    ):
+        """Initialize TP/SL executor.
+
+        Args:
+            w3: Web3 instance
+            Session: SQLAlchemy session factory
+            price_agg: Price aggregator used for closes
+            markets: Preloaded market catalog shared by every close
+            bus: Price bus publishing the prices to trigger on
+            source: Bus source whose prices count
+            resync_s: Seconds between full reloads (default: settings)
+        """
+        self.w3 = w3
+        self.Session = Session
+        self.price_agg = price_agg
+        self.markets = markets
+        self.bus = bus
+        self.source = source
+        self.resync_s = settings.TPSL_RESYNC_S if resync_s is None else resync_s
+        self.book = TriggerBook()
+        self.is_running = False
 
-    while True:
-        db = Session()
+        # Closes run concurrently; their orders stay out of the book meanwhile
+        self.closing: dict[int, asyncio.Task] = {}
+        # Orders whose close failed wait out of the book until re-armed
+        self.retrying: dict[int, asyncio.TimerHandle] = {}
+        self._failures: dict[int, int] = {}
+        self._watchers: dict[str, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def run(self) -> None:
+        """Load the book, then trigger on prices until stopped."""
+        self.is_running = True
+        self._loop = asyncio.get_running_loop()
+        unsubscribe = on_tpsl_change(self._on_change)
         try:
-            for rec in list_tpsl(db, tg_user_id=None):  # Check all active orders
+            while self.is_running:
                 try:
-                    quote = price_agg.get_price(rec.symbol)
-                    if not quote:
-                        continue
-
-                    current_price = quote.price / (10**quote.decimals)
-
-                    # Check take-profit trigger
-                    if rec.take_profit_price and current_price >= rec.take_profit_price:
-                        logger.info(
-                            f"TP triggered: {rec.symbol} @ {current_price} >= {rec.take_profit_price}"
-                        )
-                        tpsl_triggers.labels(type="TP").inc()
-                        svc = AvantisService(w3, db, price_agg)
-                        # Close 100% of position
-                        svc.close_market(
-                            rec.tg_user_id,
-                            rec.symbol,
-                            reduce_usdc=999999,
-                            slippage_pct=0.5,
-                        )
-                        deactivate_tpsl(db, rec.id)
-                        continue
-
-                    # Check stop-loss trigger
-                    if rec.stop_loss_price and current_price <= rec.stop_loss_price:
-                        logger.info(
-                            f"SL triggered: {rec.symbol} @ {current_price} <= {rec.stop_loss_price}"
-                        )
-                        tpsl_triggers.labels(type="SL").inc()
-                        svc = AvantisService(w3, db, price_agg)
-                        # Close 100% of position
-                        svc.close_market(
-                            rec.tg_user_id,
-                            rec.symbol,
-                            reduce_usdc=999999,
-                            slippage_pct=0.5,
-                        )
-                        deactivate_tpsl(db, rec.id)
-
+                    await self.resync()
                 except Exception as e:
-                    logger.error(f"Failed to process TP/SL {rec.id}: {e}")
+                    logger.error(f"TP/SL resync failed: {e}", exc_info=True)
                     tpsl_errors.inc()
 
-        except KeyboardInterrupt:
-            logger.info("TP/SL executor stopped by user")
-            break
+                # Set heartbeat
+                loop_heartbeat.labels(component="tpsl").set(1)
+                await asyncio.sleep(self.resync_s)
+        finally:
+            unsubscribe()
+            await self.stop()
+
+    async def stop(self) -> None:
+        """Stop watching prices and wait for closes in flight."""
+        self.is_running = False
+        watchers, self._watchers = list(self._watchers.values()), {}
+        for task in watchers:
+            task.cancel()
+        for handle in self.retrying.values():
+            handle.cancel()
+        self.retrying.clear()
+        await asyncio.gather(*watchers, *self.closing.values(), return_exceptions=True)
+
+    async def resync(self) -> None:
+        """Reload every active order and check it against the latest prices."""
+        db = self.Session()
+        try:
+            records = list_tpsl(db, tg_user_id=None)
+        finally:
+            db.close()
+
+        # Orders deactivated elsewhere are not re-armed
+        active = {rec.id for rec in records}
+        for tpsl_id in [i for i in self.retrying if i not in active]:
+            self._cancel_retry(tpsl_id)
+
+        self.book.sync(records, exclude=[*self.closing, *self.retrying])
+        logger.debug(f"TP/SL book holds {len(self.book)} orders")
+        for key in self.book.symbols():
+            self._check_latest(key)
+
+    def on_price(self, update: PriceUpdate) -> None:
+        """Close every order whose trigger this price crossed."""
+        for fill in self.book.cross(update.symbol, update.price):
+            if fill.order.id in self.closing:
+                continue
+            op = ">=" if (fill.trigger == "TP") == fill.order.is_long else "<="
+            logger.info(
+                f"{fill.trigger} triggered: {fill.order.symbol} @ {fill.price} "
+                f"{op} {fill.level}"
+            )
+            tpsl_triggers.labels(type=fill.trigger).inc()
+
+            task = asyncio.create_task(self._close_position(fill))
+            self.closing[fill.order.id] = task
+            task.add_done_callback(lambda t, order=fill.order: self._closed(order, t))
+
+    def _closed(self, order: RestingOrder, task: asyncio.Task) -> None:
+        self.closing.pop(order.id, None)
+        if task.cancelled():
+            return
+        if task.result() is not False:
+            self._failures.pop(order.id, None)
+            return
+
+        failures = self._failures.get(order.id, 0) + 1
+        self._failures[order.id] = failures
+        delay = min(self.RETRY_MAX_S, self.RETRY_BASE_S * 2 ** (failures - 1))
+        logger.warning(f"Retrying TP/SL {order.id} in {delay:g}s ({failures} failed)")
+        self.retrying[order.id] = asyncio.get_running_loop().call_later(
+            delay, self._rearm, order
+        )
+
+    def _rearm(self, order: RestingOrder) -> None:
+        # Back in the book, the next crossing price (or the last one) retries it
+        self.retrying.pop(order.id, None)
+        if self.is_running:
+            self.book.add(order)
+            self._check_latest(PriceBus.key(order.symbol))
+
+    def _cancel_retry(self, tpsl_id: int) -> None:
+        handle = self.retrying.pop(tpsl_id, None)
+        if handle is not None:
+            handle.cancel()
+        self._failures.pop(tpsl_id, None)
+
+    def _on_change(self, rec) -> None:
+        # May run on any thread; the book is only touched from the loop
+        if self._loop is None or self._loop.is_closed():
+            return
+        order, active = RestingOrder.from_record(rec), rec.active
+        self._loop.call_soon_threadsafe(self._apply, order, active)
+
+    def _apply(self, order: RestingOrder, active: bool) -> None:
+        if not active:
+            self.book.remove(order.id)
+            self._cancel_retry(order.id)
+        elif order.id not in self.closing and order.id not in self.retrying:
+            self.book.add(order)
+            self._check_latest(PriceBus.key(order.symbol))
+
+    def _check_latest(self, key: str) -> None:
+        """Cross the last known price and make sure the symbol is watched."""
+        if key not in self._watchers and self.is_running:
+            self._watchers[key] = asyncio.create_task(self._watch(key))
+        update = self.bus.latest(key, source=self.source)
+        if update is not None:
+            self.on_price(update)
+
+    async def _watch(self, key: str) -> None:
+        while True:
+            update = await self.bus.next_update(key)
+            if update.source != self.source:
+                continue
+            try:
+                self.on_price(update)
+            except Exception as e:
+                logger.error(f"Failed to process {key} price for TP/SL: {e}")
+                tpsl_errors.inc()
+
+    async def _close_position(self, fill: Fill) -> bool:
+        """Close a triggered position and deactivate its TP/SL order."""
+        db = self.Session()
+        try:
+            svc = AvantisService(self.w3, db, self.price_agg, self.markets)
+            # Close 100% of position
+            await svc.close_market_async(
+                fill.order.tg_user_id,
+                fill.order.symbol,
+                reduce_usdc=999999,
+                slippage_pct=0.5,
+            )
+            deactivate_tpsl(db, fill.order.id)
+            return True
         except Exception as e:
-            logger.error(f"TP/SL executor error: {e}", exc_info=True)
+            logger.error(
+                f"Failed to execute {fill.trigger} for TP/SL {fill.order.id}: {e}"
+            )
             tpsl_errors.inc()
+            return False
         finally:
             db.close()
 
-        # Set heartbeat
-        loop_heartbeat.labels(component="tpsl").set(1)
-        time.sleep(10)  # Check every 10 seconds
+
+async def _run_loop():
+    logger.info("Starting TP/SL executor...")
+
+    w3 = Web3(Web3.HTTPProvider(settings.BASE_RPC_URL))
+    db_url = settings.DATABASE_URL.replace("sqlite+aiosqlite:", "sqlite:")
+    eng = create_engine(db_url, pool_pre_ping=True)
+    Session = sessionmaker(bind=eng, expire_on_commit=False)
+
+    # Load Chainlink feeds from config
+    cl_map = load_chainlink_feeds()
+    adapter = ChainlinkAdapter(w3, cl_map)
+    price_bus.register_source("chainlink", adapter.get_prices, cl_map)
+    price_agg = PriceAggregator([BusPriceFeed(price_bus, source="chainlink"), adapter])
+
+    # Prices arrive from the bus poll instead of a fixed executor tick
+    price_bus.start()
+    executor = TPSLExecutor(w3, Session, price_agg, default_market_catalog())
+    try:
+        await executor.run()
+    finally:
+        await price_bus.stop()
 
 
 if __name__ == "__main__":
@@ -98,4 +263,7 @@ if __name__ == "__main__":
         level=logging.INFO,
         format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
     )
-    run_loop()
+    try:
+        run_loop()
+    except KeyboardInterrupt:
+        logger.info("TP/SL executor stopped by user")
@@ -0,0 +1,183 @@
+"""Price-indexed book of resting TP/SL triggers."""
+
+import bisect
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Optional
+
+from src.services.price_bus import PriceBus
+
+_INF = float("inf")
+
+
+@dataclass(frozen=True)
+class RestingOrder:
+    """The parts of a TP/SL row the book needs to fire it."""
+
+    id: int
+    tg_user_id: int
+    symbol: str
+    is_long: bool
+    take_profit_price: Optional[float]
+    stop_loss_price: Optional[float]
+
+    @classmethod
+    def from_record(cls, rec) -> "RestingOrder":
+        return cls(
+            id=rec.id,
+            tg_user_id=rec.tg_user_id,
+            symbol=rec.symbol,
+            is_long=rec.is_long,
+            take_profit_price=rec.take_profit_price,
+            stop_loss_price=rec.stop_loss_price,
+        )
+
+
+@dataclass(frozen=True)
+class Fill:
+    """A crossed trigger: the order to close and which leg fired."""
+
+    order: RestingOrder
+    trigger: str  # "TP" or "SL"
+    level: float
+    price: float
+
+
+# A leg is (level, order id, trigger); tuples sort by level first
+_Leg = tuple[float, int, str]
+
+
+class _SymbolBook:
+    """Both trigger directions for one symbol, each sorted by level."""
+
+    def __init__(self):
+        self.rising: list[_Leg] = []  # fires when price >= level
+        self.falling: list[_Leg] = []  # fires when price <= level
+
+    def __len__(self) -> int:
+        return len(self.rising) + len(self.falling)
+
+
+class TriggerBook:
+    """Resting TP/SL triggers indexed by symbol and price level.
+
+    A long's take-profit fires as the price rises to it and its stop-loss as
+    the price falls to it; a short's legs are the other way round. Each
+    direction is kept sorted, so crossing a price only touches the legs it
+    passes instead of every resting order. An order leaves the book as soon
+    as either leg fires. Not thread-safe: use it from the event loop.
+    """
+
+    def __init__(self):
+        self._books: dict[str, _SymbolBook] = {}
+        self._orders: dict[int, RestingOrder] = {}
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, tpsl_id: int) -> bool:
+        return tpsl_id in self._orders
+
+    def symbols(self) -> list[str]:
+        """Bus keys with at least one resting trigger."""
+        return [key for key, book in self._books.items() if book]
+
+    def add(self, order: RestingOrder) -> None:
+        """Add an order, replacing any previous version with the same id."""
+        self.remove(order.id)
+        legs = list(self._legs(order))
+        if not legs:
+            return
+
+        book = self._books.setdefault(PriceBus.key(order.symbol), _SymbolBook())
+        for side, leg in legs:
+            bisect.insort(getattr(book, side), leg)
+        self._orders[order.id] = order
+
+    def remove(self, tpsl_id: int) -> Optional[RestingOrder]:
+        """Take an order's legs out of the book."""
+        order = self._orders.pop(tpsl_id, None)
+        if order is None:
+            return None
+
+        self._remove_legs(order)
+        return order
+
+    def _remove_legs(self, order: RestingOrder, skip: str = "") -> None:
+        book = self._books[PriceBus.key(order.symbol)]
+        for side, leg in self._legs(order):
+            if leg[2] == skip:
+                continue
+            levels = getattr(book, side)
+            i = bisect.bisect_left(levels, leg)
+            if i < len(levels) and levels[i] == leg:
+                del levels[i]
+
+    def apply(self, rec) -> None:
+        """Mirror a TP/SL row after it was added, changed or deactivated."""
+        if rec.active:
+            self.add(RestingOrder.from_record(rec))
+        else:
+            self.remove(rec.id)
+
+    def sync(self, records: Iterable, exclude: Iterable[int] = ()) -> None:
+        """Make the book hold exactly the given active rows.
+
+        Args:
+            records: Every active TP/SL row
+            exclude: Order ids to leave out (e.g. closes still in flight)
+        """
+        exclude = set(exclude)
+        current = {
+            rec.id: RestingOrder.from_record(rec)
+            for rec in records
+            if rec.id not in exclude
+        }
+        for tpsl_id in [i for i in self._orders if i not in current]:
+            self.remove(tpsl_id)
+        for tpsl_id, order in current.items():
+            if self._orders.get(tpsl_id) != order:
+                self.add(order)
+
+    def cross(self, symbol: str, price: float) -> list[Fill]:
+        """Remove and return every order with a leg crossed at this price.
+
+        When both legs of an order cross at once the take-profit wins.
+        """
+        book = self._books.get(PriceBus.key(symbol))
+        if not book:
+            return []
+
+        # Crossed legs sit at the ends of their lists and go in one slice each
+        hit = bisect.bisect_right(book.rising, (price, _INF, ""))
+        crossed = book.rising[:hit]
+        del book.rising[:hit]
+        hit = bisect.bisect_left(book.falling, (price, -_INF, ""))
+        crossed += book.falling[hit:]
+        del book.falling[hit:]
+
+        fired: dict[int, Fill] = {}
+        crossed_legs: dict[int, set[str]] = {}
+        for level, tpsl_id, trigger in crossed:
+            crossed_legs.setdefault(tpsl_id, set()).add(trigger)
+            if tpsl_id in fired and fired[tpsl_id].trigger == "TP":
+                continue
+            fired[tpsl_id] = Fill(self._orders[tpsl_id], trigger, level, price)
+
+        # Only legs that did not cross are still in the lists
+        for tpsl_id, triggers in crossed_legs.items():
+            order = self._orders.pop(tpsl_id)
+            if len(triggers) == 1:
+                self._remove_legs(order, skip=next(iter(triggers)))
+        return list(fired.values())
+
+    @staticmethod
+    def _legs(order: RestingOrder):
+        # (side list name, leg) for each price the order has set
+        tp_side, sl_side = (
+            ("rising", "falling") if order.is_long else ("falling", "rising")
+        )
+        if order.take_profit_price:
+            yield tp_side, (float(order.take_profit_price), order.id, "TP")
+        if order.stop_loss_price:
+            yield sl_side, (float(order.stop_loss_price), order.id, "SL")
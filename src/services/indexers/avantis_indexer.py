@@ -4,16 +4,25 @@ Avantis Indexer (Phase 4)
 Backfills from last stored block to `tip - CONFIRMATIONS`, parses trade events into
 IndexedFill rows, and updates UserPosition aggregates. Then follows head in a loop.
 
+The backfill fetches many block ranges concurrently, shrinking the range when the
+provider rejects a response as too large, and persists them in strict block order
+so the sync_state watermark never moves past a range that has not been stored.
+
 This indexer uses the Avantis Trading contract ABI from config/abis/Trading.json
 to decode events. The contract address is loaded from config/addresses/base.mainnet.json.
 """
 
 import json
 import logging
+import re
+import threading
 import time
+from collections import deque
 from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -21,7 +30,11 @@ from web3 import Web3
 
 from src.config.settings import settings
 from src.database.models import IndexedFill
-from src.repositories.positions_repo import insert_fills, upsert_position
+from src.repositories.positions_repo import (
+    PositionDelta,
+    insert_fills,
+    upsert_positions,
+)
 from src.repositories.sync_state_repo import get_block, set_block
 
 logger = logging.getLogger(__name__)
@@ -31,6 +44,24 @@ CONFIRMATIONS = 2
 SYNC_NAME = "avantis_indexer"
 CHUNK = 2_000  # blocks per query (tune per provider limits)
 
+# Provider error fragments meaning "ask for fewer blocks" rather than a hard failure
+_RANGE_TOO_LARGE_ERRORS = (
+    "-32005",
+    "query returned more than",
+    "block range is too large",
+    "response size exceeded",
+)
+
+# Provider error fragments meaning "slow down"; retried after a backoff, never split
+_RATE_LIMIT_ERRORS = (
+    "too many requests",
+    "rate limit",
+    "rate exceeded",
+)
+_HTTP_429 = re.compile(r"\b429\b")
+RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_BACKOFF_S = 1.0
+
 # Load contract address from config
 _CONFIG_ROOT = Path(__file__).parent.parent.parent.parent / "config"
 _ADDRESSES_PATH = _CONFIG_ROOT / "addresses" / "base.mainnet.json"
@@ -99,34 +130,76 @@ def _decode_event(w3: Web3, contract, log: dict) -> Iterable[IndexedFill]:
     return []
 
 
-def _apply_fill(db, fill: IndexedFill) -> None:
-    """Apply fill to user position aggregate and invalidate cache.
+def _apply_fills(db, fills: list[IndexedFill]) -> set[str]:
+    """Apply a batch of fills to the user position aggregates.
+
+    Runs inside the caller's transaction.
 
     Args:
         db: Database session
-        fill: IndexedFill record
+        fills: IndexedFill records in block order
+
+    Returns:
+        Addresses whose positions changed
     """
     # Positive usd_1e6 means increase; negative means reduction
-    is_long = fill.is_long
-    size_delta = fill.usd_1e6
-    coll_delta = fill.collateral_usdc_1e6
-
-    upsert_position(
+    return upsert_positions(
         db,
-        user_addr=fill.user_address,
-        symbol=fill.symbol,
-        is_long=is_long,
-        size_delta_1e6=size_delta,
-        collateral_delta_1e6=coll_delta,
+        (
+            PositionDelta(
+                user_addr=fill.user_address,
+                symbol=fill.symbol,
+                is_long=fill.is_long,
+                size_delta_1e6=fill.usd_1e6,
+                collateral_delta_1e6=fill.collateral_usdc_1e6 or 0,
+            )
+            for fill in fills
+        ),
+        commit=False,
     )
 
-    # Invalidate cache immediately so users see fresh positions
+
+def _invalidate_positions(addresses: Iterable[str]) -> None:
+    """Drop cached positions so users see the newly indexed state."""
+    if not addresses:
+        return
     try:
-        from src.services.cache.positions_cache import PositionsCache
+        from src.services.cache.positions_cache import invalidate_positions
 
-        PositionsCache().invalidate(fill.user_address)
+        invalidate_positions(addresses)
     except Exception as e:
-        logger.warning(f"Failed to invalidate cache for {fill.user_address}: {e}")
+        logger.warning(f"Failed to invalidate cached positions: {e}")
+
+
+def _persist_range(w3: Web3, contract, db, start: int, end: int, logs) -> None:
+    """Decode and store the logs of blocks `start + 1`..`end`, then advance sync_state.
+
+    Args:
+        w3: Web3 instance
+        contract: Trading contract instance
+        db: Database session
+        start: Last block already stored
+        end: Last block covered by `logs`
+        logs: Raw logs from eth_getLogs for the range
+    """
+    fills: list[IndexedFill] = []
+    for lg in logs:
+        # Only process logs from the Trading contract
+        if lg["address"].lower() != TRADING_CONTRACT:
+            continue
+
+        for fill in _decode_event(w3, contract, lg):
+            fills.append(fill)
+
+    changed: set[str] = set()
+    if fills:
+        logger.info(f"Found {len(fills)} fills in blocks {start + 1}-{end}")
+        insert_fills(db, fills, commit=False)
+        changed = _apply_fills(db, fills)
+
+    # Fills, positions and the watermark commit together
+    set_block(db, SYNC_NAME, end)
+    _invalidate_positions(changed)
 
 
 def run_once(w3: Web3, contract, SessionLocal) -> int:
@@ -168,23 +241,187 @@ def run_once(w3: Web3, contract, SessionLocal) -> int:
             }
         )
 
-        fills: list[IndexedFill] = []
-        for lg in logs:
-            # Only process logs from the Trading contract
-            if lg["address"].lower() != TRADING_CONTRACT:
-                continue
+        _persist_range(w3, contract, db, start, end, logs)
+        return end - start
 
-            for fill in _decode_event(w3, contract, lg):
-                fills.append(fill)
 
-        if fills:
-            logger.info(f"Found {len(fills)} fills in blocks {start + 1}-{end}")
-            insert_fills(db, fills)
-            for fill in fills:
-                _apply_fill(db, fill)
+class _RangeSizer:
+    """Blocks per eth_getLogs call, shared by the backfill workers.
+
+    Halved below any range the provider rejects, then grown back by a quarter
+    after every `grow_after` accepted calls in a row, up to the maximum.
+    """
+
+    def __init__(self, max_size: int, grow_after: int = 8):
+        self.max_size = max(1, max_size)
+        self.size = self.max_size
+        self.grow_after = grow_after
+        self._accepted = 0
+        self._lock = threading.Lock()
+
+    def shrink(self, rejected: int) -> None:
+        with self._lock:
+            self.size = max(1, min(self.size, rejected // 2))
+            self._accepted = 0
+
+    def grow(self) -> None:
+        with self._lock:
+            self._accepted += 1
+            if self._accepted >= self.grow_after:
+                self.size = min(self.max_size, self.size + max(1, self.size // 4))
+                self._accepted = 0
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Whether an eth_getLogs error is the provider throttling requests."""
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    message = str(error).lower()
+    return bool(_HTTP_429.search(message)) or any(
+        fragment in message for fragment in _RATE_LIMIT_ERRORS
+    )
+
+
+def _is_range_too_large(error: Exception) -> bool:
+    """Whether an eth_getLogs error asks for a smaller block range."""
+    # Some providers reuse -32005 for request rate limits
+    if _is_rate_limited(error):
+        return False
+    message = str(error).lower()
+    return any(fragment in message for fragment in _RANGE_TOO_LARGE_ERRORS)
 
-        set_block(db, SYNC_NAME, end)
-        return end - start
+
+def _get_logs(w3: Web3, from_block: int, to_block: int) -> list:
+    """One eth_getLogs call, retried with exponential backoff while rate limited."""
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        try:
+            return w3.eth.get_logs(
+                {
+                    "fromBlock": from_block,
+                    "toBlock": to_block,
+                    "address": Web3.to_checksum_address(TRADING_CONTRACT),
+                }
+            )
+        except Exception as e:
+            if attempt == RATE_LIMIT_RETRIES or not _is_rate_limited(e):
+                raise
+            delay = RATE_LIMIT_BACKOFF_S * 2**attempt
+            logger.warning(
+                f"Provider rate limited blocks {from_block}-{to_block}, "
+                f"retrying in {delay:g}s"
+            )
+            time.sleep(delay)
+
+
+def _fetch_logs(w3: Web3, from_block: int, to_block: int, sizer: _RangeSizer) -> list:
+    """Fetch Trading contract logs for a block range, splitting rejected ranges.
+
+    Rate-limited calls are retried after a backoff rather than split, which
+    would only multiply the requests hitting the limit.
+
+    Args:
+        w3: Web3 instance
+        from_block: First block of the range
+        to_block: Last block of the range (inclusive)
+        sizer: Shared range size, shrunk on rejection
+
+    Returns:
+        Logs for the whole range in block order
+
+    Raises:
+        Exception: Any provider error other than an oversized range, an
+            oversized single block, or a rate limit that outlasts the retries
+    """
+    try:
+        logs = _get_logs(w3, from_block, to_block)
+    except Exception as e:
+        if from_block == to_block or not _is_range_too_large(e):
+            raise
+        span = to_block - from_block + 1
+        sizer.shrink(span)
+        logger.info(f"Provider rejected {span} blocks from {from_block}, splitting")
+        mid = from_block + span // 2 - 1
+        return _fetch_logs(w3, from_block, mid, sizer) + _fetch_logs(
+            w3, mid + 1, to_block, sizer
+        )
+
+    sizer.grow()
+    return list(logs)
+
+
+def backfill(
+    w3: Web3,
+    contract,
+    SessionLocal,
+    target: Optional[int] = None,
+    workers: Optional[int] = None,
+    chunk: int = CHUNK,
+) -> int:
+    """Backfill from the stored watermark to `target` with concurrent log fetches.
+
+    Up to `2 * workers` ranges are requested ahead while earlier ranges are
+    decoded and stored. Ranges are persisted strictly in block order, so when a
+    fetch fails the watermark stays at the end of the last contiguous stored
+    range and the next run resumes from there.
+
+    Args:
+        w3: Web3 instance
+        contract: Trading contract instance
+        SessionLocal: SQLAlchemy session factory
+        target: Last block to index (default: tip - CONFIRMATIONS)
+        workers: Concurrent eth_getLogs calls (default: INDEXER_BACKFILL_WORKERS)
+        chunk: Largest block range requested per call
+
+    Returns:
+        Number of blocks processed
+    """
+    workers = max(1, workers or settings.INDEXER_BACKFILL_WORKERS)
+
+    with SessionLocal() as db:
+        start = get_block(db, SYNC_NAME)
+        if target is None:
+            target = max(0, w3.eth.block_number - CONFIRMATIONS)
+
+        if start == 0:
+            start = max(0, target - settings.INDEXER_BACKFILL_RANGE)
+            logger.info(f"First run, backfilling from block {start}")
+
+        if start >= target:
+            return 0
+
+        logger.info(
+            f"Backfilling blocks {start + 1} to {target} with {workers} workers"
+        )
+
+        sizer = _RangeSizer(chunk)
+        pending: deque[tuple[int, int, Future]] = deque()
+        next_block = start + 1
+        stored = start
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="indexer-backfill"
+        ) as pool:
+            try:
+                while pending or next_block <= target:
+                    while next_block <= target and len(pending) < 2 * workers:
+                        end = min(target, next_block + sizer.size - 1)
+                        future = pool.submit(_fetch_logs, w3, next_block, end, sizer)
+                        pending.append((next_block, end, future))
+                        next_block = end + 1
+
+                    from_block, end, future = pending.popleft()
+                    logs = future.result()
+                    _persist_range(w3, contract, db, from_block - 1, end, logs)
+                    stored = end
+            except BaseException:
+                logger.error(f"Backfill stopped, sync_state left at block {stored}")
+                raise
+            finally:
+                for _, _, future in pending:
+                    future.cancel()
+
+        return stored - start
 
 
 def main():
@@ -208,6 +445,13 @@ def main():
     )
     SessionLocal = sessionmaker(bind=eng, expire_on_commit=False)
 
+    try:
+        n = backfill(w3, contract, SessionLocal)
+        logger.info(f"Backfill indexed {n} blocks, following head")
+    except Exception as e:
+        # Resume serially from the stored watermark
+        logger.error(f"Backfill error: {e}", exc_info=True)
+
     while True:
         try:
             n = run_once(w3, contract, SessionLocal)
@@ -5,12 +5,14 @@ This module provides parameterized price/impact/risk utilities using the Avantis
 for getting trading parameters, fees, and risk calculations.
 """
 
+import asyncio
 import logging
 from typing import Any, Optional
 
 from avantis_trader_sdk.types import LossProtectionInfo, PairSpread, TradeInput
 
 from src.integrations.avantis.sdk_client import get_sdk_client
+from src.services.cache.block_cache import BlockCache
 
 logger = logging.getLogger(__name__)
 
@@ -57,13 +59,18 @@ class AvantisPriceProvider:
     Parameterized price/impact/risk utility using the Avantis Trader SDK
 
     Provides methods for getting trading parameters, fees, spreads, and risk calculations.
+    Independent SDK calls run concurrently. Pair-level parameters (pair index,
+    pair spread, loss protection multipliers) are cached for ``params_ttl_s``.
     """
 
-    def __init__(self):
-        """Initialize the price provider"""
+    def __init__(self, params_ttl_s: float = 30.0):
+        """Initialize the price provider
+
+        Args:
+            params_ttl_s: How long pair-level parameters are reused
+        """
         self._client = None
-        self._cache: dict[str, Any] = {}
-        self._cache_ttl = 30  # Cache TTL in seconds
+        self._params = BlockCache(ttl_s=params_ttl_s)
         self.latest_price: dict[str, float] = {}  # Simple price cache
 
     async def _get_client(self):
@@ -85,7 +92,9 @@ class AvantisPriceProvider:
         """
         try:
             client = await self._get_client()
-            pair_index = await client.pairs_cache.get_pair_index(pair)
+            pair_index = await self._params.get_or_load(
+                ("pair_index", pair), lambda: client.pairs_cache.get_pair_index(pair)
+            )
             logger.debug(f"Pair index for {pair}: {pair_index}")
             return pair_index
         except Exception as e:
@@ -137,6 +146,36 @@ class AvantisPriceProvider:
             logger.error(f"❌ Error getting loss protection: {e}")
             raise
 
+    async def get_loss_protection_percent(self, trade_input: TradeInput) -> float:
+        """
+        Get the loss protection percentage for a trade
+
+        Unlike get_loss_protection this does not need the opening fee, so it
+        can be fetched alongside it. The multiplier for the trade's tier is a
+        pair-level parameter and is cached.
+
+        Args:
+            trade_input: Trade input parameters
+
+        Returns:
+            float: Loss protection percentage
+        """
+        try:
+            client = await self._get_client()
+            trading_parameters = client.trading_parameters
+            tier = await trading_parameters.get_loss_protection_tier(trade_input)
+            percent = await self._params.get_or_load(
+                ("loss_protection", trade_input.pairIndex, tier),
+                lambda: trading_parameters.get_loss_protection_percentage_by_tier(
+                    tier, trade_input.pairIndex
+                ),
+            )
+            logger.debug(f"Loss protection: {percent}% (tier {tier})")
+            return percent
+        except Exception as e:
+            logger.error(f"❌ Error getting loss protection: {e}")
+            raise
+
     async def get_pair_spread(self, pair: str) -> Optional[PairSpread]:
         """
         Get the current pair spread
@@ -149,7 +188,10 @@ class AvantisPriceProvider:
         """
         try:
             client = await self._get_client()
-            spread = await client.asset_parameters.get_pair_spread(pair)
+            spread = await self._params.get_or_load(
+                ("pair_spread", pair),
+                lambda: client.asset_parameters.get_pair_spread(pair),
+            )
             logger.debug(f"Pair spread for {pair}: {spread}")
             return spread
         except Exception as e:
@@ -228,11 +270,22 @@ class AvantisPriceProvider:
             Dict[str, Any]: Complete trade quote with all parameters
         """
         try:
-            # Get pair index
-            pair_index = await self.get_pair_index(pair)
+            quote = await self._quote_parts(pair, is_long, collateral_usdc, leverage)
+            # Slippage does not change any SDK parameter
+            return TradeQuote(**quote, slippage_pct=slippage_pct)
+
+        except Exception as e:
+            logger.error(f"❌ Error creating trade quote for {pair}: {e}")
+            raise
 
-            # Calculate position size
-            position_size = collateral_usdc * leverage
+    async def _quote_parts(
+        self, pair: str, is_long: bool, collateral_usdc: float, leverage: float
+    ) -> dict[str, Any]:
+        # Calculate position size
+        position_size = collateral_usdc * leverage
+
+        async def fee_and_protection():
+            pair_index = await self.get_pair_index(pair)
 
             # Create trade input for parameter calculation (use zero address for tests/mocks)
             trade_input = TradeInput(
@@ -247,39 +300,42 @@ class AvantisPriceProvider:
                 sl=0,
                 timestamp=0,
             )
-
-            # Get opening fee
-            opening_fee_usdc = await self.estimate_opening_fee(trade_input)
-
-            # Get loss protection
-            loss_protection = await self.get_loss_protection(
-                trade_input, opening_fee_usdc
-            )
-
-            # Get spreads (optional, may fail for some pairs)
-            pair_spread = await self.get_pair_spread(pair)
-            price_impact_spread = await self.get_price_impact_spread(
-                pair, is_long, position_size
-            )
-            skew_impact_spread = await self.get_skew_impact_spread(
-                pair, is_long, position_size
+            fee, percent = await asyncio.gather(
+                self.estimate_opening_fee(trade_input),
+                self.get_loss_protection_percent(trade_input),
             )
+            return pair_index, fee, percent
+
+        # Spreads are optional (None on failure) and only need the pair name
+        (
+            (pair_index, opening_fee_usdc, loss_protection_percent),
+            pair_spread,
+            price_impact_spread,
+            skew_impact_spread,
+        ) = await asyncio.gather(
+            fee_and_protection(),
+            self.get_pair_spread(pair),
+            self.get_price_impact_spread(pair, is_long, position_size),
+            self.get_skew_impact_spread(pair, is_long, position_size),
+        )
 
-            return TradeQuote(
-                pair_index=pair_index,
-                position_size=position_size,
-                opening_fee_usdc=opening_fee_usdc,
-                loss_protection_percent=loss_protection.loss_protection_percent,
-                loss_protection_amount=loss_protection.loss_protection_amount,
-                pair_spread=pair_spread,
-                price_impact_spread=price_impact_spread,
-                skew_impact_spread=skew_impact_spread,
-                slippage_pct=slippage_pct,
-            )
+        # Same amount the SDK's get_loss_protection_for_trade_input computes
+        loss_protection_amount = (
+            (collateral_usdc - opening_fee_usdc) * loss_protection_percent / 100
+            if loss_protection_percent
+            else 0
+        )
 
-        except Exception as e:
-            logger.error(f"❌ Error creating trade quote for {pair}: {e}")
-            raise
+        return {
+            "pair_index": pair_index,
+            "position_size": position_size,
+            "opening_fee_usdc": opening_fee_usdc,
+            "loss_protection_percent": loss_protection_percent,
+            "loss_protection_amount": loss_protection_amount,
+            "pair_spread": pair_spread,
+            "price_impact_spread": price_impact_spread,
+            "skew_impact_spread": skew_impact_spread,
+        }
 
     async def get_available_pairs(self) -> list[str]:
         """
@@ -320,22 +376,22 @@ class AvantisPriceProvider:
             Dict[str, Any]: Pair information including spreads, fees, etc.
         """
         try:
-            pair_index = await self.get_pair_index(pair)
-            pair_spread = await self.get_pair_spread(pair)
-
             # Get spreads for a small position to show current market conditions
             small_position_size = 1000  # $1000 position
-            price_impact_long = await self.get_price_impact_spread(
-                pair, True, small_position_size
-            )
-            price_impact_short = await self.get_price_impact_spread(
-                pair, False, small_position_size
-            )
-            skew_impact_long = await self.get_skew_impact_spread(
-                pair, True, small_position_size
-            )
-            skew_impact_short = await self.get_skew_impact_spread(
-                pair, False, small_position_size
+            (
+                pair_index,
+                pair_spread,
+                price_impact_long,
+                price_impact_short,
+                skew_impact_long,
+                skew_impact_short,
+            ) = await asyncio.gather(
+                self.get_pair_index(pair),
+                self.get_pair_spread(pair),
+                self.get_price_impact_spread(pair, True, small_position_size),
+                self.get_price_impact_spread(pair, False, small_position_size),
+                self.get_skew_impact_spread(pair, True, small_position_size),
+                self.get_skew_impact_spread(pair, False, small_position_size),
             )
 
             return {
@@ -1,11 +1,15 @@
 import asyncio
 import logging
+from typing import Optional
 
 from telegram import Bot
 
 from src.config.settings import config
 from src.database.operations import db
-from src.services.price_service import price_service
+from src.services.price_bus import PriceUpdate, price_bus
+
+# Importing the price service registers CoinGecko as a bus source
+from src.services.price_service import price_service  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
@@ -23,20 +27,24 @@ class PositionMonitor:
                 # For now, just monitoring logic
                 positions = await db.list_open_positions()
 
+                # One bus snapshot per tick, shared by every position
+                prices = await price_bus.get_many({p.symbol for p in positions})
                 for position in positions:
-                    await self.check_position(position)
+                    if position.symbol in prices:
+                        await self.check_position(position, prices[position.symbol])
 
             except Exception as e:
                 logger.error(f"Error monitoring positions: {e}")
 
             await asyncio.sleep(self.check_interval)
 
-    async def check_position(self, position):
+    async def check_position(self, position, update: Optional[PriceUpdate] = None):
         """Check individual position for updates"""
         try:
-            current_price = price_service.get_price(position.symbol)
-            if not current_price:
+            update = update or await price_bus.get(position.symbol)
+            if not update:
                 return
+            current_price = update.price
 
             # Update current price
             position.current_price = current_price
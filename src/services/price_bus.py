@@ -0,0 +1,379 @@
+"""
+Shared in-process price bus
+One owner per (source, symbol) ingests upstream prices into a TTL'd last-value cache
+that every consumer in the process reads from
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from collections.abc import Awaitable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Union
+
+from src.adapters.price.base import PriceQuote
+from src.config.settings import settings
+from src.monitoring.metrics import price_bus_fetches, price_bus_reads
+from src.services.cache.single_flight import SingleFlight
+from src.services.markets.symbols import to_canonical
+
+logger = logging.getLogger(__name__)
+
+# A fetcher takes source-native symbols and returns prices keyed by the same
+# symbols, either as floats or as adapter PriceQuotes. Sync fetchers run in a
+# worker thread.
+PriceFetcher = Callable[[list[str]], Union[dict[str, Any], Awaitable[dict[str, Any]]]]
+
+
+@dataclass(frozen=True)
+class PriceUpdate:
+    """A price as seen by every consumer of the bus"""
+
+    symbol: str  # bus key, e.g. "BTC"
+    price: float
+    source: str
+    timestamp: float  # upstream publish time (unix seconds)
+    received_at: float  # when the bus ingested it (unix seconds)
+    seq: int  # increases with every update published on the bus
+    quote: Optional[PriceQuote] = None  # original adapter quote, when given
+
+    @property
+    def age_s(self) -> float:
+        """Seconds since the bus ingested this price"""
+        return time.time() - self.received_at
+
+    @property
+    def source_age_s(self) -> float:
+        """Seconds since the upstream source published this price"""
+        return time.time() - self.timestamp
+
+
+@dataclass
+class _Source:
+    name: str
+    fetch: PriceFetcher
+    symbols: dict[str, str]  # bus key -> source-native symbol
+    interval_s: float
+    is_async: bool = field(init=False)
+
+    def __post_init__(self):
+        self.is_async = inspect.iscoroutinefunction(self.fetch)
+
+
+class PriceBus:
+    """Process-wide price ingestion and last-value cache.
+
+    Each registered source owns its symbols: upstream requests for a
+    (source, symbol) pair are made by the bus only, and concurrent refreshes of
+    the same pair share one request. Reads are served from the last-value
+    cache while younger than the TTL. Symbols are keyed canonically, so
+    "BTC", "BTC/USD" and "BTC-USD" are the same price. When several sources
+    provide a symbol, reads prefer them in registration order.
+    """
+
+    def __init__(self, ttl_s: Optional[float] = None):
+        self.ttl_s = settings.PRICE_BUS_TTL_S if ttl_s is None else ttl_s
+        self._sources: dict[str, _Source] = {}
+        self._publishers: dict[str, None] = {}  # every source that published
+        self._values: dict[tuple[str, str], PriceUpdate] = {}
+        self._inflight = SingleFlight()  # keyed by (source, bus key)
+        self._waiters: dict[str, list[asyncio.Future]] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._seq = 0
+
+    @staticmethod
+    def key(symbol: str) -> str:
+        """Bus key for a symbol in any of the repo's formats"""
+        symbol = to_canonical(symbol.replace("-", "/"))
+        return symbol.removesuffix("/USD")
+
+    def register_source(
+        self,
+        name: str,
+        fetch: PriceFetcher,
+        symbols: Iterable[str],
+        interval_s: Optional[float] = None,
+    ) -> None:
+        """Register (or replace) an upstream source and the symbols it owns.
+
+        Args:
+            name: Source name, e.g. "chainlink"
+            fetch: Callable fetching many source-native symbols in one request
+            symbols: Source-native symbols served by this source
+            interval_s: Poll interval while the bus is running
+        """
+        self._sources[name] = _Source(
+            name=name,
+            fetch=fetch,
+            symbols={self.key(s): s for s in symbols},
+            interval_s=(
+                settings.PRICE_BUS_POLL_INTERVAL_S if interval_s is None else interval_s
+            ),
+        )
+        logger.info(
+            f"Price bus source {name}: {len(self._sources[name].symbols)} symbols"
+        )
+
+    def publish(
+        self,
+        source: str,
+        symbol: str,
+        value: Any,
+        timestamp: Optional[float] = None,
+    ) -> Optional[PriceUpdate]:
+        """Store a price and wake everything waiting for the symbol's next update.
+
+        Must be called from the event loop thread when waiters are in use.
+        """
+        quote = value if isinstance(value, PriceQuote) else None
+        try:
+            if quote is not None:
+                price = quote.price / (10**quote.decimals)
+                timestamp = timestamp or quote.timestamp or None
+            else:
+                price = float(value)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring non-numeric {source} price for {symbol}: {value}")
+            return None
+        if not price > 0:
+            return None
+
+        now = time.time()
+        self._seq += 1
+        key = self.key(symbol)
+        update = PriceUpdate(
+            symbol=key,
+            price=price,
+            source=source,
+            timestamp=float(timestamp or now),
+            received_at=now,
+            seq=self._seq,
+            quote=quote,
+        )
+        self._values[(source, key)] = update
+        self._publishers.setdefault(source)
+
+        for waiter in self._waiters.pop(key, []):
+            if not waiter.done():
+                waiter.set_result(update)
+        return update
+
+    def latest(
+        self,
+        symbol: str,
+        max_age_s: Optional[float] = None,
+        source: Optional[str] = None,
+    ) -> Optional[PriceUpdate]:
+        """Last value for a symbol if it is younger than max_age_s (default: TTL).
+
+        Never calls upstream, so it is safe from sync code.
+        """
+        max_age_s = self.ttl_s if max_age_s is None else max_age_s
+        key = self.key(symbol)
+        for name in [source] if source is not None else self._read_order():
+            update = self._values.get((name, key))
+            if update is not None and update.age_s <= max_age_s:
+                return update
+        return None
+
+    def _read_order(self) -> list[str]:
+        # Registered sources in registration order, then push-only publishers
+        return list(self._sources) + [
+            name for name in self._publishers if name not in self._sources
+        ]
+
+    async def get(
+        self,
+        symbol: str,
+        max_age_s: Optional[float] = None,
+        source: Optional[str] = None,
+    ) -> Optional[PriceUpdate]:
+        """Fresh price for a symbol, refreshing its owner source when stale"""
+        return (await self.get_many([symbol], max_age_s, source)).get(symbol)
+
+    async def get_many(
+        self,
+        symbols: Iterable[str],
+        max_age_s: Optional[float] = None,
+        source: Optional[str] = None,
+    ) -> dict[str, PriceUpdate]:
+        """Fresh prices for many symbols with at most one request per source.
+
+        Args:
+            symbols: Symbols in any supported format
+            max_age_s: Oldest acceptable cached value (default: TTL)
+            source: Only read and refresh this source (default: all, in order)
+
+        Returns:
+            Map of requested symbol to PriceUpdate for symbols with a price
+        """
+        symbols = list(dict.fromkeys(symbols))
+        prices: dict[str, PriceUpdate] = {}
+        stale: list[str] = []
+        for symbol in symbols:
+            update = self.latest(symbol, max_age_s, source)
+            if update is not None:
+                prices[symbol] = update
+            else:
+                stale.append(symbol)
+        price_bus_reads.labels(result="hit").inc(len(prices))
+
+        # Ask sources in preference order; later ones only see what is missing
+        names = [source] if source is not None else list(self._sources)
+        for name in names:
+            owner = self._sources.get(name)
+            if owner is None:
+                continue
+            owned = [s for s in stale if self.key(s) in owner.symbols]
+            if not owned:
+                continue
+            started = time.time()
+            await self.refresh(name, owned)
+            # Anything ingested since the refresh started is fresh enough
+            fresh_s = max(self.ttl_s if max_age_s is None else max_age_s, 0)
+            fresh_s = max(fresh_s, time.time() - started)
+            for symbol in owned:
+                update = self.latest(symbol, fresh_s, source=name)
+                if update is not None:
+                    prices[symbol] = update
+            stale = [s for s in stale if s not in prices]
+
+        price_bus_reads.labels(result="miss").inc(len(symbols) - len(prices))
+        return prices
+
+    async def refresh(
+        self, source: str, symbols: Optional[Iterable[str]] = None
+    ) -> dict[str, PriceUpdate]:
+        """Fetch symbols from a source, joining requests already in flight.
+
+        Args:
+            source: Registered source name
+            symbols: Symbols to refresh (default: every symbol the source owns)
+
+        Returns:
+            Map of bus key to the source's latest PriceUpdate
+        """
+        src = self._sources[source]
+        keys = list(
+            dict.fromkeys(
+                src.symbols
+                if symbols is None
+                else (self.key(s) for s in symbols if self.key(s) in src.symbols)
+            )
+        )
+
+        running = {k: self._inflight.get((source, k)) for k in keys}
+        fetches = {task for task in running.values() if task is not None}
+        todo = [k for k, task in running.items() if task is None]
+        if todo:
+            fetches.add(
+                self._inflight.start_many(
+                    [(source, k) for k in todo], lambda: self._fetch(src, todo)
+                )
+            )
+
+        for fetch in fetches:
+            await asyncio.shield(fetch)
+
+        return {
+            k: self._values[(source, k)] for k in keys if (source, k) in self._values
+        }
+
+    async def _fetch(self, src: _Source, keys: list[str]) -> None:
+        native = [src.symbols[k] for k in keys]
+        price_bus_fetches.labels(source=src.name).inc()
+        try:
+            if src.is_async:
+                result = await src.fetch(native)
+            else:
+                result = await asyncio.to_thread(src.fetch, native)
+        except Exception as e:
+            logger.error(f"Price bus fetch from {src.name} failed: {e}")
+            return
+
+        for symbol, value in (result or {}).items():
+            if value is not None:
+                self.publish(src.name, symbol, value)
+
+    async def next_update(
+        self, symbol: str, timeout: Optional[float] = None
+    ) -> PriceUpdate:
+        """Wait for the next price published for a symbol by any source.
+
+        Raises:
+            asyncio.TimeoutError: If nothing is published within the timeout
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(self.key(symbol), []).append(waiter)
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        finally:
+            waiters = self._waiters.get(self.key(symbol))
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+
+    def start(self) -> None:
+        """Start polling every registered source on its interval"""
+        if self._tasks:
+            return
+        for name in self._sources:
+            self._tasks.append(asyncio.create_task(self._poll(name)))
+        logger.info(f"Price bus polling {len(self._tasks)} sources")
+
+    async def stop(self) -> None:
+        """Stop polling"""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _poll(self, name: str) -> None:
+        while True:
+            try:
+                await self.refresh(name)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Price bus poll of {name} failed: {e}")
+            await asyncio.sleep(self._sources[name].interval_s)
+
+
+class BusPriceFeed:
+    """PriceFeed view of the bus for PriceAggregator consumers.
+
+    Only reads the last-value cache, so it never blocks on upstream; put it
+    ahead of direct adapters in the aggregator.
+    """
+
+    def __init__(
+        self,
+        bus: PriceBus,
+        max_age_s: Optional[float] = None,
+        source: Optional[str] = None,
+    ):
+        self.bus = bus
+        self.max_age_s = max_age_s
+        self.source = source
+
+    def get_price(self, symbol: str) -> Optional[PriceQuote]:
+        update = self.bus.latest(symbol, self.max_age_s, self.source)
+        if update is None:
+            return None
+        if update.quote is not None:
+            return update.quote
+        return PriceQuote(
+            symbol=symbol,
+            price=round(update.price * 10**8),
+            decimals=8,
+            source=update.source,
+            timestamp=int(update.timestamp),
+        )
+
+    def get_prices(self, symbols: Iterable[str]) -> dict[str, PriceQuote]:
+        quotes = {symbol: self.get_price(symbol) for symbol in symbols}
+        return {symbol: quote for symbol, quote in quotes.items() if quote}
+
+
+# Global instance
+price_bus = PriceBus()
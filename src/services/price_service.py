@@ -3,15 +3,29 @@ import logging
 
 import aiohttp
 
+from src.services.price_bus import PriceBus, price_bus
+
 logger = logging.getLogger(__name__)
 
 
 class PriceService:
-    def __init__(self):
+    SOURCE = "coingecko"
+    SYMBOLS = ["BTC", "ETH", "SOL", "EURUSD", "GBPUSD", "USDJPY"]
+
+    def __init__(self, bus: PriceBus = price_bus):
         self.prices = {}
         self.update_interval = 5  # seconds
+        self.bus = bus
+        # The bus owns ingestion, so concurrent refreshes share one request
+        bus.register_source(
+            self.SOURCE, self.fetch_quotes, self.SYMBOLS, self.update_interval
+        )
 
     async def fetch_prices(self):
+        """Refresh prices through the shared price bus"""
+        await self.bus.refresh(self.SOURCE)
+
+    async def fetch_quotes(self, symbols: list[str]) -> dict[str, float]:
         """Fetch prices from CoinGecko API"""
         try:
             # FIX: Add timeout to prevent hanging connections
@@ -42,6 +56,8 @@ class PriceService:
         except Exception as e:
             logger.error(f"Error fetching prices: {e}")
 
+        return {s: self.prices[s] for s in symbols if self.prices.get(s)}
+
     async def start_price_updates(self):
         """Start continuous price updates"""
         while True:
@@ -50,7 +66,8 @@ class PriceService:
 
     def get_price(self, symbol: str) -> float:
         """Get current price for symbol"""
-        return self.prices.get(symbol, 0.0)
+        update = self.bus.latest(symbol, max_age_s=float("inf"), source=self.SOURCE)
+        return update.price if update else 0.0
 
 
 # Global instance
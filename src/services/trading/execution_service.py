@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any
 
 from src.bot.ui.formatting import fmt_usd
+from src.services.cache.block_cache import BlockCache
 from src.services.copy_trading.execution_mode import execution_manager
 from src.services.trading.trade_drafts import TradeDraft
 from src.utils.obs import log_exc, rid
@@ -46,11 +48,17 @@ class ExecutionService:
     """
     Phase 3: Quote + slippage + USDC allowance.
     Phase 4 will add execute_open/execute_close.
+
+    Quote parameters are fetched concurrently. The slippage-independent part
+    of a quote is kept on the draft, so re-rendering it with another slippage
+    makes no RPC; pair-level reads are reused for one block.
     """
 
-    def __init__(self, settings):
+    def __init__(self, settings, block_time_s: float = 2.0):
         self.settings = settings
         self.breaker = CircuitBreaker(fail_threshold=5, reset_after=20.0)
+        # Pair info and pair spread, keyed by (read, pair)
+        self._pair_reads = BlockCache(ttl_s=block_time_s)
 
     async def _guard(self, label: str, fn):
         req = rid()
@@ -68,9 +76,14 @@ class ExecutionService:
         self,
         draft: TradeDraft,
         slippage_pct: Decimal | None = None,
+        reuse_quote: bool = False,
     ) -> QuoteResult:
         """
         Build a trade input from the draft and compute fees/protection/spreads.
+
+        The fetched data is stored on the draft. With reuse_quote, a quote
+        already stored for the same pair, side, leverage and collateral is
+        re-rendered without any RPC (e.g. when only slippage changed).
         """
         if draft is None or not draft.pair:
             return QuoteResult(False, "No draft or pair selected")
@@ -109,26 +122,63 @@ class ExecutionService:
             leverage = Decimal(draft.leverage)
             collateral = Decimal(draft.collateral_usdc)
 
-            # Estimate notional and minimal USDC requirement for margin
-            # (Avantis SDK may consume different fields; adapt as needed)
-            notional = collateral * leverage
-            usdc_required = collateral  # basic margin assumption
+            key = (pair_symbol, side, leverage, collateral)
+            if reuse_quote and draft.quote is not None and draft.quote_key == key:
+                data = draft.quote
+            else:
+                data = await self._market_quote(pair_symbol, side, leverage, collateral)
+                draft.quote, draft.quote_key = data, key
+            return QuoteResult(True, "OK", {**data, "slippage_pct": str(slippage_pct)})
+        except Exception as e:
+            return QuoteResult(False, f"Quote error: {e}")
 
-            # Gather parameters from SDK
-            pair_info = await self._guard(
-                "pairs_cache.get_pair_info",
-                lambda: pairs_cache.get_pair_info(pair_symbol),
+    async def _market_quote(
+        self, pair_symbol: str, side: str, leverage: Decimal, collateral: Decimal
+    ) -> dict[str, Any]:
+        """
+        Everything in a quote that does not depend on slippage, fetched concurrently.
+        """
+        # Estimate notional and minimal USDC requirement for margin
+        # (Avantis SDK may consume different fields; adapt as needed)
+        notional = collateral * leverage
+        usdc_required = collateral  # basic margin assumption
+
+        async def allowance():
+            usdc, trader = await asyncio.gather(
+                self._guard("tokens.get_usdc", tokens.get_usdc),
+                self._guard("get_trader_client", get_trader_client),
+            )
+            owner = await self._guard("trader.get_address", trader.get_address)
+            return await self._guard(
+                "get_allowance",
+                lambda: get_allowance(
+                    owner, usdc.address, self.settings.trading_contract
+                ),
             )
-            base_asset = pair_info.base if hasattr(pair_info, "base") else pair_symbol
 
+        # Gather parameters from SDK
+        (
+            pair_info,
+            open_fee,
+            protection,
+            spread_bps,
+            impact_bps,
+            current_allowance,
+        ) = await asyncio.gather(
+            self._pair_reads.get_or_load(
+                ("pair_info", pair_symbol),
+                lambda: self._guard(
+                    "pairs_cache.get_pair_info",
+                    lambda: pairs_cache.get_pair_info(pair_symbol),
+                ),
+            ),
             # Fees
-            open_fee = await self._guard(
+            self._guard(
                 "fee_parameters.get_opening_fee",
                 lambda: fee_parameters.get_opening_fee(pair_symbol, notional, side),
-            )
-
+            ),
             # Loss protection for the draft trade
-            protection = await self._guard(
+            self._guard(
                 "trading_parameters.get_loss_protection",
                 lambda: trading_parameters.get_loss_protection_for_trade_input(
                     pair_symbol=pair_symbol,
@@ -136,52 +186,42 @@ class ExecutionService:
                     collateral_usdc=float(collateral),
                     leverage=float(leverage),
                 ),
-            )
-
+            ),
             # Spread & impact
-            spread_bps = await self._guard(
-                "asset_parameters.get_pair_spread",
-                lambda: asset_parameters.get_pair_spread(pair_symbol),
-            )
-            impact_bps = await self._guard(
+            self._pair_reads.get_or_load(
+                ("pair_spread", pair_symbol),
+                lambda: self._guard(
+                    "asset_parameters.get_pair_spread",
+                    lambda: asset_parameters.get_pair_spread(pair_symbol),
+                ),
+            ),
+            self._guard(
                 "asset_parameters.get_price_impact",
                 lambda: asset_parameters.get_price_impact_spread(
                     pair_symbol, float(notional)
                 ),
-            )
-
+            ),
             # Allowance checks
-            usdc = await self._guard("tokens.get_usdc", tokens.get_usdc)
-            trader = await self._guard("get_trader_client", get_trader_client)
-            owner = await self._guard("trader.get_address", trader.get_address)
-            current_allowance = await self._guard(
-                "get_allowance",
-                lambda: get_allowance(
-                    owner, usdc.address, self.settings.trading_contract
-                ),
-            )
-            needs_approval = current_allowance < usdc_required
-
-            data = {
-                "pair": pair_symbol,
-                "side": side,
-                "leverage": str(leverage),
-                "collateral_usdc": str(collateral),
-                "notional_usd": str(notional),
-                "slippage_pct": str(slippage_pct),
-                "fee_usdc": str(open_fee) if open_fee is not None else None,
-                "loss_protection": protection,  # structure from SDK
-                "pair_spread_bps": spread_bps,
-                "impact_spread_bps": impact_bps,
-                "needs_approval": needs_approval,
-                "allowance": str(current_allowance),
-                "usdc_required": str(usdc_required),
-                "base_asset": base_asset,
-            }
-
-            return QuoteResult(True, "OK", data)
-        except Exception as e:
-            return QuoteResult(False, f"Quote error: {e}")
+            allowance(),
+        )
+        base_asset = pair_info.base if hasattr(pair_info, "base") else pair_symbol
+        needs_approval = current_allowance < usdc_required
+
+        return {
+            "pair": pair_symbol,
+            "side": side,
+            "leverage": str(leverage),
+            "collateral_usdc": str(collateral),
+            "notional_usd": str(notional),
+            "fee_usdc": str(open_fee) if open_fee is not None else None,
+            "loss_protection": protection,  # structure from SDK
+            "pair_spread_bps": spread_bps,
+            "impact_spread_bps": impact_bps,
+            "needs_approval": needs_approval,
+            "allowance": str(current_allowance),
+            "usdc_required": str(usdc_required),
+            "base_asset": base_asset,
+        }
 
     async def approve_if_needed(self, usdc_required: Decimal) -> tuple[bool, str]:
         """
@@ -3,6 +3,7 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass, field
 from decimal import Decimal
+from typing import Any
 
 
 @dataclass
@@ -13,6 +14,10 @@ class TradeDraft:
     leverage: Decimal | None = None
     collateral_usdc: Decimal | None = None
     ts: float = field(default_factory=lambda: time.time())
+    # Last slippage-independent quote and the (pair, side, leverage,
+    # collateral) it was fetched for, so a slippage change re-renders it
+    quote: dict[str, Any] | None = None
+    quote_key: tuple | None = None
 
 
 class DraftStore:
@@ -1,10 +1,15 @@
 """Signal worker - processes queued signals (Phase 6)."""
 
+import asyncio
 import json
 import logging
+import os
+import socket
 import time
+from collections import deque
+from typing import Optional
 
-import redis
+import redis.asyncio as redis
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from web3 import Web3
@@ -14,7 +19,7 @@ from src.adapters.price.chainlink_adapter import ChainlinkAdapter
 from src.blockchain.avantis.service import AvantisService
 from src.config.feeds_loader import load_chainlink_feeds
 from src.config.settings import settings
-from src.database.models import Signal
+from src.database.models import Execution, Signal
 from src.monitoring.metrics import (
     exec_latency,
     exec_processed,
@@ -26,6 +31,36 @@ from src.signals.rules import evaluate_close, evaluate_open
 
 logger = logging.getLogger(__name__)
 
+# Moves up to ARGV[1] more signals from the queue to the processing list in
+# one round trip, after BLMOVE has waited for the first one.
+CLAIM_SIGNALS_LUA = """
+local items = {}
+for i = 1, tonumber(ARGV[1]) do
+  local item = redis.call('LMOVE', KEYS[1], KEYS[2], 'LEFT', 'RIGHT')
+  if not item then break end
+  items[#items + 1] = item
+end
+return items
+"""
+
+# Moves every signal off a dead worker's processing list (KEYS[1]) onto this
+# worker's (KEYS[2]), unless the owner's lease (KEYS[3]) is still held.
+RECLAIM_SIGNALS_LUA = """
+if redis.call('EXISTS', KEYS[3]) == 1 then
+  return {}
+end
+local items = {}
+while true do
+  local item = redis.call('LMOVE', KEYS[1], KEYS[2], 'LEFT', 'RIGHT')
+  if not item then break end
+  items[#items + 1] = item
+end
+return items
+"""
+
+# Execution states a redelivered signal must not run again from
+_FINISHED = ("SENT", "MINED", "REJECTED", "FAILED")
+
 
 def _get_queue():
     """Get Redis queue client."""
@@ -36,7 +71,13 @@ def build_services():
     """Build Web3, DB, and service layer."""
     w3 = Web3(Web3.HTTPProvider(settings.BASE_RPC_URL))
     db_url = settings.DATABASE_URL.replace("sqlite+aiosqlite:", "sqlite:")
-    eng = create_engine(db_url, pool_pre_ping=True)
+    # Every execution lane may hold a connection while it builds a transaction
+    eng = create_engine(
+        db_url,
+        pool_pre_ping=True,
+        pool_size=settings.SIGNALS_EXECUTION_CONCURRENCY,
+        max_overflow=10,
+    )
     Session = sessionmaker(bind=eng, expire_on_commit=False)
 
     # Load Chainlink feeds from config
@@ -46,39 +87,289 @@ def build_services():
     return w3, Session, price_agg
 
 
-def process_one(w3, Session, price_agg) -> bool:
-    """Process one signal from queue.
+class SignalWorker:
+    """Executes queued signals on bounded per-wallet lanes.
 
-    Returns:
-        True if processed something, False if queue empty
+    Signals are claimed with a blocking BLMOVE into a per-worker processing
+    list and only removed from it once handled. While running, a worker holds
+    a lease key it renews; the lists of workers whose lease has expired are
+    taken over by the others, so a crashed replica's signals are not lost
+    while a live replica's in-flight signals are left alone. One user's
+    signals run strictly in order; different users run in parallel up to
+    max_concurrency.
     """
-    start_time = time.time()
-    q = _get_queue()
 
-    # Update queue depth metric
-    try:
-        queue_depth.set(q.llen(settings.SIGNALS_QUEUE))
-    except Exception:
-        pass
-
-    item = q.lpop(settings.SIGNALS_QUEUE)
+    def __init__(
+        self,
+        queue_client,
+        w3,
+        Session,
+        price_agg,
+        worker_id: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        block_timeout_s: float = 5.0,
+    ):
+        """Initialize signal worker.
+
+        Args:
+            queue_client: Async Redis client
+            w3: Web3 instance
+            Session: SQLAlchemy session factory
+            price_agg: Price aggregator
+            worker_id: Names this worker's processing list and lease (default:
+                SIGNALS_WORKER_ID, else <hostname>:<pid>)
+            batch_size: Most signals claimed per round trip (default: settings)
+            max_concurrency: Most wallets executing at once (default: settings)
+            block_timeout_s: Longest single wait on an empty queue
+        """
+        self.redis = queue_client
+        self.w3 = w3
+        self.Session = Session
+        self.price_agg = price_agg
+        self.queue = settings.SIGNALS_QUEUE
+        self.worker_id = (
+            worker_id
+            or settings.SIGNALS_WORKER_ID
+            or f"{socket.gethostname()}:{os.getpid()}"
+        )
+        self.processing_key = self._processing_key(self.worker_id)
+        self.lease_key = self._lease_key(self.worker_id)
+        self.lease_s = settings.SIGNALS_WORKER_LEASE_S
+        self.batch_size = max(1, batch_size or settings.SIGNALS_MAX_BATCH)
+        self.max_concurrency = max(
+            1, max_concurrency or settings.SIGNALS_EXECUTION_CONCURRENCY
+        )
+        self.block_timeout_s = block_timeout_s
+        self.is_running = False
+
+        self._claim_more = self.redis.register_script(CLAIM_SIGNALS_LUA)
+        self._reclaim = self.redis.register_script(RECLAIM_SIGNALS_LUA)
+        self._lease_renewed_at: Optional[float] = None
+        self._execution_slots = asyncio.Semaphore(self.max_concurrency)
+        self._wallet_lanes: dict[Optional[int], deque] = {}
+        self._lane_tasks: dict[Optional[int], asyncio.Task] = {}
+
+    async def run(self) -> None:
+        """Recover unfinished signals, then claim and execute until stopped."""
+        self.is_running = True
+        logger.info(
+            f"Starting signal worker (concurrency={self.max_concurrency}, "
+            f"batch={self.batch_size})..."
+        )
+        await self._renew_lease()
+        await self.recover()
+
+        while self.is_running:
+            try:
+                if await self._renew_lease():
+                    await self._reclaim_orphans()
+                for raw in await self.claim():
+                    self._dispatch(raw, time.monotonic())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Worker error: {e}", exc_info=True)
+                await asyncio.sleep(5)
+
+        # Let in-flight lanes finish; unstarted signals stay claimed and are
+        # taken over by another worker once the lease is gone
+        if self._lane_tasks:
+            await asyncio.gather(*self._lane_tasks.values(), return_exceptions=True)
+        await self.redis.delete(self.lease_key)
+
+    def stop(self) -> None:
+        """Stop claiming new signals."""
+        self.is_running = False
+
+    def _processing_key(self, worker_id: str) -> str:
+        return f"{self.queue}:processing:{worker_id}"
+
+    def _lease_key(self, worker_id: str) -> str:
+        return f"{self.queue}:lease:{worker_id}"
+
+    async def _renew_lease(self) -> bool:
+        """Refresh this worker's lease a few times per lease period.
+
+        Returns:
+            True if the lease was renewed by this call
+        """
+        now = time.monotonic()
+        if (
+            self._lease_renewed_at is not None
+            and now - self._lease_renewed_at < self.lease_s / 3
+        ):
+            return False
+        await self.redis.set(
+            self.lease_key, self.worker_id, px=int(self.lease_s * 1000)
+        )
+        self._lease_renewed_at = now
+        return True
 
-    if not item:
+    async def recover(self) -> int:
+        """Re-dispatch signals claimed by a previous run or a dead worker.
+
+        Only call before claiming: this worker's own list is dispatched whole.
+        """
+        stranded = await self.redis.lrange(self.processing_key, 0, -1)
+        for raw in stranded:
+            self._dispatch(raw, time.monotonic())
+        if stranded:
+            logger.warning(f"Recovered {len(stranded)} unfinished signals")
+        return len(stranded) + await self._reclaim_orphans()
+
+    async def _reclaim_orphans(self) -> int:
+        """Take over the processing lists of workers whose lease has expired."""
+        prefix = self._processing_key("")
+        reclaimed = 0
+        async for key in self.redis.scan_iter(match=f"{prefix}*"):
+            key = key.decode() if isinstance(key, bytes) else key
+            if key == self.processing_key:
+                continue
+            owner = key[len(prefix) :]
+            items = await self._reclaim(
+                keys=[key, self.processing_key, self._lease_key(owner)], args=[]
+            )
+            for raw in items:
+                self._dispatch(raw, time.monotonic())
+            if items:
+                logger.warning(f"Took over {len(items)} signals from worker {owner}")
+            reclaimed += len(items)
+        return reclaimed
+
+    async def claim(self) -> list[bytes]:
+        """Wait for the next signal, then take up to a batch in one round trip."""
+        first = await self.redis.blmove(
+            self.queue, self.processing_key, self.block_timeout_s, "LEFT", "RIGHT"
+        )
         loop_heartbeat.labels(component="worker").set(1)
-        return False
+        if first is None:
+            queue_depth.set(0)
+            return []
+
+        items = [first]
+        if self.batch_size > 1:
+            items += await self._claim_more(
+                keys=[self.queue, self.processing_key], args=[self.batch_size - 1]
+            )
 
-    payload = json.loads(item.decode())
-    intent_key = payload["intent_key"]
+        # Update queue depth metric
+        try:
+            queue_depth.set(await self.redis.llen(self.queue))
+        except Exception:
+            pass
+        return items
+
+    def _dispatch(self, raw: bytes, dequeued_at: float) -> None:
+        """Append a claimed signal to its wallet lane, starting the lane if idle."""
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            payload = None
+
+        # Signals queued before tg_user_id was added share one ordered lane
+        key = payload.get("tg_user_id") if isinstance(payload, dict) else None
+        self._wallet_lanes.setdefault(key, deque()).append((raw, payload, dequeued_at))
+        if key not in self._lane_tasks:
+            self._lane_tasks[key] = asyncio.create_task(self._drain_wallet_lane(key))
+
+    async def _drain_wallet_lane(self, key: Optional[int]) -> None:
+        """Execute one wallet's signals in order, one concurrency slot at a time."""
+        lane = self._wallet_lanes[key]
+        try:
+            while lane and self.is_running:
+                async with self._execution_slots:
+                    raw, payload, dequeued_at = lane.popleft()
+                    try:
+                        if isinstance(payload, dict) and "intent_key" in payload:
+                            await self.process(payload["intent_key"], dequeued_at)
+                        else:
+                            logger.error(f"Dropping malformed signal: {raw[:200]!r}")
+                    except Exception as e:
+                        # Left claimed: the next start retries it
+                        logger.error(f"Unhandled error for signal {raw[:200]!r}: {e}")
+                        continue
+                    # Acknowledge only once handled so crashes redeliver
+                    await self.redis.lrem(self.processing_key, 1, raw)
+        finally:
+            self._lane_tasks.pop(key, None)
+            if not lane:
+                self._wallet_lanes.pop(key, None)
+
+    async def process(self, intent_key: str, dequeued_at: float) -> None:
+        """Evaluate and execute one signal.
+
+        Session work is blocking, so it runs in worker threads; a stalled loop
+        would let the lease lapse and other workers take over this one's
+        in-flight signals.
+
+        Args:
+            intent_key: Signal intent key
+            dequeued_at: Monotonic time the signal left the queue
+        """
+        db = self.Session()
+        try:
+            sig = await asyncio.to_thread(self._approve, db, intent_key)
+            if sig is None:
+                return
+
+            # Execute via service; the signal's key keeps a redelivery idempotent
+            svc = AvantisService(self.w3, db, self.price_agg)
+
+            if sig.side == "CLOSE":
+                txh = await svc.close_market_async(
+                    sig.tg_user_id,
+                    sig.symbol,
+                    sig.reduce_usdc,
+                    sig.slippage_pct,
+                    intent_key=intent_key,
+                )
+            else:
+                txh = await svc.open_market_async(
+                    sig.tg_user_id,
+                    sig.symbol,
+                    sig.side,
+                    sig.collateral_usdc,
+                    sig.leverage_x,
+                    sig.slippage_pct,
+                    intent_key=intent_key,
+                )
+
+            await asyncio.to_thread(
+                update_execution, db, intent_key, status="SENT", tx_hash=txh
+            )
+            exec_processed.labels(status="SENT").inc()
+            exec_latency.observe(time.monotonic() - dequeued_at)
+            logger.info(f"Signal executed: {intent_key} | tx={txh}")
+
+        except Exception as e:
+            await asyncio.to_thread(
+                update_execution, db, intent_key, status="FAILED", reason=str(e)
+            )
+            exec_processed.labels(status="FAILED").inc()
+            logger.error(f"Signal failed: {intent_key} | {e}", exc_info=True)
+        finally:
+            await asyncio.to_thread(db.close)
+
+    def _approve(self, db, intent_key: str) -> Optional[Signal]:
+        """Gate a signal on its execution state, the master switches and rules.
+
+        Returns:
+            The signal to execute, marked APPROVED, or None if it was skipped
+            or rejected
+        """
+        execution = db.query(Execution).filter_by(intent_key=intent_key).one_or_none()
+        if execution and execution.status in _FINISHED:
+            logger.info(f"Signal already {execution.status}, skipping: {intent_key}")
+            return None
 
-    db = Session()
-    try:
         sig = db.query(Signal).filter_by(intent_key=intent_key).one_or_none()
         if not sig:
             update_execution(
                 db, intent_key, status="REJECTED", reason="missing signal row"
             )
             logger.warning(f"Signal not found: {intent_key}")
-            return True
+            return None
 
         # Gate on master switches
         if not settings.SIGNALS_ENABLED or settings.AUTOMATION_PAUSED:
@@ -86,7 +377,7 @@ def process_one(w3, Session, price_agg) -> bool:
                 db, intent_key, status="REJECTED", reason="automation paused"
             )
             logger.info(f"Signal rejected (paused): {intent_key}")
-            return True
+            return None
 
         # Evaluate rules
         if sig.side == "CLOSE":
@@ -105,61 +396,29 @@ def process_one(w3, Session, price_agg) -> bool:
             update_execution(db, intent_key, status="REJECTED", reason=decision.reason)
             exec_processed.labels(status="REJECTED").inc()
             logger.info(f"Signal rejected: {intent_key} | {decision.reason}")
-            return True
+            return None
 
         update_execution(db, intent_key, status="APPROVED")
         exec_processed.labels(status="APPROVED").inc()
 
-        # Execute via service
-        svc = AvantisService(w3, db, price_agg)
+        # Hand the pooled connection back while the send is in flight
+        db.commit()
+        return sig
 
-        if sig.side == "CLOSE":
-            txh = svc.close_market(
-                sig.tg_user_id, sig.symbol, sig.reduce_usdc, sig.slippage_pct
-            )
-        else:
-            txh = svc.open_market(
-                sig.tg_user_id,
-                sig.symbol,
-                sig.side,
-                sig.collateral_usdc,
-                sig.leverage_x,
-                sig.slippage_pct,
-            )
-
-        update_execution(db, intent_key, status="SENT", tx_hash=txh)
-        exec_processed.labels(status="SENT").inc()
-        exec_latency.observe(time.time() - start_time)
-        loop_heartbeat.labels(component="worker").set(1)
-        logger.info(f"Signal executed: {intent_key} | tx={txh}")
-        return True
 
-    except Exception as e:
-        update_execution(db, intent_key, status="FAILED", reason=str(e))
-        exec_processed.labels(status="FAILED").inc()
-        logger.error(f"Signal failed: {intent_key} | {e}", exc_info=True)
-        return True
-    finally:
-        db.close()
+async def _run() -> None:
+    w3, Session, price_agg = build_services()
+    worker = SignalWorker(_get_queue(), w3, Session, price_agg)
+    await worker.run()
 
 
 def main():
     """Main worker loop."""
     logger.info("Starting signal worker...")
-
-    w3, Session, price_agg = build_services()
-
-    while True:
-        try:
-            processed = process_one(w3, Session, price_agg)
-            if not processed:
-                time.sleep(0.5)  # Idle sleep
-        except KeyboardInterrupt:
-            logger.info("Worker stopped by user")
-            break
-        except Exception as e:
-            logger.error(f"Worker error: {e}", exc_info=True)
-            time.sleep(5)
+    try:
+        asyncio.run(_run())
+    except KeyboardInterrupt:
+        logger.info("Worker stopped by user")
 
 
 if __name__ == "__main__":
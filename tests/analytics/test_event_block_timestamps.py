@@ -0,0 +1,146 @@
+"""
+Test block timestamp caching in AvantisEventIndexer
+Events are normalized with one get_block call per unique block
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.analytics.data_extractor import AvantisEventIndexer
+
+
+class _Eth:
+    def __init__(self, broken=()):
+        self.calls: list[int] = []
+        self.broken = set(broken)
+        self.threads: set[int] = set()
+
+    def get_block(self, block_number):
+        self.calls.append(block_number)
+        self.threads.add(threading.get_ident())
+        if block_number in self.broken:
+            raise ConnectionError("timeout")
+        return {"timestamp": 1_700_000_000 + block_number * 2}
+
+
+def _event(block_number: int, index: int):
+    return SimpleNamespace(
+        args=SimpleNamespace(
+            trader="0xABC",
+            pairIndex=index % 3,
+            long=True,
+            positionSizeDai=10**18,
+            openPrice=5 * 10**14,
+            leverage=10,
+        ),
+        blockNumber=block_number,
+        transactionHash=bytes([index % 256]) * 32,
+    )
+
+
+class _Filter:
+    def __init__(self, entries):
+        self.entries = entries
+
+    def get_all_entries(self):
+        return self.entries
+
+    def get_new_entries(self):
+        entries, self.entries = self.entries, []
+        return entries
+
+
+def _indexer(eth, opened=(), closed=()) -> AvantisEventIndexer:
+    with patch.object(AvantisEventIndexer, "_setup_web3"):
+        indexer = AvantisEventIndexer(MagicMock(), MagicMock(), AsyncMock())
+    indexer.web3 = SimpleNamespace(eth=eth)
+    opened_filter, closed_filter = _Filter(list(opened)), _Filter(list(closed))
+    indexer.trading_contract = SimpleNamespace(
+        events=SimpleNamespace(
+            TradeOpened=SimpleNamespace(create_filter=lambda **_: opened_filter),
+            TradeClosed=SimpleNamespace(create_filter=lambda **_: closed_filter),
+        )
+    )
+    indexer._persist_events = AsyncMock()
+    return indexer
+
+
+@pytest.mark.asyncio
+async def test_block_range_fetches_each_block_once_off_the_event_loop():
+    eth = _Eth()
+    opened = [_event(100 + i % 4, i) for i in range(30)]
+    closed = [_event(103 + i % 2, i) for i in range(10)]
+    indexer = _indexer(eth, opened, closed)
+
+    await indexer._process_block_range(100, 104)
+
+    assert sorted(eth.calls) == [100, 101, 102, 103, 104]
+    assert threading.get_ident() not in eth.threads
+    events = indexer._persist_events.await_args.args[0]
+    assert len(events) == 40
+    for event in events:
+        assert event.timestamp == datetime.fromtimestamp(
+            1_700_000_000 + event.block_number * 2
+        )
+
+
+@pytest.mark.asyncio
+async def test_cache_is_shared_with_real_time_monitoring():
+    eth = _Eth()
+    indexer = _indexer(eth, [_event(200, 0), _event(201, 1)], [_event(201, 2)])
+    await indexer._process_block_range(200, 201)
+
+    # Monitoring sees later events in the same blocks plus one new block
+    indexer.trading_contract.events.TradeOpened.create_filter().entries = [
+        _event(201, 3),
+        _event(202, 4),
+    ]
+    indexer.config.EVENT_MONITORING_INTERVAL = 0
+    indexer.is_running = True
+
+    async def stop_after_first_poll(*_):
+        indexer.is_running = False
+
+    indexer.redis.set.side_effect = stop_after_first_poll
+    await indexer._monitor_real_time_events()
+
+    assert sorted(eth.calls) == [200, 201, 202]
+    indexer.redis.set.assert_awaited_once_with("last_indexed_block", 202)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_fetch():
+    eth = _Eth()
+    indexer = _indexer(eth)
+
+    results = await asyncio.gather(
+        *(indexer._get_block_timestamps([300, 301, 302]) for _ in range(5))
+    )
+
+    assert sorted(eth.calls) == [300, 301, 302]
+    assert all(r == results[0] for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded_and_failures_are_retried():
+    eth = _Eth(broken={7})
+    indexer = _indexer(eth)
+    indexer.BLOCK_TIMESTAMP_CACHE_SIZE = 3
+
+    timestamps = await indexer._get_block_timestamps(range(1, 9))
+
+    assert len(timestamps) == 8
+    assert list(indexer._block_timestamps) == [5, 6, 8]
+
+    # The failed block is fetched again, and evicted blocks are refetched
+    eth.broken.clear()
+    eth.calls.clear()
+    await indexer._get_block_timestamps([1, 7, 8])
+    assert sorted(eth.calls) == [1, 7]
+    assert indexer._get_block_timestamp(8) == datetime.fromtimestamp(1_700_000_016)
+    assert sorted(eth.calls) == [1, 7]
@@ -0,0 +1,56 @@
+"""
+Tests for the trader address search index
+"""
+
+import random
+
+from src.copy_trading.address_index import AddressIndex
+
+
+def _random_addresses(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    return [f"0x{rng.getrandbits(160):040x}" for _ in range(count)]
+
+
+def test_prefix_and_substring_match_a_full_scan():
+    """Test prefix and infix results equal a ranked brute-force scan"""
+    addresses = _random_addresses(5000)
+    index = AddressIndex(addresses)
+    rng = random.Random(1)
+
+    for _ in range(100):
+        address = rng.choice(addresses)
+        prefix = address[: rng.randint(6, 12)]
+        start = rng.randint(2, 36)
+        fragment = address[start : start + rng.randint(4, 8)]
+
+        assert (
+            index.search(prefix, limit=5)
+            == [a for a in addresses if a.startswith(prefix)][:5]
+        )
+        assert (
+            index.search(fragment, limit=5)
+            == [a for a in addresses if fragment in a[2:]][:5]
+        )
+
+
+def test_results_follow_ranking_order_and_limit():
+    """Test matches come back best-ranked first, capped at the limit"""
+    addresses = ["0x00001abc", "0xffff1abc", "0x1abc0000", "0x00001abd"]
+    index = AddressIndex(addresses)
+
+    assert index.search("1abc", limit=10) == addresses[:3]
+    assert index.search("1abc", limit=2) == addresses[:2]
+    assert index.search("0x0000", limit=10) == ["0x00001abc", "0x00001abd"]
+    assert index.search("0X0000", limit=1) == ["0x00001abc"]
+
+
+def test_no_match_and_short_queries():
+    """Test misses, too-short fragments and an empty index return nothing"""
+    index = AddressIndex(["0xabc123def456"])
+
+    assert index.search("0xabd", limit=10) == []
+    assert index.search("9999", limit=10) == []
+    assert index.search("abc", limit=10) == []
+    assert AddressIndex([]).search("abcd") == []
+    assert AddressIndex([]).search("0xabcd") == []
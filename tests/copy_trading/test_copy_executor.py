@@ -334,6 +334,7 @@ async def test_execute_copy_trade_success(copy_executor):
     )
 
     # Mock successful execution
+    copy_executor._is_follow_active = AsyncMock(return_value=True)
     copy_executor._get_current_price = AsyncMock(return_value=50000.0)
     copy_executor._get_user_id = AsyncMock(return_value=123)
     copy_executor._get_max_leverage = AsyncMock(return_value=50.0)
@@ -370,6 +371,7 @@ async def test_execute_copy_trade_slippage_exceeded(copy_executor):
     )
 
     # Mock high slippage (2% > 1% limit)
+    copy_executor._is_follow_active = AsyncMock(return_value=True)
     copy_executor._get_current_price = AsyncMock(return_value=51000.0)  # 2% higher
     copy_executor._record_copy_position = AsyncMock()
     copy_executor._send_copy_notification = AsyncMock()
@@ -507,3 +509,211 @@ async def test_get_symbol_from_pair(copy_executor):
     assert copy_executor._get_symbol_from_pair("2") == "SOL-USD"
     assert copy_executor._get_symbol_from_pair("3") == "AVAX-USD"
     assert copy_executor._get_symbol_from_pair("999") == "BTC-USD"  # Default
+
+
+def _follow_row(leader_address, copytrader_id):
+    return {
+        "leader_address": leader_address,
+        "copytrader_id": copytrader_id,
+        "user_id": 100 + copytrader_id,
+        "is_enabled": True,
+        "sizing_mode": "FIXED_NOTIONAL",
+        "sizing_value": 100.0,
+        "max_slippage_bps": 100,
+        "max_leverage": 50.0,
+        "notional_cap": None,
+        "pair_filters": {},
+    }
+
+
+@pytest.mark.asyncio
+async def test_poll_leaders_fans_out_once_per_leader(copy_executor, mock_db_pool):
+    """Each leader is queried once per tick and its trades reach every follower"""
+    db_pool, conn = mock_db_pool
+    conn.fetch.return_value = [
+        _follow_row("0xleader1", 1),
+        _follow_row("0xleader1", 2),
+        _follow_row("0xleader1", 3),
+        _follow_row("0xleader2", 4),
+    ]
+    copy_executor.redis.hmget.return_value = [None, None]
+
+    trade = {
+        "pair": "0",
+        "size": 1.0,
+        "price": 50000.0,
+        "leverage": 10,
+        "is_long": True,
+    }
+    copy_executor._get_new_leader_trades = AsyncMock(
+        side_effect=lambda since_by_leader: {"0xleader1": [dict(trade)]}
+    )
+    copy_executor._check_rate_limit = AsyncMock(return_value=True)
+    mock_signal = MagicMock()
+    mock_signal.signal = "green"
+    copy_executor.market_intel.get_copy_timing_signal.return_value = mock_signal
+
+    queued = await copy_executor._poll_leaders_once()
+
+    assert queued == 3
+    assert copy_executor._get_new_leader_trades.await_count == 1
+    since_by_leader = copy_executor._get_new_leader_trades.await_args.args[0]
+    assert set(since_by_leader) == {"0xleader1", "0xleader2"}
+    # One timing signal per leader trade, not one per follower
+    assert copy_executor.market_intel.get_copy_timing_signal.await_count == 1
+    followers = set()
+    while not copy_executor.execution_queue.empty():
+        followers.add(copy_executor.execution_queue.get_nowait().copytrader_id)
+    assert followers == {1, 2, 3}
+
+    # Watermarks for every leader are written in a single call
+    copy_executor.redis.hset.assert_awaited_once()
+    mapping = copy_executor.redis.hset.await_args.kwargs["mapping"]
+    assert set(mapping) == {"0xleader1", "0xleader2"}
+
+    # Follower index is reused on the next tick
+    await copy_executor._poll_leaders_once()
+    assert conn.fetch.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_new_leader_trades_single_query(copy_executor, mock_db_pool):
+    """All watched leaders are fetched in one query and grouped by address"""
+    db_pool, conn = mock_db_pool
+    since = datetime(2024, 1, 1)
+    conn.fetch.return_value = [
+        {"address": "0xa", "pair": "0", "timestamp": since},
+        {"address": "0xb", "pair": "1", "timestamp": since},
+        {"address": "0xa", "pair": "2", "timestamp": since},
+    ]
+
+    result = await copy_executor._get_new_leader_trades({"0xa": since, "0xb": since})
+
+    conn.fetch.assert_awaited_once()
+    assert [t["pair"] for t in result["0xa"]] == ["0", "2"]
+    assert [t["pair"] for t in result["0xb"]] == ["1"]
+    assert "address" not in result["0xa"][0]
+
+
+@pytest.mark.asyncio
+async def test_poll_leaders_keeps_watermarks_when_query_fails(copy_executor):
+    """A failed trade query must not advance leader watermarks"""
+    copy_executor._get_leader_followers = AsyncMock(return_value={"0xa": [MagicMock()]})
+    copy_executor.redis.hmget.return_value = [None]
+    copy_executor._get_new_leader_trades = AsyncMock(return_value=None)
+
+    assert await copy_executor._poll_leaders_once() == 0
+    copy_executor.redis.hset.assert_not_awaited()
+
+
+def _copy_request(copytrader_id, seq):
+    from src.copy_trading.copy_executor import CopyTradeRequest
+
+    return CopyTradeRequest(
+        copytrader_id=copytrader_id,
+        leader_address="0xabc123",
+        trade_data={"pair": "0", "price": 50000.0, "seq": seq},
+        original_size=1.0,
+        target_size=0.002,
+        max_slippage_bps=100,
+        request_id=f"{copytrader_id}-{seq}",
+    )
+
+
+@pytest.mark.asyncio
+async def test_execution_lanes_parallel_across_wallets_ordered_within(
+    mock_db_pool, mock_redis, mock_avantis_client, mock_market_intelligence, mock_config
+):
+    """Different wallets execute concurrently; one wallet's trades stay ordered"""
+    import asyncio
+
+    db_pool, _ = mock_db_pool
+    executor = CopyExecutor(
+        db_pool=db_pool,
+        redis_client=mock_redis,
+        avantis_client=mock_avantis_client,
+        market_intelligence=mock_market_intelligence,
+        config=mock_config,
+        max_concurrency=3,
+    )
+
+    in_flight = 0
+    peak = 0
+    in_flight_wallets = set()
+    executed = []
+
+    async def fake_execute(request):
+        nonlocal in_flight, peak
+        assert request.copytrader_id not in in_flight_wallets
+        in_flight_wallets.add(request.copytrader_id)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        executed.append((request.copytrader_id, request.trade_data["seq"]))
+        in_flight -= 1
+        in_flight_wallets.discard(request.copytrader_id)
+
+    executor._execute_copy_trade = fake_execute
+    executor.is_running = True
+
+    for seq in range(4):
+        for wallet in range(5):
+            executor._dispatch_copy_request(_copy_request(wallet, seq))
+
+    await asyncio.gather(*list(executor._lane_tasks.values()))
+
+    assert len(executed) == 20
+    assert peak == 3
+    for wallet in range(5):
+        assert [s for w, s in executed if w == wallet] == [0, 1, 2, 3]
+    assert executor._wallet_lanes == {}
+    assert executor._pending_requests == 0
+
+
+@pytest.mark.asyncio
+async def test_follower_index_reloads_when_version_changes(copy_executor, mock_db_pool):
+    """A follow change bumped by another process reloads the index early"""
+    db_pool, conn = mock_db_pool
+    conn.fetch.return_value = [_follow_row("0xleader1", 1)]
+    copy_executor.redis.get.return_value = b"1"
+
+    await copy_executor._get_leader_followers()
+    await copy_executor._get_leader_followers()
+    assert conn.fetch.await_count == 1
+
+    copy_executor.redis.get.return_value = b"2"
+    await copy_executor._get_leader_followers()
+    assert conn.fetch.await_count == 2
+
+    await copy_executor.unfollow_trader(123, "0xleader1")
+    copy_executor.redis.incr.assert_awaited_once_with(
+        CopyExecutor.FOLLOWER_INDEX_VERSION_KEY
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_copy_trade_skips_inactive_follow(copy_executor, mock_db_pool):
+    """A follow disabled since the request was queued is not executed"""
+    db_pool, conn = mock_db_pool
+    conn.fetch.return_value = [_follow_row("0xabc123", 1)]
+    copy_executor.redis.get.return_value = b"1"
+    await copy_executor._get_leader_followers()
+
+    # Unchanged version: the cached index is trusted, no query per execution
+    assert await copy_executor._is_follow_active(1, "0xabc123")
+    assert conn.fetch.await_count == 1
+
+    # Another process unfollowed and bumped the version
+    conn.fetch.return_value = []
+    copy_executor.redis.get.return_value = b"2"
+    copy_executor._execute_avantis_trade = AsyncMock()
+    copy_executor._record_copy_position = AsyncMock()
+    request = _copy_request(1, 0)
+
+    await copy_executor._execute_copy_trade(request)
+
+    assert conn.fetch.await_count == 2
+    copy_executor._execute_avantis_trade.assert_not_awaited()
+    copy_executor._record_copy_position.assert_awaited_once_with(
+        request, CopyStatus.CANCELLED, reason="Follow no longer active"
+    )
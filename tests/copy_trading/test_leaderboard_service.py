@@ -2,8 +2,11 @@
 Tests for Leaderboard Service functionality
 """
 
+import asyncio
+import json
+import time
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -287,7 +290,7 @@ async def test_suggest_copy_size(leaderboard_service):
 
 
 @pytest.mark.asyncio
-async def test_get_leaderboard_by_category_volume(leaderboard_service):
+async def test_get_leaderboard_by_category_volume(leaderboard_service, mock_redis):
     """Test getting leaderboard by volume category"""
     # Mock top traders
     mock_traders = [
@@ -296,19 +299,18 @@ async def test_get_leaderboard_by_category_volume(leaderboard_service):
         {"address": "0xghi789", "last_30d_volume_usd": 500000},
     ]
 
-    with patch.object(
-        leaderboard_service, "get_top_traders", return_value=mock_traders
-    ):
-        traders = await leaderboard_service.get_leaderboard_by_category(
-            "volume", limit=3
-        )
+    mock_redis.get.return_value = json.dumps(
+        leaderboard_service._build_snapshot(mock_traders)
+    )
+
+    traders = await leaderboard_service.get_leaderboard_by_category("volume", limit=3)
 
-        assert len(traders) == 3
-        assert traders[0]["last_30d_volume_usd"] == 2000000  # Highest volume first
+    assert len(traders) == 3
+    assert traders[0]["last_30d_volume_usd"] == 2000000  # Highest volume first
 
 
 @pytest.mark.asyncio
-async def test_get_leaderboard_by_category_pnl(leaderboard_service):
+async def test_get_leaderboard_by_category_pnl(leaderboard_service, mock_redis):
     """Test getting leaderboard by PnL category"""
     # Mock top traders
     mock_traders = [
@@ -317,13 +319,109 @@ async def test_get_leaderboard_by_category_pnl(leaderboard_service):
         {"address": "0xghi789", "realized_pnl_clean_usd": 25000},
     ]
 
-    with patch.object(
-        leaderboard_service, "get_top_traders", return_value=mock_traders
-    ):
-        traders = await leaderboard_service.get_leaderboard_by_category("pnl", limit=3)
+    mock_redis.get.return_value = json.dumps(
+        leaderboard_service._build_snapshot(mock_traders)
+    )
+
+    traders = await leaderboard_service.get_leaderboard_by_category("pnl", limit=3)
+
+    assert len(traders) == 3
+    assert traders[0]["realized_pnl_clean_usd"] == 100000  # Highest PnL first
+
+
+@pytest.mark.asyncio
+async def test_materialize_ranks_once_without_per_trader_lookups(
+    leaderboard_service, mock_db_pool, mock_redis
+):
+    """Test one query and one write publish every category"""
+    db_pool, conn = mock_db_pool
+    now = datetime.utcnow()
+    conn.fetch.return_value = [
+        {
+            "address": f"0x{i:040x}",
+            "last_30d_volume_usd": 1_000_000 * (i + 1),
+            "realized_pnl_clean_usd": 50_000 * (3 - i),
+            "trade_count_30d": 500,
+            "unique_symbols": 5,
+            "last_trade_at": now,
+            "consistency": 0.5,
+            "risk_level": "MED",
+            "archetype": "Risk Manager",
+            "has_ai_analysis": i != 1,
+        }
+        for i in range(3)
+    ]
+
+    snapshot = await leaderboard_service.materialize("30d")
+
+    conn.fetch.assert_called_once()
+    conn.fetchrow.assert_not_called()
+    mock_redis.get.assert_not_called()
+    mock_redis.setex.assert_called_once()
+    assert set(snapshot["rankings"]) == {"volume", "pnl", "consistency", "copyability"}
+    by_address = {t["address"]: t for t in snapshot["traders"]}
+    assert by_address[f"0x{1:040x}"]["copyability_score"] == 50  # no analysis
+    assert by_address[f"0x{0:040x}"]["copyability_score"] > 50
+    assert "has_ai_analysis" not in by_address[f"0x{0:040x}"]
+
+    # Reads only slice the published snapshot
+    mock_redis.get.return_value = mock_redis.setex.call_args.args[2]
+    conn.fetch.reset_mock()
+    by_pnl = await leaderboard_service.get_leaderboard_by_category("pnl", limit=2)
+    assert [t["address"] for t in by_pnl] == [f"0x{0:040x}", f"0x{1:040x}"]
+    conn.fetch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_build_one_snapshot(
+    leaderboard_service, mock_db_pool, mock_redis
+):
+    """Test a burst of reads on an empty cache ranks the window once"""
+    db_pool, conn = mock_db_pool
+    mock_redis.get.return_value = None
+
+    async def slow_fetch(*args):
+        await asyncio.sleep(0.01)
+        return []
+
+    conn.fetch.side_effect = slow_fetch
+
+    results = await asyncio.gather(
+        *(leaderboard_service.get_top_traders(limit=10) for _ in range(20))
+    )
+
+    assert results == [[]] * 20
+    conn.fetch.assert_called_once()
+    mock_redis.setex.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_stats_refreshes_coalesce_into_background_rebuilds(leaderboard_service):
+    """Test refreshes during a rebuild queue a single follow-up rebuild"""
+    from src.analytics.position_tracker import PositionTracker
+
+    builds = 0
+
+    async def materialize(window):
+        nonlocal builds
+        builds += 1
+        await asyncio.sleep(0.01)
+
+    leaderboard_service.materialize = materialize
+    tracker = PositionTracker(None, None, None)
+    tracker.on_stats_refreshed(leaderboard_service.schedule_refresh)
+
+    def notify():
+        for listener in tracker._refresh_listeners:
+            listener(100)
+
+    notify()
+    await asyncio.sleep(0)  # first rebuild starts
+    for _ in range(4):
+        notify()
+    await leaderboard_service._refresh_task
 
-        assert len(traders) == 3
-        assert traders[0]["realized_pnl_clean_usd"] == 100000  # Highest PnL first
+    assert builds == 2
 
 
 @pytest.mark.asyncio
@@ -364,6 +462,90 @@ async def test_search_traders_invalid_query(leaderboard_service):
     assert traders == []
 
 
+@pytest.mark.asyncio
+async def test_search_traders_uses_index_and_one_card_query(
+    leaderboard_service, mock_db_pool, mock_redis
+):
+    """Test infix search hits the address index and fetches cards in one query"""
+    db_pool, conn = mock_db_pool
+    addresses = ["0xaaaa00beef01", "0xbbbb11beef02", "0xcccc22dead03"]
+    conn.fetch.side_effect = [
+        [{"address": a} for a in addresses],  # index load, ranked by volume
+        [
+            {"address": a, "last_30d_volume_usd": 1000, "has_ai_analysis": False}
+            for a in reversed(addresses[:2])
+        ],
+    ]
+
+    traders = await leaderboard_service.search_traders("BEEF", limit=10)
+
+    # Cards come back in ranking order, with no per-trader lookups
+    assert [t["address"] for t in traders] == addresses[:2]
+    assert all("has_ai_analysis" not in t for t in traders)
+    assert conn.fetch.call_count == 2
+    conn.fetchrow.assert_not_called()
+    mock_redis.get.assert_not_called()
+
+    # The index is reused by later searches
+    conn.fetch.side_effect = [[{"address": addresses[2]}]]
+    traders = await leaderboard_service.search_traders("0xcccc", limit=10)
+    assert [t["address"] for t in traders] == [addresses[2]]
+    assert conn.fetch.call_count == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", ["0xc", "0xCc", "0xccc"])
+async def test_search_traders_short_prefix(leaderboard_service, mock_db_pool, query):
+    """Test 0x prefixes shorter than an infix gram still search the index"""
+    db_pool, conn = mock_db_pool
+    addresses = ["0xcccc22dead03", "0xaaaa00beef01", "0xccc011beef02"]
+    conn.fetch.side_effect = [
+        [{"address": a} for a in addresses],
+        [{"address": a, "last_30d_volume_usd": 1000} for a in addresses],
+    ]
+
+    traders = await leaderboard_service.search_traders(query, limit=10)
+
+    assert [t["address"] for t in traders] == [addresses[0], addresses[2]]
+    assert await leaderboard_service.search_traders("ccc", limit=10) == []
+
+
+@pytest.mark.asyncio
+async def test_stale_address_index_is_served_while_rebuilding(leaderboard_service):
+    """Test a search on a stale index answers at once and rebuilds behind"""
+    from src.copy_trading.address_index import AddressIndex
+
+    release = asyncio.Event()
+    builds = 0
+
+    async def build():
+        nonlocal builds
+        builds += 1
+        await release.wait()
+        leaderboard_service._address_index = AddressIndex(["0xbbbb0002"])
+        leaderboard_service._address_index_built_at = time.monotonic()
+        return leaderboard_service._address_index
+
+    leaderboard_service._build_address_index = build
+    stale = AddressIndex(["0xaaaa0001"])
+    leaderboard_service._address_index = stale
+    leaderboard_service._address_index_built_at = (
+        time.monotonic() - leaderboard_service.cache_ttl
+    )
+
+    for _ in range(3):
+        index = await asyncio.wait_for(leaderboard_service._get_address_index(), 0.1)
+        assert index is stale
+    assert builds == 1
+
+    release.set()
+    await leaderboard_service._builds.get("address_index")
+    assert (await leaderboard_service._get_address_index()).search("0xbbbb", 1) == [
+        "0xbbbb0002"
+    ]
+    assert builds == 1
+
+
 @pytest.mark.asyncio
 async def test_get_trader_analytics_summary(leaderboard_service, mock_db_pool):
     """Test getting trader analytics summary"""
@@ -391,3 +573,53 @@ async def test_get_trader_analytics_summary(leaderboard_service, mock_db_pool):
     assert "volume_stats" in summary
     assert "archetype_distribution" in summary
     assert len(summary["archetype_distribution"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_background_stats_refresh_publishes_snapshot(
+    monkeypatch, mock_db_pool, mock_redis
+):
+    """Test the background wiring republishes the leaderboard after a refresh"""
+    import asyncpg
+    import redis.asyncio
+
+    from src.analytics.position_tracker import PositionTracker
+    from src.config.settings import settings
+    from src.services.background import BackgroundServiceManager
+
+    db_pool, conn = mock_db_pool
+    conn.fetch.return_value = []
+    monkeypatch.setattr(settings, "DATABASE_URL", "postgresql+asyncpg://db/vanta")
+    monkeypatch.setattr(asyncpg, "create_pool", AsyncMock(return_value=db_pool))
+    monkeypatch.setattr(redis.asyncio, "from_url", MagicMock(return_value=mock_redis))
+
+    # One stats pass against an empty window
+    monkeypatch.setattr(
+        PositionTracker, "_get_indexer_watermark", AsyncMock(return_value=100)
+    )
+    monkeypatch.setattr(
+        PositionTracker, "_load_stats_sync", AsyncMock(return_value=None)
+    )
+    monkeypatch.setattr(
+        PositionTracker, "_get_window_trades", AsyncMock(return_value=[])
+    )
+    monkeypatch.setattr(PositionTracker, "_persist_stats_delta", AsyncMock())
+
+    manager = BackgroundServiceManager()
+    await manager._start_trader_leaderboards()
+    assert len(manager.services) == 1
+
+    try:
+        for _ in range(100):
+            if mock_redis.setex.call_count == len(LeaderboardService.WINDOWS):
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        for task in manager.services:
+            task.cancel()
+        await asyncio.gather(*manager.services, return_exceptions=True)
+
+    key, ttl, payload = mock_redis.setex.call_args.args
+    assert key == LeaderboardService._snapshot_key(LeaderboardService.WINDOWS[-1])
+    assert ttl == 300
+    assert json.loads(payload)["traders"] == []
@@ -0,0 +1,179 @@
+"""
+Test Market Intelligence regime detection
+Checks the rolling regime window against the original full-recompute logic
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.ai.market_intelligence import MarketIntelligence, PriceData, RegimeWindow
+
+
+def _legacy_metrics(points, now):
+    """Reference implementation: rebuild the 24h list and recompute from scratch"""
+    cutoff = now - timedelta(hours=24)
+    prices = [p for ts, p in points if ts > cutoff]
+    if len(prices) < 20:
+        return None, None, len(prices)
+
+    recent_prices = prices[-12:]
+    returns = [
+        np.log(recent_prices[i] / recent_prices[i - 1])
+        for i in range(1, len(recent_prices))
+    ]
+    volatility = np.std(returns) * np.sqrt(720)
+
+    trend_return = None
+    if len(prices) >= 288:
+        trend_return = (prices[-1] - prices[-288]) / prices[-288]
+    return volatility, trend_return, len(prices)
+
+
+class TestRegimeWindow:
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_full_recompute(self, seed):
+        """Incremental metrics equal a full recompute, including across gaps"""
+        rng = np.random.default_rng(seed)
+        window = RegimeWindow()
+        points = []
+        now = datetime(2025, 1, 1)
+        price = 100.0
+
+        for _ in range(2000):
+            # Mostly 5s ticks with occasional multi-hour gaps to force expiry
+            gap = 5 if rng.random() > 0.005 else int(rng.integers(3600, 30 * 3600))
+            now += timedelta(seconds=gap)
+            price *= 1 + rng.normal(0, 0.01 if rng.random() > 0.1 else 0.05)
+
+            points.append((now, price))
+            window.push(price, now, now)
+
+            volatility, trend_return, count = _legacy_metrics(points, now)
+            assert window.volatility() == volatility
+            assert window.trend_return() == trend_return
+            assert len(window) == min(count, RegimeWindow.TREND_POINTS)
+
+    def test_memory_is_bounded(self):
+        window = RegimeWindow()
+        now = datetime(2025, 1, 1)
+        for i in range(10_000):
+            window.push(100.0 + i % 7, now + timedelta(seconds=i), now)
+        assert len(window._points) == RegimeWindow.TREND_POINTS
+        assert len(window._returns) == RegimeWindow.VOLATILITY_POINTS - 1
+
+
+@pytest.mark.asyncio
+async def test_regime_signal_from_price_updates():
+    config = MagicMock()
+    config.PYTH_PRICE_FEED_IDS_JSON = '{"BTC-USD": "0xabc"}'
+    intel = MarketIntelligence(config)
+
+    start = datetime.utcnow()
+    for i in range(30):
+        await intel._update_regime_analysis(
+            "BTC-USD",
+            PriceData(
+                symbol="BTC-USD",
+                price=50000.0 * (1 + (0.05 if i % 2 else -0.05)),
+                timestamp=start + timedelta(seconds=i),
+                confidence=0.95,
+                source="test",
+            ),
+        )
+
+    signal = await intel.get_copy_timing_signal("BTC-USD")
+    assert signal.signal == "red"
+    assert signal.confidence == pytest.approx(0.3 + 0.3 * 0.6)
+
+
+@pytest.mark.asyncio
+async def test_batched_hermes_fetch_against_stub_server(monkeypatch):
+    """All feeds are refreshed by one request per tick over one connection"""
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    feed_ids = [f"0x{i:064x}" for i in range(40)]
+    requests = []
+    peers = set()
+
+    async def latest(request):
+        ids = request.query.getall("ids[]")
+        requests.append(ids)
+        peers.add(request.transport.get_extra_info("peername"))
+        return web.json_response(
+            {
+                "parsed": [
+                    {
+                        "id": feed_id.removeprefix("0x"),
+                        "price": {
+                            "price": str(100_000_000 + n),
+                            "conf": "50000",
+                            "expo": -8,
+                            "publish_time": 1700000000,
+                        },
+                    }
+                    for n, feed_id in enumerate(ids)
+                ]
+            }
+        )
+
+    app = web.Application()
+    app.router.add_get("/v2/updates/price/latest", latest)
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.setenv("PYTH_REST_URL", str(server.make_url("/")))
+
+    config = MagicMock()
+    config.PYTH_PRICE_FEED_IDS_JSON = "{}"
+    intel = MarketIntelligence(config)
+    try:
+        for _ in range(3):
+            prices = await intel._fetch_pyth_prices(feed_ids)
+            assert set(prices) == set(feed_ids)
+
+        assert len(requests) == 3
+        assert all(len(ids) == 40 for ids in requests)
+        assert len(peers) == 1  # connection reused across ticks
+        assert prices[feed_ids[1]].price == pytest.approx(1.00000001)
+        assert prices[feed_ids[1]].confidence == pytest.approx(1 - 0.0005 / 1.00000001)
+    finally:
+        await intel.close()
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_regime_changes_are_recorded_with_the_monitor():
+    config = MagicMock()
+    config.PYTH_PRICE_FEED_IDS_JSON = '{"BTC-USD": "0xabc"}'
+    monitor = MagicMock()
+    intel = MarketIntelligence(config, monitor=monitor)
+
+    start = datetime.utcnow()
+    regimes = []
+    for i in range(40):
+        # Flat prices keep the default green regime until a swing starts
+        swing = 0.05 if i % 2 else -0.05
+        await intel._update_regime_analysis(
+            "BTC-USD",
+            PriceData(
+                symbol="BTC-USD",
+                price=50000.0 * (1 + (swing if i >= 25 else 0)),
+                timestamp=start + timedelta(seconds=i),
+                confidence=0.95,
+                source="test",
+            ),
+        )
+        regimes.append(intel.regime_data["BTC-USD"]["regime"])
+
+    changes = sum(a != b for a, b in zip(["green"] + regimes, regimes))
+    assert regimes[-1] == "red"
+    assert monitor.record_metric.call_count == changes
+    monitor.record_metric.assert_called_with(
+        "market_regime_changes",
+        1,
+        "counter",
+        {"service": "market_intelligence", "symbol": "BTC-USD"},
+    )
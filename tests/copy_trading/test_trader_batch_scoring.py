@@ -0,0 +1,150 @@
+"""
+Test batch trader scoring
+Checks TraderAnalyzer.analyze_traders against the per-trader analyze_trader path
+"""
+
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.ai.trader_analyzer import TraderAnalyzer
+from src.analytics.position_tracker import TraderStats
+
+
+def _stats(address: str, rng: np.random.Generator) -> TraderStats:
+    return TraderStats(
+        address=address,
+        last_30d_volume_usd=float(rng.uniform(0, 5_000_000)),
+        median_trade_size_usd=float(rng.uniform(0, 50_000)),
+        trade_count_30d=int(rng.integers(0, 500)),
+        realized_pnl_clean_usd=float(rng.normal(0, 50_000)),
+        last_trade_at=None,
+        maker_ratio=None if rng.random() < 0.3 else float(rng.random()),
+        unique_symbols=int(rng.integers(1, 10)),
+        win_rate=float(rng.random()),
+    )
+
+
+def _trades(rng: np.random.Generator, count: int, now: datetime) -> list[dict]:
+    trades = []
+    for _ in range(count):
+        # Whole-minute timestamps over 40 days produce same-time ties and
+        # trades on both sides of the 30-day volatility cutoff
+        ts = now - timedelta(minutes=int(rng.integers(0, 40 * 24 * 60)))
+        trade = {
+            "pair": f"PAIR{rng.integers(0, 4)}",
+            "is_long": bool(rng.random() < 0.6),
+            "size": float(rng.uniform(0.1, 5)),
+            "price": float(rng.uniform(10, 60_000)),
+            "timestamp": ts,
+            "event_type": "OPENED" if rng.random() < 0.55 else "CLOSED",
+        }
+        if rng.random() < 0.9:
+            trade["leverage"] = int(rng.integers(1, 50))
+        if trade["event_type"] == "CLOSED":
+            trade["pnl"] = float(rng.normal(10, 100))
+        trades.append(trade)
+    return trades
+
+
+def _population(seed: int) -> list[tuple]:
+    rng = np.random.default_rng(seed)
+    now = datetime.utcnow()
+    traders = []
+    for i in range(60):
+        count = [0, 1, 2, 5, 12][i] if i < 5 else int(rng.integers(10, 300))
+        traders.append(
+            (f"0x{i:040x}", _stats(f"0x{i:040x}", rng), _trades(rng, count, now))
+        )
+
+    # Closes with nothing open, and a trader whose trades miss a required key
+    address = f"0x{60:040x}"
+    ts = now - timedelta(days=1)
+    traders.append(
+        (
+            address,
+            _stats(address, rng),
+            [
+                {
+                    "pair": "X",
+                    "is_long": True,
+                    "size": 1,
+                    "price": 1,
+                    "timestamp": ts,
+                    "event_type": "CLOSED",
+                    "pnl": 5.0,
+                },
+                {
+                    "pair": "X",
+                    "is_long": True,
+                    "size": 1,
+                    "price": 1,
+                    "timestamp": ts,
+                    "event_type": "OPENED",
+                },
+            ],
+        )
+    )
+    address = f"0x{61:040x}"
+    traders.append(
+        (address, _stats(address, rng), [{"is_long": True, "timestamp": ts}] * 3)
+    )
+    return traders
+
+
+def _assert_same(batch, single):
+    expected, actual = asdict(single), asdict(batch)
+    for field, value in expected.items():
+        if isinstance(value, float):
+            assert actual[field] == pytest.approx(
+                value, rel=1e-9, abs=1e-12, nan_ok=True
+            ), field
+        else:
+            assert actual[field] == value, field
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", [3, 11])
+async def test_batch_matches_per_trader(seed, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # model training writes ./models
+    analyzer = TraderAnalyzer(config=None)
+    traders = _population(seed)
+
+    # The batch path must not lean on its per-trader fallback
+    with patch.object(analyzer, "analyze_trader", side_effect=AssertionError):
+        batch = await analyzer.analyze_traders(traders)
+    single = [await analyzer.analyze_trader(*trader) for trader in traders]
+
+    assert analyzer.is_trained
+    assert [a.address for a in batch] == [t[0] for t in traders]
+    for batch_analysis, single_analysis in zip(batch, single):
+        _assert_same(batch_analysis, single_analysis)
+
+
+@pytest.mark.asyncio
+async def test_batch_features_match_per_trader(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    analyzer = TraderAnalyzer(config=None)
+    traders = _population(5)[:60]
+
+    frame = analyzer._build_trade_frame(traders)
+    features = analyzer._extract_features_batch(frame)
+
+    for row, (_, stats, trades) in zip(features, traders):
+        np.testing.assert_allclose(
+            row, analyzer._extract_features(stats, trades), rtol=1e-12, atol=1e-12
+        )
+
+
+@pytest.mark.asyncio
+async def test_batch_without_valid_traders_skips_training():
+    analyzer = TraderAnalyzer(config=None)
+    stats = _stats("0xabc", np.random.default_rng(0))
+
+    result = await analyzer.analyze_traders([("0xabc", stats, [{"pair": "X"}])])
+
+    assert not analyzer.is_trained
+    assert result[0].strengths == ["Insufficient data for analysis"]
@@ -0,0 +1,311 @@
+"""
+Test the single-pass trader stats refresh
+Checks PositionTracker's batched refresh against the per-trader calculation
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.analytics.position_tracker import PositionTracker
+
+
+def _window_trades(seed: int, traders: int = 40) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    start = datetime(2025, 1, 1)
+    rows = []
+    for t in range(traders):
+        address = f"0x{t:040x}"
+        # Whole-minute timestamps so some trades share a timestamp
+        minutes = np.sort(rng.integers(0, 30 * 24 * 60, int(rng.integers(1, 120))))
+        for m in minutes:
+            rows.append(
+                {
+                    "address": address,
+                    "pair": f"PAIR{rng.integers(0, 5)}",
+                    "is_long": bool(rng.random() < 0.5),
+                    "size": float(rng.choice([0.5, 1.0, 1.5, 2.0, rng.uniform(0, 3)])),
+                    "price": float(
+                        rng.choice([0.0, rng.uniform(10, 60_000)], p=[0.02, 0.98])
+                    ),
+                    "event_type": "OPENED" if rng.random() < 0.5 else "CLOSED",
+                    "timestamp": start + timedelta(minutes=int(m)),
+                    "leverage": int(rng.integers(1, 50)),
+                    "fee": float(rng.uniform(0, 2)),
+                }
+            )
+    return rows
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", [1, 2, 3])
+async def test_batch_stats_match_per_trader(seed):
+    rows = _window_trades(seed)
+    tracker = PositionTracker(None, None, None)
+
+    by_address: dict[str, list[dict]] = {}
+    for row in rows:
+        by_address.setdefault(row["address"], []).append(row)
+
+    async def trader_trades(address, since):
+        return by_address[address]
+
+    tracker._get_trader_trades = trader_trades
+    batch = tracker._calculate_all_trader_stats(rows)
+
+    assert [s.address for s in batch] == list(by_address)
+    for stats in batch:
+        expected = await tracker._calculate_trader_stats(stats.address, None)
+        assert stats.trade_count_30d == expected.trade_count_30d
+        assert stats.unique_symbols == expected.unique_symbols
+        assert stats.last_trade_at == expected.last_trade_at
+        assert stats.win_rate == expected.win_rate
+        assert stats.maker_ratio == expected.maker_ratio
+        assert stats.median_trade_size_usd == pytest.approx(
+            expected.median_trade_size_usd, rel=1e-12
+        )
+        assert stats.last_30d_volume_usd == pytest.approx(
+            expected.last_30d_volume_usd, rel=1e-12
+        )
+        assert stats.realized_pnl_clean_usd == pytest.approx(
+            expected.realized_pnl_clean_usd, rel=1e-12, abs=1e-9
+        )
+
+
+class _MemoryDatabase:
+    """Connection stand-in that evaluates the tracker's trade_events queries"""
+
+    def __init__(self, events=()):
+        self.events: list[dict] = []
+        self.trader_stats: dict[str, tuple] = {}
+        self.sync: dict | None = None
+        self.fetches: list[str] = []
+        self.upserts: list[list[str]] = []
+        for event in events:
+            self.add_event(event)
+
+    def add_event(self, event: dict):
+        self.events.append({"id": len(self.events) + 1, "block_number": 0, **event})
+
+    def window(self, since, addresses=None) -> list[dict]:
+        rows = [
+            e
+            for e in self.events
+            if e["timestamp"] >= since
+            and (addresses is None or e["address"] in addresses)
+        ]
+        rows.sort(key=lambda e: (e["address"], e["timestamp"], e["id"]))
+        return rows
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def transaction(self):
+        return self
+
+    async def fetchval(self, query, *args):
+        return max((e["block_number"] for e in self.events), default=0)
+
+    async def fetchrow(self, query, *args):
+        assert "FROM trader_stats_sync" in query
+        return self.sync
+
+    async def fetch(self, query, *args):
+        self.fetches.append(query)
+        if "WITH changed" not in query:
+            return self.window(args[0])
+
+        last_block, head, previous_start, window_start = args
+        changed = {
+            e["address"]
+            for e in self.events
+            if last_block < e["block_number"] <= head
+            or previous_start <= e["timestamp"] < window_start
+        }
+        rows = self.window(window_start, changed)
+        emptied = changed - {r["address"] for r in rows}
+        return rows + [{"address": a, "timestamp": None} for a in sorted(emptied)]
+
+    async def execute(self, query, *args):
+        if "INSERT INTO trader_stats (" in query:
+            self.upserts.append(args[0])
+            for address, *values in zip(*args[:8]):
+                self.trader_stats[address] = tuple(values)
+        elif "DELETE FROM trader_stats" in query and "NOT (" in query:
+            keep = set(args[0])
+            self.trader_stats = {
+                a: v for a, v in self.trader_stats.items() if a in keep
+            }
+        elif "DELETE FROM trader_stats" in query:
+            for address in args[0]:
+                self.trader_stats.pop(address, None)
+        elif "INSERT INTO trader_stats_sync" in query:
+            self.sync = {"last_block": args[1], "window_start": args[2]}
+
+
+class _Pool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def acquire(self):
+        return self.conn
+
+
+class _Pipeline:
+    def __init__(self, redis):
+        self.redis = redis
+
+    def hset(self, key, mapping):
+        self.redis.hashes[key] = mapping
+
+    def expire(self, key, ttl):
+        pass
+
+    def delete(self, *keys):
+        for key in keys:
+            self.redis.hashes.pop(key, None)
+
+    async def execute(self):
+        self.redis.round_trips += 1
+
+
+class _Redis:
+    def __init__(self):
+        self.hashes = {}
+        self.values = {}
+        self.round_trips = 0
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    def pipeline(self):
+        return _Pipeline(self)
+
+
+def _expected_stats(tracker, db, window_start) -> dict[str, tuple]:
+    """Full recompute of the window, shaped like the stored trader_stats rows"""
+    return {
+        s.address: (
+            s.last_30d_volume_usd,
+            s.median_trade_size_usd,
+            s.trade_count_30d,
+            s.realized_pnl_clean_usd,
+            s.last_trade_at,
+            s.maker_ratio,
+            s.unique_symbols,
+        )
+        for s in tracker._calculate_all_trader_stats(db.window(window_start))
+    }
+
+
+@pytest.mark.asyncio
+async def test_first_refresh_rebuilds_with_one_query_and_bulk_writes():
+    rows = _window_trades(4)
+    db = _MemoryDatabase(rows)
+    redis_client = _Redis()
+    tracker = PositionTracker(_Pool(db), redis_client, None)
+    now = datetime(2025, 1, 31)
+
+    await tracker._update_trader_stats(now=now)
+
+    addresses = sorted({row["address"] for row in rows})
+    assert len(db.fetches) == 1
+    assert db.upserts == [addresses]
+    assert db.trader_stats == _expected_stats(tracker, db, now - timedelta(days=30))
+    assert db.sync["window_start"] == now - timedelta(days=30)
+    assert redis_client.round_trips == 1
+    assert sorted(redis_client.hashes) == [f"trader_stats:{a}:30d" for a in addresses]
+
+
+@pytest.mark.asyncio
+async def test_incremental_refresh_only_touches_changed_traders():
+    rows = _window_trades(5)
+    db = _MemoryDatabase(rows)
+    redis_client = _Redis()
+    redis_client.values["last_indexed_block"] = b"0"
+    tracker = PositionTracker(_Pool(db), redis_client, None)
+    now = datetime(2025, 1, 31)
+    await tracker._update_trader_stats(now=now)
+
+    trader = rows[0]["address"]
+    db.add_event({**rows[0], "timestamp": now, "block_number": 7})
+    redis_client.values["last_indexed_block"] = b"7"
+
+    # Restart: a fresh tracker resumes from the stored watermark
+    tracker = PositionTracker(_Pool(db), redis_client, None)
+    await tracker._update_trader_stats(now=now + timedelta(seconds=60))
+
+    assert db.upserts[-1] == [trader]
+    assert "WITH changed" in db.fetches[-1]
+    assert db.sync["last_block"] == 7
+    assert db.trader_stats == _expected_stats(
+        tracker, db, now + timedelta(seconds=60) - timedelta(days=30)
+    )
+
+
+_event = st.fixed_dictionaries(
+    {
+        "address": st.sampled_from([f"0x{i:040x}" for i in range(6)]),
+        "pair": st.sampled_from(["BTC", "ETH", "SOL"]),
+        "is_long": st.booleans(),
+        "size": st.sampled_from([0.5, 1.0, 2.0, 3.0]),
+        "price": st.sampled_from([0.0, 95.0, 100.0, 104.5]),
+        "event_type": st.sampled_from(["OPENED", "CLOSED"]),
+        "fee": st.sampled_from([0.0, 0.25]),
+        "age_minutes": st.integers(0, 3 * 24 * 60),
+    }
+)
+
+_step = st.fixed_dictionaries(
+    {
+        "events": st.lists(_event, max_size=8),
+        "advance_hours": st.integers(0, 400),
+        "published": st.booleans(),
+        "restart": st.booleans(),
+    }
+)
+
+
+@settings(max_examples=60, deadline=None)
+@given(steps=st.lists(_step, min_size=1, max_size=12))
+def test_incremental_refresh_matches_full_recompute(steps):
+    """Stored stats equal a full recompute after every fully indexed tick"""
+
+    async def scenario():
+        db = _MemoryDatabase()
+        redis_client = _Redis()
+        tracker = PositionTracker(_Pool(db), redis_client, None)
+        now = datetime(2025, 1, 1)
+        block = 0
+
+        for step in steps:
+            now += timedelta(hours=step["advance_hours"])
+            for event in step["events"]:
+                block += 1
+                fields = {k: v for k, v in event.items() if k != "age_minutes"}
+                db.add_event(
+                    {
+                        **fields,
+                        "timestamp": now - timedelta(minutes=event["age_minutes"]),
+                        "block_number": block,
+                    }
+                )
+            if step["published"]:
+                redis_client.values["last_indexed_block"] = str(block).encode()
+            if step["restart"]:
+                tracker = PositionTracker(_Pool(db), redis_client, None)
+
+            await tracker._update_trader_stats(now=now)
+
+            if step["published"]:
+                window_start = now - timedelta(days=30)
+                assert db.trader_stats == _expected_stats(tracker, db, window_start)
+
+    asyncio.run(scenario())
@@ -83,9 +83,11 @@ class TestAvantisServiceValidation:
         from src.adapters.price.base import PriceQuote
         from src.blockchain.avantis.service import AvantisService
 
-        mock_price_agg.get_price.return_value = PriceQuote(
-            symbol="BTC-USD", price=5000000000000, decimals=8, source="chainlink"
-        )
+        mock_price_agg.get_prices.return_value = {
+            "BTC-USD": PriceQuote(
+                symbol="BTC-USD", price=5000000000000, decimals=8, source="chainlink"
+            )
+        }
 
         service = AvantisService(mock_w3, db_session, mock_price_agg)
 
@@ -101,3 +103,40 @@ class TestAvantisServiceValidation:
         assert btc.min_position_usd_1e6 == 5_000_000
         assert btc.price == 5000000000000
         assert btc.source == "chainlink"
+
+        # One price lookup for the whole list
+        mock_price_agg.get_prices.assert_called_once()
+        mock_price_agg.get_price.assert_not_called()
+        assert markets["ETH-USD"].price is None
+
+    @pytest.mark.asyncio  # type: ignore[misc]
+    async def test_async_sends_share_one_orchestrator(  # type: ignore[no-untyped-def]
+        self, db_session, mock_w3, mock_price_agg
+    ) -> None:
+        """Test async opens and closes build the orchestrator once, off the loop."""
+        from unittest.mock import AsyncMock
+
+        from src.blockchain.avantis.service import AvantisService
+
+        service = AvantisService(mock_w3, db_session, mock_price_agg)
+        orch = MagicMock()
+        orch.execute_async = AsyncMock(return_value="0xabc")
+
+        with patch("src.blockchain.avantis.service.TxOrchestrator") as orch_cls:
+            orch_cls.create = AsyncMock(return_value=orch)
+            for _ in range(3):
+                await service.open_market_async(
+                    user_id=123,
+                    symbol="BTC-USD",
+                    side="LONG",
+                    collateral_usdc=10.0,
+                    leverage_x=2,
+                    slippage_pct=1.0,
+                )
+            await service.close_market_async(
+                user_id=123, symbol="BTC-USD", reduce_usdc=5.0, slippage_pct=1.0
+            )
+
+        orch_cls.create.assert_awaited_once_with(mock_w3, db_session)
+        orch_cls.assert_not_called()
+        assert orch.execute_async.await_count == 4
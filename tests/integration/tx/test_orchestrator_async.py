@@ -0,0 +1,301 @@
+"""Integration tests for the non-blocking orchestrator path."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from hexbytes import HexBytes
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from web3 import Web3
+from web3.exceptions import TransactionNotFound
+
+from src.database.models import Base, TxIntent, TxSend
+
+SIGNER = "0x" + "bb" * 20
+TO = "0x" + "cc" * 20
+
+
+class _Eth:
+    """Chain double that only mines when told to, counting RPC calls."""
+
+    def __init__(self, pending_nonce: int = 5):
+        self.pending_nonce = pending_nonce
+        self.blocks: list[list[HexBytes]] = [[]]
+        self.mempool: dict[HexBytes, int] = {}  # hash -> nonce
+        self.mined: dict[HexBytes, int] = {}  # hash -> block number
+        self.calls: dict[str, int] = {}
+        self.send_errors: list[Exception] = []
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    @property
+    def chain_id(self) -> int:
+        self._count("chain_id")
+        return 8453
+
+    @property
+    def block_number(self) -> int:
+        self._count("block_number")
+        return len(self.blocks) - 1
+
+    def get_block(self, block_id):
+        self._count("get_block")
+        if block_id == "latest":
+            return {"baseFeePerGas": 1_000_000_000, "transactions": self.blocks[-1]}
+        return {"transactions": self.blocks[block_id]}
+
+    def estimate_gas(self, tx):
+        return 100_000
+
+    def get_transaction_count(self, address, block_identifier):
+        self._count("get_transaction_count")
+        return self.pending_nonce
+
+    def send_raw_transaction(self, raw_tx: bytes) -> HexBytes:
+        self._count("send_raw_transaction")
+        if self.send_errors:
+            raise self.send_errors.pop(0)
+        tx_hash = HexBytes(Web3.keccak(raw_tx))
+        self.mempool[tx_hash] = int(raw_tx.split(b":")[0])
+        return tx_hash
+
+    def get_transaction_receipt(self, tx_hash):
+        self._count("get_transaction_receipt")
+        tx_hash = HexBytes(tx_hash)
+        if tx_hash not in self.mined:
+            raise TransactionNotFound(f"{tx_hash.hex()} not found")
+        return SimpleNamespace(
+            transactionHash=tx_hash,
+            status=1,
+            blockNumber=self.mined[tx_hash],
+            gasUsed=90_000,
+            effectiveGasPrice=2_000_000_000,
+        )
+
+    def mine(self, only=None) -> None:
+        """Mine the mempool (or only the given hashes) into a new block."""
+        hashes = [h for h in self.mempool if only is None or h.hex() in only]
+        for tx_hash in hashes:
+            nonce = self.mempool.pop(tx_hash)
+            self.mined[tx_hash] = len(self.blocks)
+            self.pending_nonce = max(self.pending_nonce, nonce + 1)
+            # Replacements of the same nonce can no longer be mined
+            for other, other_nonce in list(self.mempool.items()):
+                if other_nonce == nonce:
+                    del self.mempool[other]
+        self.blocks.append(hashes)
+
+
+class _Web3:
+    def __init__(self):
+        self.eth = _Eth()
+
+
+class TestOrchestratorAsync:
+    """Test execute_async nonce handling, receipt tracking and RBF."""
+
+    @pytest.fixture
+    def db_session(self):
+        """Create in-memory SQLite session."""
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        session = Session(engine)
+        yield session
+        session.close()
+
+    @pytest.fixture
+    def chain(self):
+        """Web3 double."""
+        return _Web3()
+
+    @staticmethod
+    def _orchestrator(chain, db_session, **kwargs):
+        """Orchestrator whose signer encodes nonce and fee into the raw tx."""
+        signer = MagicMock()
+        signer.address = SIGNER
+        signer.sign_tx.side_effect = lambda p: (
+            f"{p['nonce']}:{p['maxFeePerGas']}:{p['data']}".encode()
+        )
+        from src.blockchain.tx.orchestrator import ReceiptTracker, TxOrchestrator
+
+        with patch("src.blockchain.signers.factory.get_signer", return_value=signer):
+            orch = TxOrchestrator(chain, db_session, **kwargs)
+        orch.receipts = ReceiptTracker(chain, poll_interval=0.01)
+        orch.rbf_wait_s = 0.2
+        orch.final_wait_s = 0.5
+        return orch
+
+    @pytest.fixture
+    def orch(self, chain, db_session):
+        """Orchestrator with a process-local nonce store."""
+        from src.blockchain.tx.nonce_store import LocalNonceStore
+
+        return self._orchestrator(chain, db_session, nonce_store=LocalNonceStore(chain))
+
+    @staticmethod
+    async def _miner(chain, interval_s: float = 0.02, only=None):
+        while True:
+            await asyncio.sleep(interval_s)
+            chain.eth.mine(only)
+
+    @pytest.mark.asyncio
+    async def test_many_in_flight_transactions(self, chain, orch, db_session):
+        """Test 200 concurrent intents get consecutive nonces and cheap receipts."""
+        # Throughput, not RBF: leave room for a slow runner
+        orch.rbf_wait_s = 5
+        orch.final_wait_s = 10
+        miner = asyncio.create_task(self._miner(chain))
+        try:
+            hashes = await asyncio.gather(
+                *(
+                    orch.execute_async(f"open:{i}", TO, f"0x{i:04x}".encode())
+                    for i in range(200)
+                )
+            )
+        finally:
+            miner.cancel()
+
+        nonces = sorted(s.nonce for s in db_session.query(TxSend).all())
+        assert nonces == list(range(5, 205))
+        assert len(set(hashes)) == 200
+        assert {i.status for i in db_session.query(TxIntent).all()} == {"MINED"}
+
+        # One nonce and chain id read; receipts once per transaction, not per poll
+        assert chain.eth.calls["get_transaction_count"] == 1
+        assert chain.eth.calls["chain_id"] == 1
+        assert chain.eth.calls["get_transaction_receipt"] <= 2 * 200
+        assert chain.eth.calls["send_raw_transaction"] == 200
+
+    @pytest.mark.asyncio
+    async def test_existing_intent_is_not_resent(self, chain, orch):
+        """Test a settled intent returns its hash without sending again."""
+        miner = asyncio.create_task(self._miner(chain))
+        try:
+            first = await orch.execute_async("close:1", TO, b"\x01")
+            second = await orch.execute_async("close:1", TO, b"\x01")
+        finally:
+            miner.cancel()
+
+        assert second == first
+        assert chain.eth.calls["send_raw_transaction"] == 1
+
+    @pytest.mark.asyncio
+    async def test_replaced_original_mined(self, chain, orch, db_session):
+        """Test the original is recognised when it is mined after an RBF."""
+        original = None
+
+        async def mine_original_after_replacement():
+            while len(chain.eth.mempool) < 2:
+                await asyncio.sleep(0.01)
+            chain.eth.mine(only={original})
+
+        task = asyncio.create_task(orch.execute_async("open:rbf", TO, b"\x02"))
+        while not chain.eth.mempool:
+            await asyncio.sleep(0.01)
+        original = next(iter(chain.eth.mempool)).hex()
+        await mine_original_after_replacement()
+
+        assert await task == original
+        sends = db_session.query(TxSend).order_by(TxSend.id).all()
+        assert len(sends) == 2
+        assert sends[0].replaced_by == sends[1].tx_hash
+        assert sends[1].max_fee_per_gas > sends[0].max_fee_per_gas
+        assert db_session.query(TxIntent).one().status == "MINED"
+
+    @pytest.mark.asyncio
+    async def test_never_mined_fails_intent(self, chain, orch, db_session):
+        """Test the intent is marked FAILED after the last RBF wait."""
+        with pytest.raises(RuntimeError, match="timed out"):
+            await orch.execute_async("open:stuck", TO, b"\x03")
+
+        assert db_session.query(TxIntent).one().status == "FAILED"
+        assert chain.eth.calls["send_raw_transaction"] == 2
+        assert not orch.receipts._pending
+
+    @pytest.mark.asyncio
+    async def test_failed_send_releases_nonce(self, chain, orch, db_session):
+        """Test a send that never reached the chain hands its nonce on."""
+        chain.eth.send_errors.append(ConnectionError("connection reset"))
+        with pytest.raises(ConnectionError):
+            await orch.execute_async("open:a", TO, b"\x04")
+
+        miner = asyncio.create_task(self._miner(chain))
+        try:
+            await orch.execute_async("open:b", TO, b"\x05")
+        finally:
+            miner.cancel()
+
+        assert [s.nonce for s in db_session.query(TxSend).all()] == [5]
+
+    @pytest.mark.asyncio
+    async def test_nonce_too_low_resyncs_and_retries(self, chain, orch, db_session):
+        """Test a nonce already used elsewhere is skipped and the send retried."""
+        miner = asyncio.create_task(self._miner(chain))
+        try:
+            await orch.execute_async("open:a", TO, b"\x06")
+
+            # Another sender used nonces 6 and 7 meanwhile
+            chain.eth.pending_nonce = 8
+            chain.eth.send_errors.append(ValueError("nonce too low"))
+            await orch.execute_async("open:b", TO, b"\x07")
+        finally:
+            miner.cancel()
+
+        assert [s.nonce for s in db_session.query(TxSend).all()] == [5, 8]
+        assert chain.eth.calls["get_transaction_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_already_known_is_not_resent(self, chain, orch, db_session):
+        """Test a transaction already in the mempool is not sent again."""
+        chain.eth.send_errors.append(ValueError("already known"))
+        with pytest.raises(ValueError):
+            await orch.execute_async("open:a", TO, b"\x08")
+
+        assert chain.eth.calls["send_raw_transaction"] == 1
+
+    @pytest.mark.asyncio
+    async def test_default_store_is_shared_through_redis(
+        self, chain, db_session, monkeypatch
+    ):
+        """Test processes sharing a signer draw nonces from one Redis counter."""
+        import fakeredis
+
+        from src.blockchain.tx import orchestrator
+        from src.blockchain.tx.nonce_store import LocalNonceStore, RedisNonceStore
+
+        server = fakeredis.FakeServer()
+        monkeypatch.setattr(
+            orchestrator.redis_async,
+            "from_url",
+            lambda url: fakeredis.FakeAsyncRedis(server=server),
+        )
+        monkeypatch.setattr(orchestrator.settings, "REDIS_URL", "redis://redis:6379")
+
+        # Two processes: separate Web3 instances and stores, one chain
+        other = _Web3()
+        other.eth = chain.eth
+        orchs = [self._orchestrator(w3, db_session) for w3 in (chain, other)]
+        assert all(isinstance(o.nonce_store, RedisNonceStore) for o in orchs)
+        assert orchs[0].nonce_store is not orchs[1].nonce_store
+
+        miner = asyncio.create_task(self._miner(chain))
+        try:
+            await asyncio.gather(
+                *(
+                    orchs[i % 2].execute_async(f"open:{i}", TO, bytes([i]))
+                    for i in range(20)
+                )
+            )
+        finally:
+            miner.cancel()
+
+        assert sorted(s.nonce for s in db_session.query(TxSend).all()) == list(
+            range(5, 25)
+        )
+
+        monkeypatch.setattr(orchestrator.settings, "REDIS_URL", "")
+        local = self._orchestrator(_Web3(), db_session)
+        assert isinstance(local.nonce_store, LocalNonceStore)
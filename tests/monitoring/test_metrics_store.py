@@ -0,0 +1,157 @@
+"""Tests for metric rollups and the PerformanceMonitor that feeds them."""
+
+from collections import deque
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.monitoring.metrics_store import MetricsStore
+from src.monitoring.performance_monitor import PerformanceMonitor
+
+NOW = 1_699_999_200  # on an hour boundary
+
+
+class TestMetricsStore:
+    def test_samples_roll_up_at_every_resolution(self) -> None:
+        """Test buckets keep count/sum/min/max/last instead of samples."""
+        store = MetricsStore()
+        for i, value in enumerate([3.0, 1.0, 5.0, 2.0]):
+            store.record("latency_ms", value, "gauge", {"svc": "a"}, NOW + i * 20)
+
+        rows, _ = store.drain()
+
+        assert [(r[3], r[5:]) for r in rows] == [
+            (60, (3, 9.0, 1.0, 5.0, 5.0)),
+            (60, (1, 2.0, 2.0, 2.0, 2.0)),
+            (300, (4, 11.0, 1.0, 5.0, 2.0)),
+            (3600, (4, 11.0, 1.0, 5.0, 2.0)),
+        ]
+        assert store.drain() == ([], set())
+
+    def test_memory_is_bounded(self) -> None:
+        """Test old buckets are overwritten and extra series dropped."""
+        store = MetricsStore(resolutions=((60, 10),), max_series=2)
+        for minute in range(1000):
+            store.record("events", 1, "counter", timestamp=NOW + minute * 60)
+
+        assert store.total("events", 600, now=NOW + 999 * 60) == 10
+        assert store._rollups[0].start.shape == (2, 10)
+        assert store.record("b", 1) and not store.record("c", 1)
+        # Older than the ring: nothing to fold into
+        assert not store.record("events", 1, "counter", timestamp=NOW)
+
+    def test_summary_and_totals_read_the_window(self) -> None:
+        """Test summaries aggregate series by name over the window only."""
+        store = MetricsStore()
+        store.record("events", 7, "counter", {"shard": "1"}, NOW - 7200)
+        store.record("events", 2, "counter", {"shard": "1"}, NOW - 600)
+        store.record("events", 4, "counter", {"shard": "2"}, NOW - 60)
+
+        assert store.total("events", 3600, now=NOW) == 6
+        assert store.total("events", 3600, {"shard": "2"}, now=NOW) == 4
+        assert store.total("events", 86400, now=NOW) == 13
+        [summary] = store.summary(3600, now=NOW)
+        assert summary["metric_name"] == "events"
+        assert (summary["samples"], summary["total"]) == (2, 6.0)
+        assert (summary["max_value"], summary["last_value"]) == (4.0, 4.0)
+        assert summary["avg_value"] == 3.0
+
+
+@pytest.fixture
+def monitor():
+    conn = MagicMock()
+    conn.fetch = AsyncMock()
+    conn.fetchval = AsyncMock()
+    conn.execute = AsyncMock()
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=conn)
+    acquire.__aexit__ = AsyncMock(return_value=None)
+    db_pool = MagicMock()
+    db_pool.acquire.return_value = acquire
+    return PerformanceMonitor(db_pool, AsyncMock(), MagicMock()), conn
+
+
+class TestPerformanceMonitor:
+    @pytest.mark.asyncio
+    async def test_event_counts_only_read_new_rows(self, monitor) -> None:
+        """Test each pass counts rows past the id floor, not the table."""
+        monitor, conn = monitor
+        minute = datetime.utcnow().replace(second=0, microsecond=0)
+        conn.fetch.side_effect = [
+            [
+                {"address": "0xa", "minute": minute, "events": 3, "ids": [8, 9, 10]},
+                {"address": "0xb", "minute": minute, "events": 1, "ids": [12]},
+            ],
+            [{"address": "0xa", "minute": minute, "events": 2, "ids": [14, 15]}],
+            [],
+            [],
+        ]
+
+        for _ in range(3):
+            await monitor._collect_event_monitoring_metrics()
+
+        floors = [call.args[1:] for call in conn.fetch.call_args_list]
+        assert floors == [(0, []), (12, []), (12, [14, 15])]
+        assert monitor._recent_total("events_indexed") == 6
+        assert len(monitor._trader_last_seen) == 2
+
+        # Traders drop out of the active set after the window
+        monitor._trader_last_seen["0xb"] = monitor._epoch(minute - timedelta(hours=2))
+        await monitor._collect_event_monitoring_metrics()
+        assert list(monitor._trader_last_seen) == ["0xa"]
+
+    @pytest.mark.asyncio
+    async def test_late_committed_rows_are_counted_once(self, monitor) -> None:
+        """Test a row committed after a higher id is picked up by the overlap."""
+        monitor, conn = monitor
+        minute = datetime.utcnow().replace(second=0, microsecond=0)
+        conn.fetch.side_effect = [
+            [{"address": "0xa", "minute": minute, "events": 1, "ids": [10]}],
+            # 12 commits before 11
+            [{"address": "0xa", "minute": minute, "events": 1, "ids": [12]}],
+            [{"address": "0xb", "minute": minute, "events": 1, "ids": [11]}],
+        ]
+
+        for _ in range(3):
+            await monitor._collect_event_monitoring_metrics()
+
+        floors = [call.args[1:] for call in conn.fetch.call_args_list]
+        assert floors == [(0, []), (10, []), (10, [12])]
+        assert monitor._recent_total("events_indexed") == 3
+
+        # Once a pass is ID_OVERLAP_S old, its mark becomes the floor
+        marks = monitor._id_marks["trade_events"]
+        monitor._id_marks["trade_events"] = deque(
+            (at - monitor.ID_OVERLAP_S, high) for at, high in marks
+        )
+        conn.fetch.side_effect = [[]]
+        await monitor._collect_event_monitoring_metrics()
+        assert conn.fetch.call_args.args[1:] == (12, [])
+
+    @pytest.mark.asyncio
+    async def test_copy_health_and_summary_use_rollups(self, monitor) -> None:
+        """Test health and summaries read the store, and writes are one batch."""
+        monitor, conn = monitor
+        minute = datetime.utcnow().replace(second=0, microsecond=0)
+        conn.fetchval.side_effect = [5, 8, 5]
+        conn.fetch.return_value = [
+            {"minute": minute, "positions": 10, "failed": 3, "ids": list(range(31, 41))}
+        ]
+
+        await monitor._collect_copy_trading_metrics()
+        health = await monitor._check_copy_trading_health()
+        summary = await monitor.get_metrics_summary()
+        await monitor._write_metrics_to_db()
+
+        assert health.details["recent_trades"] == 10
+        assert health.details["failure_rate_percent"] == 30
+        assert health.status.value == "unhealthy"
+        assert {m["metric_name"] for m in summary["metrics"]} == {
+            "copy_trades_active_copytraders",
+            "copy_trades_active_follows",
+            "copy_trades_failed_trades",
+            "copy_trades_recent_positions",
+        }
+        conn.execute.assert_awaited_once()
+        assert len(conn.execute.call_args.args[1]) == 12  # 4 series x 3 rollups
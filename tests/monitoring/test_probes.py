@@ -0,0 +1,146 @@
+"""Tests for concurrent health probes and the snapshots endpoints serve."""
+
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from src.monitoring import health, health_server
+from src.monitoring.probes import ProbeSnapshot, ProbeTimeout, run_probes
+
+
+def _latency_count(probe: str, result: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "vanta_health_probe_latency_seconds_count",
+            {"probe": probe, "result": result},
+        )
+        or 0.0
+    )
+
+
+class TestRunProbes:
+    @pytest.mark.asyncio
+    async def test_probes_run_concurrently_under_deadlines(self) -> None:
+        """Test a hung probe costs its deadline and does not hold up others."""
+
+        async def slow_ok():
+            await asyncio.sleep(0.1)
+            return "ok"
+
+        async def hung():
+            await asyncio.sleep(10)
+
+        async def broken():
+            raise RuntimeError("connection refused")
+
+        before = _latency_count("t_hung", "timeout")
+        start = time.perf_counter()
+        results = await run_probes(
+            {"t_a": slow_ok, "t_b": slow_ok, "t_hung": hung, "t_broken": broken},
+            {"t_hung": 0.2},
+        )
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.35
+        assert results["t_a"] == results["t_b"] == "ok"
+        assert isinstance(results["t_hung"], ProbeTimeout)
+        assert str(results["t_broken"]) == "connection refused"
+        assert _latency_count("t_hung", "timeout") == before + 1
+        assert _latency_count("t_a", "ok") >= 1
+
+
+class TestProbeSnapshot:
+    @pytest.mark.asyncio
+    async def test_readers_share_one_refresh_and_reuse_it(self) -> None:
+        """Test a burst of reads runs the probes once, then serves the result."""
+        runs = 0
+
+        async def refresh():
+            nonlocal runs
+            runs += 1
+            await asyncio.sleep(0.01)
+            return {"status": "healthy", "run": runs}
+
+        snapshot = ProbeSnapshot(refresh)
+        results = await asyncio.gather(*(snapshot.get() for _ in range(20)))
+        await snapshot.get()
+
+        assert runs == 1
+        assert all(r == {"status": "healthy", "run": 1} for r in results)
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_is_served_while_refreshing(self) -> None:
+        """Test a stale read answers at once and refreshes in the background."""
+        release = asyncio.Event()
+        runs = 0
+
+        async def refresh():
+            nonlocal runs
+            runs += 1
+            if runs > 1:
+                await release.wait()
+            return {"run": runs}
+
+        snapshot = ProbeSnapshot(refresh, max_age_s=0.01)
+        await snapshot.get()
+        await asyncio.sleep(0.02)
+
+        assert await asyncio.wait_for(snapshot.get(), 0.1) == {"run": 1}
+        release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert (await snapshot.get())["run"] == 2
+
+
+class TestHealthEndpoints:
+    def test_health_server_answers_from_snapshot(self, monkeypatch) -> None:
+        """Test /ready and /health do not run the checks per request."""
+        runs = 0
+
+        async def checks():
+            nonlocal runs
+            runs += 1
+            return {"database": True, "redis": True, "rpc": True}
+
+        monkeypatch.setattr(health_server, "_snapshot", ProbeSnapshot(checks))
+        client = TestClient(health_server.app)
+
+        for _ in range(5):
+            assert client.get("/ready").status_code == 200
+        body = client.get("/health").json()
+
+        assert runs == 1
+        assert body["status"] == "healthy"
+        assert body["checks"] == {"database": True, "redis": True, "rpc": True}
+
+    @pytest.mark.asyncio
+    async def test_health_checker_runs_checks_concurrently(self, monkeypatch) -> None:
+        """Test all checks together take about as long as the slowest one."""
+        checker = health.HealthChecker()
+
+        def slow_check(delay):
+            async def check():
+                await asyncio.sleep(delay)
+                return {"status": "healthy", "message": "ok"}
+
+            return check
+
+        monkeypatch.setattr(checker, "check_redis", slow_check(0.1))
+        monkeypatch.setattr(checker, "check_database", slow_check(0.1))
+        monkeypatch.setattr(checker, "check_system_resources", slow_check(0.1))
+        monkeypatch.setattr(checker, "check_avantis_connectivity", slow_check(10))
+        monkeypatch.setattr(health, "_get_oracle_status", slow_check(0.1))
+        monkeypatch.setattr(checker, "PROBE_TIMEOUTS", {"avantis": 0.2})
+
+        start = time.perf_counter()
+        report = await checker.run_all_checks()
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.35
+        assert report["status"] == "unhealthy"
+        assert report["unhealthy_checks"] == ["avantis"]
+        assert "timed out" in report["checks"]["avantis"]["message"]
+        assert report["oracle_status"]["status"] == "healthy"
@@ -0,0 +1,289 @@
+"""Tests for the signal worker's queue handling and execution lanes (Redis stubbed)."""
+
+import asyncio
+import fnmatch
+import json
+import os
+import socket
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.config.settings import settings
+from src.database.models import Base, Execution, Signal
+from src.signals.rules import Decision
+from src.workers.signal_worker import (
+    CLAIM_SIGNALS_LUA,
+    RECLAIM_SIGNALS_LUA,
+    SignalWorker,
+)
+
+
+class InMemoryRedisQueue:
+    """Async Redis stub for the list and key commands the worker uses."""
+
+    def __init__(self):
+        self.lists: dict[str, list[bytes]] = {}
+        self.values: dict[str, str] = {}
+        self.calls: dict[str, int] = {}
+        self._pushed = asyncio.Event()
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    async def rpush(self, key, *values):
+        self.lists.setdefault(key, []).extend(
+            v if isinstance(v, bytes) else v.encode() for v in values
+        )
+        self._pushed.set()
+
+    async def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    async def lrange(self, key, start, end):
+        items = self.lists.get(key, [])
+        return list(items[start:] if end == -1 else items[start : end + 1])
+
+    async def lrem(self, key, count, value):
+        self._count("lrem")
+        items = self.lists.get(key, [])
+        if value in items:
+            items.remove(value)
+            return 1
+        return 0
+
+    def _lmove(self, src, dst):
+        items = self.lists.get(src)
+        if not items:
+            return None
+        item = items.pop(0)
+        self.lists.setdefault(dst, []).append(item)
+        return item
+
+    async def blmove(self, src, dst, timeout, where_from, where_to):
+        self._count("blmove")
+        while not self.lists.get(src):
+            self._pushed.clear()
+            try:
+                await asyncio.wait_for(self._pushed.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._lmove(src, dst)
+
+    async def set(self, key, value, px=None):
+        self.values[key] = value
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+        self.lists.pop(key, None)
+
+    async def scan_iter(self, match):
+        for key in list(self.lists):
+            if fnmatch.fnmatchcase(key, match):
+                yield key.encode()
+
+    def register_script(self, script):
+        async def claim(keys, args):
+            self._count("claim")
+            items = []
+            for _ in range(int(args[0])):
+                item = self._lmove(*keys)
+                if item is None:
+                    break
+                items.append(item)
+            return items
+
+        async def reclaim(keys, args):
+            src, dst, lease = keys
+            if lease in self.values:
+                return []
+            items = []
+            while (item := self._lmove(src, dst)) is not None:
+                items.append(item)
+            return items
+
+        scripts = {CLAIM_SIGNALS_LUA: claim, RECLAIM_SIGNALS_LUA: reclaim}
+        assert script in scripts
+        return scripts[script]
+
+
+def _raw(intent_key: str, tg_user_id=None) -> str:
+    payload = {"intent_key": intent_key}
+    if tg_user_id is not None:
+        payload["tg_user_id"] = tg_user_id
+    return json.dumps(payload)
+
+
+class TestSignalWorker:
+    """Test claiming, per-wallet ordering and crash recovery."""
+
+    @pytest.fixture
+    def queue(self):
+        return InMemoryRedisQueue()
+
+    @staticmethod
+    def _worker(queue, **kwargs) -> SignalWorker:
+        kwargs.setdefault("block_timeout_s", 0.05)
+        return SignalWorker(queue, MagicMock(), MagicMock(), MagicMock(), **kwargs)
+
+    @staticmethod
+    async def _run_until_drained(worker: SignalWorker, queue) -> None:
+        task = asyncio.create_task(worker.run())
+        while queue.lists.get(worker.processing_key) or queue.lists.get(
+            settings.SIGNALS_QUEUE
+        ):
+            await asyncio.sleep(0.01)
+        worker.stop()
+        await task
+
+    @pytest.mark.asyncio
+    async def test_claims_batch_in_one_round_trip(self, queue):
+        """Test a backlog is claimed with one BLMOVE plus one claim script call."""
+        await queue.rpush(
+            settings.SIGNALS_QUEUE, *(_raw(f"k{i}", i) for i in range(10))
+        )
+        worker = self._worker(queue, batch_size=50)
+
+        claimed = await worker.claim()
+
+        assert len(claimed) == 10
+        assert queue.calls == {"blmove": 1, "claim": 1}
+        assert len(queue.lists[worker.processing_key]) == 10
+        assert not queue.lists[settings.SIGNALS_QUEUE]
+
+    @pytest.mark.asyncio
+    async def test_wallet_order_kept_across_concurrent_lanes(self, queue):
+        """Test one user's signals run in order while users run in parallel."""
+        worker = self._worker(queue, max_concurrency=4)
+        started: list[str] = []
+        running = 0
+        peak = 0
+
+        async def process(intent_key, dequeued_at):
+            nonlocal running, peak
+            started.append(intent_key)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        worker.process = process
+        await queue.rpush(
+            settings.SIGNALS_QUEUE,
+            *(_raw(f"u{user}:{n}", user) for n in range(5) for user in range(8)),
+        )
+        await self._run_until_drained(worker, queue)
+
+        for user in range(8):
+            mine = [k for k in started if k.startswith(f"u{user}:")]
+            assert mine == [f"u{user}:{n}" for n in range(5)]
+        assert peak == 4
+        assert queue.calls["lrem"] == 40
+
+    @pytest.mark.asyncio
+    async def test_recovers_signals_claimed_before_crash(self, queue):
+        """Test a restarted worker runs what the crashed one had claimed."""
+        crashed = self._worker(queue, worker_id="w1")
+        await queue.rpush(settings.SIGNALS_QUEUE, _raw("a", 1), _raw("b", 2))
+        await crashed.claim()  # claimed, never processed
+
+        restarted = self._worker(queue, worker_id="w1")
+        restarted.process = AsyncMock()
+        await self._run_until_drained(restarted, queue)
+
+        processed = [c.args[0] for c in restarted.process.call_args_list]
+        assert sorted(processed) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_takes_over_only_workers_without_a_lease(self, queue):
+        """Test replicas get their own lists and only dead ones are taken over."""
+        alive = self._worker(queue, worker_id="alive")
+        dead = self._worker(queue, worker_id="dead")
+        await alive._renew_lease()
+        await queue.rpush(alive.processing_key, _raw("a", 1))
+        await queue.rpush(dead.processing_key, _raw("d1", 2), _raw("d2", 3))
+        await queue.rpush(settings.SIGNALS_QUEUE, _raw("q", 4))
+
+        replica = self._worker(queue)
+        assert replica.worker_id == f"{socket.gethostname()}:{os.getpid()}"
+        replica.process = AsyncMock()
+        await self._run_until_drained(replica, queue)
+
+        processed = [c.args[0] for c in replica.process.call_args_list]
+        assert sorted(processed) == ["d1", "d2", "q"]
+        assert queue.lists[alive.processing_key] == [_raw("a", 1).encode()]
+        assert not queue.lists[dead.processing_key]
+        # A clean stop gives up the lease at once
+        assert replica.lease_key not in queue.values
+
+    @pytest.mark.asyncio
+    async def test_unhandled_error_leaves_signal_claimed(self, queue):
+        """Test a signal whose handling raised is not acknowledged."""
+        worker = self._worker(queue)
+        worker.process = AsyncMock(side_effect=RuntimeError("db down"))
+        await queue.rpush(settings.SIGNALS_QUEUE, _raw("a", 1))
+
+        worker.is_running = True
+        for raw in await worker.claim():
+            worker._dispatch(raw, 0.0)
+        await asyncio.gather(*worker._lane_tasks.values())
+
+        assert queue.lists[worker.processing_key] == [_raw("a", 1).encode()]
+
+
+class TestSignalWorkerProcess:
+    """Test signal evaluation and execution."""
+
+    @pytest.fixture
+    def Session(self):
+        # One shared connection: the worker runs session work in threads
+        engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine, expire_on_commit=False)
+        db = Session()
+        db.add(
+            Signal(
+                source="test",
+                signal_id="1",
+                intent_key="sig:test:1",
+                tg_user_id=7,
+                symbol="BTC-USD",
+                side="LONG",
+                collateral_usdc=10.0,
+                leverage_x=2,
+            )
+        )
+        db.commit()
+        db.close()
+        return Session
+
+    @pytest.mark.asyncio
+    async def test_executes_with_signal_intent_key(self, Session):
+        """Test an approved signal is sent under its own idempotency key."""
+        worker = SignalWorker(InMemoryRedisQueue(), MagicMock(), Session, MagicMock())
+        svc = MagicMock()
+        svc.open_market_async = AsyncMock(return_value="0xabc")
+
+        with (
+            patch(
+                "src.workers.signal_worker.evaluate_open", return_value=Decision(True)
+            ),
+            patch("src.workers.signal_worker.AvantisService", return_value=svc),
+        ):
+            await worker.process("sig:test:1", 0.0)
+            # A redelivery after the send does nothing
+            await worker.process("sig:test:1", 0.0)
+
+        svc.open_market_async.assert_awaited_once()
+        assert svc.open_market_async.call_args.kwargs["intent_key"] == "sig:test:1"
+        db = Session()
+        execution = db.query(Execution).filter_by(intent_key="sig:test:1").one()
+        assert (execution.status, execution.tx_hash) == ("SENT", "0xabc")
+        db.close()
@@ -291,17 +291,13 @@ class TestAvantisPriceProvider:
         with (
             patch.object(price_provider, "get_pair_index", return_value=1),
             patch.object(price_provider, "estimate_opening_fee", return_value=2.5),
-            patch.object(price_provider, "get_loss_protection") as mock_loss_protection,
+            patch.object(
+                price_provider, "get_loss_protection_percent", return_value=5.0
+            ),
             patch.object(price_provider, "get_pair_spread", return_value=None),
             patch.object(price_provider, "get_price_impact_spread", return_value=0.1),
             patch.object(price_provider, "get_skew_impact_spread", return_value=0.05),
         ):
-            # Mock loss protection response
-            loss_protection = Mock()
-            loss_protection.loss_protection_percent = 5.0
-            loss_protection.loss_protection_amount = 50.0
-            mock_loss_protection.return_value = loss_protection
-
             quote = await price_provider.quote_open(
                 pair="ETH/USD",
                 is_long=True,
@@ -315,7 +311,7 @@ class TestAvantisPriceProvider:
             assert quote["position_size"] == 1000.0  # 100 * 10
             assert quote["opening_fee_usdc"] == 2.5
             assert quote["loss_protection_percent"] == 5.0
-            assert quote["loss_protection_amount"] == 50.0
+            assert quote["loss_protection_amount"] == 4.875  # (100 - 2.5) * 5%
             assert quote["impact_spread"] == 0.1
             assert quote["slippage_pct"] == 1.0
 
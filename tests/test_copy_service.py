@@ -120,8 +120,11 @@ async def test_autocopy_reason_server_dry(mock_copy_store):
 @pytest.mark.asyncio
 async def test_autocopy_reason_executor_missing(mock_copy_store):
     """Test auto-copy when executor is not available"""
-    # Mock executor not available
-    with patch("src.services.copytrading.copy_service.EXECUTOR_OK", False):
+    # Mock executor not available (executor_available() recomputes EXECUTOR_OK)
+    with (
+        patch("src.services.copytrading.copy_service._copy_executor", None),
+        patch("src.services.copytrading.copy_service.EXECUTOR_OK", False),
+    ):
         with patch("src.services.copytrading.copy_service.is_live", return_value=True):
             signal = {
                 "pair": "ETH/USD",
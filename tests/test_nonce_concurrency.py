@@ -1,10 +1,10 @@
-"""Nonce reservation concurrency testing (Redis stubbed)."""
+"""Nonce reservation concurrency testing (Redis via fakeredis with Lua)."""
 
 import asyncio
-import threading
 import time
 from unittest.mock import patch
 
+import fakeredis
 import pytest
 
 from src.blockchain.tx.nonce_manager import NonceManager
@@ -15,46 +15,32 @@ from src.blockchain.tx.nonce_store import (
 )
 
 
-class InMemoryRedisForNonce:
-    def __init__(self):
-        self.store = {}
-        self.locks = {}
-
-    def ping(self):
-        return True
-
-    def get(self, key):
-        val = self.store.get(key)
-        if val is None:
-            return None
-        return val if isinstance(val, (bytes, bytearray)) else str(val).encode()
-
-    def set(self, key, value, ex=None):
-        self.store[key] = value
-        return True
+class InMemoryRedisForNonce(fakeredis.FakeAsyncRedis):
+    """In-memory Redis running the real nonce Lua scripts, counting calls."""
 
-    def lock(self, key, timeout=5, blocking_timeout=5):
-        if key not in self.locks:
-            self.locks[key] = threading.Lock()
-        lock = self.locks[key]
+    def __init__(self):
+        super().__init__()
+        self.script_calls = 0
 
-        class _Ctx:
-            def __enter__(self_inner):
-                acquired = lock.acquire(timeout=blocking_timeout)
-                if not acquired:
-                    raise TimeoutError("Could not acquire lock")
-                return True
+    def register_script(self, script):
+        run = super().register_script(script)
 
-            def __exit__(self_inner, exc_type, exc, tb):
-                lock.release()
+        async def call(keys, args):
+            self.script_calls += 1
+            return await run(keys=keys, args=args)
 
-        return _Ctx()
+        return call
 
 
 class StubWeb3:
     class Eth:
+        def __init__(self):
+            self.pending = 0
+            self.calls = 0
+
         def get_transaction_count(self, address, state):
-            return 0
+            self.calls += 1
+            return self.pending
 
     def __init__(self):
         self.eth = StubWeb3.Eth()
@@ -70,12 +56,12 @@ class TestNonceReservationConcurrency:
 
     @pytest.fixture
     def redis_store(self):
-        """Create Redis nonce store with in-memory Redis stub."""
+        """Create Redis nonce store backed by fakeredis."""
         return RedisNonceStore(InMemoryRedisForNonce(), StubWeb3())
 
     @pytest.fixture
     def hybrid_store(self):
-        """Create hybrid nonce store with in-memory Redis stub."""
+        """Create hybrid nonce store backed by fakeredis."""
         return HybridNonceStore(InMemoryRedisForNonce(), StubWeb3())
 
     @pytest.fixture
@@ -481,3 +467,187 @@ class TestNonceReservationConcurrency:
         results.sort()
         for i in range(1, len(results)):
             assert results[i] == results[i - 1] + 1
+
+
+class TestNonceRelease:
+    """Test atomic Redis reservation and the release path for failed sends."""
+
+    ADDRESS = "0x9999999999999999999999999999999999999999"
+
+    @pytest.mark.asyncio
+    async def test_reservation_is_one_script_call(self):
+        """Test warm reservations cost one round trip and no chain reads."""
+        redis, web3 = InMemoryRedisForNonce(), StubWeb3()
+        web3.eth.pending = 41
+        store = RedisNonceStore(redis, web3)
+
+        first = await store.acquire(self.ADDRESS)
+        assert first == 41
+        assert (redis.script_calls, web3.eth.calls) == (2, 1)
+
+        nonces = await asyncio.gather(
+            *(store.acquire(self.ADDRESS) for _ in range(500))
+        )
+        assert sorted(nonces) == list(range(42, 542))
+        assert (redis.script_calls, web3.eth.calls) == (502, 1)
+
+    @pytest.mark.asyncio
+    async def test_released_nonces_are_reused_lowest_first(self):
+        """Test failed sends do not leave nonce gaps."""
+        store = RedisNonceStore(InMemoryRedisForNonce(), StubWeb3())
+        nonces = [await store.acquire(self.ADDRESS) for _ in range(5)]
+        assert nonces == [0, 1, 2, 3, 4]
+
+        await store.release(self.ADDRESS, 3)
+        await store.release(self.ADDRESS, 1)
+        await store.release(self.ADDRESS, 99)  # never reserved: ignored
+
+        assert [await store.acquire(self.ADDRESS) for _ in range(3)] == [1, 3, 5]
+
+    @pytest.mark.asyncio
+    async def test_released_nonces_below_chain_are_dropped(self):
+        """Test a cold counter reseeds from chain and prunes mined nonces."""
+        redis, web3 = InMemoryRedisForNonce(), StubWeb3()
+        store = RedisNonceStore(redis, web3)
+        for _ in range(4):
+            await store.acquire(self.ADDRESS)
+        await store.release(self.ADDRESS, 1)
+
+        # Counter expired while another sender moved the chain forward
+        await redis.flushall()
+        web3.eth.pending = 10
+        assert await store.acquire(self.ADDRESS) == 10
+        assert await store.acquire(self.ADDRESS) == 11
+
+    @pytest.mark.asyncio
+    async def test_manager_releases_to_store(self):
+        """Test NonceManager.release_nonce feeds the next reservation."""
+        manager = NonceManager(InMemoryRedisForNonce(), StubWeb3())
+        async with manager.reserve(self.ADDRESS) as first:
+            pass
+        await manager.release_nonce(self.ADDRESS, first)
+
+        async with manager.reserve(self.ADDRESS) as again:
+            assert again == first
+
+        # The in-memory fallback honours releases as well
+        fallback = NonceManager(None, StubWeb3())
+        async with fallback.reserve(self.ADDRESS) as nonce:
+            pass
+        await fallback.release_nonce(self.ADDRESS, nonce)
+        async with fallback.reserve(self.ADDRESS) as again:
+            assert again == nonce
+
+    @pytest.mark.asyncio
+    async def test_body_errors_do_not_trigger_fallback(self):
+        """Test an exception inside the reservation keeps Redis as primary."""
+        store = HybridNonceStore(InMemoryRedisForNonce(), StubWeb3())
+        with pytest.raises(ValueError):
+            async with store.reserve(self.ADDRESS):
+                raise ValueError("send failed")
+
+        assert store._redis_healthy
+        assert await store.acquire(self.ADDRESS) == 1
+
+    @pytest.mark.asyncio
+    async def test_resync_skips_used_nonces_without_going_back(self):
+        """Test resync raises the counter to the chain but never lowers it."""
+        redis, web3 = InMemoryRedisForNonce(), StubWeb3()
+        store = RedisNonceStore(redis, web3)
+        for _ in range(3):
+            await store.acquire(self.ADDRESS)
+        await store.release(self.ADDRESS, 1)
+
+        web3.eth.pending = 2  # behind our reservations: nothing changes
+        await store.resync(self.ADDRESS)
+        assert await store.acquire(self.ADDRESS) == 3
+
+        web3.eth.pending = 10  # another sender used 4..9
+        await store.resync(self.ADDRESS)
+        assert await store.acquire(self.ADDRESS) == 10
+
+
+class TestSubmitNonceHandling:
+    """Test BaseClient.submit releases nonces only when nothing was sent."""
+
+    ADDRESS = "0x9999999999999999999999999999999999999999"
+
+    @pytest.fixture
+    def client(self):
+        from contextlib import asynccontextmanager
+        from unittest.mock import AsyncMock, MagicMock
+
+        from src.blockchain.base_client import BaseClient
+
+        @asynccontextmanager
+        async def get_session():
+            yield AsyncMock()
+
+        client = BaseClient.__new__(BaseClient)
+        client.w3 = StubWeb3()
+        client.w3.eth.pending = 7
+        client.chain_id = 8453
+        client.redis = InMemoryRedisForNonce()
+        client.db_manager = MagicMock(get_session=get_session)
+        client.signer = MagicMock(address=self.ADDRESS)
+        client.signer.sign_and_send = AsyncMock(return_value="0xhash")
+
+        repo = MagicMock()
+        repo.get_by_request_id = AsyncMock(return_value=None)
+        repo.record_if_new = AsyncMock()
+        builder = MagicMock()
+        builder.estimate_gas.return_value = 21_000
+        builder.build.side_effect = lambda **tx: tx
+        with (
+            patch(
+                "src.database.transaction_repo.TransactionRepository",
+                return_value=repo,
+            ),
+            patch("src.blockchain.tx.builder.TxBuilder", return_value=builder),
+            patch("src.blockchain.tx.gas_policy.GasPolicy") as gas_policy,
+        ):
+            gas_policy.return_value.quote.return_value = (2, 1)
+            yield client, builder
+
+    async def _next_nonce(self, client) -> int:
+        async with NonceManager(client.redis, client.w3).reserve(self.ADDRESS) as n:
+            return n
+
+    @pytest.mark.asyncio
+    async def test_failed_gas_estimate_releases_nonce(self, client):
+        """Test a build failure returns the nonce instead of leaving a gap."""
+        client, builder = client
+        builder.estimate_gas.side_effect = ValueError("execution reverted")
+
+        with pytest.raises(ValueError):
+            await client.submit({"to": self.ADDRESS}, request_id="r1")
+
+        client.signer.sign_and_send.assert_not_called()
+        assert await self._next_nonce(client) == 7
+
+    @pytest.mark.asyncio
+    async def test_send_failing_after_broadcast_keeps_nonce(self, client):
+        """Test a nonce the chain already has is not handed out again."""
+        client, _ = client
+
+        async def broadcast_then_time_out(tx):
+            client.w3.eth.pending = tx["nonce"] + 1
+            raise TimeoutError("read timed out")
+
+        client.signer.sign_and_send.side_effect = broadcast_then_time_out
+
+        with pytest.raises(TimeoutError):
+            await client.submit({"to": self.ADDRESS}, request_id="r1")
+
+        assert await self._next_nonce(client) == 8
+
+    @pytest.mark.asyncio
+    async def test_send_failing_before_broadcast_releases_nonce(self, client):
+        """Test a send the chain never saw gives its nonce back."""
+        client, _ = client
+        client.signer.sign_and_send.side_effect = ConnectionError("refused")
+
+        with pytest.raises(ConnectionError):
+            await client.submit({"to": self.ADDRESS}, request_id="r1")
+
+        assert await self._next_nonce(client) == 7
@@ -0,0 +1,61 @@
+"""Unit tests for the per-block cache."""
+
+import asyncio
+
+import pytest
+
+from src.services.cache.block_cache import BlockCache
+
+
+class TestBlockCache:
+    """Test expiry, shared loads and eviction."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self) -> None:
+        """Test a burst of misses for one key loads it once."""
+        cache = BlockCache(ttl_s=10)
+        loads = 0
+
+        async def load():
+            nonlocal loads
+            loads += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(
+            *(cache.get_or_load("key", load) for _ in range(20))
+        )
+
+        assert results == ["value"] * 20
+        assert loads == 1
+        assert cache.get("key") == "value"
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_and_failures_are_not_cached(self) -> None:
+        """Test stale entries and failed loads are loaded again."""
+        cache = BlockCache(ttl_s=0.01)
+        attempts = 0
+
+        async def load():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise RuntimeError("rpc down")
+            return attempts
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("key", load)
+        assert await cache.get_or_load("key", load) == 2
+        await asyncio.sleep(0.02)
+        assert cache.get("key") is None
+        assert await cache.get_or_load("key", load) == 3
+
+    def test_oldest_entries_are_evicted_when_full(self) -> None:
+        """Test the cache stays within max_entries."""
+        cache = BlockCache(ttl_s=10, max_entries=3)
+        for i in range(5):
+            cache.set(i, i)
+
+        assert len(cache) == 3
+        assert cache.get(0) is None
+        assert cache.get(4) == 4
@@ -0,0 +1,135 @@
+"""Unit tests for the async positions cache (Redis stubbed)."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.services.cache import positions_cache as positions_cache_module
+from src.services.cache.positions_cache import PositionsCache, invalidate_positions
+
+
+class InMemoryAsyncRedis:
+    """Async Redis stub for the commands the cache uses, with a round trip."""
+
+    def __init__(self, rtt_s: float = 0.005):
+        self.rtt_s = rtt_s
+        self.values: dict[str, str] = {}
+        self.calls: list[str] = []
+        self.down = False
+
+    async def _round_trip(self, name: str) -> None:
+        self.calls.append(name)
+        await asyncio.sleep(self.rtt_s)
+        if self.down:
+            raise ConnectionError("redis down")
+
+    async def get(self, key):
+        await self._round_trip("get")
+        return self.values.get(key)
+
+    async def setex(self, key, ttl, value):
+        await self._round_trip("setex")
+        self.values[key] = value
+
+    async def unlink(self, *keys):
+        await self._round_trip("unlink")
+        return sum(self.values.pop(k, None) is not None for k in keys)
+
+
+class TestPositionsCache:
+    """Test shared loads, batched invalidation and Redis outages."""
+
+    @pytest.mark.asyncio
+    async def test_burst_for_one_user_loads_once(self) -> None:
+        """Test 50 concurrent misses for one user make a single DB load."""
+        redis = InMemoryAsyncRedis()
+        cache = PositionsCache(client=redis)
+        loads = 0
+
+        async def load():
+            nonlocal loads
+            loads += 1
+            await asyncio.sleep(0.01)
+            return [{"symbol": "BTC-USD"}]
+
+        results = await asyncio.gather(
+            *(cache.get_or_load("0xAbC", load) for _ in range(50))
+        )
+
+        assert loads == 1
+        assert all(r == [{"symbol": "BTC-USD"}] for r in results)
+        assert redis.calls.count("setex") == 1
+
+        # Later reads are cache hits
+        assert await cache.get_or_load("0xabc", load) == [{"symbol": "BTC-USD"}]
+        assert loads == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_load_reaches_every_waiter_then_retries(self) -> None:
+        """Test a failed load fails its waiters and the next miss loads again."""
+        cache = PositionsCache(client=InMemoryAsyncRedis())
+        attempts = 0
+
+        async def load():
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(0.01)
+            if attempts == 1:
+                raise RuntimeError("db down")
+            return []
+
+        results = await asyncio.gather(
+            *(cache.get_or_load("0xabc", load) for _ in range(5)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        assert await cache.get_or_load("0xabc", load) == []
+        assert attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_many_is_one_round_trip(self) -> None:
+        """Test a batch of users is invalidated with a single UNLINK."""
+        redis = InMemoryAsyncRedis()
+        cache = PositionsCache(client=redis)
+        users = [f"0x{i:040x}" for i in range(100)]
+        for user in users:
+            await cache.set_positions(user, [])
+        redis.calls.clear()
+
+        removed = await cache.invalidate_many(users + users[:10])
+
+        assert removed == 100
+        assert redis.calls == ["unlink"]
+        assert redis.values == {}
+
+    @pytest.mark.asyncio
+    async def test_redis_outage_falls_through_to_loader(self) -> None:
+        """Test a failing Redis is skipped for a while instead of per request."""
+        redis = InMemoryAsyncRedis()
+        redis.down = True
+        cache = PositionsCache(client=redis)
+
+        assert await cache.get_or_load("0xabc", lambda: [{"symbol": "ETH"}]) == [
+            {"symbol": "ETH"}
+        ]
+        assert await cache.get_or_load("0xabc", lambda: []) == []
+        assert redis.calls == ["get"]
+
+    def test_sync_invalidation_batches_one_unlink(self) -> None:
+        """Test the indexer's sync path removes a batch with one command."""
+
+        class SyncRedis:
+            def __init__(self):
+                self.calls = []
+
+            def unlink(self, *keys):
+                self.calls.append(keys)
+                return len(keys)
+
+        client = SyncRedis()
+        with patch.object(positions_cache_module, "_sync_client", client):
+            assert invalidate_positions(["0xabc", "0xABC", "0xdef"]) == 2
+
+        assert len(client.calls) == 1
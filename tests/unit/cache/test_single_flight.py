@@ -0,0 +1,82 @@
+"""Unit tests for the shared in-flight load helper."""
+
+import asyncio
+
+import pytest
+
+from src.services.cache.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test joined loads, cancellation and error handling."""
+
+    @pytest.mark.asyncio
+    async def test_callers_join_the_running_load(self) -> None:
+        """Test concurrent callers share a load and a later call starts anew."""
+        flights = SingleFlight()
+        runs = 0
+
+        async def load():
+            nonlocal runs
+            runs += 1
+            await asyncio.sleep(0.01)
+            return runs
+
+        results = await asyncio.gather(*(flights.do("key", load) for _ in range(10)))
+        assert results == [1] * 10
+        assert "key" not in flights
+        assert await flights.do("key", load) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_the_load(self) -> None:
+        """Test a waiter giving up leaves the load running for the others."""
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            return "value"
+
+        first = asyncio.create_task(flights.do("key", load))
+        second = asyncio.create_task(flights.do("key", load))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "value"
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_failures_reach_waiters_and_are_retrieved(self) -> None:
+        """Test a failed load raises to callers and is marked retrieved."""
+        flights = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0)
+            raise RuntimeError("rpc down")
+
+        results = await asyncio.gather(
+            flights.do("key", load), flights.do("key", load), return_exceptions=True
+        )
+        assert [str(r) for r in results] == ["rpc down"] * 2
+
+        # Nobody awaits this one; it must not log "exception never retrieved"
+        task = flights.start("other", load)
+        await asyncio.wait([task])
+        await asyncio.sleep(0)
+        assert not task._log_traceback
+
+    @pytest.mark.asyncio
+    async def test_one_load_covers_many_keys(self) -> None:
+        """Test every key of a multi-key load joins that one load."""
+        flights = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.01)
+
+        task = flights.start_many(["a", "b"], load)
+        assert flights.get("a") is task
+        assert flights.start("b", load) is task
+        await task
+        await asyncio.sleep(0)
+        assert "a" not in flights and "b" not in flights
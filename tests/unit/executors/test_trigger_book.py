@@ -0,0 +1,193 @@
+"""Unit tests for the TP/SL trigger book and executor."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.database.models import Base
+from src.repositories.tpsl_repo import add_tpsl, list_tpsl
+from src.services.executors.tpsl_executor import TPSLExecutor
+from src.services.executors.trigger_book import RestingOrder, TriggerBook
+from src.services.price_bus import PriceBus
+
+
+def _order(tpsl_id, is_long=True, tp=None, sl=None, symbol="BTC-USD"):
+    return RestingOrder(tpsl_id, 7, symbol, is_long, tp, sl)
+
+
+class TestTriggerBook:
+    """Test crossing, replacement and resync of resting triggers."""
+
+    def test_legs_fire_in_the_position_direction(self) -> None:
+        """Test long TP/short SL fire rising and long SL/short TP falling."""
+        book = TriggerBook()
+        book.add(_order(1, is_long=True, tp=110, sl=90))
+        book.add(_order(2, is_long=False, tp=90, sl=110))
+
+        assert book.cross("BTC", 100) == []
+        fills = book.cross("BTC/USD", 111)
+        assert {(f.order.id, f.trigger) for f in fills} == {(1, "TP"), (2, "SL")}
+        # Both orders left the book with their other leg
+        assert len(book) == 0
+        assert book.cross("BTC", 50) == []
+
+    def test_cross_only_touches_crossed_levels(self) -> None:
+        """Test a price move fires exactly the orders whose levels it passed."""
+        book = TriggerBook()
+        for i in range(1, 1001):
+            book.add(_order(i, tp=100 + i, sl=100 - i / 100))
+        book.add(_order(2000, tp=105, symbol="ETH-USD"))
+
+        fills = book.cross("BTC", 105)
+        assert sorted(f.order.id for f in fills) == [1, 2, 3, 4, 5]
+        assert {f.trigger for f in fills} == {"TP"}
+        assert len(book) == 996
+        assert 2000 in book
+
+        fills = book.cross("BTC", 99.9)
+        assert sorted(f.order.id for f in fills) == [6, 7, 8, 9, 10]
+        assert {f.trigger for f in fills} == {"SL"}
+
+    def test_replacing_an_order_moves_its_levels(self) -> None:
+        """Test re-adding an order drops its old levels."""
+        book = TriggerBook()
+        book.add(_order(1, tp=110))
+        book.add(_order(1, tp=120))
+
+        assert book.cross("BTC", 115) == []
+        assert [f.level for f in book.cross("BTC", 120)] == [120.0]
+
+    def test_sync_mirrors_active_rows(self) -> None:
+        """Test sync adds new rows, drops missing ones and honours exclude."""
+        book = TriggerBook()
+        book.add(_order(1, tp=110))
+        book.add(_order(2, tp=110))
+        rows = [
+            MagicMock(
+                id=i,
+                tg_user_id=7,
+                symbol="BTC-USD",
+                is_long=True,
+                take_profit_price=110.0,
+                stop_loss_price=None,
+            )
+            for i in (2, 3, 4)
+        ]
+
+        book.sync(rows, exclude=[4])
+
+        assert sorted(f.order.id for f in book.cross("BTC", 110)) == [2, 3]
+
+
+class TestTPSLExecutor:
+    """Test the executor closes on published prices and follows the repo."""
+
+    @pytest.fixture
+    def Session(self, tmp_path):
+        eng = create_engine(f"sqlite:///{tmp_path}/test.db")
+        Base.metadata.create_all(eng)
+        return sessionmaker(bind=eng, expire_on_commit=False)
+
+    @staticmethod
+    async def _settle() -> None:
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    @pytest.mark.asyncio
+    async def test_closes_when_published_price_crosses(self, Session) -> None:
+        """Test an order added in-process fires on the next crossing price."""
+        bus = PriceBus(ttl_s=60)
+        executor = TPSLExecutor(MagicMock(), Session, MagicMock(), bus=bus)
+        svc = MagicMock()
+        svc.close_market_async = AsyncMock(return_value="0xabc")
+
+        with patch(
+            "src.services.executors.tpsl_executor.AvantisService", return_value=svc
+        ):
+            run = asyncio.create_task(executor.run())
+            await self._settle()
+
+            db = Session()
+            rec = add_tpsl(db, 7, "BTC-USD", True, tp=110.0, sl=90.0)
+            await self._settle()
+            assert rec.id in executor.book
+
+            bus.publish("chainlink", "BTC", 100.0)
+            bus.publish("coingecko", "BTC", 120.0)  # other sources do not count
+            await self._settle()
+            svc.close_market_async.assert_not_awaited()
+
+            bus.publish("chainlink", "BTC", 89.0)
+            await self._settle()
+
+            run.cancel()
+            await asyncio.gather(run, return_exceptions=True)
+
+        svc.close_market_async.assert_awaited_once()
+        assert svc.close_market_async.call_args.args[:2] == (7, "BTC-USD")
+        assert list_tpsl(db) == []
+        db.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_close_is_rearmed(self, Session) -> None:
+        """Test an order whose close failed fires again once its delay is up."""
+        bus = PriceBus(ttl_s=60)
+        db = Session()
+        rec = add_tpsl(db, 7, "ETH-USD", False, tp=None, sl=3_000.0)
+        db.close()
+        executor = TPSLExecutor(MagicMock(), Session, MagicMock(), bus=bus)
+        executor.RETRY_BASE_S = 0.05
+        svc = MagicMock()
+        svc.close_market_async = AsyncMock(side_effect=[RuntimeError("rpc"), "0x1"])
+
+        with patch(
+            "src.services.executors.tpsl_executor.AvantisService", return_value=svc
+        ):
+            run = asyncio.create_task(executor.run())
+            await self._settle()
+            assert len(executor.book) == 1
+
+            bus.publish("chainlink", "ETH", 3_100.0)
+            await self._settle()
+            assert rec.id in executor.retrying
+            assert len(executor.book) == 0
+
+            # Crossing prices during the delay do not retry it
+            bus.publish("chainlink", "ETH", 3_050.0)
+            await self._settle()
+            assert svc.close_market_async.await_count == 1
+
+            # Re-armed, it retries on the last price
+            await asyncio.sleep(0.1)
+            await self._settle()
+
+            run.cancel()
+            await asyncio.gather(run, return_exceptions=True)
+
+        assert svc.close_market_async.await_count == 2
+        assert len(executor.book) == 0
+        assert executor.retrying == {}
+
+    @pytest.mark.asyncio
+    async def test_retry_delay_doubles_up_to_a_cap(self, Session) -> None:
+        """Test consecutive failures back off and a success resets the count."""
+        executor = TPSLExecutor(MagicMock(), Session, MagicMock(), bus=PriceBus())
+        order = _order(1, sl=90.0)
+        loop = asyncio.get_running_loop()
+
+        delays = []
+        for _ in range(7):
+            failed = loop.create_future()
+            failed.set_result(False)
+            executor._closed(order, failed)
+            delays.append(round(executor.retrying[1].when() - loop.time()))
+            executor.retrying.pop(1).cancel()
+        assert delays == [10, 20, 40, 80, 160, 300, 300]
+
+        closed = loop.create_future()
+        closed.set_result(True)
+        executor._closed(order, closed)
+        assert executor._failures == {}
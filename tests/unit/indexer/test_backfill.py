@@ -0,0 +1,206 @@
+"""Unit tests for the concurrent indexer backfill against a recorded log fixture."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from web3 import Web3
+
+from src.database.models import Base, IndexedFill
+from src.repositories.sync_state_repo import get_block
+from src.services.indexers import avantis_indexer
+from src.services.indexers.avantis_indexer import SYNC_NAME, TRADING_CONTRACT, backfill
+
+
+class _FixtureEth:
+    """eth namespace serving eth_getLogs from a recorded list of logs.
+
+    Rejects ranges returning more than `limit` logs the way hosted providers do,
+    and fails any range covering a block in `broken` with a non-size error.
+    The first `throttled` calls are answered with a 429 rate-limit error.
+    """
+
+    def __init__(self, logs: list[dict], tip: int, limit: int = 40):
+        self.logs = logs
+        self.block_number = tip
+        self.limit = limit
+        self.broken: set[int] = set()
+        self.throttled = 0
+        self.calls: list[tuple[int, int]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get_logs(self, params: dict) -> list[dict]:
+        from_block, to_block = params["fromBlock"], params["toBlock"]
+        with self._lock:
+            self.calls.append((from_block, to_block))
+            throttle = self.throttled > 0
+            self.throttled -= throttle
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(0.002)  # provider round trip
+            if throttle:
+                raise ValueError({"code": 429, "message": "Too Many Requests"})
+            if any(from_block <= b <= to_block for b in self.broken):
+                raise ConnectionError("connection reset by peer")
+            logs = [
+                lg for lg in self.logs if from_block <= lg["blockNumber"] <= to_block
+            ]
+            if len(logs) > self.limit:
+                raise ValueError(
+                    {
+                        "code": -32005,
+                        "message": f"query returned more than {self.limit} results",
+                    }
+                )
+            return logs
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _recorded_logs(blocks: int) -> list[dict]:
+    address = Web3.to_checksum_address(TRADING_CONTRACT)
+    logs = []
+    for block in range(1, blocks + 1):
+        # A dense stretch forces the provider to reject wide ranges
+        per_block = 3 if 2_000 <= block < 2_300 else int(block % 7 == 0)
+        for i in range(per_block):
+            logs.append({"address": address, "blockNumber": block, "logIndex": i})
+    return logs
+
+
+def _decode(w3, contract, log):
+    return [
+        IndexedFill(
+            user_address="0xabc",
+            symbol="BTC-USD",
+            is_long=True,
+            usd_1e6=1,
+            tx_hash=f"0x{log['blockNumber']:x}{log['logIndex']:02d}",
+            block_number=log["blockNumber"],
+        )
+    ]
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    eng = create_engine(f"sqlite:///{tmp_path}/test.db")
+    Base.metadata.create_all(eng)
+    monkeypatch.setattr(avantis_indexer, "_decode_event", _decode)
+    monkeypatch.setattr(avantis_indexer, "_apply_fills", lambda db, fills: set())
+    return sessionmaker(bind=eng, expire_on_commit=False)
+
+
+def _stored(SessionLocal) -> tuple[int, list[tuple[int, str]]]:
+    with SessionLocal() as db:
+        fills = db.query(IndexedFill).order_by(IndexedFill.id).all()
+        return get_block(db, SYNC_NAME), [(f.block_number, f.tx_hash) for f in fills]
+
+
+def test_backfill_fetches_concurrently_and_stores_in_block_order(
+    session_factory,
+) -> None:
+    logs = _recorded_logs(6_000)
+    eth = _FixtureEth(logs, tip=6_000)
+    w3 = SimpleNamespace(eth=eth)
+
+    processed = backfill(w3, None, session_factory, target=6_000, workers=4, chunk=500)
+
+    watermark, fills = _stored(session_factory)
+    assert processed == 6_000
+    assert watermark == 6_000
+    assert [block for block, _ in fills] == [lg["blockNumber"] for lg in logs]
+    assert len({tx for _, tx in fills}) == len(logs)
+    assert eth.max_in_flight > 1
+    # The dense stretch was split below the provider limit
+    assert any(to - frm + 1 < 500 for frm, to in eth.calls)
+
+
+def test_backfill_never_advances_watermark_past_a_failed_range(
+    session_factory, monkeypatch
+) -> None:
+    logs = _recorded_logs(6_000)
+    eth = _FixtureEth(logs, tip=6_000)
+    eth.broken = {3_100}
+    w3 = SimpleNamespace(eth=eth)
+
+    watermarks: list[int] = []
+    set_block = avantis_indexer.set_block
+
+    def recording_set_block(db, name, block):
+        watermarks.append(block)
+        set_block(db, name, block)
+
+    monkeypatch.setattr(avantis_indexer, "set_block", recording_set_block)
+
+    with pytest.raises(ConnectionError):
+        backfill(w3, None, session_factory, target=6_000, workers=4, chunk=500)
+
+    watermark, fills = _stored(session_factory)
+    assert watermarks == sorted(watermarks)
+    assert watermark < 3_100
+    assert [block for block, _ in fills] == [
+        lg["blockNumber"] for lg in logs if lg["blockNumber"] <= watermark
+    ]
+
+    # The next run resumes from the watermark and stores each log exactly once
+    eth.broken.clear()
+    processed = backfill(w3, None, session_factory, target=6_000, workers=4, chunk=500)
+
+    watermark_after, fills = _stored(session_factory)
+    assert processed == 6_000 - watermark
+    assert watermark_after == 6_000
+    assert [block for block, _ in fills] == [lg["blockNumber"] for lg in logs]
+
+
+def test_backfill_raises_when_a_single_block_is_rejected(session_factory) -> None:
+    logs = _recorded_logs(2_100)
+    eth = _FixtureEth(logs, tip=2_100, limit=2)
+    w3 = SimpleNamespace(eth=eth)
+
+    with pytest.raises(ValueError):
+        backfill(w3, None, session_factory, target=2_100, workers=2, chunk=500)
+
+    watermark, fills = _stored(session_factory)
+    assert watermark < 2_000
+    assert all(block <= watermark for block, _ in fills)
+
+
+def test_backfill_backs_off_on_rate_limits_instead_of_splitting(
+    session_factory, monkeypatch
+) -> None:
+    logs = _recorded_logs(1_000)
+    eth = _FixtureEth(logs, tip=1_000, limit=1_000)
+    eth.throttled = 3
+    w3 = SimpleNamespace(eth=eth)
+    monkeypatch.setattr(avantis_indexer, "RATE_LIMIT_BACKOFF_S", 0.001)
+
+    processed = backfill(w3, None, session_factory, target=1_000, workers=1, chunk=500)
+
+    watermark, fills = _stored(session_factory)
+    assert processed == 1_000
+    assert [block for block, _ in fills] == [lg["blockNumber"] for lg in logs]
+    # The throttled range was retried whole, never split
+    assert eth.calls == [(1, 500)] * 4 + [(501, 1_000)]
+
+
+@pytest.mark.parametrize(
+    ("message", "too_large"),
+    [
+        ("{'code': -32005, 'message': 'query returned more than 10000 results'}", True),
+        ("block range is too large", True),
+        ("response size exceeded", True),
+        ("{'code': -32005, 'message': 'project ID request rate exceeded'}", False),
+        ("429 Client Error: Too Many Requests", False),
+        ("daily request limit exceeded", False),
+        ("too many connections", False),
+    ],
+)
+def test_range_too_large_ignores_rate_limits(message, too_large) -> None:
+    assert avantis_indexer._is_range_too_large(ValueError(message)) is too_large
@@ -0,0 +1,81 @@
+"""Unit tests for quote fan-in and caching in the Avantis price provider."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.markets.avantis_price_provider import AvantisPriceProvider
+
+RTT_S = 0.05
+
+
+class FakeSDKClient:
+    """SDK client stub recording every call, each taking one round trip."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+        def rpc(name, value):
+            async def call(*args, **kwargs):
+                self.calls.append(name)
+                await asyncio.sleep(RTT_S)
+                return value
+
+            return call
+
+        self.pairs_cache = SimpleNamespace(get_pair_index=rpc("pair_index", 1))
+        self.fee_parameters = SimpleNamespace(get_opening_fee=rpc("fee", 2.5))
+        self.trading_parameters = SimpleNamespace(
+            get_loss_protection_tier=rpc("lp_tier", 1),
+            get_loss_protection_percentage_by_tier=rpc("lp_percent", 5),
+        )
+        self.asset_parameters = SimpleNamespace(
+            get_pair_spread=rpc("pair_spread", 0.01),
+            get_price_impact_spread=rpc("price_impact", 0.1),
+            get_skew_impact_spread=rpc("skew_impact", 0.05),
+        )
+
+
+@pytest.fixture
+def provider():
+    provider = AvantisPriceProvider()
+    provider._client = FakeSDKClient()
+    return provider
+
+
+class TestQuoteOpen:
+    """Test quotes fan out concurrently and reuse cached parameters."""
+
+    @pytest.mark.asyncio
+    async def test_warm_pair_quote_costs_one_round_trip(self, provider) -> None:
+        """Test a new quote on a known pair waits for about one RPC."""
+        await provider.quote_open("ETH/USD", True, 100.0, 10.0)
+        provider._client.calls.clear()
+
+        start = time.perf_counter()
+        quote = await provider.quote_open("ETH/USD", False, 200.0, 5.0)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 2 * RTT_S
+        assert sorted(provider._client.calls) == [
+            "fee",
+            "lp_tier",
+            "price_impact",
+            "skew_impact",
+        ]
+        assert quote.loss_protection_percent == 5
+        assert quote.loss_protection_amount == pytest.approx((200.0 - 2.5) * 0.05)
+
+    @pytest.mark.asyncio
+    async def test_size_dependent_parameters_are_read_per_quote(self, provider) -> None:
+        """Test only pair-level parameters are cached between quotes."""
+        first = await provider.quote_open("ETH/USD", True, 100.0, 10.0, 0.5)
+        provider._client.calls.clear()
+
+        second = await provider.quote_open("ETH/USD", True, 100.0, 10.0, 2.0)
+
+        assert "fee" in provider._client.calls
+        assert "pair_spread" not in provider._client.calls
+        assert (first.slippage_pct, second.slippage_pct) == (0.5, 2.0)
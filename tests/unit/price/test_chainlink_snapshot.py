@@ -0,0 +1,214 @@
+"""Unit tests for the multicall Chainlink price snapshot."""
+
+from eth_abi import decode, encode
+from web3 import Web3
+from web3.providers import BaseProvider
+
+from src.adapters.price.aggregator import PriceAggregator
+from src.adapters.price.base import PriceQuote
+from src.adapters.price.chainlink_adapter import (
+    DECIMALS_CALLDATA,
+    LATEST_ROUND_DATA_CALLDATA,
+    MULTICALL3_ADDRESS,
+    ROUND_DATA_TYPES,
+    ChainlinkAdapter,
+)
+
+
+class _FeedChain(BaseProvider):
+    """JSON-RPC stand-in executing eth_call against aggregators and Multicall3."""
+
+    def __init__(self, feeds: dict[str, tuple[int, int, int]]):
+        super().__init__()
+        # address -> (decimals, answer, updatedAt)
+        self.feeds = {Web3.to_checksum_address(a): v for a, v in feeds.items()}
+        self.reverting: set[str] = set()
+        self.block_number = 1_000
+        self.eth_calls = 0
+        self.subcalls: list[bytes] = []
+        self.down = False
+        self.multicall_down = False
+
+    def make_request(self, method, params):
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(8453)}
+        assert method == "eth_call", method
+        self.eth_calls += 1
+        if self.down:
+            return {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "error": {"code": -32000, "message": "down"},
+            }
+
+        to = Web3.to_checksum_address(params[0]["to"])
+        data = bytes.fromhex(params[0]["data"][2:])
+        if to == Web3.to_checksum_address(MULTICALL3_ADDRESS):
+            if self.multicall_down:
+                return {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "error": {"code": 3, "message": "execution reverted"},
+                }
+            _, calls = decode(["bool", "(address,bytes)[]"], data[4:])
+            results = [self._call(target, calldata) for target, calldata in calls]
+            out = encode(
+                ["uint256", "bytes32", "(bool,bytes)[]"],
+                [self.block_number, b"\x11" * 32, results],
+            )
+        else:
+            success, out = self._call(to, data)
+            if not success:
+                return {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "error": {"code": 3, "message": "execution reverted"},
+                }
+        return {"jsonrpc": "2.0", "id": 1, "result": "0x" + out.hex()}
+
+    def _call(self, target: str, calldata: bytes) -> tuple[bool, bytes]:
+        target = Web3.to_checksum_address(target)
+        self.subcalls.append(calldata)
+        if target in self.reverting or target not in self.feeds:
+            return False, b""
+        decimals, answer, updated_at = self.feeds[target]
+        if calldata == DECIMALS_CALLDATA:
+            return True, encode(["uint8"], [decimals])
+        if calldata == LATEST_ROUND_DATA_CALLDATA:
+            return True, encode(
+                ROUND_DATA_TYPES, [7, answer, updated_at, updated_at, 7]
+            )
+        return False, b""
+
+
+def _feeds(count: int) -> dict[str, str]:
+    return {f"SYM{i}-USD": "0x" + f"{i + 1:040x}" for i in range(count)}
+
+
+def _chain(symbol_to_feed: dict[str, str]) -> _FeedChain:
+    return _FeedChain(
+        {
+            address: (8 if i % 2 else 18, (i + 1) * 10**8, 1_700_000_000 + i)
+            for i, address in enumerate(symbol_to_feed.values())
+        }
+    )
+
+
+class TestChainlinkSnapshot:
+    """Test ChainlinkAdapter.get_prices and PriceAggregator.get_prices."""
+
+    def test_snapshot_reads_all_feeds_in_one_call(self) -> None:
+        """Test 30 feeds are read in one eth_call at a single block."""
+        symbol_to_feed = _feeds(30)
+        chain = _chain(symbol_to_feed)
+        adapter = ChainlinkAdapter(Web3(chain), symbol_to_feed)
+
+        quotes = adapter.get_prices()
+
+        assert chain.eth_calls == 1
+        assert list(quotes) == list(symbol_to_feed)
+        assert {q.block_number for q in quotes.values()} == {1_000}
+        for i, sym in enumerate(symbol_to_feed):
+            assert quotes[sym].price == (i + 1) * 10**8
+            assert quotes[sym].decimals == (8 if i % 2 else 18)
+            assert quotes[sym].timestamp == 1_700_000_000 + i
+            assert quotes[sym].source == "chainlink"
+
+    def test_snapshot_matches_per_symbol_reads(self) -> None:
+        """Test batch quotes equal get_price apart from the block number."""
+        symbol_to_feed = _feeds(4)
+        chain = _chain(symbol_to_feed)
+        adapter = ChainlinkAdapter(Web3(chain), symbol_to_feed)
+
+        quotes = adapter.get_prices(["SYM3-USD", "SYM1-USD"])
+
+        assert list(quotes) == ["SYM3-USD", "SYM1-USD"]
+        for sym, quote in quotes.items():
+            single = adapter.get_price(sym)
+            assert single == PriceQuote(**{**vars(quote), "block_number": 0})
+
+    def test_decimals_are_read_once(self) -> None:
+        """Test later snapshots only request latestRoundData."""
+        symbol_to_feed = _feeds(5)
+        chain = _chain(symbol_to_feed)
+        adapter = ChainlinkAdapter(Web3(chain), symbol_to_feed)
+
+        adapter.get_prices()
+        chain.subcalls.clear()
+        chain.block_number += 1
+        quotes = adapter.get_prices()
+
+        assert chain.eth_calls == 2
+        assert chain.subcalls == [LATEST_ROUND_DATA_CALLDATA] * 5
+        assert {q.block_number for q in quotes.values()} == {1_001}
+
+    def test_failing_feeds_are_skipped(self) -> None:
+        """Test reverted and non-positive answers drop only their symbol."""
+        symbol_to_feed = _feeds(4)
+        chain = _chain(symbol_to_feed)
+        chain.reverting.add(Web3.to_checksum_address(symbol_to_feed["SYM1-USD"]))
+        address = Web3.to_checksum_address(symbol_to_feed["SYM2-USD"])
+        chain.feeds[address] = (8, -5, 1)
+        adapter = ChainlinkAdapter(Web3(chain), symbol_to_feed)
+
+        quotes = adapter.get_prices(["SYM0-USD", "SYM1-USD", "SYM2-USD", "UNKNOWN"])
+
+        assert list(quotes) == ["SYM0-USD"]
+
+        # Decimals of the reverted feed are retried on the next snapshot
+        chain.reverting.clear()
+        chain.subcalls.clear()
+        assert "SYM1-USD" in adapter.get_prices(["SYM1-USD"])
+        assert chain.subcalls == [DECIMALS_CALLDATA, LATEST_ROUND_DATA_CALLDATA]
+
+    def test_failed_multicall_falls_back_to_per_symbol_reads(self) -> None:
+        """Test a failing Multicall3 still yields every feed via get_price."""
+        symbol_to_feed = _feeds(3)
+        chain = _chain(symbol_to_feed)
+        chain.multicall_down = True
+        chain.reverting.add(Web3.to_checksum_address(symbol_to_feed["SYM2-USD"]))
+        adapter = ChainlinkAdapter(Web3(chain), symbol_to_feed)
+
+        quotes = adapter.get_prices()
+
+        assert list(quotes) == ["SYM0-USD", "SYM1-USD"]
+        for sym, quote in quotes.items():
+            assert quote == adapter.get_price(sym)
+
+    def test_aggregator_falls_back_per_missing_symbol(self) -> None:
+        """Test the aggregator asks later feeds only for missing symbols."""
+        symbol_to_feed = _feeds(3)
+        chain = _chain(symbol_to_feed)
+        chain.reverting.add(Web3.to_checksum_address(symbol_to_feed["SYM2-USD"]))
+
+        class _Fallback:
+            def __init__(self) -> None:
+                self.asked: list[str] = []
+
+            def get_price(self, symbol: str):
+                self.asked.append(symbol)
+                if symbol == "MISSING":
+                    return None
+                return PriceQuote(symbol=symbol, price=1, decimals=8, source="pyth")
+
+        fallback = _Fallback()
+        aggregator = PriceAggregator(
+            [ChainlinkAdapter(Web3(chain), symbol_to_feed), fallback]
+        )
+
+        quotes = aggregator.get_prices(["SYM0-USD", "SYM1-USD", "SYM2-USD", "MISSING"])
+
+        assert chain.eth_calls == 1
+        assert fallback.asked == ["SYM2-USD", "MISSING"]
+        assert {s: q.source for s, q in quotes.items()} == {
+            "SYM0-USD": "chainlink",
+            "SYM1-USD": "chainlink",
+            "SYM2-USD": "pyth",
+        }
+
+        # A failed multicall falls back for every symbol
+        chain.down = True
+        fallback.asked.clear()
+        quotes = aggregator.get_prices(["SYM0-USD", "SYM1-USD"])
+        assert fallback.asked == ["SYM0-USD", "SYM1-USD"]
+        assert {q.source for q in quotes.values()} == {"pyth"}
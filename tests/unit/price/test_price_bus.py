@@ -0,0 +1,187 @@
+"""Unit tests for the shared price bus."""
+
+import asyncio
+
+import pytest
+
+from src.adapters.price.aggregator import PriceAggregator
+from src.adapters.price.base import PriceQuote
+from src.services.price_bus import BusPriceFeed, PriceBus
+
+
+class _Upstream:
+    """Price source counting upstream requests."""
+
+    def __init__(self, prices: dict[str, float], delay_s: float = 0.01):
+        self.prices = prices
+        self.delay_s = delay_s
+        self.requests: list[list[str]] = []
+        self.down = False
+
+    async def fetch(self, symbols: list[str]) -> dict[str, float]:
+        self.requests.append(list(symbols))
+        await asyncio.sleep(self.delay_s)
+        if self.down:
+            raise ConnectionError("upstream down")
+        return {s: self.prices[s] for s in symbols if s in self.prices}
+
+
+class TestPriceBus:
+    """Test PriceBus ingestion, caching and fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_consumers_share_one_request(self) -> None:
+        """Test 50 concurrent reads of a cold symbol make one upstream call."""
+        bus = PriceBus(ttl_s=5)
+        upstream = _Upstream({"BTC": 65_000.0, "ETH": 3_000.0})
+        bus.register_source("cg", upstream.fetch, ["BTC", "ETH"])
+
+        results = await asyncio.gather(*(bus.get("BTC") for _ in range(50)))
+
+        assert len(upstream.requests) == 1
+        assert {r.price for r in results} == {65_000.0}
+        assert len({r.seq for r in results}) == 1
+
+        # A batch read joins the in-flight request for the symbols it shares
+        upstream.requests.clear()
+        bus.ttl_s = 0
+        await asyncio.gather(bus.get_many(["BTC", "ETH"]), bus.get("ETH"))
+        assert upstream.requests == [["BTC", "ETH"]]
+
+    @pytest.mark.asyncio
+    async def test_reads_are_served_from_cache_until_ttl(self) -> None:
+        """Test fresh values skip upstream and stale ones refresh."""
+        bus = PriceBus(ttl_s=60)
+        upstream = _Upstream({"BTC": 1.0})
+        bus.register_source("cg", upstream.fetch, ["BTC"])
+
+        first = await bus.get("BTC")
+        upstream.prices["BTC"] = 2.0
+        assert (await bus.get("BTC")).price == 1.0
+        assert len(upstream.requests) == 1
+
+        refreshed = await bus.get("BTC", max_age_s=0)
+        assert refreshed.price == 2.0
+        assert refreshed.seq > first.seq
+        assert len(upstream.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_symbol_formats_share_one_key(self) -> None:
+        """Test BTC, BTC/USD and BTC-USD are the same price."""
+        bus = PriceBus()
+        upstream = _Upstream({"BTC-USD": 65_000.0})
+        bus.register_source("cl", upstream.fetch, ["BTC-USD"])
+
+        prices = await bus.get_many(["BTC", "BTC/USD", "btc-usd"])
+
+        assert len(upstream.requests) == 1
+        assert set(prices) == {"BTC", "BTC/USD", "btc-usd"}
+        assert {u.symbol for u in prices.values()} == {"BTC"}
+        assert bus.latest("BTC/USD").price == 65_000.0
+
+    @pytest.mark.asyncio
+    async def test_sources_are_preferred_in_registration_order(self) -> None:
+        """Test later sources are only asked for what earlier ones lack."""
+        bus = PriceBus()
+        primary = _Upstream({"BTC": 100.0})
+        backup = _Upstream({"BTC": 99.0, "ETH": 10.0})
+        bus.register_source("primary", primary.fetch, ["BTC", "ETH"])
+        bus.register_source("backup", backup.fetch, ["BTC", "ETH"])
+
+        prices = await bus.get_many(["BTC", "ETH"])
+
+        assert primary.requests == [["BTC", "ETH"]]
+        assert backup.requests == [["ETH"]]
+        assert {s: u.source for s, u in prices.items()} == {
+            "BTC": "primary",
+            "ETH": "backup",
+        }
+
+        # Restricting to one source never falls back
+        only = await bus.get_many(["ETH"], max_age_s=0, source="primary")
+        assert only == {}
+        assert len(backup.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_returns_nothing_and_is_retried(self) -> None:
+        """Test upstream errors leave the symbol missing rather than raising."""
+        bus = PriceBus()
+        upstream = _Upstream({"BTC": 1.0})
+        upstream.down = True
+        bus.register_source("cg", upstream.fetch, ["BTC"])
+
+        assert await bus.get("BTC") is None
+        assert await bus.get("DOGE") is None
+
+        upstream.down = False
+        assert (await bus.get("BTC")).price == 1.0
+        assert len(upstream.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_sync_fetchers_and_quotes(self) -> None:
+        """Test adapter-style sync fetchers run off the loop and keep quotes."""
+        bus = PriceBus()
+        quote = PriceQuote(
+            symbol="ETH", price=3_000 * 10**8, decimals=8, source="chainlink"
+        )
+        bus.register_source("chainlink", lambda symbols: {"ETH": quote}, ["ETH"])
+
+        update = await bus.get("ETH/USD")
+
+        assert update.price == 3_000.0
+        assert update.quote is quote
+        feed = BusPriceFeed(bus, source="chainlink")
+        assert feed.get_price("ETH") is quote
+
+    @pytest.mark.asyncio
+    async def test_next_update_wakes_subscribers(self) -> None:
+        """Test waiters receive the next published price for their symbol."""
+        bus = PriceBus()
+        waiters = [asyncio.create_task(bus.next_update("BTC/USD")) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        bus.publish("ws", "ETH", 10.0)
+        bus.publish("ws", "BTC", 42.0)
+        updates = await asyncio.gather(*waiters)
+
+        assert {(u.symbol, u.price) for u in updates} == {("BTC", 42.0)}
+        with pytest.raises(asyncio.TimeoutError):
+            await bus.next_update("BTC", timeout=0.01)
+        assert not bus._waiters.get("BTC")
+
+    @pytest.mark.asyncio
+    async def test_polling_keeps_the_cache_warm(self) -> None:
+        """Test start() refreshes every source on its interval."""
+        bus = PriceBus(ttl_s=60)
+        upstream = _Upstream({"BTC": 1.0}, delay_s=0)
+        bus.register_source("cg", upstream.fetch, ["BTC"], interval_s=0.01)
+
+        bus.start()
+        await asyncio.sleep(0.05)
+        await bus.stop()
+
+        assert len(upstream.requests) >= 2
+        assert (await bus.get("BTC")).price == 1.0
+        assert bus._tasks == []
+
+
+def test_bus_feed_serves_aggregator_from_cache() -> None:
+    """Test BusPriceFeed answers from the cache and falls back when cold."""
+    bus = PriceBus(ttl_s=60)
+    bus.publish("cg", "SOL", 150.25)
+
+    class _Direct:
+        def get_price(self, symbol: str):
+            return PriceQuote(symbol=symbol, price=1, decimals=0, source="direct")
+
+    aggregator = PriceAggregator([BusPriceFeed(bus), _Direct()])
+
+    sol = aggregator.get_price("SOL/USD")
+    assert sol.price / 10**sol.decimals == pytest.approx(150.25)
+    assert sol.source == "cg"
+    assert aggregator.get_price("ETH").source == "direct"
+
+    # Zero, negative and non-numeric prices are never published
+    assert bus.publish("cg", "SOL", 0) is None
+    assert bus.publish("cg", "SOL", "n/a") is None
+    assert bus.latest("SOL").price == 150.25
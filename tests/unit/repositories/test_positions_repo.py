@@ -1,14 +1,19 @@
 """Unit tests for positions repository (Phase 4)."""
 
+import random
+
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
-from src.database.models import Base
+from src.database.models import Base, IndexedFill, UserPosition
 from src.repositories.positions_repo import (
+    PositionDelta,
     get_position,
+    insert_fills,
     list_positions,
     upsert_position,
+    upsert_positions,
 )
 
 
@@ -70,3 +75,110 @@ class TestPositionsRepo:
         pos = get_position(db_session, "0xabc", "BTC-USD")
         assert pos is not None
         assert pos.user_address == "0xabc"
+
+    def test_bulk_upsert_matches_per_row_path(self, tmp_path) -> None:
+        """Test upsert_positions ends in the same state as upsert_position."""
+        rng = random.Random(4)
+        users = [f"0x{i:040x}" for i in range(30)] + ["0xABC", "0xabc"]
+        deltas = [
+            PositionDelta(
+                user_addr=rng.choice(users),
+                symbol=rng.choice(["BTC-USD", "eth-usd", "SOL-USD"]),
+                is_long=rng.random() < 0.5,
+                # Reductions past zero exercise the clamp mid-sequence
+                size_delta_1e6=rng.randint(-3_000_000, 2_000_000),
+                collateral_delta_1e6=rng.randint(-1_000_000, 1_000_000),
+                realized_pnl_delta_1e6=rng.randint(-50_000, 50_000),
+            )
+            for _ in range(2_000)
+        ]
+
+        def state(Session):
+            with Session() as db:
+                return sorted(
+                    (
+                        p.user_address,
+                        p.symbol,
+                        p.is_long,
+                        p.size_usd_1e6,
+                        p.entry_collateral_1e6,
+                        p.realized_pnl_1e6,
+                    )
+                    for p in db.query(UserPosition)
+                )
+
+        sessions = []
+        for name in ("per_row", "bulk"):
+            eng = create_engine(f"sqlite:///{tmp_path}/{name}.db")
+            Base.metadata.create_all(eng)
+            sessions.append(sessionmaker(bind=eng))
+        per_row, bulk = sessions
+
+        # Both start from some existing positions
+        for Session in sessions:
+            with Session() as db:
+                for d in deltas[:50]:
+                    upsert_position(
+                        db,
+                        d.user_addr,
+                        d.symbol,
+                        d.is_long,
+                        d.size_delta_1e6,
+                        d.collateral_delta_1e6,
+                        d.realized_pnl_delta_1e6,
+                    )
+
+        with per_row() as db:
+            for d in deltas[50:]:
+                upsert_position(
+                    db,
+                    d.user_addr,
+                    d.symbol,
+                    d.is_long,
+                    d.size_delta_1e6,
+                    d.collateral_delta_1e6,
+                    d.realized_pnl_delta_1e6,
+                )
+        with bulk() as db:
+            changed = upsert_positions(db, deltas[50:1000])
+            changed |= upsert_positions(db, deltas[1000:])
+
+        assert state(bulk) == state(per_row)
+        assert "0xabc" in changed
+
+    def test_bulk_ingest_uses_constant_statements(self, db_session) -> None:
+        """Test a batch of fills and positions is a few statements and one commit."""
+        fills = [
+            IndexedFill(
+                user_address=f"0x{i % 400:040x}",
+                symbol="BTC-USD",
+                is_long=True,
+                usd_1e6=1_000_000,
+                collateral_usdc_1e6=100_000,
+                tx_hash=f"0x{i:064x}",
+                block_number=i,
+            )
+            for i in range(5_000)
+        ]
+        statements = []
+        event.listen(
+            db_session.get_bind(),
+            "before_cursor_execute",
+            lambda conn, cursor, stmt, *args: statements.append(stmt.split()[0]),
+        )
+
+        insert_fills(db_session, fills, commit=False)
+        upsert_positions(
+            db_session,
+            (
+                PositionDelta(f.user_address, f.symbol, True, f.usd_1e6, 100_000)
+                for f in fills
+            ),
+            commit=False,
+        )
+        db_session.commit()
+
+        assert len(statements) <= 5, statements
+        assert db_session.query(IndexedFill).count() == 5_000
+        pos = get_position(db_session, f"0x{7:040x}", "BTC-USD")
+        assert pos.size_usd_1e6 == 13_000_000  # addresses below 200 get 13 fills
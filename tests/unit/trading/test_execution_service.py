@@ -0,0 +1,120 @@
+"""Unit tests for bot quotes kept with the trade draft."""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.trading import execution_service
+from src.services.trading.execution_service import ExecutionService
+from src.services.trading.trade_drafts import TradeDraft
+
+
+class CountingSDK:
+    """SDK stand-in recording every call."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+        def rpc(name, value):
+            async def call(*args, **kwargs):
+                self.calls.append(name)
+                return value
+
+            return call
+
+        self.pairs_cache = SimpleNamespace(
+            get_pair_info=rpc("pair_info", SimpleNamespace(base="ETH"))
+        )
+        self.fee_parameters = SimpleNamespace(get_opening_fee=rpc("fee", 2.5))
+        self.trading_parameters = SimpleNamespace(
+            get_loss_protection_for_trade_input=rpc("loss_protection", {"value": 5})
+        )
+        self.asset_parameters = SimpleNamespace(
+            get_pair_spread=rpc("pair_spread", 1),
+            get_price_impact_spread=rpc("price_impact", 2),
+        )
+        self.tokens = SimpleNamespace(
+            get_usdc=rpc("usdc", SimpleNamespace(address="0x1"))
+        )
+        self.get_trader_client = rpc(
+            "trader", SimpleNamespace(get_address=rpc("address", "0x2"))
+        )
+        self.get_allowance = rpc("allowance", Decimal("1000"))
+
+
+@pytest.fixture
+def sdk(monkeypatch):
+    sdk = CountingSDK()
+    for name in (
+        "pairs_cache",
+        "fee_parameters",
+        "trading_parameters",
+        "asset_parameters",
+        "tokens",
+        "get_trader_client",
+        "get_allowance",
+    ):
+        monkeypatch.setattr(execution_service, name, getattr(sdk, name), raising=False)
+    monkeypatch.setattr(execution_service, "SDK_AVAILABLE", True)
+    return sdk
+
+
+@pytest.fixture
+def service():
+    settings = SimpleNamespace(default_slippage_pct=1, trading_contract="0x3")
+    return ExecutionService(settings, block_time_s=0.01)
+
+
+@pytest.fixture
+def draft():
+    return TradeDraft(
+        user_id=42,
+        pair="ETH/USD",
+        side="LONG",
+        leverage=Decimal("10"),
+        collateral_usdc=Decimal("100"),
+    )
+
+
+class TestQuoteFromDraft:
+    @pytest.mark.asyncio
+    async def test_slippage_change_reuses_draft_quote(self, sdk, service, draft):
+        """Test a slippage change long after the card appeared makes no RPC."""
+        first = await service.quote_from_draft(draft)
+        assert "fee" in sdk.calls
+
+        # Well past the block TTL, as a real button press would be
+        await asyncio.sleep(0.05)
+        sdk.calls.clear()
+        second = await service.quote_from_draft(draft, Decimal("2"), reuse_quote=True)
+
+        assert sdk.calls == []
+        assert second.data["slippage_pct"] == "2"
+        assert second.data["fee_usdc"] == first.data["fee_usdc"]
+
+    @pytest.mark.asyncio
+    async def test_changed_draft_is_quoted_again(self, sdk, service, draft):
+        """Test a stored quote is only reused for the same trade."""
+        await service.quote_from_draft(draft)
+
+        draft.collateral_usdc = Decimal("200")
+        sdk.calls.clear()
+        res = await service.quote_from_draft(draft, Decimal("0.5"), reuse_quote=True)
+
+        # Size-dependent reads again; pair-level reads still within the block
+        assert "fee" in sdk.calls
+        assert "pair_info" not in sdk.calls
+        assert res.data["collateral_usdc"] == "200"
+        assert draft.quote["collateral_usdc"] == "200"
+
+    @pytest.mark.asyncio
+    async def test_fresh_quote_ignores_stored_one(self, sdk, service, draft):
+        """Test showing the card again fetches current fees and allowance."""
+        await service.quote_from_draft(draft)
+        sdk.calls.clear()
+
+        await service.quote_from_draft(draft)
+
+        assert {"fee", "allowance"} <= set(sdk.calls)
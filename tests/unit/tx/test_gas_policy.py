@@ -1,6 +1,6 @@
 """Unit tests for EIP-1559 gas policy (Phase 2)."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -82,3 +82,49 @@ class TestGasPolicy:
 
         # Would be 168 Gwei, but capped at 150
         assert bumped == 150_000_000_000
+
+    def test_quotes_share_one_header_per_block(self):
+        """Test repeated quotes within a block fetch the header once."""
+        from src.blockchain.tx.gas_policy import GasPolicy
+
+        w3 = MagicMock()
+        w3.eth.get_block.return_value = {"number": 10, "baseFeePerGas": 10**9}
+
+        quotes = {GasPolicy().quote(w3) for _ in range(200)}
+
+        assert len(quotes) == 1
+        assert w3.eth.get_block.call_count == 1
+
+    def test_quote_refreshes_after_block_interval(self):
+        """Test a new header is read once the block interval has passed."""
+        from src.blockchain.tx.gas_policy import GasPolicy, GasQuoteCache
+
+        w3 = MagicMock()
+        w3.eth.get_block.return_value = {"number": 10, "baseFeePerGas": 10**9}
+        policy = GasPolicy(max_priority_gwei=0, surge_multiplier=1.0)
+
+        with patch("src.blockchain.tx.gas_policy.time.monotonic", return_value=100.0):
+            assert policy.quote(w3)[0] == 10**9
+
+        w3.eth.get_block.return_value = {"number": 11, "baseFeePerGas": 2 * 10**9}
+        block_time = GasQuoteCache.for_web3(w3).block_time_s
+        with patch(
+            "src.blockchain.tx.gas_policy.time.monotonic",
+            return_value=100.0 + block_time,
+        ):
+            assert policy.quote(w3)[0] == 2 * 10**9
+
+        assert w3.eth.get_block.call_count == 2
+
+    def test_bump_fee_keeps_up_with_base_fee(self):
+        """Test an RBF bump is never below the current block's quote."""
+        from src.blockchain.tx.gas_policy import GasPolicy
+
+        w3 = MagicMock()
+        w3.eth.get_block.return_value = {"baseFeePerGas": 20_000_000_000}
+        policy = GasPolicy(max_priority_gwei=2, surge_multiplier=1.2)
+
+        # 10 Gwei * 1.15 is below (20 + 2) * 1.2 = 26.4 Gwei
+        assert policy.bump_fee(10_000_000_000, 0.15, w3) == int(26.4 * 1e9)
+        # Without a client only the percentage bump applies
+        assert policy.bump_fee(10_000_000_000, 0.15) == int(11.5 * 1e9)